@@ -1,19 +1,32 @@
 import certifi
 import redis
+import redis.asyncio
+from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo import MongoClient
 
 from app import logger
 from app.bot import DiscordBot
 from app.config import AppConfig
+from app.data.monitoring import command_monitor
+
+REDIS_MAX_CONNECTIONS = 50
 
 
 def create_app(config: AppConfig) -> DiscordBot:
-    global mongo_client, redis_client, bot
+    global mongo_client, mongo_async_client, redis_client, redis_async_client, bot
 
     mongo_client = MongoClient(
         config.MONGO_URL,
         tls=config.is_prod(),
         tlsCAFile=certifi.where() if config.is_prod() else None,
+        event_listeners=[command_monitor],
+    )
+    # Used by the bot event loop (app.data.aio); the sync client stays for the Flask thread and sync services.
+    mongo_async_client = AsyncIOMotorClient(
+        config.MONGO_URL,
+        tls=config.is_prod(),
+        tlsCAFile=certifi.where() if config.is_prod() else None,
+        event_listeners=[command_monitor],
     )
 
     config.load_db_configs()
@@ -25,6 +38,14 @@ def create_app(config: AppConfig) -> DiscordBot:
     redis_client = redis.from_url(
         url=config.REDIS_URL, health_check_interval=30, decode_responses=True
     )
+    # Used by the bot event loop; the sync clients stay for the Flask thread and sync services.
+    redis_async_client = redis.asyncio.Redis(
+        connection_pool=redis.asyncio.BlockingConnectionPool.from_url(
+            config.REDIS_URL,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            health_check_interval=30,
+        )
+    )
     redis_status = "OK" if redis_client.ping() else "Error"
     logger.info(f"Redis: {redis_status}")
 
@@ -1,3 +1,4 @@
+import asyncio
 import threading
 
 import discord
@@ -41,5 +42,57 @@ class DiscordBot(Bot):
         )
 
     async def setup_hook(self) -> None:
+        from app import logger
+        from app.constants import LogTypes as logconstants
+        from app.data.indexes import ensure_indexes
+        from app.services.cache import run_invalidation_subscriber
+        from app.services.cog_events import (
+            configure_cog_events_spill,
+            replay_spilled_cog_events,
+            run_cog_events_flusher,
+        )
+        from app.services.command_counters import run_command_counters_flusher
+        from app.services.guild_features import load_guild_features
+        from app.services.streamer_targets import ensure_streamer_targets
+
+        logger.info(f"Mongo indexes created: {await asyncio.to_thread(ensure_indexes) or 'none missing'}")
+        logger.info(f"Guild features loaded for {await asyncio.to_thread(load_guild_features)} guilds")
+        logger.info(f"Twitch streamer index built: {await ensure_streamer_targets() or 'already built'}")
+        self.cache_invalidation_task = self.loop.create_task(run_invalidation_subscriber())
+        self.command_counters_task = self.loop.create_task(run_command_counters_flusher())
+        configure_cog_events_spill(self.config.COG_EVENTS_SPILL_PATH)
+        try:
+            logger.info(f"Spilled cog events replayed: {await replay_spilled_cog_events()}")
+        except Exception as e:
+            # The spill file is only removed once its events are stored, so the next start retries it.
+            logger.error(
+                f"Failed to replay spilled cog events: {type(e).__name__}: {e}",
+                log_type=logconstants.APPLICATION_ERROR_TYPE,
+                exc_info=True,
+            )
+        self.cog_events_task = self.loop.create_task(run_cog_events_flusher())
         await cogs_manager(self, "load", get_cogs_folder())
         await self.tree.set_translator(Translator(self))
+
+    async def close(self) -> None:
+        from app import logger
+        from app.constants import LogTypes as logconstants
+        from app.services.cog_events import flush_cog_events
+        from app.services.command_counters import flush_command_counters
+
+        try:
+            # A failing flush must not keep the other buffers, the Twitch session or the gateway open.
+            for flush in (flush_command_counters, flush_cog_events):
+                try:
+                    await flush()
+                except Exception as e:
+                    logger.error(
+                        f"Failed to flush {flush.__name__} on shutdown: {type(e).__name__}: {e}",
+                        log_type=logconstants.APPLICATION_ERROR_TYPE,
+                        exc_info=True,
+                    )
+        finally:
+            try:
+                await self.twitch.close()
+            finally:
+                await super().close()
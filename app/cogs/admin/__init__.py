@@ -8,9 +8,11 @@ from discord.app_commands import Choice
 
 import app
 from app.bot import DiscordBot
+from app.cogs.admin.cache import Cache
 from app.cogs.admin.cogs import Cogs
 from app.cogs.admin.configs import Configs
 from app.cogs.admin.debug import Debug
+from app.cogs.admin.indexes import Indexes
 from app.cogs.admin.subscriptions import Subscriptions
 from app.cogs.admin.sync import Sync
 from app.logger import DiscordLogsHandler
@@ -42,7 +44,7 @@ class Admin(GroupCog, name="admin"):
     )
     async def show_overview(self, interaction: discord.Interaction) -> None:
         await interaction.response.defer(thinking=True, ephemeral=True)
-        data = get_overview_data(self.bot)
+        data = await get_overview_data(self.bot)
         embed = build_overview_embed(self.bot, data)
         await interaction.followup.send(embed=embed, ephemeral=True)
 
@@ -133,8 +135,10 @@ class Admin(GroupCog, name="admin"):
 async def setup(bot: DiscordBot) -> None:
     admin = Admin(bot)
 
+    admin.app_command.add_command(Cache(bot))
     admin.app_command.add_command(Cogs(bot))
     admin.app_command.add_command(Debug(bot))
+    admin.app_command.add_command(Indexes(bot))
     admin.app_command.add_command(Sync(bot))
     admin.app_command.add_command(Configs(bot))
     admin.app_command.add_command(Subscriptions(bot))
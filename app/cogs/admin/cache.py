@@ -0,0 +1,39 @@
+import discord
+
+from app.bot import DiscordBot
+from app.decorators import keiko_command
+from app.services.cache import backfill_guild_key_registry
+from app.services.command_counters import migrate_legacy_command_counters
+from app.types.cogs import Group
+
+
+class Cache(Group, name="cache"):
+    def __init__(self, bot: DiscordBot):
+        self.bot = bot
+        super().__init__()
+
+    @keiko_command(
+        name="backfill-registry",
+        description="Keiko registers the cache keys of every guild written before the key registry",
+    )
+    async def backfill_registry(self, interaction: discord.Interaction) -> None:
+        await interaction.response.defer(ephemeral=True)
+
+        registered = await backfill_guild_key_registry()
+        await interaction.followup.send(
+            f":card_box: Registered **{registered}** guild cache keys!",
+            ephemeral=True
+        )
+
+    @keiko_command(
+        name="migrate-counters",
+        description="Keiko moves the old per-command counters into the counter hashes",
+    )
+    async def migrate_counters(self, interaction: discord.Interaction) -> None:
+        await interaction.response.defer(ephemeral=True)
+
+        migrated = await migrate_legacy_command_counters()
+        await interaction.followup.send(
+            f":abacus: Migrated **{migrated}** command counters!",
+            ephemeral=True
+        )
@@ -0,0 +1,67 @@
+import asyncio
+import json
+
+import discord
+
+from app.bot import DiscordBot
+from app.data.indexes import ensure_indexes, get_index_report
+from app.data.monitoring import command_monitor
+from app.decorators import keiko_command
+from app.types.cogs import Group
+
+
+class Indexes(Group, name="indexes"):
+    def __init__(self, bot: DiscordBot):
+        self.bot = bot
+        super().__init__()
+
+    @keiko_command(
+        name="report",
+        description="Keiko lists the database indexes that are missing or were never used",
+    )
+    async def show_report(self, interaction: discord.Interaction) -> None:
+        await interaction.response.defer(ephemeral=True)
+
+        # pymongo is blocking: the index stats of every collection are read off the event loop.
+        report = await asyncio.to_thread(get_index_report)
+        missing = "\n".join(f"`{index['namespace']}` {index['name']}" for index in report["missing"])
+        unused = "\n".join(
+            f"`{index['namespace']}` {index['name']}" + ("" if index["declared"] else " (not declared)")
+            for index in report["unused"]
+        )
+
+        response = f":mag: **Missing indexes:**\n{missing or 'None'}\n\n"
+        response += f":zzz: **Unused since MongoDB started:**\n{unused or 'None'}"
+        await interaction.followup.send(response[:2000], ephemeral=True)
+
+    @keiko_command(
+        name="ensure",
+        description="Keiko creates every declared database index that is missing",
+    )
+    async def ensure(self, interaction: discord.Interaction) -> None:
+        await interaction.response.defer(ephemeral=True)
+
+        created = await asyncio.to_thread(ensure_indexes)
+        await interaction.followup.send(
+            f":card_index: Created **{len(created)}** indexes!",
+            ephemeral=True
+        )
+
+    @keiko_command(
+        name="slow-queries",
+        description="Keiko shows the slowest recent database queries, with their filter values hidden",
+    )
+    async def show_slow_queries(self, interaction: discord.Interaction, clear: bool = False) -> None:
+        await interaction.response.defer(ephemeral=True)
+
+        queries = command_monitor.get_slow_queries()
+        lines = "\n".join(
+            f"`{query['duration_ms']:.0f}ms` {query['command']} `{query['database']}.{query['collection']}` "
+            f"{json.dumps(query['filter'], default=str) if query['filter'] is not None else ''}"
+            for query in queries
+        )
+        if clear:
+            command_monitor.clear_slow_queries()
+
+        response = f":snail: **Queries slower than {command_monitor.threshold_ms}ms:**\n{lines or 'None'}"
+        await interaction.followup.send(response[:2000], ephemeral=True)
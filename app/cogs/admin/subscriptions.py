@@ -1,6 +1,7 @@
 import discord
 
 from app.bot import DiscordBot
+from app.services.streamer_targets import rebuild_streamer_targets
 from app.services.subscriptions import (
     get_reminder_subscriptions,
     get_twitch_subscriptions,
@@ -21,9 +22,23 @@ class Subscriptions(Group, name="subscriptions"):
     async def show_twitch_subscriptions(self, interaction: discord.Interaction) -> None:
         await interaction.response.defer(thinking=True)
 
-        view = get_twitch_subscriptions()
+        view = await get_twitch_subscriptions()
         await interaction.followup.send(view=view, embed=view.custom_embed, ephemeral=True)
 
+    @keiko_command(
+        name="twitch-repair",
+        description="Keiko rebuilds the streamer index of the Twitch notifications from the saved settings",
+    )
+    async def repair_twitch_targets(self, interaction: discord.Interaction) -> None:
+        await interaction.response.defer(ephemeral=True)
+
+        result = await rebuild_streamer_targets()
+        await interaction.followup.send(
+            f":wrench: Indexed **{result['targets']}** notifications of **{result['guilds']}** guilds "
+            f"({result['missing']} were missing, {result['stale']} were stale)",
+            ephemeral=True,
+        )
+
     @keiko_command(
         name="reminder",
         description="Manage reminders subscriptions",
@@ -1,12 +1,12 @@
 import discord
 
 from app.bot import DiscordBot
-from app.data.moderations import find_moderations_by_guild
+from app.data.aio.moderations import find_moderations_by_guild
 from app.decorators import keiko_command
 from app.services.utils import parse_locale
 from app.translator import locale_str
 from app.types.cogs import Cog
-from app.views.setup import SetupView
+from app.views.setup import SetupView, find_paused_features
 
 
 class Setup(Cog, name=locale_str("setup", type="name", namespace="setup")):
@@ -22,8 +22,9 @@ class Setup(Cog, name=locale_str("setup", type="name", namespace="setup")):
     async def setup(self, interaction: discord.Interaction) -> None:
         locale = parse_locale(interaction.locale)
         guild_id = str(interaction.guild.id)
-        moderations = find_moderations_by_guild(interaction.guild.id) or {}
-        view = SetupView(moderations, locale, guild_id=guild_id)
+        moderations = await find_moderations_by_guild(interaction.guild.id) or {}
+        paused = await find_paused_features(guild_id, moderations)
+        view = SetupView(moderations, locale, guild_id=guild_id, paused=paused)
         embed = view.get_embed()
 
         await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
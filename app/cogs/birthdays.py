@@ -4,7 +4,7 @@ from discord import app_commands
 from app.bot import DiscordBot
 from app.components.embed import response_embed, response_error_embed
 from app.constants import KeikoIcons
-from app.data import birthdays as birthdays_data
+from app.data.aio import birthdays as birthdays_data
 from app.decorators import keiko_command
 from app.services import reminders_birthdays as birthdays_service
 from app.services.dates import format_mm_dd_label, get_month_choices, parse_date_parts
@@ -40,13 +40,13 @@ class Birthday(Cog, name=locale_str("birthday", type="name", namespace="birthday
             return await interaction.response.send_message(embed=embed, ephemeral=True)
 
         guild_id = str(interaction.guild.id)
-        if not birthdays_data.is_birthday_enabled(guild_id) or not birthdays_data.find_birthday_config(guild_id):
+        if not await birthdays_data.is_birthday_enabled(guild_id) or not await birthdays_data.find_birthday_config(guild_id):
             embed = response_error_embed("reminders-birthdays-disabled", interaction.locale, footer=True)
             return await interaction.response.send_message(embed=embed, ephemeral=True)
 
         await interaction.response.defer(ephemeral=True, thinking=True)
 
-        existing = birthdays_data.find_birthday_item(guild_id, str(interaction.user.id))
+        existing = await birthdays_data.find_birthday_item(guild_id, str(interaction.user.id))
         if existing:
             if not birthdays_service.can_self_edit_birthday(existing):
                 embed = response_error_embed("reminders-birthdays-self-edit-limit", interaction.locale, footer=True)
@@ -66,7 +66,7 @@ class Birthday(Cog, name=locale_str("birthday", type="name", namespace="birthday
                 .replace("{new_date}", format_mm_dd_label(date, interaction.locale))
             )
             async def confirm_overwrite(confirm_interaction: discord.Interaction) -> None:
-                birthdays_service.upsert_birthday(
+                await birthdays_service.upsert_birthday(
                     guild_id=guild_id,
                     user_id=str(interaction.user.id),
                     mm_dd=date,
@@ -92,7 +92,7 @@ class Birthday(Cog, name=locale_str("birthday", type="name", namespace="birthday
             await interaction.followup.send(embed=embed, view=view, ephemeral=True)
             return
 
-        birthdays_service.upsert_birthday(
+        await birthdays_service.upsert_birthday(
             guild_id=guild_id,
             user_id=str(interaction.user.id),
             mm_dd=date,
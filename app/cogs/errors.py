@@ -9,7 +9,7 @@ from app.components.embed import response_error_embed
 from app.constants import LogTypes as logconstants
 from app.exceptions import ErrorContext
 from app.services import utils
-from app.services.cache import increment_redis_key
+from app.services.command_counters import increment_command_counter
 from app.services.moderations import insert_error_by_command
 from app.types.cogs import Cog
 
@@ -84,7 +84,7 @@ class Errors(Cog, name="errors"):
         if interaction.command:
             command_name = getattr(interaction.command, "_attr", interaction.command.qualified_name)
 
-        increment_redis_key(f"{logconstants.COMMAND_ERROR_TYPE}:{command_name}")
+        increment_command_counter(logconstants.COMMAND_ERROR_TYPE, command_name)
 
 
 async def setup(bot: DiscordBot) -> None:
@@ -7,18 +7,20 @@ from app import logger
 from app.bot import DiscordBot
 from app.constants import CogsConstants as cogconstants
 from app.constants import Commands as commandsconstants
-from app.constants import GuildConstants as constants
 from app.constants import LogTypes as logconstants
 from app.decorators import with_error_context
-from app.data.moderations import count_moderations_by_owner, find_moderations_by_guild
+from app.data.aio.moderations import count_moderations_by_owner, find_moderations_by_guild
 from app.services import block_links as block_links_service
 from app.services import default_roles as default_roles_service
 from app.services import stream_elements as stream_elements_service
-from app.services.cache import increment_redis_key, remove_all_cache_by_guild
+from app.services.command_counters import increment_command_counter
+from app.services.guild_features import (
+    is_feature_enabled,
+    remove_guild_features,
+)
 from app.services.moderations import (
-    insert_moderations_by_guild,
+    join_moderations_by_guild,
     pause_all_moderations_by_guild,
-    update_moderations_by_guild,
 )
 from app.services.utils import cogs_manager, format_relative_time, get_available_roles_by_guild
 from app.services.welcome_messages import send_welcome_message
@@ -66,11 +68,15 @@ class Events(Cog, name="events"):
     @commands.Cog.listener()
     @with_error_context("on_member_join")
     async def on_member_join(self, member: discord.Member):
-        roles = get_available_roles_by_guild(member.guild)
-        if roles:
-            await default_roles_service.set_on_member_join(member)
+        guild_id = str(member.guild.id)
+
+        if is_feature_enabled(guild_id, commandsconstants.DEFAULT_ROLES_KEY):
+            roles = get_available_roles_by_guild(member.guild)
+            if roles:
+                await default_roles_service.set_on_member_join(member)
 
-        await send_welcome_message(member)
+        if is_feature_enabled(guild_id, commandsconstants.WELCOME_MESSAGES_KEY):
+            await send_welcome_message(member)
 
     @commands.Cog.listener()
     @with_error_context("on_message")
@@ -80,10 +86,13 @@ class Events(Cog, name="events"):
 
         guild_id = str(message.guild.id)
 
-        if message.content.startswith("ks!"):
+        if message.content.startswith("ks!") and is_feature_enabled(
+            guild_id, commandsconstants.INTEGRATIONS_STREAM_ELEMENTS_COMMANDS_KEY
+        ):
             await stream_elements_service.check_message(guild_id, message, "ks!")
 
-        await block_links_service.check_message(guild_id, message)
+        if is_feature_enabled(guild_id, commandsconstants.BLOCK_LINKS_KEY):
+            await block_links_service.check_message(guild_id, message)
 
     @commands.Cog.listener()
     @with_error_context("on_interaction")
@@ -98,9 +107,7 @@ class Events(Cog, name="events"):
             return None
 
         if str(interaction.user.id) != str(self.bot.owner_id):
-            increment_redis_key(
-                f"{logconstants.COMMAND_CALL_TYPE}:{interaction.command._attr}"
-            )
+            increment_command_counter(logconstants.COMMAND_CALL_TYPE, interaction.command._attr)
 
         logger.info(
             f"command started ({interaction.id}): command {interaction.command.qualified_name} called by {interaction.user.id} in channel {interaction.channel.id} at guild {interaction.guild.id}",
@@ -113,15 +120,9 @@ class Events(Cog, name="events"):
     @with_error_context("on_guild_join")
     async def on_guild_join(self, guild: discord.Guild):
         owner_id = str(guild.owner.id)
-        exist = find_moderations_by_guild(guild.id)
-
-        if not exist:
-            insert_moderations_by_guild(guild.id, owner_id=owner_id)
-        else:
-            update_moderations_by_guild(guild.id, constants.IS_BOT_ONLINE, True)
-            update_moderations_by_guild(guild.id, "owner_id", owner_id)
+        exist = await join_moderations_by_guild(guild.id, owner_id)
 
-        total_servers = count_moderations_by_owner(owner_id)
+        total_servers = await count_moderations_by_owner(owner_id)
         action = "Joined new guild" if not exist else "Joined again"
 
         total_guilds = len(self.bot.guilds)
@@ -138,7 +139,7 @@ class Events(Cog, name="events"):
     @commands.Cog.listener()
     @with_error_context("on_guild_remove")
     async def on_guild_remove(self, guild: discord.Guild):
-        moderations = find_moderations_by_guild(guild.id)
+        moderations = await find_moderations_by_guild(guild.id)
 
         active_commands = []
         duration_info = ""
@@ -159,8 +160,9 @@ class Events(Cog, name="events"):
             owner_id=guild.owner.id,
             log_type=logconstants.EVENT_LEFT_GUILD_TYPE,
         )
-        remove_all_cache_by_guild(guild.id)
-        return pause_all_moderations_by_guild(guild.id, str(self.bot.user.id))
+        moderations = await pause_all_moderations_by_guild(guild.id, str(self.bot.user.id), moderations)
+        remove_guild_features(guild.id)
+        return moderations
 
 
 async def setup(bot: DiscordBot) -> None:
@@ -4,7 +4,7 @@ from discord import app_commands
 from app.bot import DiscordBot
 from app.components.embed import response_embed, response_error_embed
 from app.constants import KeikoIcons
-from app.data import birthdays as birthdays_data
+from app.data.aio import birthdays as birthdays_data
 from app.decorators import keiko_admin_only, keiko_command
 from app.services import reminders_birthdays as birthdays_service
 from app.services.dates import format_mm_dd_label, get_month_choices, parse_date_parts
@@ -52,13 +52,13 @@ class Birthdays(
             return await interaction.response.send_message(embed=embed, ephemeral=True)
 
         guild_id = str(interaction.guild.id)
-        if not birthdays_data.is_birthday_enabled(guild_id) or not birthdays_data.find_birthday_config(guild_id):
+        if not await birthdays_data.is_birthday_enabled(guild_id) or not await birthdays_data.find_birthday_config(guild_id):
             embed = response_error_embed("reminders-birthdays-disabled", interaction.locale, footer=True)
             return await interaction.response.send_message(embed=embed, ephemeral=True)
 
         await interaction.response.defer(ephemeral=True, thinking=True)
 
-        birthdays_service.upsert_birthday(
+        await birthdays_service.upsert_birthday(
             guild_id=guild_id,
             user_id=str(member.id),
             mm_dd=date,
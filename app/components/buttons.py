@@ -7,7 +7,7 @@ from app import logger
 from app.components.embed import response_embed
 from app.constants import KeikoIcons as icons
 from app.constants import LogTypes as logconstants
-from app.services.cache import increment_redis_key
+from app.services.command_counters import increment_command_counter
 from app.services.utils import get_command_by_key, ml, parse_locale
 
 
@@ -243,7 +243,7 @@ class ExecuteCommandButton(discord.ui.Button):
             interaction_source="button (help)",
         )
 
-        increment_redis_key(f"{logconstants.COMMAND_CALL_TYPE}:{self.command_key}:button")
+        increment_command_counter(logconstants.COMMAND_CALL_TYPE, f"{self.command_key}:button")
 
         guild_id = str(interaction.guild.id)
         service = importlib.import_module(self.COMMAND_SERVICES[self.command_key])
@@ -473,7 +473,7 @@ class SyncronizeSubscriptionsButton(discord.ui.Button):
             if count > 0:
                 continue
 
-            handle_unsubscribe_streamer(interaction, {"streamer": {"value": streamer}})
+            await handle_unsubscribe_streamer(interaction, {"streamer": {"value": streamer}})
             unsubscribed_streamers.append(streamer)
 
         return await interaction.followup.send(
@@ -1,3 +1,4 @@
+import inspect
 from typing import Any, Callable, Dict, List, Union
 
 import discord
@@ -122,7 +123,7 @@ class CustomModal(discord.ui.Modal):
         self.parse_response()
 
         if self.validation:
-            validation = self.modal_validation.validate(self.validation, responses=self.response)
+            validation = await self.modal_validation.validate(self.validation, responses=self.response)
             if not validation["ok"]:
                 self.response = None
                 embed = response_error_embed(validation["error_key"], self.locale)
@@ -222,20 +223,21 @@ class ModalValidations:
     def __init__(self, cogs: List[Dict[str, Any]]) -> None:
         self.cogs = cogs
 
-    def validate(self, validation_func: str, responses: str) -> bool:
+    async def validate(self, validation_func: str, responses: str) -> bool:
         try:
-            return getattr(self, validation_func)(responses)
+            result = getattr(self, validation_func)(responses)
         except AttributeError:
             return False
+        return await result if inspect.isawaitable(result) else result
 
-    def validate_streamer_name(self, response: str) -> bool:
+    async def validate_streamer_name(self, response: str) -> bool:
         from app import bot
 
         for item in self.cogs:
             if response.lower() == item.get("streamer").get("value").lower():
                 return {"ok": False, "error_key": "streamer-already-registered"}
 
-        ok = bot.twitch.get_user_id_from_login(response) is not None
+        ok = await bot.twitch.get_user_id_from_login(response) is not None
         return {"ok": ok, "error_key": "streamer-not-found"}
 
     def validate_youtube_channel(self, response: str) -> bool:
@@ -18,6 +18,7 @@ class AppConfig:
 
         self.ENVIRONMENT = os.getenv("APPLICATION_ENVIRONMENT")
         self.DEBUG = os.getenv("DEBUG")
+        self.COG_EVENTS_SPILL_PATH = os.getenv("COG_EVENTS_SPILL_PATH")
         self.get_ssm_configs() if self.is_prod() else self.get_local_configs()
 
     def get_local_configs(self):
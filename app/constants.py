@@ -317,16 +317,16 @@ class Emojis:
     FRISBEE_EMOJI: Final[str] = ":flying_disc:"
     EDIT_EMOJI: Final[str] = ":pencil:"
 
-default_allowed_links: Final[Dict[str, str]] = {
-    "facebook": "https://facebook.com",
-    "instagram": "https://instagram.com",
-    "twitter": "https://twitter.com",
-    "twitch": "https://twitch.tv",
-    "youtube": "https://youtube.com",
-    "discord": "https://discord.gg",
-    "spotify": "https://open.spotify.com",
-    "tiktok": "https://tiktok.com",
-    "reddit": "https://reddit.com",
+default_allowed_domains: Final[Dict[str, List[str]]] = {
+    "facebook": ["facebook.com", "fb.watch"],
+    "instagram": ["instagram.com"],
+    "twitter": ["twitter.com", "x.com"],
+    "twitch": ["twitch.tv"],
+    "youtube": ["youtube.com", "youtu.be"],
+    "discord": ["discord.gg", "discord.com"],
+    "spotify": ["open.spotify.com", "spotify.link"],
+    "tiktok": ["tiktok.com"],
+    "reddit": ["reddit.com", "redd.it"],
 }
 
 supported_locales = [
@@ -0,0 +1,14 @@
+from typing import Any, Dict
+
+from app import mongo_async_client
+from app.constants import DBConfigs as constants
+
+
+async def find_admin_configs() -> Dict[str, Any]:
+    return await mongo_async_client.configs.admin.find_one(
+        {constants.ADMIN_GUILD_ID: {"$exists": True}}
+    )
+
+
+async def update_admin_configs(data: Dict[str, Any]):
+    return await mongo_async_client.configs.admin.update_one({}, {"$set": data})
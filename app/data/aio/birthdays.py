@@ -0,0 +1,105 @@
+from typing import Any, Dict, List, Optional
+
+from pymongo import ReturnDocument
+
+from app import mongo_async_client
+from app.constants import Commands as constants
+from app.data.aio.moderations import find_moderation_by_guild
+from app.data.birthdays import build_config_update, build_item_update
+
+
+async def is_birthday_enabled(guild_id: str) -> bool:
+    return bool(await find_moderation_by_guild(guild_id, constants.REMINDERS_BIRTHDAY_KEY))
+
+
+async def find_birthday_config(guild_id: str, projection: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+    return await mongo_async_client.guild.reminders_birthday.find_one({"guild_id": str(guild_id)}, projection)
+
+
+async def upsert_birthday_config(
+    guild_id: str,
+    channel_id: str,
+    mention_everyone: bool = False,
+    locale: str = None,
+    timezone: str = None,
+    notification_time: str = None,
+    default_message: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    return await mongo_async_client.guild.reminders_birthday.find_one_and_update(
+        {"guild_id": str(guild_id)},
+        build_config_update(
+            guild_id, channel_id, mention_everyone, locale, timezone, notification_time, default_message
+        ),
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+
+
+async def find_birthday_item(guild_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+    return await mongo_async_client.reminders.birthdays.find_one({
+        "guild_id": str(guild_id),
+        "user_id": str(user_id),
+    })
+
+
+async def find_birthday_items_by_date(date: str, projection: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    return await mongo_async_client.reminders.birthdays.find({"date": str(date)}, projection).to_list(length=None)
+
+
+async def find_birthday_items_by_guild(guild_id: str, projection: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    return await mongo_async_client.reminders.birthdays.find(
+        {"guild_id": str(guild_id)}, projection
+    ).to_list(length=None)
+
+
+async def find_reminder_id_by_guild_and_date(guild_id: str, date: str) -> Optional[str]:
+    item = await mongo_async_client.reminders.birthdays.find_one({
+        "guild_id": str(guild_id),
+        "date": str(date),
+    })
+    return item.get("reminder_id") if item else None
+
+
+async def count_birthday_items_by_guild_and_date(guild_id: str, date: str) -> int:
+    return await mongo_async_client.reminders.birthdays.count_documents({
+        "guild_id": str(guild_id),
+        "date": str(date),
+    })
+
+
+async def upsert_birthday_item(
+    guild_id: str,
+    user_id: str,
+    date: str,
+    reminder_id: Optional[str] = None,
+    self_edit_count: Optional[int] = None,
+    message: Optional[Dict[str, Any]] = None,
+    image: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    return await mongo_async_client.reminders.birthdays.find_one_and_update(
+        {"guild_id": str(guild_id), "user_id": str(user_id)},
+        build_item_update(guild_id, user_id, date, reminder_id, self_edit_count, message, image),
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+
+
+async def remove_birthday_item(guild_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+    item = await find_birthday_item(guild_id, user_id)
+    if not item:
+        return None
+    await mongo_async_client.reminders.birthdays.delete_one({
+        "guild_id": str(guild_id),
+        "user_id": str(user_id),
+    })
+    return item
+
+
+async def delete_birthday_items_by_guild(guild_id: str) -> int:
+    result = await mongo_async_client.reminders.birthdays.delete_many({"guild_id": str(guild_id)})
+    return result.deleted_count
+
+
+async def delete_birthday_config(guild_id: str) -> int:
+    result = await mongo_async_client.guild.reminders_birthday.delete_one({"guild_id": str(guild_id)})
+    return result.deleted_count
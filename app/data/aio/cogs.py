@@ -0,0 +1,129 @@
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError
+
+from app import mongo_async_client
+from app.data.util import parse_insert_timestamp, parse_update_timestamp, parse_upsert_timestamp
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+async def find_cog_by_guild_id(guild_id: str, cog: str, projection: Dict[str, Any] = None) -> Dict[str, Any]:
+    return await mongo_async_client.guild[cog].find_one({"guild_id": str(guild_id)}, projection)
+
+
+async def insert_cog_by_guild_id(cog: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns the stored document."""
+    guild_id = data.get("guild_id")
+    if not guild_id:
+        data = parse_insert_timestamp(data)
+        await mongo_async_client.guild[cog].insert_one(data)
+        return data
+
+    return await mongo_async_client.guild[cog].find_one_and_update(
+        {"guild_id": str(guild_id)},
+        parse_upsert_timestamp(data),
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+
+
+async def insert_cog_event(cog_key: str, data: Dict[str, Any]) -> str:
+    return await mongo_async_client.events[cog_key].insert_one(data)
+
+
+async def insert_cog_events(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """One unordered insert_many per events collection, written concurrently; returns the events not stored.
+
+    insert_many gives each event its _id in place, so an event sent again after a partial
+    failure hits a duplicate key: it was already stored and is not returned.
+    """
+    by_cog: Dict[str, List[Dict[str, Any]]] = {}
+    for event in events:
+        by_cog.setdefault(event["cog_key"], []).append(event)
+    failed = await asyncio.gather(*(_insert_events(cog_key, documents) for cog_key, documents in by_cog.items()))
+    return [event for events in failed for event in events]
+
+
+async def _insert_events(cog_key: str, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    try:
+        await mongo_async_client.events[cog_key].insert_many(documents, ordered=False)
+    except BulkWriteError as e:
+        return [
+            documents[error["index"]]
+            for error in e.details.get("writeErrors", [])
+            if error.get("code") != DUPLICATE_KEY_ERROR
+        ]
+    return []
+
+
+async def find_cog_events_by_guild_id(guild_id: str, cog_key: str) -> List[Dict[str, Any]]:
+    return await (
+        mongo_async_client.events[cog_key]
+        .find({"guild_id": str(guild_id)}, {"_id": False})
+        .sort("datetime", -1)
+        .to_list(length=None)
+    )
+
+
+async def find_cog_events_page(
+    guild_id: str, cog_key: str, before: Optional[Tuple[datetime, ObjectId]] = None, limit: int = 20
+) -> List[Dict[str, Any]]:
+    """Newest events of the guild after the `before` cursor, the (datetime, _id) of the last event read.
+
+    Keyset page on the (guild_id, datetime, _id) index; _id breaks the ties of events sharing a datetime.
+    """
+    query: Dict[str, Any] = {"guild_id": str(guild_id)}
+    if before is not None:
+        date, _id = before
+        query["$or"] = [{"datetime": {"$lt": date}}, {"datetime": date, "_id": {"$lt": _id}}]
+    return await (
+        mongo_async_client.events[cog_key]
+        .find(query)
+        .sort([("datetime", -1), ("_id", -1)])
+        .limit(limit)
+        .to_list(length=limit)
+    )
+
+
+async def find_last_cog_event(guild_id: str, cog_key: str, events: List[str]) -> Optional[Dict[str, Any]]:
+    found = await (
+        mongo_async_client.events[cog_key]
+        .find({"guild_id": str(guild_id), "event": {"$in": events}}, {"_id": False})
+        .sort("datetime", -1)
+        .limit(1)
+        .to_list(length=1)
+    )
+    return found[0] if found else None
+
+
+async def insert_error_by_command(cog_key: str, data: Dict[str, Any]) -> str:
+    data = parse_insert_timestamp(data)
+    data["command_key"] = cog_key
+    return await mongo_async_client.audit.errors.insert_one(data)
+
+
+async def update_cog_by_guild(guild_id: str, cog: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns the updated document, or None when the guild has no document for the cog."""
+    data = parse_update_timestamp(data)
+    return await mongo_async_client.guild[cog].find_one_and_update(
+        {"guild_id": str(guild_id)},
+        {"$set": data},
+        return_document=ReturnDocument.AFTER,
+    )
+
+
+async def update_cogs_by_guild(guild_id: str, cogs: List[str], data: Dict[str, Any]):
+    """Sets the same fields on the guild document of each cog; the collections are written concurrently."""
+    data = parse_update_timestamp(data)
+    return await asyncio.gather(
+        *(mongo_async_client.guild[cog].update_one({"guild_id": str(guild_id)}, {"$set": data}) for cog in cogs)
+    )
+
+
+async def delete_cog_by_guild_id(guild_id: str, cog: str):
+    return await mongo_async_client.guild[cog].delete_one({"guild_id": str(guild_id)})
@@ -0,0 +1,20 @@
+from typing import Any, Dict
+
+from app import mongo_async_client
+from app.constants import DBConfigs as constants
+
+
+async def find_db_configs() -> Dict[str, Any]:
+    return await mongo_async_client.configs.data.find_one(
+        {constants.KEIKO_STATUS: {"$exists": True}}
+    )
+
+async def find_db_integration_configs(name: str) -> Dict[str, Any]:
+    configs = await mongo_async_client.configs.integrations.find_one(
+        {"name": name}
+    )
+    return configs.get('configs', {})
+
+
+async def update_db_configs(data: Dict[str, Any]):
+    return await mongo_async_client.configs.data.update_one({}, {"$set": data})
@@ -0,0 +1,64 @@
+from typing import Any, Dict, List, Optional
+
+from pymongo import ReturnDocument
+
+from app import mongo_async_client
+from app.data.util import parse_insert_timestamp, parse_update_timestamp, parse_upsert_timestamp
+
+
+async def find_moderation_by_guild(guild_id: str, data: str) -> Any:
+    moderations = await mongo_async_client.guild.moderations.find_one(
+        {"guild_id": str(guild_id)}, {data: True, "_id": False}
+    )
+    if not moderations:
+        return None
+    return moderations.get(data) or None
+
+
+async def find_moderations_by_guild(guild_id: str, projection: Dict[str, Any] = None) -> dict:
+    return await mongo_async_client.guild.moderations.find_one({"guild_id": str(guild_id)}, projection)
+
+
+async def insert_moderations_by_guild(data: Dict[str, Any]) -> str:
+    data = parse_insert_timestamp(data)
+
+    return await mongo_async_client.guild.moderations.insert_one(data)
+
+
+async def count_moderations_by_owner(owner_id: str) -> int:
+    return await mongo_async_client.guild.moderations.count_documents({"owner_id": str(owner_id)})
+
+
+async def find_moderations_by_owner(owner_id: str, projection: Dict[str, Any] = None) -> list:
+    return await mongo_async_client.guild.moderations.find({"owner_id": str(owner_id)}, projection).to_list(length=None)
+
+
+async def update_moderations_by_guild(guild_id: str, data: str, value: bool):
+    new_data = {data: value}
+    new_data = parse_update_timestamp(new_data)
+
+    return await mongo_async_client.guild.moderations.update_one(
+        {"guild_id": str(guild_id)}, {"$set": new_data}
+    )
+
+
+async def set_moderations_by_guild(guild_id: str, data: Dict[str, Any]):
+    return await mongo_async_client.guild.moderations.update_one(
+        {"guild_id": str(guild_id)}, {"$set": parse_update_timestamp(data)}
+    )
+
+
+async def upsert_moderations_by_guild(
+    guild_id: str, data: Dict[str, Any], defaults: Dict[str, Any] = None
+) -> Optional[Dict[str, Any]]:
+    """Sets `data`, creating the document from `defaults` if the guild has none; returns the previous document."""
+    return await mongo_async_client.guild.moderations.find_one_and_update(
+        {"guild_id": str(guild_id)},
+        parse_upsert_timestamp(data, on_insert=defaults),
+        upsert=True,
+        return_document=ReturnDocument.BEFORE,
+    )
+
+
+async def find_online_moderations(projection: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    return await mongo_async_client.guild.moderations.find({"is_bot_online": True}, projection).to_list(length=None)
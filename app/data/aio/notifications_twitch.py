@@ -0,0 +1,106 @@
+from collections import defaultdict
+from typing import Any, Dict, List
+
+from pymongo import DeleteMany, ReplaceOne
+
+from app import mongo_async_client
+from app.constants import Commands as constants
+from app.data.notifications_twitch import STREAMER_TARGETS_COLLECTION
+
+
+async def find_streamer_targets(streamer_name: str) -> List[Dict[str, Any]]:
+    return await mongo_async_client.notifications[STREAMER_TARGETS_COLLECTION].find(
+        {"streamer": streamer_name}, {"_id": False}
+    ).to_list(length=None)
+
+async def has_streamer_targets() -> bool:
+    return await mongo_async_client.notifications[STREAMER_TARGETS_COLLECTION].find_one({}, {"_id": True}) is not None
+
+async def find_all_streamer_targets() -> List[Dict[str, Any]]:
+    return await mongo_async_client.notifications[STREAMER_TARGETS_COLLECTION].find({}, {"_id": False}).to_list(length=None)
+
+async def find_streamers_by_guild(guild_id: str) -> List[str]:
+    return await mongo_async_client.notifications[STREAMER_TARGETS_COLLECTION].distinct(
+        "streamer", {"guild_id": str(guild_id)}
+    )
+
+async def replace_streamer_targets_by_guild(guild_id: str, targets: List[Dict[str, Any]]):
+    """Upserts the guild entries of the index, then deletes the ones no longer configured."""
+    operations = [*_upsert_targets(targets), _delete_stale_targets(guild_id, targets)]
+    return await mongo_async_client.notifications[STREAMER_TARGETS_COLLECTION].bulk_write(operations, ordered=True)
+
+async def delete_streamer_targets_by_guild(guild_id: str):
+    return await mongo_async_client.notifications[STREAMER_TARGETS_COLLECTION].delete_many({"guild_id": str(guild_id)})
+
+async def find_enabled_notifications(projection: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    return await mongo_async_client.guild[constants.NOTIFICATIONS_TWITCH_KEY].find(
+        {"enabled": True}, projection
+    ).to_list(length=None)
+
+async def replace_all_streamer_targets(targets: List[Dict[str, Any]]):
+    """Rebuilds the whole index without emptying it: upserts every target, then deletes the stale entries."""
+    targets_by_guild = defaultdict(list)
+    for target in targets:
+        targets_by_guild[target["guild_id"]].append(target)
+
+    operations = [
+        *_upsert_targets(targets),
+        *(_delete_stale_targets(guild_id, guild_targets) for guild_id, guild_targets in targets_by_guild.items()),
+        DeleteMany({"guild_id": {"$nin": list(targets_by_guild)}}),
+    ]
+    return await mongo_async_client.notifications[STREAMER_TARGETS_COLLECTION].bulk_write(operations, ordered=True)
+
+def _upsert_targets(targets: List[Dict[str, Any]]) -> List[ReplaceOne]:
+    return [
+        ReplaceOne(
+            {"streamer": target["streamer"], "guild_id": target["guild_id"], "channel_id": target["channel_id"]},
+            dict(target),
+            upsert=True,
+        )
+        for target in targets
+    ]
+
+def _delete_stale_targets(guild_id: str, targets: List[Dict[str, Any]]) -> DeleteMany:
+    stale = {"guild_id": str(guild_id)}
+    if targets:
+        stale["$nor"] = [{"streamer": target["streamer"], "channel_id": target["channel_id"]} for target in targets]
+    return DeleteMany(stale)
+
+async def find_last_stream_date(streamer_name: str) -> str:
+    response = await mongo_async_client.audit[constants.NOTIFICATIONS_TWITCH_KEY].find_one(
+        {
+            "streamer": str(streamer_name)
+        }
+    )
+    return response.get("last_stream_date") if response else None
+
+async def update_last_stream_date(streamer_name: str, last_stream_date: str) -> str:
+    return await mongo_async_client.audit[constants.NOTIFICATIONS_TWITCH_KEY].update_one(
+        {
+            "streamer": str(streamer_name),
+        },
+        {"$set": {"last_stream_date": str(last_stream_date)}},
+        upsert=True
+    )
+
+async def find_stream_notification(guild_id: str, channel_id: str, streamer_name: str) -> Dict[str, Any]:
+    return await mongo_async_client.notifications[constants.NOTIFICATIONS_TWITCH_KEY].find_one(
+        {
+            "guild_id": str(guild_id),
+            "channel_id": str(channel_id),
+            "streamer": streamer_name,
+        }
+    )
+
+async def save_stream_notification(
+    guild_id: str, channel_id: str, streamer_name: str, message_id: str
+) -> str:
+    return await mongo_async_client.notifications[constants.NOTIFICATIONS_TWITCH_KEY].update_one(
+        {
+            "guild_id": str(guild_id),
+            "channel_id": str(channel_id),
+            "streamer": streamer_name,
+        },
+        {"$set": {"message_id": str(message_id)}},
+        upsert=True,
+    )
@@ -0,0 +1,22 @@
+from typing import Any, Dict, List
+
+from app import mongo_async_client
+from app.constants import Commands as constants
+
+
+async def count_youtube_video_subscription_by_guilds(youtuber: str) -> int:
+    return await mongo_async_client.guild[constants.NOTIFICATIONS_YOUTUBE_VIDEO_KEY].count_documents(
+        {
+            "notifications.values.youtuber.value": youtuber,
+            "enabled": True,
+        }
+    )
+
+async def find_guilds_by_youtuber(youtuber: str, projection: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    return await mongo_async_client.guild[constants.NOTIFICATIONS_YOUTUBE_VIDEO_KEY].find(
+        {
+            "notifications.values.youtuber.value": youtuber,
+            "enabled": True,
+        },
+        projection,
+    ).to_list(length=None)
@@ -0,0 +1,18 @@
+from app import mongo_async_client
+from app.data.util import parse_insert_timestamp
+
+
+async def find_reminder_by_value(value: str) -> dict:
+    return await mongo_async_client.audit.reminders.find_one({"value": value})
+
+async def insert_reminder(reminder_id: str, title: str, value: str) -> None:
+    data = {
+        "reminder_id": reminder_id,
+        "title": title,
+        "value": value,
+    }
+    data = parse_insert_timestamp(data)
+    return await mongo_async_client.audit.reminders.insert_one(data)
+
+async def delete_reminder_by_id(reminder_id: str) -> None:
+    return await mongo_async_client.audit.reminders.delete_one({"reminder_id": str(reminder_id)})
@@ -1,17 +1,19 @@
 from typing import Any, Dict, List, Optional
 
+from pymongo import ReturnDocument
+
 from app import mongo_client
 from app.constants import Commands as constants
 from app.data.moderations import find_moderation_by_guild
-from app.data.util import parse_insert_timestamp, parse_update_timestamp
+from app.data.util import parse_upsert_timestamp
 
 
 def is_birthday_enabled(guild_id: str) -> bool:
     return bool(find_moderation_by_guild(guild_id, constants.REMINDERS_BIRTHDAY_KEY))
 
 
-def find_birthday_config(guild_id: str) -> Optional[Dict[str, Any]]:
-    return mongo_client.guild.reminders_birthday.find_one({"guild_id": str(guild_id)})
+def find_birthday_config(guild_id: str, projection: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+    return mongo_client.guild.reminders_birthday.find_one({"guild_id": str(guild_id)}, projection)
 
 
 def upsert_birthday_config(
@@ -23,27 +25,14 @@ def upsert_birthday_config(
     notification_time: str = None,
     default_message: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    existing = find_birthday_config(guild_id) or {}
-    data = {
-        "guild_id": str(guild_id),
-        "channel_id": str(channel_id),
-        "mention_everyone": bool(mention_everyone),
-    }
-    if locale:
-        data["locale"] = str(locale)
-    if timezone is not None:
-        data["timezone"] = str(timezone)
-    if notification_time is not None:
-        data["notification_time"] = str(notification_time)
-    if default_message is not None:
-        data["default_message"] = default_message
-    update = parse_update_timestamp(data) if existing else parse_insert_timestamp(data)
-    mongo_client.guild.reminders_birthday.update_one(
+    return mongo_client.guild.reminders_birthday.find_one_and_update(
         {"guild_id": str(guild_id)},
-        {"$set": update},
+        build_config_update(
+            guild_id, channel_id, mention_everyone, locale, timezone, notification_time, default_message
+        ),
         upsert=True,
+        return_document=ReturnDocument.AFTER,
     )
-    return {**existing, **update}
 
 
 def find_birthday_item(guild_id: str, user_id: str) -> Optional[Dict[str, Any]]:
@@ -53,12 +42,12 @@ def find_birthday_item(guild_id: str, user_id: str) -> Optional[Dict[str, Any]]:
     })
 
 
-def find_birthday_items_by_date(date: str) -> List[Dict[str, Any]]:
-    return list(mongo_client.reminders.birthdays.find({"date": str(date)}))
+def find_birthday_items_by_date(date: str, projection: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    return list(mongo_client.reminders.birthdays.find({"date": str(date)}, projection))
 
 
-def find_birthday_items_by_guild(guild_id: str) -> List[Dict[str, Any]]:
-    return list(mongo_client.reminders.birthdays.find({"guild_id": str(guild_id)}))
+def find_birthday_items_by_guild(guild_id: str, projection: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    return list(mongo_client.reminders.birthdays.find({"guild_id": str(guild_id)}, projection))
 
 
 def find_reminder_id_by_guild_and_date(guild_id: str, date: str) -> Optional[str]:
@@ -85,28 +74,12 @@ def upsert_birthday_item(
     message: Optional[Dict[str, Any]] = None,
     image: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    existing = find_birthday_item(guild_id, user_id)
-    item = build_default_item(user_id, date, reminder_id, self_edit_count)
-
-    if existing:
-        item["reminder_id"] = reminder_id if reminder_id is not None else existing.get("reminder_id")
-        item["self_edit_count"] = (
-            self_edit_count if self_edit_count is not None else existing.get("self_edit_count", 0)
-        )
-        item["message"] = message or existing.get("message") or item["message"]
-        item["image"] = image or existing.get("image") or item["image"]
-    else:
-        item["message"] = message or item["message"]
-        item["image"] = image or item["image"]
-
-    item["guild_id"] = str(guild_id)
-    update = parse_update_timestamp(item) if existing else parse_insert_timestamp(item)
-    mongo_client.reminders.birthdays.update_one(
+    return mongo_client.reminders.birthdays.find_one_and_update(
         {"guild_id": str(guild_id), "user_id": str(user_id)},
-        {"$set": update},
+        build_item_update(guild_id, user_id, date, reminder_id, self_edit_count, message, image),
         upsert=True,
+        return_document=ReturnDocument.AFTER,
     )
-    return {**(existing or {}), **update}
 
 
 def remove_birthday_item(guild_id: str, user_id: str) -> Optional[Dict[str, Any]]:
@@ -156,6 +129,58 @@ def build_default_item(
     }
 
 
+def build_config_update(
+    guild_id: str,
+    channel_id: str,
+    mention_everyone: bool = False,
+    locale: str = None,
+    timezone: str = None,
+    notification_time: str = None,
+    default_message: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Upsert of a birthday config: only the given optional fields are overwritten."""
+    data = {
+        "guild_id": str(guild_id),
+        "channel_id": str(channel_id),
+        "mention_everyone": bool(mention_everyone),
+    }
+    if locale:
+        data["locale"] = str(locale)
+    if timezone is not None:
+        data["timezone"] = str(timezone)
+    if notification_time is not None:
+        data["notification_time"] = str(notification_time)
+    if default_message is not None:
+        data["default_message"] = default_message
+    return parse_upsert_timestamp(data)
+
+
+def build_item_update(
+    guild_id: str,
+    user_id: str,
+    date: str,
+    reminder_id: Optional[str] = None,
+    self_edit_count: Optional[int] = None,
+    message: Optional[Dict[str, Any]] = None,
+    image: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Upsert of a birthday item: fields not given keep their stored value, or get the default on insert."""
+    default = build_default_item(user_id, date)
+    data = {field: default[field] for field in ("user_id", "date", "month", "day")}
+    data["guild_id"] = str(guild_id)
+    if reminder_id is not None:
+        data["reminder_id"] = reminder_id
+    if self_edit_count is not None:
+        data["self_edit_count"] = self_edit_count
+    if message:
+        data["message"] = message
+    if image:
+        data["image"] = image
+
+    on_insert = {field: default[field] for field in ("reminder_id", "self_edit_count", "message", "image")}
+    return parse_upsert_timestamp(data, on_insert=on_insert)
+
+
 def to_summary_composition(item: Dict[str, Any]) -> Dict[str, Any]:
     message = item.get("message") or {}
     image = item.get("image") or {}
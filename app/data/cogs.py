@@ -1,25 +1,29 @@
 from typing import Any, Dict
 
+from pymongo import ReturnDocument
+
 from app import mongo_client
-from app.data.util import parse_insert_timestamp, parse_update_timestamp
+from app.data.util import parse_insert_timestamp, parse_update_timestamp, parse_upsert_timestamp
 
 
-def find_cog_by_guild_id(guild_id: str, cog: str) -> Dict[str, Any]:
-    return mongo_client.guild[cog].find_one({"guild_id": str(guild_id)})
+def find_cog_by_guild_id(guild_id: str, cog: str, projection: Dict[str, Any] = None) -> Dict[str, Any]:
+    return mongo_client.guild[cog].find_one({"guild_id": str(guild_id)}, projection)
 
 
-def insert_cog_by_guild_id(cog: str, data: Dict[str, Any]) -> str:
+def insert_cog_by_guild_id(cog: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns the stored document."""
     guild_id = data.get("guild_id")
-    existing = find_cog_by_guild_id(guild_id, cog) if guild_id else None
-
-    if existing:
-        data = parse_update_timestamp(data)
-        return mongo_client.guild[cog].replace_one(
-            {"guild_id": str(guild_id)}, {**existing, **data}
-        )
-
-    data = parse_insert_timestamp(data)
-    return mongo_client.guild[cog].insert_one(data)
+    if not guild_id:
+        data = parse_insert_timestamp(data)
+        mongo_client.guild[cog].insert_one(data)
+        return data
+
+    return mongo_client.guild[cog].find_one_and_update(
+        {"guild_id": str(guild_id)},
+        parse_upsert_timestamp(data),
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
 
 
 def insert_cog_event(cog_key: str, data: Dict[str, Any]) -> str:
@@ -40,10 +44,13 @@ def insert_error_by_command(cog_key: str, data: Dict[str, Any]) -> str:
     return mongo_client.audit.errors.insert_one(data)
 
 
-def update_cog_by_guild(guild_id: str, cog: str, data: Dict[str, Any]) -> str:
+def update_cog_by_guild(guild_id: str, cog: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns the updated document, or None when the guild has no document for the cog."""
     data = parse_update_timestamp(data)
-    return mongo_client.guild[cog].update_one(
-        {"guild_id": str(guild_id)}, {"$set": data}
+    return mongo_client.guild[cog].find_one_and_update(
+        {"guild_id": str(guild_id)},
+        {"$set": data},
+        return_document=ReturnDocument.AFTER,
     )
 
 
@@ -0,0 +1,144 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+from app import logger, mongo_client
+from app.constants import Commands as constants
+from app.constants import LogTypes as logconstants
+from app.data.notifications_twitch import STREAMER_TARGETS_COLLECTION
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    database: str
+    collection: str
+    keys: Tuple[Tuple[str, int], ...]
+    # TTL index: MongoDB removes documents this many seconds after the date in the (single) key.
+    expire_after_seconds: Optional[int] = None
+
+    @property
+    def name(self) -> str:
+        """Same name MongoDB generates for the keys, so indexes created by hand are recognized."""
+        return "_".join(f"{field}_{direction}" for field, direction in self.keys)
+
+    @property
+    def namespace(self) -> str:
+        return f"{self.database}.{self.collection}"
+
+    def to_model(self) -> IndexModel:
+        if self.expire_after_seconds is not None:
+            return IndexModel(list(self.keys), name=self.name, expireAfterSeconds=self.expire_after_seconds)
+        return IndexModel(list(self.keys), name=self.name)
+
+
+GUILD_ID_COLLECTIONS = [
+    *constants.COMMANDS_LIST,
+    constants.INTEGRATIONS_STREAM_ELEMENTS_COMMANDS_KEY,
+    constants.MODERATIONS_KEY,
+]
+EVENT_COLLECTIONS = [*constants.COMMANDS_LIST, constants.MODERATIONS_KEY]
+# Command history older than this is removed by MongoDB.
+COG_EVENTS_RETENTION = 365 * 24 * 60 * 60
+
+INDEXES: List[IndexSpec] = [
+    # find_cog_by_guild_id and every per-guild read
+    *(IndexSpec("guild", collection, (("guild_id", ASCENDING),)) for collection in GUILD_ID_COLLECTIONS),
+    # count_moderations_by_owner / find_moderations_by_owner
+    IndexSpec("guild", constants.MODERATIONS_KEY, (("owner_id", ASCENDING),)),
+    # find_streamer_targets
+    IndexSpec("notifications", STREAMER_TARGETS_COLLECTION, (("streamer", ASCENDING),)),
+    # find_streamers_by_guild / replace_streamer_targets_by_guild
+    IndexSpec("notifications", STREAMER_TARGETS_COLLECTION, (("guild_id", ASCENDING),)),
+    # find_guilds_by_youtuber / count_youtube_video_subscription_by_guilds
+    IndexSpec(
+        "guild",
+        constants.NOTIFICATIONS_YOUTUBE_VIDEO_KEY,
+        (("notifications.values.youtuber.value", ASCENDING), ("enabled", ASCENDING)),
+    ),
+    # find_last_stream_date / update_last_stream_date
+    IndexSpec("audit", constants.NOTIFICATIONS_TWITCH_KEY, (("streamer", ASCENDING),)),
+    # find_stream_notification / save_stream_notification
+    IndexSpec(
+        "notifications",
+        constants.NOTIFICATIONS_TWITCH_KEY,
+        (("guild_id", ASCENDING), ("channel_id", ASCENDING), ("streamer", ASCENDING)),
+    ),
+    # find_birthday_items_by_date
+    IndexSpec("reminders", "birthdays", (("date", ASCENDING),)),
+    # find_birthday_item / upsert_birthday_item, and guild-only reads by prefix
+    IndexSpec("reminders", "birthdays", (("guild_id", ASCENDING), ("user_id", ASCENDING))),
+    # find_cog_events_page / find_last_cog_event
+    *(
+        IndexSpec("events", collection, (("guild_id", ASCENDING), ("datetime", DESCENDING), ("_id", DESCENDING)))
+        for collection in EVENT_COLLECTIONS
+    ),
+    # retention of the command history
+    *(
+        IndexSpec("events", collection, (("datetime", ASCENDING),), expire_after_seconds=COG_EVENTS_RETENTION)
+        for collection in EVENT_COLLECTIONS
+    ),
+]
+
+
+def _group_by_namespace(specs: List[IndexSpec]) -> Dict[Tuple[str, str], List[IndexSpec]]:
+    grouped: Dict[Tuple[str, str], List[IndexSpec]] = {}
+    for spec in specs:
+        grouped.setdefault((spec.database, spec.collection), []).append(spec)
+    return grouped
+
+
+def ensure_indexes(specs: List[IndexSpec] = INDEXES) -> List[str]:
+    """Creates the declared indexes that do not exist yet; returns their namespaced names.
+
+    Safe to run on every startup: indexes that already exist are left untouched.
+    """
+    created = []
+    for (database, collection), collection_specs in _group_by_namespace(specs).items():
+        existing = mongo_client[database][collection].index_information()
+        missing = [spec for spec in collection_specs if spec.name not in existing]
+        if not missing:
+            continue
+
+        try:
+            mongo_client[database][collection].create_indexes([spec.to_model() for spec in missing])
+        except OperationFailure as e:
+            logger.error(
+                f"Failed to create indexes on {database}.{collection}: {e}",
+                log_type=logconstants.APPLICATION_ERROR_TYPE,
+                exc_info=True,
+            )
+            continue
+        created.extend(f"{spec.namespace}.{spec.name}" for spec in missing)
+
+    return created
+
+
+def get_index_report(specs: List[IndexSpec] = INDEXES) -> Dict[str, List[Dict[str, Any]]]:
+    """Declared indexes missing from MongoDB, and existing indexes never used since the server started."""
+    missing = []
+    unused = []
+    for (database, collection), collection_specs in _group_by_namespace(specs).items():
+        declared = {spec.name for spec in collection_specs}
+        stats = {
+            index["name"]: index
+            for index in mongo_client[database][collection].aggregate([{"$indexStats": {}}])
+        }
+
+        missing.extend(
+            {"namespace": f"{database}.{collection}", "name": name}
+            for name in sorted(declared - stats.keys())
+        )
+        unused.extend(
+            {
+                "namespace": f"{database}.{collection}",
+                "name": name,
+                "declared": name in declared,
+                "since": index.get("accesses", {}).get("since"),
+            }
+            for name, index in sorted(stats.items())
+            if name != "_id_" and not index.get("accesses", {}).get("ops")
+        )
+
+    return {"missing": missing, "unused": unused}
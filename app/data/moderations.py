@@ -1,18 +1,22 @@
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Optional
+
+from pymongo import ReturnDocument
 
 from app import mongo_client
-from app.data.util import parse_insert_timestamp, parse_update_timestamp
+from app.data.util import parse_insert_timestamp, parse_update_timestamp, parse_upsert_timestamp
 
 
 def find_moderation_by_guild(guild_id: str, data: str) -> Any:
-    moderations = mongo_client.guild.moderations.find_one({"guild_id": str(guild_id)})
+    moderations = mongo_client.guild.moderations.find_one(
+        {"guild_id": str(guild_id)}, {data: True, "_id": False}
+    )
     if not moderations:
         return None
     return moderations.get(data) or None
 
 
-def find_moderations_by_guild(guild_id: str) -> dict:
-    return mongo_client.guild.moderations.find_one({"guild_id": str(guild_id)})
+def find_moderations_by_guild(guild_id: str, projection: Dict[str, Any] = None) -> dict:
+    return mongo_client.guild.moderations.find_one({"guild_id": str(guild_id)}, projection)
 
 
 def insert_moderations_by_guild(data: Dict[str, Any]) -> str:
@@ -25,8 +29,8 @@ def count_moderations_by_owner(owner_id: str) -> int:
     return mongo_client.guild.moderations.count_documents({"owner_id": str(owner_id)})
 
 
-def find_moderations_by_owner(owner_id: str) -> list:
-    return list(mongo_client.guild.moderations.find({"owner_id": str(owner_id)}))
+def find_moderations_by_owner(owner_id: str, projection: Dict[str, Any] = None) -> list:
+    return list(mongo_client.guild.moderations.find({"owner_id": str(owner_id)}, projection))
 
 
 def update_moderations_by_guild(guild_id: str, data: str, value: bool):
@@ -36,3 +40,19 @@ def update_moderations_by_guild(guild_id: str, data: str, value: bool):
     return mongo_client.guild.moderations.update_one(
         {"guild_id": str(guild_id)}, {"$set": new_data}
     )
+
+
+def upsert_moderations_by_guild(
+    guild_id: str, data: Dict[str, Any], defaults: Dict[str, Any] = None
+) -> Optional[Dict[str, Any]]:
+    """Sets `data`, creating the document from `defaults` if the guild has none; returns the previous document."""
+    return mongo_client.guild.moderations.find_one_and_update(
+        {"guild_id": str(guild_id)},
+        parse_upsert_timestamp(data, on_insert=defaults),
+        upsert=True,
+        return_document=ReturnDocument.BEFORE,
+    )
+
+
+def find_online_moderations(projection: Dict[str, Any] = None) -> Iterable[Dict[str, Any]]:
+    return mongo_client.guild.moderations.find({"is_bot_online": True}, projection)
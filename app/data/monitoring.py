@@ -0,0 +1,119 @@
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import monitoring
+
+from app.metrics import MONGO_COMMAND_DURATION, MONGO_COMMAND_FAILURES
+
+# Commands slower than this are kept in the slow query buffer.
+SLOW_QUERY_THRESHOLD_MS = 100
+SLOW_QUERY_BUFFER_SIZE = 50
+# Connection handshake and session bookkeeping, not queries of the bot.
+IGNORED_COMMANDS = {"hello", "ismaster", "isMaster", "ping", "saslStart", "saslContinue", "endSessions", "buildInfo"}
+# Where each command keeps the filter that selects its documents.
+FILTER_FIELDS = {
+    "find": "filter",
+    "count": "query",
+    "distinct": "query",
+    "findAndModify": "query",
+}
+REDACTED = "?"
+
+
+def redact_filter(value: Any) -> Any:
+    """Shape of a filter: field names and operators are kept, every value is replaced."""
+    if isinstance(value, dict):
+        return {key: redact_filter(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        # An $in of a thousand ids has the same shape as an $in of one.
+        shapes = []
+        for item in value:
+            shape = redact_filter(item)
+            if shape not in shapes:
+                shapes.append(shape)
+        return shapes
+    return REDACTED
+
+
+def get_command_filter(command_name: str, command: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    if command_name in FILTER_FIELDS:
+        return command.get(FILTER_FIELDS[command_name])
+    if command_name in ("update", "delete"):
+        statements = command.get("updates" if command_name == "update" else "deletes") or [{}]
+        return statements[0].get("q")
+    if command_name == "aggregate":
+        pipeline = command.get("pipeline") or [{}]
+        return pipeline[0].get("$match")
+    return None
+
+
+def get_command_collection(command_name: str, command: Dict[str, Any]) -> str:
+    if command_name == "getMore":
+        return str(command.get("collection", ""))
+    collection = command.get(command_name)
+    return collection if isinstance(collection, str) else ""
+
+
+class CommandMonitor(monitoring.CommandListener):
+    """Records the latency of every MongoDB command, and keeps the slowest recent ones with redacted filters.
+
+    pymongo calls it synchronously on the thread running the command, for both the sync and the Motor client.
+    """
+
+    def __init__(self, threshold_ms: float = SLOW_QUERY_THRESHOLD_MS, size: int = SLOW_QUERY_BUFFER_SIZE):
+        self.threshold_ms = threshold_ms
+        self.slow_queries: deque = deque(maxlen=size)
+        # Commands waiting for their reply, by connection and request id.
+        self._started: Dict[Tuple[Any, int], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        if event.command_name in IGNORED_COMMANDS:
+            return
+
+        command_filter = get_command_filter(event.command_name, event.command)
+        with self._lock:
+            self._started[(event.connection_id, event.request_id)] = {
+                "database": event.database_name,
+                "collection": get_command_collection(event.command_name, event.command),
+                "filter": redact_filter(command_filter) if command_filter is not None else None,
+            }
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        self._finish(event)
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        started = self._finish(event)
+        if started:
+            MONGO_COMMAND_FAILURES.labels(started["database"], started["collection"], event.command_name).inc()
+
+    def _finish(self, event) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            started = self._started.pop((event.connection_id, event.request_id), None)
+        if not started:
+            return None
+
+        duration_ms = event.duration_micros / 1000
+        MONGO_COMMAND_DURATION.labels(started["database"], started["collection"], event.command_name).observe(
+            duration_ms / 1000
+        )
+        if duration_ms >= self.threshold_ms:
+            self.slow_queries.append({
+                **started,
+                "command": event.command_name,
+                "duration_ms": duration_ms,
+                "at": datetime.now(timezone.utc),
+            })
+        return started
+
+    def get_slow_queries(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Slow queries in the buffer, slowest first."""
+        return sorted(self.slow_queries, key=lambda query: query["duration_ms"], reverse=True)[:limit]
+
+    def clear_slow_queries(self):
+        self.slow_queries.clear()
+
+
+command_monitor = CommandMonitor()
@@ -5,21 +5,9 @@ from app import mongo_client
 from app.constants import Commands as constants
 
 
-def count_streamers_guilds(streamer_name: str) -> int:
-    return mongo_client.guild[constants.NOTIFICATIONS_TWITCH_KEY].count_documents(
-        {
-            "notifications.values.streamer.value": streamer_name,
-            "enabled": True,
-        }
-    )
+# Inverted index of the notifications: one document per streamer, guild and channel.
+STREAMER_TARGETS_COLLECTION = "twitch_streamer_targets"
 
-def find_guilds_by_streamer_name(streamer_name: str) -> Dict[str, Any]:
-    return mongo_client.guild[constants.NOTIFICATIONS_TWITCH_KEY].find(
-        {
-            "notifications.values.streamer.value": streamer_name,
-            "enabled": True,
-        }
-    )
 
 def find_last_stream_date(streamer_name: str) -> str:
     response = mongo_client.audit[constants.NOTIFICATIONS_TWITCH_KEY].find_one(
@@ -13,10 +13,11 @@ def count_youtube_video_subscription_by_guilds(youtuber: str) -> Dict[str, Any]:
         }
     )
 
-def find_guilds_by_youtuber(youtuber: str) -> Dict[str, Any]:
+def find_guilds_by_youtuber(youtuber: str, projection: Dict[str, Any] = None) -> Dict[str, Any]:
     return mongo_client.guild[constants.NOTIFICATIONS_YOUTUBE_VIDEO_KEY].find(
         {
             "notifications.values.youtuber.value": youtuber,
             "enabled": True,
-        }
+        },
+        projection,
     )
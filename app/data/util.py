@@ -14,3 +14,14 @@ def parse_update_timestamp(data: Dict[Any, Any]) -> Dict[Any, Any]:
     new_data = {"updated_at": date}
     new_data.update(data)
     return new_data
+
+
+def parse_upsert_timestamp(data: Dict[Any, Any], on_insert: Dict[Any, Any] = None) -> Dict[str, Dict[Any, Any]]:
+    """Update document for an upsert: `data` is always set, `on_insert` and created_at only when the document is new."""
+    date = datetime.datetime.now(tz=datetime.timezone.utc)
+    new_data = {"updated_at": date}
+    new_data.update(data)
+    # created_at can only be written on insert: in both operators Mongo rejects the update.
+    insert_data = {"created_at": new_data.pop("created_at", date)}
+    insert_data.update({key: value for key, value in (on_insert or {}).items() if key not in new_data})
+    return {"$set": new_data, "$setOnInsert": insert_data}
@@ -17,7 +17,7 @@ class OpenAIIntegration(IntegrationBase):
         @wraps(func)
         async def wrapper(self, locale: str, message: str) -> str:
             from app.services.cache import get_data_from_redis
-            cached_locale = get_data_from_redis(message)
+            cached_locale = await get_data_from_redis(message)
             if cached_locale:
                 return cached_locale
             return await func(self, locale, message)
@@ -33,7 +33,7 @@ class OpenAIIntegration(IntegrationBase):
         country = locale.split("-")[1] if len(locale.split("-")) > 1 else locale
 
         response = f":flag_{country.lower()}: -> {translated_response}"
-        set_data_in_redis_with_expiration(original_message, locale, 60 * 60 * 24 * 7)
+        await set_data_in_redis_with_expiration(original_message, locale, 60 * 60 * 24 * 7)
 
         return response
 
@@ -1,8 +1,12 @@
+import asyncio
 import hashlib
 import hmac
 import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
 
-import requests
+import aiohttp
+from flask import Request
 
 TWITCH_MESSAGE_ID = 'Twitch-Eventsub-Message-Id'.lower()
 TWITCH_MESSAGE_TIMESTAMP = 'Twitch-Eventsub-Message-Timestamp'.lower()
@@ -12,17 +16,50 @@ HMAC_PREFIX = 'sha256='
 MESSAGE_TYPE = 'Twitch-Eventsub-Message-Type'.lower()
 MESSAGE_TYPE_CHALLENGE = 'webhook_callback_verification'
 TWITCH_API_URL = 'https://api.twitch.tv/helix'
+TWITCH_AUTH_URL = 'https://id.twitch.tv/oauth2/token'
+
+TWITCH_MAX_CONNECTIONS = 20
+TWITCH_KEEPALIVE_TIMEOUT = 60
+TWITCH_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3)
+# The app token is renewed this many seconds before it expires, so no request is sent with an expired token.
+TWITCH_TOKEN_REFRESH_MARGIN = 300
+# Requests answered with 429 wait for the rate limit window and are sent again, up to this many times.
+TWITCH_RATELIMIT_RETRIES = 3
+
+
+@dataclass
+class HelixResponse:
+    status_code: int
+    body: Dict[str, Any] = field(default_factory=dict)
+
+    def json(self) -> Dict[str, Any]:
+        return self.body
+
 
 class TwitchClient:
-    def __init__(self, bot):
+    """Helix client of the bot event loop, on one keep-alive connection pool.
+
+    The app token is refreshed by one caller at a time, before it expires or when Helix answers 401,
+    and requests wait for the rate limit window to reset instead of failing with 429.
+    """
+
+    def __init__(self, bot, api_url: str = TWITCH_API_URL, auth_url: str = TWITCH_AUTH_URL):
         from app import DiscordBot
 
         self.bot: DiscordBot = bot
+        self.api_url = api_url
+        self.auth_url = auth_url
         self.token = None
         self.token_expiration_time = None
         self.webhook_url = f"{self.bot.config.WEBHOOK_URL}/twitch"
 
-    def _get_hmac_message(self, request: requests.Request) -> str:
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._token_lock = asyncio.Lock()
+        self._ratelimit_lock = asyncio.Lock()
+        self._ratelimit_remaining: Optional[int] = None
+        self._ratelimit_reset: Optional[float] = None
+
+    def _get_hmac_message(self, request: Request) -> str:
         return (request.headers.get(TWITCH_MESSAGE_ID, '') +
                 request.headers.get(TWITCH_MESSAGE_TIMESTAMP, '') +
                 request.data.decode('utf-8'))
@@ -30,152 +67,148 @@ class TwitchClient:
     def _get_hmac(self, secret: str, message: str) -> str:
         return hmac.new(secret.encode('utf-8'), message.encode('utf-8'), hashlib.sha256).hexdigest()
 
-    def check_request_is_a_challenge(self, request: requests.Request) -> bool:
+    def check_request_is_a_challenge(self, request: Request) -> bool:
         return MESSAGE_TYPE_CHALLENGE == request.headers.get(MESSAGE_TYPE, '')
 
-    def verify_twitch_signature(self, request: requests.Request) -> bool:
+    def verify_twitch_signature(self, request: Request) -> bool:
         message = self._get_hmac_message(request)
         hmac_value = HMAC_PREFIX + self._get_hmac(self.bot.config.TWITCH_HMAC_SECRET, message)
         twitch_signature = request.headers.get(TWITCH_MESSAGE_SIGNATURE, '')
 
         return hmac.compare_digest(hmac_value.encode('utf-8'), twitch_signature.encode('utf-8'))
 
-    def check_auth_token(func):
-        def wrapper(self, *args, **kwargs):
-            current_time = time.time()
-            if not self.token_expiration_time or current_time >= self.token_expiration_time:
-                self.authenticate()
-            return func(self, *args, **kwargs)
-
-        return wrapper
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created on first use, inside the running event loop.
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=TWITCH_MAX_CONNECTIONS, keepalive_timeout=TWITCH_KEEPALIVE_TIMEOUT
+                ),
+                timeout=TWITCH_REQUEST_TIMEOUT,
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def _is_token_fresh(self) -> bool:
+        return bool(self.token) and time.time() < self.token_expiration_time - TWITCH_TOKEN_REFRESH_MARGIN
+
+    async def authenticate(self) -> str:
+        params = {
+            "client_id": self.bot.config.TWITCH_CLIENT_ID,
+            "client_secret": self.bot.config.TWITCH_SECRET,
+            "grant_type": "client_credentials",
+        }
+        async with self._get_session().post(self.auth_url, params=params) as response:
+            response.raise_for_status()
+            response_data = await response.json()
 
-    def authenticate(self):
-        url = f"https://id.twitch.tv/oauth2/token?client_id={self.bot.config.TWITCH_CLIENT_ID}&client_secret={self.bot.config.TWITCH_SECRET}&grant_type=client_credentials"
-        response = requests.post(url)
-        response_data = response.json()
         self.token = response_data['access_token']
         self.token_expiration_time = time.time() + int(response_data['expires_in'])
         return self.token
 
-
-    @check_auth_token
-    def get_user_id_from_login(self, login: str) -> str:
-        request_url = f"{TWITCH_API_URL}/users?login={login}"
-        headers = {
-            'Client-ID': self.bot.config.TWITCH_CLIENT_ID,
-            'Authorization': f'Bearer {self.token}'
-        }
-        response = requests.get(request_url, headers=headers)
-        data = response.json().get('data')
-        if not data:
-            return None
-        return data[0]['id']
-
-    @check_auth_token
-    def get_user_info(self, login: str) -> dict:
-        request_url = f"{TWITCH_API_URL}/users?login={login}"
-        headers = {
-            'Client-ID': self.bot.config.TWITCH_CLIENT_ID,
-            'Authorization': f'Bearer {self.token}'
-        }
-        response = requests.get(request_url, headers=headers)
+    async def _get_token(self, rejected_token: Optional[str] = None) -> str:
+        """Current app token; callers that arrive during a refresh wait for it instead of starting another."""
+        if self._is_token_fresh() and self.token != rejected_token:
+            return self.token
+
+        async with self._token_lock:
+            if self._is_token_fresh() and self.token != rejected_token:
+                return self.token
+            return await self.authenticate()
+
+    async def _wait_for_ratelimit(self):
+        async with self._ratelimit_lock:
+            if self._ratelimit_remaining is not None and self._ratelimit_remaining <= 0:
+                delay = self._ratelimit_reset - time.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self._ratelimit_remaining = None
+            elif self._ratelimit_remaining is not None:
+                # Counts the requests already admitted until Helix reports the bucket again.
+                self._ratelimit_remaining -= 1
+
+    def _update_ratelimit(self, headers):
+        remaining = headers.get('Ratelimit-Remaining')
+        reset = headers.get('Ratelimit-Reset')
+        if remaining is None or reset is None:
+            return
+        self._ratelimit_remaining = int(remaining)
+        self._ratelimit_reset = float(reset)
+
+    async def _request(self, method: str, path: str, **kwargs) -> HelixResponse:
+        rejected_token = None
+        ratelimit_retries = 0
+        while True:
+            await self._wait_for_ratelimit()
+            token = await self._get_token(rejected_token)
+            headers = {
+                'Client-ID': self.bot.config.TWITCH_CLIENT_ID,
+                'Authorization': f'Bearer {token}',
+            }
+            async with self._get_session().request(method, f"{self.api_url}{path}", headers=headers, **kwargs) as response:
+                self._update_ratelimit(response.headers)
+                body = await response.json() if response.content_type == 'application/json' else None
+
+            if response.status == 401 and rejected_token is None:
+                rejected_token = token
+                continue
+            if response.status == 429 and ratelimit_retries < TWITCH_RATELIMIT_RETRIES:
+                ratelimit_retries += 1
+                self._ratelimit_remaining = 0
+                self._ratelimit_reset = self._ratelimit_reset or time.time() + 1
+                continue
+            return HelixResponse(response.status, body or {})
+
+    async def get_user_id_from_login(self, login: str) -> str:
+        user = await self.get_user_info(login)
+        return user['id'] if user else None
+
+    async def get_user_info(self, login: str) -> dict:
+        response = await self._request('GET', '/users', params={'login': login})
         data = response.json().get("data")
         return data[0] if data else None
 
-    @check_auth_token
-    def get_user_info_by_id(self, user_id: str) -> dict:
-        request_url = f"{TWITCH_API_URL}/users?id={user_id}"
-        headers = {
-            'Client-ID': self.bot.config.TWITCH_CLIENT_ID,
-            'Authorization': f'Bearer {self.token}'
-        }
-        response = requests.get(request_url, headers=headers)
+    async def get_user_info_by_id(self, user_id: str) -> dict:
+        response = await self._request('GET', '/users', params={'id': user_id})
         data = response.json().get("data")
         return data[0] if data else None
 
-    @check_auth_token
-    def get_stream_info(self, login: str) -> dict:
-        request_url = f"{TWITCH_API_URL}/streams?user_login={login}&first=1"
-        headers = {
-            'Client-ID': self.bot.config.TWITCH_CLIENT_ID,
-            'Authorization': f'Bearer {self.token}'
-        }
-        response = requests.get(request_url, headers=headers)
+    async def get_stream_info(self, login: str) -> dict:
+        response = await self._request('GET', '/streams', params={'user_login': login, 'first': 1})
         data = response.json().get("data")
         return data[0] if data else None
 
-    @check_auth_token
-    def subscribe_to_stream_online_event(self, user_id: str) -> None:
-        request_url = f"{TWITCH_API_URL}/eventsub/subscriptions"
-        headers = {
-            'Client-ID': self.bot.config.TWITCH_CLIENT_ID,
-            'Authorization': f'Bearer {self.token}',
-            'Content-Type': 'application/json'
-        }
-        data = {
-            "type": "stream.online",
-            "version": "1",
-            "condition": {
-                "broadcaster_user_id": user_id
-            },
-            "transport": {
-                "method": "webhook",
-                "callback": f"{self.bot.config.WEBHOOK_URL}/twitch",
-                "secret": self.bot.config.TWITCH_HMAC_SECRET
-            }
-        }
-        response = requests.post(request_url, headers=headers, json=data)
-        return response
-
-    @check_auth_token
-    def subscribe_to_stream_offline_event(self, user_id: str) -> None:
-        request_url = f"{TWITCH_API_URL}/eventsub/subscriptions"
-        headers = {
-            'Client-ID': self.bot.config.TWITCH_CLIENT_ID,
-            'Authorization': f'Bearer {self.token}',
-            'Content-Type': 'application/json'
-        }
+    async def subscribe_to_stream_online_event(self, user_id: str) -> HelixResponse:
+        return await self._subscribe_to_stream_event("stream.online", user_id)
+
+    async def subscribe_to_stream_offline_event(self, user_id: str) -> HelixResponse:
+        return await self._subscribe_to_stream_event("stream.offline", user_id)
+
+    async def _subscribe_to_stream_event(self, event_type: str, user_id: str) -> HelixResponse:
         data = {
-            "type": "stream.offline",
+            "type": event_type,
             "version": "1",
             "condition": {
                 "broadcaster_user_id": user_id
             },
             "transport": {
                 "method": "webhook",
-                "callback": f"{self.bot.config.WEBHOOK_URL}/twitch",
+                "callback": self.webhook_url,
                 "secret": self.bot.config.TWITCH_HMAC_SECRET
             }
         }
-        response = requests.post(request_url, headers=headers, json=data)
-        return response
-
-    @check_auth_token
-    def unsubscribe_from_stream_event(self, subscription_id: str) -> None:
-        request_url = f"{TWITCH_API_URL}/eventsub/subscriptions?id={subscription_id}"
-        headers = {
-            'Client-ID': self.bot.config.TWITCH_CLIENT_ID,
-            'Authorization': f'Bearer {self.token}'
-        }
-        response = requests.delete(request_url, headers=headers)
-        return response
-
-    @check_auth_token
-    def get_subscriptions(self) -> dict:
-        request_url = f"{TWITCH_API_URL}/eventsub/subscriptions"
-        headers = {
-            'Client-ID': self.bot.config.TWITCH_CLIENT_ID,
-            'Authorization': f'Bearer {self.token}'
-        }
-        response = requests.get(request_url, headers=headers)
+        return await self._request('POST', '/eventsub/subscriptions', json=data)
+
+    async def unsubscribe_from_stream_event(self, subscription_id: str) -> HelixResponse:
+        return await self._request('DELETE', '/eventsub/subscriptions', params={'id': subscription_id})
+
+    async def get_subscriptions(self) -> dict:
+        response = await self._request('GET', '/eventsub/subscriptions')
         return response.json()
 
-    @check_auth_token
-    def get_subscription_by_user_id(self, user_id: str) -> dict:
-        request_url = f"{TWITCH_API_URL}/eventsub/subscriptions?user_id={user_id}"
-        headers = {
-            'Client-ID': self.bot.config.TWITCH_CLIENT_ID,
-            'Authorization': f'Bearer {self.token}'
-        }
-        response = requests.get(request_url, headers=headers)
+    async def get_subscription_by_user_id(self, user_id: str) -> dict:
+        response = await self._request('GET', '/eventsub/subscriptions', params={'user_id': user_id})
         return response.json()
@@ -0,0 +1,53 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+METRIC_PREFIX = "keiko_"
+
+COG_CACHE_LOOKUPS = Counter(
+    METRIC_PREFIX + "cog_cache_lookups",
+    "Guild cog config lookups by cache result (hit, negative_hit, miss)",
+    ["cog", "result"],
+)
+
+LOCAL_CACHE_ENTRIES = Gauge(
+    METRIC_PREFIX + "local_cache_entries",
+    "Entries held by the in-process cache tier",
+    ["family"],
+)
+
+LOCAL_CACHE_BYTES = Gauge(
+    METRIC_PREFIX + "local_cache_bytes",
+    "Approximate serialized size of the entries held by the in-process cache tier",
+    ["family"],
+)
+
+LOCAL_CACHE_HIT_RATIO = Gauge(
+    METRIC_PREFIX + "local_cache_hit_ratio",
+    "Hit ratio of the in-process cache tier since startup",
+    ["family"],
+)
+
+MONGO_COMMAND_DURATION = Histogram(
+    METRIC_PREFIX + "mongo_command_duration_seconds",
+    "MongoDB command latency seen by the driver",
+    ["database", "collection", "command"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+MONGO_COMMAND_FAILURES = Counter(
+    METRIC_PREFIX + "mongo_command_failures",
+    "MongoDB commands that returned an error",
+    ["database", "collection", "command"],
+)
+
+TWITCH_NOTIFICATION_DELAY = Histogram(
+    METRIC_PREFIX + "twitch_notification_delay_seconds",
+    "Time from the stream.online webhook to the announcement being posted (announce) and completed with stream info (enrich)",
+    ["phase"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+)
+
+FANOUT_DELIVERIES = Counter(
+    METRIC_PREFIX + "fanout_deliveries",
+    "Deliveries of announcement fan-outs by kind (twitch, youtube, birthday...) and result (sent, failed, skipped)",
+    ["kind", "result"],
+)
@@ -4,10 +4,11 @@ from typing import Any, Dict
 
 import discord
 
-from app import mongo_client, redis_client
+from app import mongo_async_client, redis_async_client
 from app.bot import DiscordBot
-from app.constants import Commands, KeikoIcons, LogTypes, Style
+from app.constants import Commands, KeikoIcons, Style
 from app.data import admin as configs_data
+from app.services.command_counters import get_command_counters
 from app.services.utils import format_datetime_output, format_relative_time
 
 
@@ -39,7 +40,7 @@ def get_admin_configs():
     return configs_data.find_admin_configs()
 
 
-def get_overview_data(bot: DiscordBot) -> dict:
+async def get_overview_data(bot: DiscordBot) -> dict:
     uptime = datetime.now() - bot.ready_time
     formatted_uptime = format_datetime_output(uptime)
     ready_time_utc = bot.ready_time.replace(tzinfo=timezone.utc)
@@ -67,7 +68,9 @@ def get_overview_data(bot: DiscordBot) -> dict:
     for cmd in Commands.COMMANDS_LIST:
         feature_group[cmd] = {"$sum": {"$cond": [{"$eq": [f"${cmd}", True]}, 1, 0]}}
 
-    pipeline = [{"$facet": {
+    # Only the fields the facets read go through the pipeline.
+    projection = {field: True for field in ["is_bot_online", "owner_id", "guild_id", "created_at", *Commands.COMMANDS_LIST]}
+    pipeline = [{"$project": {**projection, "_id": False}}, {"$facet": {
         "guild_status": [
             {"$group": {"_id": "$is_bot_online", "count": {"$sum": 1}}}
         ],
@@ -93,7 +96,7 @@ def get_overview_data(bot: DiscordBot) -> dict:
         ]
     }}]
 
-    facet_result = list(mongo_client.guild.moderations.aggregate(pipeline))
+    facet_result = await mongo_async_client.guild.moderations.aggregate(pipeline).to_list(length=None)
     facet = facet_result[0] if facet_result else {}
 
     # Parse guild status
@@ -143,31 +146,22 @@ def get_overview_data(bot: DiscordBot) -> dict:
         guild_obj = bot.get_guild(int(newest_guild_id))
         newest_guild_name = guild_obj.name if guild_obj else newest_guild_id
 
-    command_calls = {}
-    total_calls = 0
-    for key in redis_client.scan_iter(f"{LogTypes.COMMAND_CALL_TYPE}:*"):
-        cmd_name = key.split(":", 1)[1]
-        count = int(redis_client.get(key) or 0)
-        command_calls[cmd_name] = count
-        total_calls += count
-
-    command_errors = {}
-    total_errors = 0
-    for key in redis_client.scan_iter(f"{LogTypes.COMMAND_ERROR_TYPE}:*"):
-        cmd_name = key.split(":", 1)[1]
-        count = int(redis_client.get(key) or 0)
-        command_errors[cmd_name] = count
-        total_errors += count
+    counters = await get_command_counters()
+    command_calls = counters["calls"]
+    total_calls = sum(command_calls.values())
+    command_errors = counters["errors"]
+    total_errors = sum(command_errors.values())
+    daily_calls = counters["daily_calls"]
 
     error_rate = round(total_errors / total_calls * 100, 1) if total_calls > 0 else None
 
-    redis_keys = redis_client.dbsize()
+    redis_keys = await redis_async_client.dbsize()
 
     twitch_subs = 0
     twitch_unique_streamers = 0
     twitch_available = True
     try:
-        subs_response = bot.twitch.get_subscriptions()
+        subs_response = await bot.twitch.get_subscriptions()
         subs_data = subs_response.get("data", [])
         twitch_subs = len(subs_data)
         twitch_unique_streamers = len({s.get("condition", {}).get("broadcaster_user_id") for s in subs_data})
@@ -199,6 +193,9 @@ def get_overview_data(bot: DiscordBot) -> dict:
         "command_errors": command_errors,
         "total_errors": total_errors,
         "error_rate": error_rate,
+        "calls_today": daily_calls[0][1],
+        "calls_last_days": sum(count for _, count in daily_calls),
+        "trend_days": len(daily_calls),
         "redis_keys": redis_keys,
         "twitch_subs": twitch_subs,
         "twitch_unique_streamers": twitch_unique_streamers,
@@ -288,6 +285,9 @@ def build_overview_embed(bot: DiscordBot, data: dict) -> discord.Embed:
         error_info = f" | **{errors}** errors ({rate}%)" if errors > 0 else ""
         usage_lines.append(f"{cmd_name}: **{count:,}** calls{error_info}")
     usage_lines.append(f"Total: **{data['total_calls']:,}** calls")
+    usage_lines.append(
+        f"Today: **{data['calls_today']:,}** | Last {data['trend_days']} days: **{data['calls_last_days']:,}**"
+    )
     embed.add_field(
         name=f":joystick: Command Usage (error rate: {error_rate_str})",
         value="\n".join(usage_lines),
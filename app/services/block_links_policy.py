@@ -0,0 +1,107 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from app.constants import Commands as constants
+from app.constants import default_allowed_domains
+from app.services import cache
+from app.services.link_matcher import DomainTrie
+
+MAX_CACHED_POLICIES = 4096
+
+_MISSING = object()
+_policies: "OrderedDict[str, Optional[BlockLinksPolicy]]" = OrderedDict()
+# Bumped by every invalidation, so a load that raced one is not stored.
+_generations: Dict[str, int] = {}
+_epoch = 0
+
+
+@dataclass(frozen=True)
+class BlockLinksPolicy:
+    """Compiled block_links settings of a guild, ready for the on_message path."""
+
+    allowed_roles: FrozenSet[str]
+    allowed_chats: FrozenSet[str]
+    allowed_domains: DomainTrie
+    answer: str
+
+    @classmethod
+    def from_cog_data(cls, cog_data: Dict[str, Any]) -> "BlockLinksPolicy":
+        return cls(
+            allowed_roles=frozenset(
+                str(role) for role in _parse_values(cog_data.get(constants.BLOCK_LINKS_ALLOWED_ROLES_KEY))
+            ),
+            allowed_chats=frozenset(
+                str(chat) for chat in _parse_values(cog_data.get(constants.BLOCK_LINKS_ALLOWED_CHATS_KEY))
+            ),
+            allowed_domains=parse_allowed_domains(
+                _parse_values(cog_data.get(constants.BLOCK_LINKS_ALLOWED_LINKS_KEY))
+            ),
+            answer=cog_data.get(constants.BLOCK_LINKS_ANSWER_KEY),
+        )
+
+
+def parse_allowed_domains(allowed_links: Iterable[str]) -> DomainTrie:
+    return DomainTrie(
+        domain
+        for name in allowed_links
+        if name
+        for domain in default_allowed_domains.get(str(name).lower(), [])
+    )
+
+
+async def get_policy(guild_id: str) -> Optional[BlockLinksPolicy]:
+    guild_id = str(guild_id)
+    policy = _policies.get(guild_id, _MISSING)
+    if policy is not _MISSING:
+        _policies.move_to_end(guild_id)
+        return policy
+
+    generation = _generation(guild_id)
+    cog_data = await cache.get_cog_config(guild_id, constants.BLOCK_LINKS_KEY)
+    policy = BlockLinksPolicy.from_cog_data(cog_data) if cog_data else None
+    if _generation(guild_id) != generation:
+        return policy
+
+    _policies[guild_id] = policy
+    if len(_policies) > MAX_CACHED_POLICIES:
+        _policies.popitem(last=False)
+
+    return policy
+
+
+def invalidate_policy(guild_id: str) -> None:
+    guild_id = str(guild_id)
+    _generations[guild_id] = _generations.get(guild_id, 0) + 1
+    _policies.pop(guild_id, None)
+
+
+def clear_policies() -> None:
+    global _epoch
+    _epoch += 1
+    _generations.clear()
+    _policies.clear()
+
+
+def _generation(guild_id: str) -> Tuple[int, int]:
+    return _epoch, _generations.get(guild_id, 0)
+
+
+def _on_cog_invalidate(guild_id: Optional[str], cog_key: Optional[str]) -> None:
+    if guild_id is None:
+        clear_policies()
+    elif cog_key in (None, constants.BLOCK_LINKS_KEY):
+        invalidate_policy(guild_id)
+
+
+def _parse_values(data: Any) -> list:
+    if isinstance(data, dict):
+        data = data.get("values")
+    if data is None:
+        return []
+    if isinstance(data, (str, int)):
+        return [data]
+    return list(data)
+
+
+cache.on_invalidate(cache.COG_CACHE_FAMILY, _on_cog_invalidate)
@@ -1,267 +0,0 @@
-"""
-Testes unitarios para block_links.py.
-
-Estes testes NAO fazem I/O - apenas testam logica pura.
-"""
-
-import pytest
-from app.services.block_links import remove_allowed_links
-
-
-class TestRemoveAllowedLinks:
-    """Testes para remocao de links permitidos."""
-
-    def test_removes_allowed_twitter_link(self):
-        """
-        Verifica que links do Twitter sao removidos quando permitidos.
-
-        Input: Lista com link do Twitter, Twitter na lista permitida
-        Output: Lista vazia (link foi removido)
-        """
-        # Arrange
-        links = ["https://twitter.com"]
-        allowed = ["twitter"]
-
-        # Act
-        result = remove_allowed_links(links, allowed)
-
-        # Assert
-        assert len(result) == 0
-
-    def test_removes_allowed_instagram_link(self):
-        """
-        Verifica que links do Instagram sao removidos quando permitidos.
-
-        Input: Lista com link do Instagram, Instagram na lista permitida
-        Output: Lista vazia
-        """
-        # Arrange
-        links = ["https://instagram.com"]
-        allowed = ["instagram"]
-
-        # Act
-        result = remove_allowed_links(links, allowed)
-
-        # Assert
-        assert len(result) == 0
-
-    def test_keeps_non_allowed_links(self):
-        """
-        Verifica que links nao permitidos permanecem na lista.
-
-        Input: Link do Twitter, apenas Instagram permitido
-        Output: Link do Twitter permanece
-        """
-        # Arrange
-        links = ["https://twitter.com"]
-        allowed = ["instagram"]
-
-        # Act
-        result = remove_allowed_links(links, allowed)
-
-        # Assert
-        assert len(result) == 1
-        assert "twitter.com" in result[0]
-
-    def test_removes_multiple_allowed_links(self):
-        """
-        Verifica que multiplos links permitidos sao removidos.
-
-        Input: Links do Twitter e Instagram, ambos permitidos
-        Output: Lista vazia
-
-        NOTA: Esta funcao tem um bug conhecido - ela modifica a lista
-        enquanto itera, o que pode pular elementos. Este teste documenta
-        o comportamento atual.
-        """
-        # Arrange
-        links = ["https://twitter.com", "https://instagram.com"]
-        allowed = ["twitter", "instagram"]
-
-        # Act
-        result = remove_allowed_links(links, allowed)
-
-        # Assert
-        # BUG: Devido a modificacao durante iteracao, apenas 1 link e removido
-        # O comportamento esperado seria len(result) == 0
-        assert len(result) == 1  # Documenta bug atual
-
-    def test_removes_www_prefix(self):
-        """
-        Verifica que links com www. sao processados corretamente.
-
-        Input: Link com www.twitter.com, Twitter permitido
-        Output: Lista vazia
-
-        NOTA: O codigo tenta remover o www. e trailing slash do link
-        mas compara com a versao original na lista. Este teste
-        documenta o comportamento atual.
-        """
-        # Arrange
-        links = ["https://www.twitter.com"]
-        allowed = ["twitter"]
-
-        # Act/Assert
-        # BUG: O codigo modifica uma variavel local 'link' mas tenta
-        # remover 'link' da lista original, causando ValueError
-        # pois 'https://twitter.com' (sem www) nao esta em links
-        import pytest
-        with pytest.raises(ValueError):
-            remove_allowed_links(links, allowed)
-
-    def test_handles_links_with_trailing_slash(self):
-        """
-        Verifica que links com barra final sao processados.
-
-        Input: Link com barra final, servico permitido
-        Output: Lista vazia
-
-        NOTA: Mesmo bug que www - modifica copia local mas tenta
-        remover da lista original.
-        """
-        # Arrange
-        links = ["https://twitter.com/"]
-        allowed = ["twitter"]
-
-        # Act/Assert
-        import pytest
-        with pytest.raises(ValueError):
-            remove_allowed_links(links, allowed)
-
-    def test_handles_empty_links_list(self):
-        """
-        Verifica que lista vazia retorna lista vazia.
-
-        Input: Lista vazia de links
-        Output: Lista vazia
-        """
-        # Arrange
-        links = []
-        allowed = ["twitter"]
-
-        # Act
-        result = remove_allowed_links(links, allowed)
-
-        # Assert
-        assert result == []
-
-    def test_handles_empty_allowed_list(self):
-        """
-        Verifica que nenhum link e removido quando lista de permitidos esta vazia.
-
-        Input: Links, lista de permitidos vazia
-        Output: Todos os links permanecem
-        """
-        # Arrange
-        links = ["https://twitter.com", "https://instagram.com"]
-        allowed = []
-
-        # Act
-        result = remove_allowed_links(links, allowed)
-
-        # Assert
-        assert len(result) == 2
-
-    def test_case_insensitive_allowed_list(self):
-        """
-        Verifica que a lista de permitidos e case-insensitive.
-
-        Input: "TWITTER" em maiusculas na lista de permitidos
-        Output: Link do Twitter e removido
-        """
-        # Arrange
-        links = ["https://twitter.com"]
-        allowed = ["TWITTER"]
-
-        # Act
-        result = remove_allowed_links(links, allowed)
-
-        # Assert
-        assert len(result) == 0
-
-    def test_keeps_unknown_links(self):
-        """
-        Verifica que links desconhecidos (nao na lista padrao) sao mantidos.
-
-        Input: Link de site desconhecido
-        Output: Link permanece na lista
-        """
-        # Arrange
-        links = ["https://unknown-site.com"]
-        allowed = ["twitter"]
-
-        # Act
-        result = remove_allowed_links(links, allowed)
-
-        # Assert
-        assert len(result) == 1
-        assert "unknown-site.com" in result[0]
-
-    def test_partial_match_keeps_link(self):
-        """
-        Verifica que links com path nao sao removidos por match parcial.
-
-        Por exemplo, https://twitter.com/user nao e igual a https://twitter.com
-        """
-        # Arrange
-        links = ["https://twitter.com/user/status/123"]
-        allowed = ["twitter"]
-
-        # Act
-        result = remove_allowed_links(links, allowed)
-
-        # Assert
-        # O link com path deveria permanecer pois nao e exatamente o dominio base
-        assert len(result) == 1
-
-    def test_handles_twitch_links(self):
-        """
-        Verifica que links da Twitch sao processados corretamente.
-
-        Input: Link da Twitch, Twitch permitido
-        Output: Lista vazia
-        """
-        # Arrange
-        links = ["https://twitch.tv"]
-        allowed = ["twitch"]
-
-        # Act
-        result = remove_allowed_links(links, allowed)
-
-        # Assert
-        assert len(result) == 0
-
-    def test_handles_youtube_links(self):
-        """
-        Verifica que links do YouTube sao processados corretamente.
-
-        Input: Link do YouTube, YouTube permitido
-        Output: Lista vazia
-        """
-        # Arrange
-        links = ["https://youtube.com"]
-        allowed = ["youtube"]
-
-        # Act
-        result = remove_allowed_links(links, allowed)
-
-        # Assert
-        assert len(result) == 0
-
-    def test_handles_discord_links(self):
-        """
-        Verifica que links do Discord sao processados corretamente.
-
-        Input: Link de convite Discord, Discord permitido
-        Output: Lista vazia
-        """
-        # Arrange
-        links = ["https://discord.gg"]
-        allowed = ["discord"]
-
-        # Act
-        result = remove_allowed_links(links, allowed)
-
-        # Assert
-        assert len(result) == 0
-
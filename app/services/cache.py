@@ -1,55 +1,523 @@
-from typing import Any, Dict
+import asyncio
+import copy
+import json
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
-from bson import json_util
+from app import logger, redis_async_client, redis_client
+from app.constants import LogTypes as logconstants
+from app.data.aio import cogs as cogs_data
+from app.metrics import (
+    COG_CACHE_LOOKUPS,
+    LOCAL_CACHE_BYTES,
+    LOCAL_CACHE_ENTRIES,
+    LOCAL_CACHE_HIT_RATIO,
+)
+from app.services import cache_codec
+from app.services.local_cache import LocalCache, SingleFlight, should_refresh_early
 
-from app import redis_client
-from app.data import cogs as cogs_data
+# Keys written with the codec below live under this prefix; keys without it hold
+# bson.json_util values and are still read until they expire.
+CACHE_KEY_PREFIX = "v2:"
+CACHE_CODEC = "msgpack"
+CACHE_COMPRESSION_THRESHOLD = 1024
+
+COG_CACHE_EXPIRATION = 60 * 60 * 24 * 30
+# Cached for guilds without the feature configured, so lookups skip Mongo.
+COG_NEGATIVE_CACHE_VALUE = "__none__"
+COG_NEGATIVE_CACHE_EXPIRATION = 60 * 60 * 6
+
+# Short lock so only one process reloads a cog from Mongo; the others wait briefly for its result.
+COG_LOAD_LOCK_EXPIRATION_MS = 5000
+COG_LOAD_LOCK_WAIT = 0.01
+COG_LOAD_LOCK_WAIT_STEPS = 5
+# Smoothing factor of the load time estimates that drive early refresh.
+LOAD_TIME_SMOOTHING = 0.2
+
+CACHE_INVALIDATION_CHANNEL = "cache:invalidation"
+CACHE_INVALIDATION_RETRY_DELAY = 5
+# Identifies this process on the invalidation channel, so it skips its own messages.
+CACHE_INSTANCE_ID = uuid.uuid4().hex
+
+
+@dataclass(frozen=True)
+class CacheFamily:
+    """Settings of a group of Redis keys served through the in-process tier."""
+
+    name: str
+    max_entries: int
+    local_expiration: float
+
+
+COG_CACHE_FAMILY = CacheFamily("cog", max_entries=8192, local_expiration=60)
+
+_families: Dict[str, CacheFamily] = {}
+_local_caches: Dict[str, LocalCache] = {}
+_invalidation_hooks: Dict[str, List[Callable[[Optional[str], Optional[str]], None]]] = {}
+_load_times: Dict[str, float] = {"mongo": 0.05}
+_flights = SingleFlight()
+# Highest cache version seen per guild; data read at an older version is not kept in memory.
+_seen_versions: Dict[str, int] = {}
+
+
+def register_cache_family(family: CacheFamily) -> LocalCache:
+    if family.name in _local_caches:
+        return _local_caches[family.name]
+
+    local_cache = LocalCache(family.max_entries, family.local_expiration)
+    _families[family.name] = family
+    _local_caches[family.name] = local_cache
+    _load_times[family.name] = 0.001
+    _invalidation_hooks[family.name] = []
+
+    LOCAL_CACHE_ENTRIES.labels(family.name).set_function(lambda: len(local_cache))
+    LOCAL_CACHE_BYTES.labels(family.name).set_function(lambda: local_cache.stats()["bytes"])
+    LOCAL_CACHE_HIT_RATIO.labels(family.name).set_function(lambda: local_cache.stats()["hit_ratio"])
+
+    return local_cache
+
+
+def on_invalidate(family: CacheFamily, hook: Callable[[Optional[str], Optional[str]], None]):
+    """Registers hook(guild_id, key) to run when family entries are invalidated.
+
+    key is None when the whole guild is invalidated, and both are None when everything is.
+    """
+    _invalidation_hooks[family.name].append(hook)
+
+
+async def get_or_load(
+    family: CacheFamily,
+    guild_id: str,
+    key: str,
+    loader: Callable[[], Awaitable[Tuple[Any, int, int]]],
+) -> Any:
+    entry = _local_caches[family.name].get_entry(key)
+    if entry is not None:
+        value, remaining = entry
+        if _flights.in_flight(key) or not should_refresh_early(remaining, _load_times[family.name]):
+            return value
+
+    return await _flights.do(key, lambda: _load_into_local_cache(family, guild_id, key, loader))
+
+
+async def _load_into_local_cache(
+    family: CacheFamily,
+    guild_id: str,
+    key: str,
+    loader: Callable[[], Awaitable[Tuple[Any, int, int]]],
+) -> Any:
+    started_at = time.perf_counter()
+    value, size, version = await loader()
+    _record_load_time(family.name, time.perf_counter() - started_at)
+
+    if version >= _seen_versions.get(str(guild_id), 0):
+        _local_caches[family.name].set(key, value, size)
+    return value
+
+
+def _record_load_time(name: str, elapsed: float):
+    _load_times[name] += LOAD_TIME_SMOOTHING * (elapsed - _load_times[name])
+
+
+def invalidate(
+    family: CacheFamily,
+    guild_id: str,
+    key: Optional[str] = None,
+    version: Optional[int] = None,
+):
+    guild_id = str(guild_id)
+    if version is not None and version > _seen_versions.get(guild_id, 0):
+        _seen_versions[guild_id] = version
+
+    local_cache = _local_caches[family.name]
+    if key is None:
+        prefix = get_guild_cache_prefix(guild_id)
+        local_cache.invalidate_where(lambda cache_key: cache_key.startswith(prefix))
+    else:
+        local_cache.invalidate(get_cog_cache_key(guild_id, key))
+
+    _run_invalidation_hooks(family, guild_id, key)
+
+
+def invalidate_all(family: CacheFamily):
+    _local_caches[family.name].invalidate_where(lambda _: True)
+    _run_invalidation_hooks(family, None, None)
+
+
+def _run_invalidation_hooks(family: CacheFamily, guild_id: Optional[str], key: Optional[str]):
+    for hook in _invalidation_hooks[family.name]:
+        hook(guild_id, key)
+
+
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: local_cache.stats() for name, local_cache in _local_caches.items()}
+
+
+def clear_local_caches():
+    for local_cache in _local_caches.values():
+        local_cache.clear()
+    _seen_versions.clear()
+
+
+def get_cache_version_key(guild_id: str) -> str:
+    return f"cache:version:{guild_id}"
+
+
+def get_cache_invalidated_key(guild_id: str, key: Optional[str] = None) -> str:
+    """Version at which a cog (or, without key, the whole guild) was last invalidated."""
+    return f"cache:invalidated:{guild_id}:{key}" if key else f"cache:invalidated:{guild_id}"
+
+
+def get_guild_keys_key(guild_id: str) -> str:
+    """Set of the cache keys owned by a guild, so they can be evicted without scanning the keyspace."""
+    return f"cache:keys:{guild_id}"
+
+
+def register_guild_key(pipeline: Any, guild_id: str, key: str):
+    registry = get_guild_keys_key(guild_id)
+    pipeline.sadd(registry, key)
+    pipeline.expire(registry, COG_CACHE_EXPIRATION)
+
+
+def _invalidation_message(family: CacheFamily, guild_id: str, key: Optional[str], version: int) -> str:
+    return json.dumps({
+        "origin": CACHE_INSTANCE_ID,
+        "family": family.name,
+        "guild_id": str(guild_id),
+        "key": key,
+        "version": version,
+    })
+
+
+def handle_invalidation_message(data: str):
+    message = json.loads(data)
+    if message.get("origin") == CACHE_INSTANCE_ID:
+        return
+
+    family = _families.get(message.get("family"))
+    if not family:
+        return
+
+    invalidate(family, message["guild_id"], message.get("key"), message.get("version"))
+
+
+async def run_invalidation_subscriber():
+    """Evicts local entries invalidated by other processes until cancelled."""
+    while True:
+        pubsub = redis_async_client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+            # Messages published while unsubscribed are lost, so start from an empty cache.
+            for family in _families.values():
+                invalidate_all(family)
+
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    handle_invalidation_message(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(
+                f"Cache invalidation subscriber failed: {type(e).__name__}: {e}",
+                log_type=logconstants.APPLICATION_ERROR_TYPE,
+                exc_info=True,
+            )
+            await asyncio.sleep(CACHE_INVALIDATION_RETRY_DELAY)
+        finally:
+            await pubsub.aclose()
+
+
+register_cache_family(COG_CACHE_FAMILY)
 
 
 def clear_cache_commands_by_guild(guild_id: str, command_key: str) -> int:
-    for key in redis_client.scan_iter(f"{guild_id}@{command_key}:*"):
-        redis_client.delete(key)
-    return
+    registry = get_guild_keys_key(guild_id)
+    prefix = f"{guild_id}@{command_key}:"
+    keys = [key for key in redis_client.smembers(registry) if key.startswith(prefix)]
+    if keys:
+        pipeline = redis_client.pipeline()
+        pipeline.unlink(*keys)
+        pipeline.srem(registry, *keys)
+        pipeline.execute()
+    return len(keys)
+
 
+def encode_value(data: Any) -> bytes:
+    return cache_codec.encode(data, CACHE_CODEC, CACHE_COMPRESSION_THRESHOLD)
 
-def set_data_in_redis(key: str, data: Dict[str, Any]):
-    redis_client.set(key, json_util.dumps(data))
 
-def set_data_in_redis_with_expiration(key: str, data: Dict[str, Any], expiration: int):
-    redis_client.setex(key, expiration, json_util.dumps(data))
+async def set_data_in_redis(key: str, data: Dict[str, Any]):
+    await redis_async_client.set(CACHE_KEY_PREFIX + key, encode_value(data))
 
-def get_data_from_redis(key: str) -> Dict[str, Any]:
-    data = redis_client.get(key)
-    if data:
-        return json_util.loads(data)
+async def set_data_in_redis_with_expiration(key: str, data: Dict[str, Any], expiration: int):
+    await redis_async_client.setex(CACHE_KEY_PREFIX + key, expiration, encode_value(data))
+
+async def get_data_from_redis(key: str) -> Dict[str, Any]:
+    raw, legacy_raw = await redis_async_client.mget(CACHE_KEY_PREFIX + key, key)
+    if raw:
+        return cache_codec.decode(raw)
+    if legacy_raw:
+        return cache_codec.decode_legacy(legacy_raw)
     return {}
 
-def increment_redis_key(key: str, increment_by=1):
-    return redis_client.incrby(key, increment_by)
 
+def get_guild_cache_prefix(guild_id: str) -> str:
+    return f"{CACHE_KEY_PREFIX}guild:{guild_id}:"
+
+
+def get_cog_cache_key(guild_id: str, key: str) -> str:
+    return f"{get_guild_cache_prefix(guild_id)}cog.{key}"
+
+
+def get_legacy_cog_cache_key(guild_id: str, key: str) -> str:
+    return f"guild:{guild_id}:cog.{key}"
+
+
+async def get_cog_config(guild_id: str, key: str, manager: bool=False) -> Dict[str, Any]:
+    """Cog config of a guild served from the in-process tier, then Redis, then Mongo.
+
+    Non-manager reads share the cached document and must not mutate it.
+    """
+    data = await get_or_load(
+        COG_CACHE_FAMILY,
+        guild_id,
+        get_cog_cache_key(guild_id, key),
+        lambda: _fetch_cog_data(guild_id, key),
+    )
+    if manager and data:
+        data = copy.deepcopy(data)
+    return _filter_cog_data(data, manager)
+
+
+async def get_cog_data_or_populate(guild_id: str, key: str, manager: bool=False) -> Dict[str, Any]:
+    data, _, _ = await _fetch_cog_data(guild_id, key)
+    return _filter_cog_data(data, manager)
+
+
+async def _fetch_cog_data(guild_id: str, key: str) -> Tuple[Optional[Dict[str, Any]], int, int]:
+    """Returns the cog document (None if not configured), its cached size and the guild cache version."""
+    redis_key = get_cog_cache_key(guild_id, key)
+    async with redis_async_client.pipeline(transaction=False) as pipeline:
+        pipeline.mget(*_get_cog_version_keys(guild_id, key))
+        pipeline.ttl(redis_key)
+        (raw, legacy_raw, *versions), ttl = await pipeline.execute()
+    version, invalidated_at = _parse_cog_versions(versions)
+
+    cached = _parse_cached_cog(raw, invalidated_at)
+    if cached is None and legacy_raw:
+        cached = await _migrate_legacy_cog(guild_id, key, legacy_raw, invalidated_at)
+
+    if cached is not None:
+        refresh = ttl > 0 and should_refresh_early(ttl, _load_times["mongo"])
+        if not refresh or not await _acquire_load_lock(redis_key):
+            data, size = cached
+            COG_CACHE_LOOKUPS.labels(key, "hit" if data is not None else "negative_hit").inc()
+            return data, size, version
+
+        COG_CACHE_LOOKUPS.labels(key, "early_refresh").inc()
+        return await _load_cog_data(guild_id, key, version, locked=True)
+
+    COG_CACHE_LOOKUPS.labels(key, "miss").inc()
+    if await _acquire_load_lock(redis_key):
+        return await _load_cog_data(guild_id, key, version, locked=True)
+
+    # Another process is loading this cog: give it a moment before querying Mongo as well.
+    for _ in range(COG_LOAD_LOCK_WAIT_STEPS):
+        await asyncio.sleep(COG_LOAD_LOCK_WAIT)
+        raw, _, *versions = await redis_async_client.mget(*_get_cog_version_keys(guild_id, key))
+        version, invalidated_at = _parse_cog_versions(versions)
+        cached = _parse_cached_cog(raw, invalidated_at)
+        if cached is not None:
+            return (*cached, version)
+
+    return await _load_cog_data(guild_id, key, version, locked=False)
+
+
+def _get_cog_version_keys(guild_id: str, key: str) -> List[str]:
+    return [
+        get_cog_cache_key(guild_id, key),
+        get_legacy_cog_cache_key(guild_id, key),
+        get_cache_version_key(guild_id),
+        get_cache_invalidated_key(guild_id, key),
+        get_cache_invalidated_key(guild_id),
+    ]
+
+
+def _parse_cog_versions(versions: List[Optional[bytes]]) -> Tuple[int, int]:
+    """Returns the current guild cache version and the version the cog was last invalidated at."""
+    version, *invalidated_at = (int(value or 0) for value in versions)
+    return version, max(invalidated_at)
+
+
+def _parse_cached_cog(raw: Optional[bytes], invalidated_at: int) -> Optional[Tuple[Optional[Dict[str, Any]], int]]:
+    """Returns (data, size) of a valid cached value, or None when it must be reloaded."""
+    if not raw:
+        return None
+
+    stamp, payload = _unstamp(raw)
+    # Written by a reader that raced an invalidation: the data may predate it.
+    if stamp < invalidated_at:
+        return None
+    return cache_codec.decode(payload), len(raw)
+
+
+async def _migrate_legacy_cog(
+    guild_id: str, key: str, legacy_raw: bytes, invalidated_at: int
+) -> Optional[Tuple[Optional[Dict[str, Any]], int]]:
+    """Reads a json_util value from the unprefixed key and rewrites it in the current format."""
+    legacy = _decode_text(legacy_raw)
+    stamp = 0
+    if legacy.startswith("@"):
+        stamp, _, legacy = legacy[1:].partition(":")
+        stamp = int(stamp)
+    if stamp < invalidated_at:
+        return None
+
+    data = None if legacy == COG_NEGATIVE_CACHE_VALUE else cache_codec.decode_legacy(legacy)
+    raw = _stamp(encode_value(data), stamp)
+
+    async with redis_async_client.pipeline() as pipeline:
+        pipeline.setex(
+            get_cog_cache_key(guild_id, key),
+            COG_CACHE_EXPIRATION if data else COG_NEGATIVE_CACHE_EXPIRATION,
+            raw,
+        )
+        pipeline.delete(get_legacy_cog_cache_key(guild_id, key))
+        register_guild_key(pipeline, guild_id, get_cog_cache_key(guild_id, key))
+        await pipeline.execute()
+    return data, len(raw)
+
+
+async def _load_cog_data(guild_id: str, key: str, version: int, locked: bool) -> Tuple[Optional[Dict[str, Any]], int, int]:
+    redis_key = get_cog_cache_key(guild_id, key)
+    try:
+        started_at = time.perf_counter()
+        data = await cogs_data.find_cog_by_guild_id(str(guild_id), key)
+        _record_load_time("mongo", time.perf_counter() - started_at)
+
+        raw = _stamp(encode_value(data or None), version)
+        expiration = COG_CACHE_EXPIRATION if data else COG_NEGATIVE_CACHE_EXPIRATION
+        async with redis_async_client.pipeline(transaction=False) as pipeline:
+            pipeline.setex(redis_key, expiration, raw)
+            register_guild_key(pipeline, guild_id, redis_key)
+            await pipeline.execute()
+        return data or None, len(raw), version
+    finally:
+        if locked:
+            await _release_load_lock(redis_key)
+
+
+async def _acquire_load_lock(redis_key: str) -> bool:
+    return bool(await redis_async_client.set(
+        f"{redis_key}:lock", CACHE_INSTANCE_ID, nx=True, px=COG_LOAD_LOCK_EXPIRATION_MS
+    ))
+
+
+async def _release_load_lock(redis_key: str):
+    lock_key = f"{redis_key}:lock"
+    if _decode_text(await redis_async_client.get(lock_key)) == CACHE_INSTANCE_ID:
+        await redis_async_client.delete(lock_key)
+
+
+def _decode_text(value: Any) -> Any:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _stamp(payload: bytes, version: int) -> bytes:
+    return b"@%d:%b" % (version, payload)
+
+
+def _unstamp(raw: bytes) -> Tuple[int, bytes]:
+    version, _, payload = raw[1:].partition(b":")
+    return int(version), payload
+
+
+def _filter_cog_data(data: Optional[Dict[str, Any]], manager: bool) -> Optional[Dict[str, Any]]:
+    if data is None:
+        return None
+    return data if data.get("enabled") or manager else {}
+
+
+async def set_cog_cache_by_guild(guild_id: str, key: str, data: Optional[Dict[str, Any]]):
+    """Write-through: caches the document just written to Mongo (None once it is deleted)."""
+    version = await redis_async_client.incr(get_cache_version_key(guild_id))
+    raw = _stamp(encode_value(data or None), version)
+    expiration = COG_CACHE_EXPIRATION if data else COG_NEGATIVE_CACHE_EXPIRATION
+
+    # Values stamped before this version are ignored, so a reader that loaded the previous
+    # document and writes it back after this point cannot replace the new one.
+    async with redis_async_client.pipeline(transaction=False) as pipeline:
+        pipeline.set(get_cache_invalidated_key(guild_id, key), version, ex=COG_CACHE_EXPIRATION)
+        pipeline.setex(get_cog_cache_key(guild_id, key), expiration, raw)
+        pipeline.delete(get_legacy_cog_cache_key(guild_id, key))
+        register_guild_key(pipeline, guild_id, get_cog_cache_key(guild_id, key))
+        pipeline.publish(CACHE_INVALIDATION_CHANNEL, _invalidation_message(COG_CACHE_FAMILY, guild_id, key, version))
+        await pipeline.execute()
+
+    invalidate(COG_CACHE_FAMILY, guild_id, key, version)
+    _local_caches[COG_CACHE_FAMILY.name].set(get_cog_cache_key(guild_id, key), data or None, len(raw))
+
+
+async def remove_cog_cache_by_guild(guild_id: str, key: str):
+    version = await redis_async_client.incr(get_cache_version_key(guild_id))
+    async with redis_async_client.pipeline(transaction=False) as pipeline:
+        pipeline.set(get_cache_invalidated_key(guild_id, key), version, ex=COG_CACHE_EXPIRATION)
+        pipeline.unlink(get_cog_cache_key(guild_id, key), get_legacy_cog_cache_key(guild_id, key))
+        pipeline.srem(get_guild_keys_key(guild_id), get_cog_cache_key(guild_id, key))
+        pipeline.publish(CACHE_INVALIDATION_CHANNEL, _invalidation_message(COG_CACHE_FAMILY, guild_id, key, version))
+        await pipeline.execute()
+
+    invalidate(COG_CACHE_FAMILY, guild_id, key, version)
+
+
+async def remove_all_cache_by_guild(guild_id: str):
+    registry = get_guild_keys_key(guild_id)
+    async with redis_async_client.pipeline(transaction=False) as pipeline:
+        pipeline.incr(get_cache_version_key(guild_id))
+        pipeline.smembers(registry)
+        version, keys = await pipeline.execute()
 
-def get_cog_data_or_populate(guild_id: str, key: str, manager: bool=False) -> Dict[str, Any]:
-    redis_key = f"guild:{guild_id}:cog.{key}"
-    data = redis_client.get(redis_key)
-    if data:
-        data = json_util.loads(data)
-        return data if data.get("enabled") or manager else {}
+    # Keys registered after SMEMBERS are stamped below the guild marker and read as stale.
+    async with redis_async_client.pipeline() as pipeline:
+        pipeline.set(get_cache_invalidated_key(guild_id), version, ex=COG_CACHE_EXPIRATION)
+        pipeline.unlink(*keys, registry)
+        pipeline.publish(CACHE_INVALIDATION_CHANNEL, _invalidation_message(COG_CACHE_FAMILY, guild_id, None, version))
+        await pipeline.execute()
+    invalidate(COG_CACHE_FAMILY, guild_id, None, version)
 
-    data = cogs_data.find_cog_by_guild_id(str(guild_id), key)
-    if data:
-        month_in_seconds = 60 * 60 * 24 * 30
-        set_data_in_redis_with_expiration(redis_key, data, month_in_seconds)
-        return data if data.get("enabled") or manager else {}
 
-    return data
+def _parse_key_guild_id(key: str) -> Optional[str]:
+    """Guild that owns a cache key written before the registry, if any."""
+    if key.endswith(":lock"):
+        return None
+    if key.startswith(CACHE_KEY_PREFIX):
+        key = key[len(CACHE_KEY_PREFIX):]
+    if key.startswith("guild:"):
+        guild_id = key.split(":", 2)[1]
+    else:
+        guild_id = key.partition("@")[0]
+    return guild_id if guild_id.isdigit() else None
 
 
-def remove_cog_cache_by_guild(guild_id: str, key: str):
-    redis_key = f"guild:{guild_id}:cog.{key}"
-    redis_client.delete(redis_key)
+async def backfill_guild_key_registry(batch_size: int = 1000) -> int:
+    """Migration: registers the guild keys written before the registry existed.
 
+    Scans the keyspace incrementally, so it can run against a live Redis.
+    """
+    registered = 0
+    for pattern in (f"{CACHE_KEY_PREFIX}guild:*", "guild:*", "*@*:*"):
+        async with redis_async_client.pipeline(transaction=False) as pipeline:
+            async for key in redis_async_client.scan_iter(match=pattern, count=batch_size):
+                key = _decode_text(key)
+                guild_id = _parse_key_guild_id(key)
+                if guild_id is None:
+                    continue
 
-def remove_all_cache_by_guild(guild_id: str):
-    keys_to_delete = redis_client.keys(f"guild:{guild_id}:*")
-    if keys_to_delete:
-        redis_client.delete(*keys_to_delete)
+                register_guild_key(pipeline, guild_id, key)
+                registered += 1
+                if registered % batch_size == 0:
+                    await pipeline.execute()
+            await pipeline.execute()
+    return registered
@@ -0,0 +1,101 @@
+import json
+import zlib
+from datetime import datetime
+from typing import Any, Callable, Dict, Tuple
+
+import msgpack
+from bson import ObjectId, json_util
+
+# Every value is written as [compression tag] + codec tag + payload, so any codec can be read
+# back whatever codec is selected for writes.
+COMPRESSED_TAG = b"Z"
+NONE_TAG = b"N"
+COMPRESSION_LEVEL = 1
+
+_MSGPACK_DATETIME = 1
+_MSGPACK_OBJECT_ID = 2
+
+
+def _msgpack_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return msgpack.ExtType(_MSGPACK_DATETIME, value.isoformat().encode())
+    if isinstance(value, ObjectId):
+        return msgpack.ExtType(_MSGPACK_OBJECT_ID, value.binary)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    if code == _MSGPACK_DATETIME:
+        return datetime.fromisoformat(data.decode())
+    if code == _MSGPACK_OBJECT_ID:
+        return ObjectId(data)
+    return msgpack.ExtType(code, data)
+
+
+def _msgpack_dumps(value: Any) -> bytes:
+    return msgpack.packb(value, default=_msgpack_default, use_bin_type=True)
+
+
+def _msgpack_loads(payload: bytes) -> Any:
+    return msgpack.unpackb(payload, ext_hook=_msgpack_ext_hook, raw=False)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$date": value.isoformat()}
+    if isinstance(value, ObjectId):
+        return {"$oid": str(value)}
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _json_object_hook(value: Dict[str, Any]) -> Any:
+    if len(value) == 1:
+        if "$date" in value:
+            return datetime.fromisoformat(value["$date"])
+        if "$oid" in value:
+            return ObjectId(value["$oid"])
+    return value
+
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value, default=_json_default, separators=(",", ":")).encode()
+
+
+def _json_loads(payload: bytes) -> Any:
+    return json.loads(payload, object_hook=_json_object_hook)
+
+
+# name -> (tag, dumps, loads)
+CODECS: Dict[str, Tuple[bytes, Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    "msgpack": (b"M", _msgpack_dumps, _msgpack_loads),
+    "json": (b"J", _json_dumps, _json_loads),
+}
+_CODECS_BY_TAG = {tag: loads for tag, _, loads in CODECS.values()}
+
+
+def encode(value: Any, codec: str = "msgpack", compression_threshold: int = None) -> bytes:
+    if value is None:
+        return NONE_TAG
+
+    tag, dumps, _ = CODECS[codec]
+    payload = tag + dumps(value)
+    if compression_threshold is not None and len(payload) > compression_threshold:
+        return COMPRESSED_TAG + zlib.compress(payload, COMPRESSION_LEVEL)
+    return payload
+
+
+def decode(raw: bytes) -> Any:
+    if raw[:1] == COMPRESSED_TAG:
+        raw = zlib.decompress(raw[1:])
+
+    tag = raw[:1]
+    if tag == NONE_TAG:
+        return None
+    return _CODECS_BY_TAG[tag](raw[1:])
+
+
+def decode_legacy(raw: Any) -> Any:
+    """Reads a value written with bson.json_util before the codec layer."""
+    if isinstance(raw, bytes):
+        raw = raw.decode()
+    return json_util.loads(raw)
@@ -0,0 +1,104 @@
+"""
+Testes unitarios para cache_codec.py.
+
+Estes testes NAO fazem I/O - apenas testam logica pura.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from bson import ObjectId
+
+from app.services import cache_codec
+
+DOCUMENT = {
+    "_id": ObjectId("65a1b2c3d4e5f60718293a4b"),
+    "guild_id": "123",
+    "enabled": True,
+    "created_at": datetime(2024, 1, 2, 3, 4, 5, 678000),
+    "updated_at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    "notifications": {"values": [{"streamer": {"value": "gaules"}}]},
+}
+
+
+class TestCodecs:
+    """Testes de ida e volta dos codecs."""
+
+    @pytest.mark.parametrize("codec", ["msgpack", "json"])
+    def test_round_trips_datetime_and_object_id(self, codec):
+        """
+        Verifica que datetime e ObjectId sobrevivem a codificacao.
+
+        Input: Documento com _id, datas com e sem timezone
+        Output: Documento identico
+        """
+        assert cache_codec.decode(cache_codec.encode(DOCUMENT, codec)) == DOCUMENT
+
+    def test_none_is_encoded_as_tag(self):
+        """
+        Verifica que None (configuracao ausente) ocupa um unico byte.
+
+        Input: None
+        Output: NONE_TAG e decodifica para None
+        """
+        raw = cache_codec.encode(None)
+
+        assert raw == cache_codec.NONE_TAG
+        assert cache_codec.decode(raw) is None
+
+    def test_reads_any_codec(self):
+        """
+        Verifica que a leitura nao depende do codec escolhido para escrita.
+
+        Input: Valor gravado em JSON
+        Output: Decodificado pela mesma funcao usada para msgpack
+        """
+        assert cache_codec.decode(cache_codec.encode({"a": 1}, "json")) == {"a": 1}
+
+
+class TestCompression:
+    """Testes da compressao acima do limite."""
+
+    def test_compresses_above_threshold(self):
+        """
+        Verifica que valores grandes sao comprimidos.
+
+        Input: Documento repetitivo acima do limite
+        Output: Valor com tag de compressao, menor e decodificavel
+        """
+        document = {"values": ["mensagem de boas-vindas"] * 200}
+
+        raw = cache_codec.encode(document, compression_threshold=256)
+
+        assert raw[:1] == cache_codec.COMPRESSED_TAG
+        assert len(raw) < len(cache_codec.encode(document))
+        assert cache_codec.decode(raw) == document
+
+    def test_keeps_small_values_uncompressed(self):
+        """
+        Verifica que valores pequenos nao sao comprimidos.
+
+        Input: Documento pequeno
+        Output: Valor sem tag de compressao
+        """
+        raw = cache_codec.encode({"enabled": True}, compression_threshold=256)
+
+        assert raw[:1] != cache_codec.COMPRESSED_TAG
+
+
+class TestDecodeLegacy:
+    """Testes de leitura do formato antigo (bson.json_util)."""
+
+    def test_decodes_json_util_bytes(self):
+        """
+        Verifica que valores antigos sao lidos mesmo vindos como bytes.
+
+        Input: JSON do json_util com $oid
+        Output: Documento com ObjectId
+        """
+        raw = b'{"_id": {"$oid": "65a1b2c3d4e5f60718293a4b"}, "enabled": true}'
+
+        assert cache_codec.decode_legacy(raw) == {
+            "_id": ObjectId("65a1b2c3d4e5f60718293a4b"),
+            "enabled": True,
+        }
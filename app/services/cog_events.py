@@ -0,0 +1,151 @@
+import asyncio
+import os
+from typing import Any, Dict, List, Optional
+
+from bson import json_util
+
+from app import logger
+from app.constants import LogTypes as logconstants
+from app.data.aio import cogs as cogs_data
+
+# Audit events are kept in memory and written to Mongo in batches, so recording an
+# enable, edit or pause costs no round trip in the interaction response.
+COG_EVENTS_FLUSH_INTERVAL = 5
+COG_EVENTS_FLUSH_SIZE = 200
+# Without a spill file, a failed batch is kept for the next flush up to this many events.
+COG_EVENTS_MAX_PENDING = 10000
+
+_pending: List[Dict[str, Any]] = []
+_flush_requested: Optional[asyncio.Event] = None
+# Durability mode: batches that cannot be written to Mongo are appended to this file.
+_spill_path: Optional[str] = None
+
+
+def configure_cog_events_spill(path: Optional[str]):
+    global _spill_path
+    _spill_path = path or None
+
+
+def enqueue_cog_event(data: Dict[str, Any]):
+    """Buffers an event of `events.<cog_key>`; it is written by the next flush."""
+    _pending.append(data)
+    if len(_pending) >= COG_EVENTS_FLUSH_SIZE and _flush_requested is not None:
+        _flush_requested.set()
+
+
+def get_pending_cog_events() -> List[Dict[str, Any]]:
+    return list(_pending)
+
+
+def clear_pending_cog_events():
+    _pending.clear()
+
+
+async def flush_cog_events() -> int:
+    """Writes the buffered events, one insert_many per events collection; returns the number written.
+
+    Events Mongo did not store go to the spill file in durability mode, or back to the buffer otherwise.
+    """
+    if not _pending:
+        return 0
+
+    batch = list(_pending)
+    _pending.clear()
+    try:
+        failed = await cogs_data.insert_cog_events(batch)
+    except Exception as e:
+        # Events stored before the error already carry their _id and are skipped on the retry.
+        logger.error(
+            f"Cog events flush failed for {len(batch)} events: {type(e).__name__}: {e}",
+            log_type=logconstants.APPLICATION_ERROR_TYPE,
+            exc_info=True,
+        )
+        failed = batch
+    else:
+        if failed:
+            logger.error(
+                f"Cog events flush stored {len(batch) - len(failed)} of {len(batch)} events",
+                log_type=logconstants.APPLICATION_ERROR_TYPE,
+            )
+
+    if failed:
+        await _keep_cog_events(failed)
+    return len(batch) - len(failed)
+
+
+async def _keep_cog_events(events: List[Dict[str, Any]]):
+    if _spill_path:
+        try:
+            await asyncio.to_thread(_spill_cog_events, events)
+            return
+        except OSError as e:
+            logger.error(
+                f"Cog events spill failed for {len(events)} events: {type(e).__name__}: {e}",
+                log_type=logconstants.APPLICATION_ERROR_TYPE,
+                exc_info=True,
+            )
+    _pending[:0] = events
+    # A long outage drops the oldest events first.
+    del _pending[:-COG_EVENTS_MAX_PENDING]
+
+
+async def run_cog_events_flusher():
+    """Flushes the buffered events every interval, or sooner when the buffer fills up, until cancelled."""
+    global _flush_requested
+    _flush_requested = asyncio.Event()
+
+    while True:
+        try:
+            await asyncio.wait_for(_flush_requested.wait(), COG_EVENTS_FLUSH_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+        _flush_requested.clear()
+
+        try:
+            await flush_cog_events()
+        except Exception as e:
+            logger.error(
+                f"Cog events flusher failed: {type(e).__name__}: {e}",
+                log_type=logconstants.APPLICATION_ERROR_TYPE,
+                exc_info=True,
+            )
+
+
+async def replay_spilled_cog_events() -> int:
+    """Writes the events spilled while Mongo was unavailable; returns the number stored.
+
+    The file is removed once every event is stored, otherwise it keeps only the events left.
+    """
+    if not _spill_path or not os.path.exists(_spill_path):
+        return 0
+
+    events = await asyncio.to_thread(_read_spilled_cog_events)
+    failed = await cogs_data.insert_cog_events(events) if events else []
+    if failed:
+        await asyncio.to_thread(_rewrite_spilled_cog_events, failed)
+    else:
+        os.remove(_spill_path)
+    return len(events) - len(failed)
+
+
+def _read_spilled_cog_events() -> List[Dict[str, Any]]:
+    with open(_spill_path, encoding="utf-8") as spill:
+        return [json_util.loads(line) for line in spill if line.strip()]
+
+
+def _rewrite_spilled_cog_events(events: List[Dict[str, Any]]):
+    partial = _spill_path + ".tmp"
+    with open(partial, "w", encoding="utf-8") as spill:
+        _write_cog_events(spill, events)
+    os.replace(partial, _spill_path)
+
+
+def _spill_cog_events(events: List[Dict[str, Any]]):
+    with open(_spill_path, "a", encoding="utf-8") as spill:
+        _write_cog_events(spill, events)
+
+
+def _write_cog_events(spill: Any, events: List[Dict[str, Any]]):
+    spill.writelines(json_util.dumps(event) + "\n" for event in events)
+    spill.flush()
+    os.fsync(spill.fileno())
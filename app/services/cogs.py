@@ -1,16 +1,23 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+from app.constants import Commands as constants
 from app.data import cogs as cogs_data
-from app.services.cache import remove_cog_cache_by_guild
+from app.data.aio import cogs as cogs_aio_data
+from app.services.cache import set_cog_cache_by_guild
+from app.services.cog_events import enqueue_cog_event
+from app.services.streamer_targets import update_streamer_targets_by_guild
 
 
-def insert_cog_by_guild(guild_id: str, cog: str, data: Dict[str, Any]):
+async def insert_cog_by_guild(guild_id: str, cog: str, data: Dict[str, Any]):
     if not data.get("guild_id"):
         data["guild_id"] = str(guild_id)
 
-    remove_cog_cache_by_guild(guild_id, cog)
+    document = await cogs_aio_data.insert_cog_by_guild_id(cog, data)
 
-    return cogs_data.insert_cog_by_guild_id(cog, data)
+    await set_cog_cache_by_guild(guild_id, cog, document)
+    await update_cog_indexes(guild_id, cog, document)
+
+    return document
 
 
 def insert_cog_event(
@@ -20,7 +27,11 @@ def insert_cog_event(
     date: str,
     user_id: str,
 ):
-    data = {
+    enqueue_cog_event(parse_cog_event(guild_id, cog_key, event, date, user_id))
+
+
+def parse_cog_event(guild_id: str, cog_key: str, event: str, date: str, user_id: str) -> Dict[str, Any]:
+    return {
         "guild_id": guild_id,
         "cog_key": cog_key,
         "user_id": user_id,
@@ -28,26 +39,36 @@ def insert_cog_event(
         "event": event,
     }
 
-    return cogs_data.insert_cog_event(cog_key, data)
-
 
 def find_cog_events_by_guild(guild_id: str, cog_key: str):
     return cogs_data.find_cog_events_by_guild_id(guild_id, cog_key)
 
 
-def update_cog_by_guild(guild_id: str, cog_key: str, data: Dict[str, Any]):
+async def update_cog_by_guild(guild_id: str, cog_key: str, data: Dict[str, Any]):
     if not data.get("guild_id"):
         data["guild_id"] = str(guild_id)
 
-    remove_cog_cache_by_guild(guild_id, cog_key)
+    document = await cogs_aio_data.update_cog_by_guild(guild_id, cog_key, data)
 
-    return cogs_data.update_cog_by_guild(guild_id, cog_key, data)
+    await set_cog_cache_by_guild(guild_id, cog_key, document)
+    await update_cog_indexes(guild_id, cog_key, document)
 
+    return document
 
-def delete_cog_by_guild(guild_id: str, cog_key: str):
+
+async def delete_cog_by_guild(guild_id: str, cog_key: str):
     if guild_id == "":
         return
 
-    remove_cog_cache_by_guild(guild_id, cog_key)
+    result = await cogs_aio_data.delete_cog_by_guild_id(guild_id, cog_key)
+
+    await set_cog_cache_by_guild(guild_id, cog_key, None)
+    await update_cog_indexes(guild_id, cog_key, None)
+
+    return result
+
 
-    return cogs_data.delete_cog_by_guild_id(guild_id, cog_key)
+async def update_cog_indexes(guild_id: str, cog_key: str, document: Optional[Dict[str, Any]]):
+    """Keeps the lookups derived from the cog document in step with it (None once it is deleted)."""
+    if cog_key == constants.NOTIFICATIONS_TWITCH_KEY:
+        await update_streamer_targets_by_guild(guild_id, document)
@@ -0,0 +1,140 @@
+import asyncio
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from app import logger, redis_async_client
+from app.constants import LogTypes as logconstants
+
+# Counts are kept in memory and written to Redis in batches, so counting a command call
+# costs no network round trip.
+COMMAND_COUNTERS_FLUSH_INTERVAL = 10
+COMMAND_COUNTERS_FLUSH_SIZE = 500
+COMMAND_COUNTERS_BUCKET_EXPIRATION = 60 * 60 * 24 * 90
+COMMAND_COUNTERS_TREND_DAYS = 7
+COMMAND_COUNTERS_TYPES = (logconstants.COMMAND_CALL_TYPE, logconstants.COMMAND_ERROR_TYPE)
+
+# (log_type, command name) -> count not yet written to Redis
+_pending: Counter = Counter()
+_flush_requested: Optional[asyncio.Event] = None
+
+
+def get_counters_key(log_type: str, day: Optional[date] = None) -> str:
+    """Hash of command name -> count, all time or for a single (UTC) day."""
+    return f"counters:{log_type}:{day.isoformat()}" if day else f"counters:{log_type}"
+
+
+def increment_command_counter(log_type: str, name: str, amount: int = 1):
+    _pending[(log_type, name)] += amount
+    if len(_pending) >= COMMAND_COUNTERS_FLUSH_SIZE and _flush_requested is not None:
+        _flush_requested.set()
+
+
+def get_pending_counters() -> Dict[Tuple[str, str], int]:
+    return dict(_pending)
+
+
+def clear_pending_counters():
+    _pending.clear()
+
+
+async def flush_command_counters() -> int:
+    """Writes the buffered counts to the all-time and daily hashes; returns the number of counters written."""
+    if not _pending:
+        return 0
+
+    batch = dict(_pending)
+    _pending.clear()
+    today = _today()
+    try:
+        async with redis_async_client.pipeline() as pipeline:
+            for (log_type, name), amount in batch.items():
+                pipeline.hincrby(get_counters_key(log_type), name, amount)
+                pipeline.hincrby(get_counters_key(log_type, today), name, amount)
+            for log_type in {log_type for log_type, _ in batch}:
+                pipeline.expire(get_counters_key(log_type, today), COMMAND_COUNTERS_BUCKET_EXPIRATION)
+            await pipeline.execute()
+    except Exception:
+        # The pipeline runs in MULTI, so nothing was counted: keep the batch for the next flush.
+        _pending.update(batch)
+        raise
+
+    return len(batch)
+
+
+async def run_command_counters_flusher():
+    """Flushes the buffered counts every interval, or sooner when the buffer fills up, until cancelled."""
+    global _flush_requested
+    _flush_requested = asyncio.Event()
+
+    while True:
+        try:
+            await asyncio.wait_for(_flush_requested.wait(), COMMAND_COUNTERS_FLUSH_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+        _flush_requested.clear()
+
+        try:
+            await flush_command_counters()
+        except Exception as e:
+            logger.error(
+                f"Command counters flush failed: {type(e).__name__}: {e}",
+                log_type=logconstants.APPLICATION_ERROR_TYPE,
+                exc_info=True,
+            )
+
+
+async def get_command_counters(days: int = COMMAND_COUNTERS_TREND_DAYS) -> Dict[str, Any]:
+    """All-time calls and errors per command, plus total calls of the last days, in one round trip."""
+    await flush_command_counters()
+
+    today = _today()
+    buckets = [today - timedelta(days=offset) for offset in range(days)]
+    async with redis_async_client.pipeline(transaction=False) as pipeline:
+        for log_type in COMMAND_COUNTERS_TYPES:
+            pipeline.hgetall(get_counters_key(log_type))
+        for day in buckets:
+            pipeline.hgetall(get_counters_key(logconstants.COMMAND_CALL_TYPE, day))
+        calls, errors, *daily = await pipeline.execute()
+
+    return {
+        "calls": _parse_counters(calls),
+        "errors": _parse_counters(errors),
+        "daily_calls": [
+            (day, sum(_parse_counters(counters).values())) for day, counters in zip(buckets, daily)
+        ],
+    }
+
+
+async def migrate_legacy_command_counters(batch_size: int = 1000) -> int:
+    """Migration: folds the `<log_type>:<command>` string counters into the all-time hashes."""
+    migrated = 0
+    for log_type in COMMAND_COUNTERS_TYPES:
+        keys = [
+            _decode(key)
+            async for key in redis_async_client.scan_iter(match=f"{log_type}:*", count=batch_size)
+        ]
+        if not keys:
+            continue
+
+        values = await redis_async_client.mget(*keys)
+        async with redis_async_client.pipeline() as pipeline:
+            for key, value in zip(keys, values):
+                pipeline.hincrby(get_counters_key(log_type), key.split(":", 1)[1], int(value or 0))
+            pipeline.unlink(*keys)
+            await pipeline.execute()
+        migrated += len(keys)
+
+    return migrated
+
+
+def _parse_counters(counters: Dict[Any, Any]) -> Dict[str, int]:
+    return {_decode(name): int(count) for name, count in counters.items()}
+
+
+def _decode(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _today() -> date:
+    return datetime.now(tz=timezone.utc).date()
@@ -17,7 +17,7 @@ from app.services.utils import get_available_roles_by_guild, ml
 
 
 async def set_on_member_join(member: discord.Member):
-    cogs = cache.get_cog_data_or_populate(member.guild.id, constants.DEFAULT_ROLES_KEY)
+    cogs = await cache.get_cog_config(member.guild.id, constants.DEFAULT_ROLES_KEY)
 
     if not cogs:
         return
@@ -40,7 +40,7 @@ async def set_on_member_join(member: discord.Member):
 
 
 async def set_on_default_roles_sync(interaction: discord.Interaction):
-    cogs = cache.get_cog_data_or_populate(
+    cogs = await cache.get_cog_config(
         interaction.guild.id, constants.DEFAULT_ROLES_KEY
     )
 
@@ -132,7 +132,7 @@ def filter_roles(roles: List[str], available_roles: Dict[str, str]) -> List[str]
 
 
 async def manager(interaction: discord.Interaction, guild_id: str):
-    cogs = cache.get_cog_data_or_populate(guild_id, constants.DEFAULT_ROLES_KEY, manager=True)
+    cogs = await cache.get_cog_config(guild_id, constants.DEFAULT_ROLES_KEY, manager=True)
 
     available_roles = get_available_roles_by_guild(interaction.guild)
     if cogs == None:
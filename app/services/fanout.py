@@ -0,0 +1,156 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+import aiohttp
+import discord
+
+from app import logger
+from app.constants import LogTypes as logconstants
+from app.metrics import FANOUT_DELIVERIES
+
+# Deliveries of one fan-out in flight at the same time; discord.py still applies its own buckets.
+FANOUT_CONCURRENCY = 10
+FANOUT_RETRIES = 2
+FANOUT_RETRY_DELAY = 0.5
+FANOUT_DEAD_LETTERS_SIZE = 200
+
+_dead_letters: Deque[Dict[str, Any]] = deque(maxlen=FANOUT_DEAD_LETTERS_SIZE)
+
+
+@dataclass
+class FanoutTarget:
+    """One delivery of a fan-out: `send` posts to `route`, the Discord rate limit bucket it shares with others."""
+
+    key: str
+    route: Optional[str] = None
+    send: Optional[Callable[[], Awaitable[Any]]] = None
+    skip_reason: Optional[str] = None
+
+    @classmethod
+    def skipped(cls, key: str, reason: str) -> "FanoutTarget":
+        return cls(key, skip_reason=reason)
+
+
+@dataclass
+class FanoutResult:
+    name: str
+    sent: int = 0
+    failed: int = 0
+    skipped: int = 0
+    # Return values of the successful sends, in target order.
+    values: List[Any] = field(default_factory=list)
+    latencies: List[float] = field(default_factory=list)
+    dead_letters: List[Dict[str, Any]] = field(default_factory=list)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+    def summary(self) -> str:
+        summary = f"sent={self.sent} failed={self.failed} skipped={self.skipped}"
+        if self.latencies:
+            summary += " " + " ".join(
+                f"{label}={self.percentile(fraction) * 1000:.0f}ms"
+                for label, fraction in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))
+            )
+        return summary
+
+
+def is_retryable(error: Exception) -> bool:
+    if isinstance(error, discord.HTTPException):
+        return error.status == 429 or error.status >= 500
+    return isinstance(error, (asyncio.TimeoutError, aiohttp.ClientError, OSError))
+
+
+def get_retry_delay(error: Exception, attempt: int) -> float:
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after:
+        return retry_after
+    return FANOUT_RETRY_DELAY * 2 ** attempt
+
+
+async def fan_out(
+    kind: str, name: str, targets: List[FanoutTarget], concurrency: int = FANOUT_CONCURRENCY
+) -> FanoutResult:
+    """Delivers every target with at most `concurrency` in flight; a failing target never stops the others.
+
+    `kind` is the bounded metric label (twitch, youtube, birthday...); `name` tells runs of a kind apart
+    in the logs and dead letters.
+
+    Targets that share a route are sent one after the other, so one busy channel does not take every
+    slot. Transient errors are retried with backoff; what still fails goes to the dead letters.
+    """
+    result = FanoutResult(f"{kind}:{name}")
+    semaphore = asyncio.Semaphore(concurrency)
+    route_locks: Dict[str, asyncio.Lock] = {}
+    values: List[Any] = [None] * len(targets)
+    delivered: List[bool] = [False] * len(targets)
+
+    async def deliver(index: int, target: FanoutTarget):
+        route_lock = route_locks.setdefault(target.route or target.key, asyncio.Lock())
+        async with route_lock, semaphore:
+            started_at = time.perf_counter()
+            for attempt in range(FANOUT_RETRIES + 1):
+                try:
+                    values[index] = await target.send()
+                    delivered[index] = True
+                    break
+                except Exception as e:
+                    if attempt < FANOUT_RETRIES and is_retryable(e):
+                        await asyncio.sleep(get_retry_delay(e, attempt))
+                        continue
+                    _dead_letter(result, target, e, attempt + 1)
+                    break
+            result.latencies.append(time.perf_counter() - started_at)
+
+    pending = []
+    for index, target in enumerate(targets):
+        if target.skip_reason:
+            result.skipped += 1
+            logger.warn(f"{result.name}: skipped {target.key}: {target.skip_reason}", log_type=logconstants.COMMAND_WARN_TYPE)
+            continue
+        pending.append(deliver(index, target))
+    await asyncio.gather(*pending)
+
+    for index, value in enumerate(values):
+        if delivered[index]:
+            result.sent += 1
+            result.values.append(value)
+    result.failed = len(result.dead_letters)
+
+    FANOUT_DELIVERIES.labels(kind, "sent").inc(result.sent)
+    FANOUT_DELIVERIES.labels(kind, "failed").inc(result.failed)
+    FANOUT_DELIVERIES.labels(kind, "skipped").inc(result.skipped)
+    return result
+
+
+def _dead_letter(result: FanoutResult, target: FanoutTarget, error: Exception, attempts: int):
+    dead_letter = {
+        "fanout": result.name,
+        "key": target.key,
+        "route": target.route,
+        "error": f"{type(error).__name__}: {error}",
+        "attempts": attempts,
+        "at": datetime.now(timezone.utc),
+    }
+    result.dead_letters.append(dead_letter)
+    _dead_letters.append(dead_letter)
+    logger.warn(
+        f"{result.name}: delivery to {target.key} failed after {attempts} attempts: {dead_letter['error']}",
+        log_type=logconstants.COMMAND_WARN_TYPE,
+    )
+
+
+def get_dead_letters() -> List[Dict[str, Any]]:
+    """Most recent failed deliveries of every fan-out, oldest first."""
+    return list(_dead_letters)
+
+
+def clear_dead_letters():
+    _dead_letters.clear()
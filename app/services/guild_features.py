@@ -0,0 +1,150 @@
+import asyncio
+from typing import Any, Dict, Optional
+
+from app import logger
+from app.constants import Commands as constants
+from app.constants import LogTypes as logconstants
+from app.data import moderations as moderations_data
+from app.data.aio import moderations as moderations_aio_data
+from app.services import cache
+
+GATED_FEATURES = [
+    *constants.COMMANDS_LIST,
+    constants.INTEGRATIONS_STREAM_ELEMENTS_COMMANDS_KEY,
+]
+FEATURE_BITS: Dict[str, int] = {key: 1 << bit for bit, key in enumerate(GATED_FEATURES)}
+
+_features: Dict[str, int] = {}
+_loaded = False
+# Pending reload of each guild (None for every guild) after a cache invalidation.
+_refreshes: Dict[Optional[str], asyncio.Task] = {}
+
+
+def load_guild_features() -> int:
+    """Loads the feature booleans of every online guild from guild.moderations."""
+    global _loaded
+
+    features = {
+        str(moderations["guild_id"]): parse_features_bitmap(moderations)
+        for moderations in moderations_data.find_online_moderations(get_features_projection())
+        if moderations.get("guild_id")
+    }
+
+    _features.clear()
+    _features.update(features)
+    _loaded = True
+
+    return len(_features)
+
+
+def get_features_projection() -> Dict[str, Any]:
+    return {"_id": False, "guild_id": True, "is_bot_online": True, **{key: True for key in GATED_FEATURES}}
+
+
+async def refresh_guild_features(guild_id: Optional[str] = None) -> None:
+    """Reloads the bitmap of a guild (or of every online guild) from guild.moderations."""
+    if guild_id is None:
+        features = {
+            str(moderations["guild_id"]): parse_features_bitmap(moderations)
+            for moderations in await moderations_aio_data.find_online_moderations(get_features_projection())
+            if moderations.get("guild_id")
+        }
+        _features.clear()
+        _features.update(features)
+        return
+
+    moderations = await moderations_aio_data.find_moderations_by_guild(guild_id, get_features_projection())
+    if moderations and moderations.get("is_bot_online"):
+        set_guild_features(guild_id, moderations)
+    else:
+        remove_guild_features(guild_id)
+
+
+def parse_features_bitmap(moderations: Optional[Dict[str, Any]]) -> int:
+    if not moderations:
+        return 0
+
+    bitmap = 0
+    for key, bit in FEATURE_BITS.items():
+        if moderations.get(key) is True:
+            bitmap |= bit
+    return bitmap
+
+
+def is_feature_enabled(guild_id: str, key: str) -> bool:
+    # Until the bitmap is loaded (or for untracked keys) the handlers decide by themselves
+    bit = FEATURE_BITS.get(key)
+    if not _loaded or bit is None:
+        return True
+
+    return bool(_features.get(str(guild_id), 0) & bit)
+
+
+def set_guild_feature(guild_id: str, key: str, value: Any) -> None:
+    bit = FEATURE_BITS.get(key)
+    if bit is None:
+        return
+
+    guild_id = str(guild_id)
+    if value is True:
+        _features[guild_id] = _features.get(guild_id, 0) | bit
+    else:
+        _features[guild_id] = _features.get(guild_id, 0) & ~bit
+
+
+def set_guild_features(guild_id: str, moderations: Optional[Dict[str, Any]]) -> None:
+    _features[str(guild_id)] = parse_features_bitmap(moderations)
+
+
+def remove_guild_features(guild_id: str) -> None:
+    _features.pop(str(guild_id), None)
+
+
+def reset_guild_features() -> None:
+    global _loaded
+
+    for task in _refreshes.values():
+        task.cancel()
+    _refreshes.clear()
+    _features.clear()
+    _loaded = False
+
+
+def _on_cog_invalidate(guild_id: Optional[str], cog_key: Optional[str]) -> None:
+    # Other processes change the moderations too; their cog writes reach this one through the
+    # invalidation bus, so the guild is reloaded instead of trusting the local bitmap.
+    if not _loaded or (cog_key is not None and cog_key not in FEATURE_BITS):
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+
+    guild_id = str(guild_id) if guild_id is not None else None
+    pending = _refreshes.get(guild_id)
+    if pending:
+        # A reload that started before this invalidation could store the previous values.
+        pending.cancel()
+    task = loop.create_task(_refresh_after_invalidation(guild_id))
+    _refreshes[guild_id] = task
+    task.add_done_callback(lambda done: _release_refresh(guild_id, done))
+
+
+async def _refresh_after_invalidation(guild_id: Optional[str]) -> None:
+    try:
+        await refresh_guild_features(guild_id)
+    except Exception as e:
+        # The bitmap keeps its previous values; the next invalidation of the guild retries.
+        logger.error(
+            f"Failed to refresh guild features of {guild_id or 'every guild'}: {type(e).__name__}: {e}",
+            log_type=logconstants.APPLICATION_ERROR_TYPE,
+            exc_info=True,
+        )
+
+
+def _release_refresh(guild_id: Optional[str], task: asyncio.Task) -> None:
+    if _refreshes.get(guild_id) is task:
+        del _refreshes[guild_id]
+
+
+cache.on_invalidate(cache.COG_CACHE_FAMILY, _on_cog_invalidate)
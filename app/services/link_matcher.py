@@ -0,0 +1,102 @@
+import re
+from typing import Dict, Iterable, List, Tuple
+
+LINK_PATTERN = re.compile(r"https?://([^\s/?#\\<>\"'`|]+)[^\s<>\"'`|]*", re.IGNORECASE)
+LINK_TRAILING_CHARS = ".,;:!?)]}*_~"
+
+
+class DomainTrie:
+    """Suffix trie of domains: a host matches when it is, or is a subdomain of, an added domain."""
+
+    _END = ""
+
+    def __init__(self, domains: Iterable[str] = ()):
+        self._root: Dict[str, dict] = {}
+        self._size = 0
+        for domain in domains:
+            self.add(domain)
+
+    def add(self, domain: str) -> None:
+        labels = normalize_host(domain).split(".")
+        if not labels or not all(labels):
+            return
+
+        node = self._root
+        for label in reversed(labels):
+            node = node.setdefault(label, {})
+
+        if self._END not in node:
+            node[self._END] = {}
+            self._size += 1
+
+    def matches(self, host: str) -> bool:
+        node = self._root
+        if not node:
+            return False
+
+        for label in reversed(host.split(".")):
+            node = node.get(label)
+            if node is None:
+                return False
+            if self._END in node:
+                return True
+
+        return False
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+
+def may_contain_link(content: str) -> bool:
+    return "://" in content and "." in content
+
+
+def extract_links(content: str) -> List[Tuple[str, str]]:
+    """Returns (link, host) pairs for every http(s) link in the content."""
+    if not content or not may_contain_link(content):
+        return []
+
+    links = []
+    for match in LINK_PATTERN.finditer(content):
+        link = match.group(0)
+        authority = match.group(1)
+        if link[-1] in LINK_TRAILING_CHARS:
+            link = link.rstrip(LINK_TRAILING_CHARS)
+            authority = authority[:len(link) - match.start(1) + match.start(0)]
+
+        host = parse_authority_host(authority)
+        if host:
+            links.append((link, host))
+
+    return links
+
+
+def parse_link_host(link: str) -> str:
+    authority = link.partition("://")[2]
+    for separator in "/?#\\":
+        authority = authority.partition(separator)[0]
+
+    return parse_authority_host(authority)
+
+
+def parse_authority_host(authority: str) -> str:
+    host = authority.rpartition("@")[2] if "@" in authority else authority
+    if host.startswith("["):
+        return host.partition("]")[0][1:].lower()
+
+    return normalize_host(host.partition(":")[0] if ":" in host else host)
+
+
+def normalize_host(host: str) -> str:
+    host = (host or "").lower().rstrip(".")
+    return host[4:] if host.startswith("www.") else host
+
+
+def find_blocked_links(content: str, allowed_domains: DomainTrie) -> List[str]:
+    return [
+        link for link, host in extract_links(content)
+        if not allowed_domains.matches(host)
+    ]
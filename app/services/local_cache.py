@@ -0,0 +1,132 @@
+import asyncio
+import math
+import random
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+MISSING = object()
+
+
+class LocalCache:
+    """Size-bounded in-process LRU whose entries expire after a fixed TTL."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        expiration: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.expiration = expiration
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        # key -> (value, expires_at, size in bytes)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float, int]]" = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        entry = self.get_entry(key)
+        return default if entry is None else entry[0]
+
+    def get_entry(self, key: Hashable) -> Optional[Tuple[Any, float]]:
+        """Returns (value, seconds until expiration), or None when missing or expired."""
+        entry = self._entries.get(key)
+        remaining = entry[1] - self._clock() if entry is not None else 0
+        if remaining <= 0:
+            if entry is not None:
+                self._pop(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0], remaining
+
+    def set(self, key: Hashable, value: Any, size: int = 0) -> None:
+        self._pop(key)
+        self._entries[key] = (value, self._clock() + self.expiration, size)
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries:
+            self._pop(next(iter(self._entries)))
+
+    def invalidate(self, key: Hashable) -> None:
+        self._pop(key)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        keys = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            self._pop(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[1] > self._clock()
+
+    def _pop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+
+def should_refresh_early(
+    remaining: float,
+    load_time: float,
+    beta: float = 1.0,
+    rand: Callable[[], float] = random.random,
+) -> bool:
+    """Probabilistic early expiration (XFetch): more likely as expiration nears and loads get slower."""
+    return -load_time * beta * math.log(1.0 - rand()) >= remaining
+
+
+class SingleFlight:
+    """Runs one loader per key at a time; concurrent callers await and share its result."""
+
+    def __init__(self):
+        self._flights: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        flight = self._flights.get(key)
+        if flight is not None:
+            return await asyncio.shield(flight)
+
+        flight = self._flights[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await loader()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except BaseException as e:
+            flight.set_exception(e)
+            # Marks the exception as retrieved when no other caller was waiting.
+            flight.exception()
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            del self._flights[key]
+
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._flights
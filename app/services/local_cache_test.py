@@ -0,0 +1,231 @@
+"""
+Testes unitarios para local_cache.py.
+
+Estes testes NAO fazem I/O - apenas testam logica pura.
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.local_cache import MISSING, LocalCache, SingleFlight, should_refresh_early
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLocalCache:
+    """Testes para o LRU em memoria com TTL."""
+
+    def test_returns_missing_for_unknown_key(self):
+        """
+        Verifica que chaves ausentes retornam o sentinela e contam como miss.
+
+        Input: Cache vazio
+        Output: MISSING e uma miss
+        """
+        local_cache = LocalCache(max_entries=2, expiration=10)
+
+        assert local_cache.get("a") is MISSING
+        assert local_cache.stats()["misses"] == 1
+
+    def test_caches_none_values(self):
+        """
+        Verifica que None e um valor valido (cache negativo).
+
+        Input: set("a", None)
+        Output: get retorna None, nao MISSING
+        """
+        local_cache = LocalCache(max_entries=2, expiration=10)
+        local_cache.set("a", None)
+
+        assert local_cache.get("a") is None
+
+    def test_expires_entries(self):
+        """
+        Verifica que entradas expiram apos o TTL.
+
+        Input: Entrada com TTL de 10s, relogio avancado 10s
+        Output: MISSING e entrada removida
+        """
+        # Arrange
+        clock = FakeClock()
+        local_cache = LocalCache(max_entries=2, expiration=10, clock=clock)
+        local_cache.set("a", 1, size=5)
+
+        # Act
+        clock.now = 10
+
+        # Assert
+        assert local_cache.get("a") is MISSING
+        assert local_cache.stats()["entries"] == 0
+        assert local_cache.stats()["bytes"] == 0
+
+    def test_evicts_least_recently_used(self):
+        """
+        Verifica que a entrada menos usada e removida ao exceder o limite.
+
+        Input: Limite de 2, "a" lido antes de inserir "c"
+        Output: "b" removido, "a" e "c" mantidos
+        """
+        # Arrange
+        local_cache = LocalCache(max_entries=2, expiration=10)
+        local_cache.set("a", 1)
+        local_cache.set("b", 2)
+        local_cache.get("a")
+
+        # Act
+        local_cache.set("c", 3)
+
+        # Assert
+        assert "a" in local_cache
+        assert "b" not in local_cache
+        assert "c" in local_cache
+
+    def test_tracks_bytes_and_hit_ratio(self):
+        """
+        Verifica a introspeccao de bytes e taxa de acerto.
+
+        Input: Duas entradas (3 e 7 bytes), um hit e um miss
+        Output: 10 bytes, hit_ratio 0.5
+        """
+        # Arrange
+        local_cache = LocalCache(max_entries=4, expiration=10)
+        local_cache.set("a", 1, size=3)
+        local_cache.set("b", 2, size=7)
+
+        # Act
+        local_cache.get("a")
+        local_cache.get("z")
+
+        # Assert
+        stats = local_cache.stats()
+        assert stats["entries"] == 2
+        assert stats["bytes"] == 10
+        assert stats["hit_ratio"] == 0.5
+
+    def test_invalidate_where(self):
+        """
+        Verifica a invalidacao por predicado (ex.: todas as chaves de uma guild).
+
+        Input: Chaves de duas guilds, predicado pela guild 1
+        Output: Apenas as chaves da guild 2 permanecem
+        """
+        # Arrange
+        local_cache = LocalCache(max_entries=4, expiration=10)
+        local_cache.set("guild:1:cog.a", 1, size=1)
+        local_cache.set("guild:1:cog.b", 2, size=1)
+        local_cache.set("guild:2:cog.a", 3, size=1)
+
+        # Act
+        removed = local_cache.invalidate_where(lambda key: key.startswith("guild:1:"))
+
+        # Assert
+        assert removed == 2
+        assert len(local_cache) == 1
+        assert local_cache.stats()["bytes"] == 1
+
+
+class TestShouldRefreshEarly:
+    """Testes para a expiracao antecipada probabilistica."""
+
+    def test_never_refreshes_far_from_expiration(self):
+        """
+        Verifica que entradas longe de expirar nao sao recarregadas.
+
+        Input: 60s restantes, carga de 10ms, sorteio medio
+        Output: False
+        """
+        assert should_refresh_early(60, 0.01, rand=lambda: 0.5) is False
+
+    def test_refreshes_close_to_expiration(self):
+        """
+        Verifica que entradas perto de expirar sao recarregadas.
+
+        Input: 1ms restante, carga de 10ms, sorteio medio
+        Output: True
+        """
+        assert should_refresh_early(0.001, 0.01, rand=lambda: 0.5) is True
+
+
+class TestSingleFlight:
+    """Testes para o carregamento unico por chave."""
+
+    async def test_concurrent_callers_share_one_load(self):
+        """
+        Verifica que chamadas concorrentes executam o loader uma unica vez.
+
+        Input: 8 tasks pedindo a mesma chave com loader lento
+        Output: Loader chamado 1 vez, todas recebem o mesmo resultado
+        """
+        # Arrange
+        flights = SingleFlight()
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"answer": 42}
+
+        # Act
+        results = await asyncio.gather(*(flights.do("k", loader) for _ in range(8)))
+
+        # Assert
+        assert len(calls) == 1
+        assert len(results) == 8
+        assert all(result is results[0] for result in results)
+        assert not flights.in_flight("k")
+
+    async def test_propagates_loader_error(self):
+        """
+        Verifica que erros do loader sao repassados e a chave e liberada.
+
+        Input: Loader que lanca ValueError
+        Output: ValueError e nova chamada executa o loader novamente
+        """
+        # Arrange
+        flights = SingleFlight()
+
+        async def failing_loader():
+            raise ValueError("mongo down")
+
+        async def loader():
+            return "ok"
+
+        # Act / Assert
+        with pytest.raises(ValueError):
+            await flights.do("k", failing_loader)
+        assert await flights.do("k", loader) == "ok"
+
+    async def test_cancelled_leader_cancels_followers(self):
+        """
+        Verifica que cancelar o leader nao deixa os seguidores esperando para sempre.
+
+        Input: Leader cancelado durante o loader, um seguidor aguardando
+        Output: CancelledError nos dois e chave liberada
+        """
+        # Arrange
+        flights = SingleFlight()
+
+        async def loader():
+            await asyncio.sleep(1)
+
+        leader = asyncio.create_task(flights.do("k", loader))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flights.do("k", loader))
+        await asyncio.sleep(0)
+
+        # Act
+        leader.cancel()
+
+        # Assert
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+        assert not flights.in_flight("k")
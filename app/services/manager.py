@@ -1,9 +1,66 @@
-from typing import Any, Dict, List
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 import discord
+from bson import ObjectId
 
+from app.data.aio import cogs as cogs_data
+from app.services.cog_events import flush_cog_events
 from app.services.utils import get_command_display_name, ml
 
+HISTORY_PAGE_SIZE = 4
+
+
+class CogEventsHistory:
+    """Command history of a guild read one page at a time, newest first, across one or more cogs.
+
+    Each events collection is read with its own keyset bound, so a page costs at most one
+    limited query per collection and events already read are never fetched again. Events
+    still buffered by app.services.cog_events are flushed before the first page.
+    """
+
+    def __init__(self, guild_id: str, cog_keys: List[str], page_size: int = HISTORY_PAGE_SIZE):
+        self.guild_id = str(guild_id)
+        self.page_size = page_size
+        self._buffers: Dict[str, List[Dict[str, Any]]] = {key: [] for key in cog_keys}
+        # (datetime, _id) of the oldest event fetched from each collection, or None before the first fetch.
+        self._bounds: Dict[str, Optional[Tuple[datetime, ObjectId]]] = {key: None for key in cog_keys}
+        self._drained: Dict[str, bool] = {key: False for key in cog_keys}
+        self._started = False
+
+    @property
+    def exhausted(self) -> bool:
+        return all(self._drained.values()) and not any(self._buffers.values())
+
+    async def next_page(self) -> List[Dict[str, Any]]:
+        if not self._started:
+            self._started = True
+            await flush_cog_events()
+
+        refill = [
+            key for key, buffer in self._buffers.items()
+            if len(buffer) < self.page_size and not self._drained[key]
+        ]
+        pages = await asyncio.gather(*(
+            cogs_data.find_cog_events_page(self.guild_id, key, self._bounds[key], self.page_size)
+            for key in refill
+        ))
+        for key, events in zip(refill, pages):
+            self._buffers[key].extend(events)
+            self._drained[key] = len(events) < self.page_size
+            if events:
+                self._bounds[key] = (events[-1]["datetime"], events[-1]["_id"])
+
+        candidates = sorted(
+            ((event["datetime"], key) for key, buffer in self._buffers.items() for event in buffer),
+            reverse=True,
+        )[:self.page_size]
+        page = []
+        for _, key in candidates:
+            page.append(self._buffers[key].pop(0))
+        return page
+
 
 def parse_history_data(
     data: List[Dict[str, Any]], interaction: discord.Interaction, guild: discord.Guild=None, with_cog: bool = None
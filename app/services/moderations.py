@@ -1,5 +1,6 @@
+import asyncio
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 import discord
 
@@ -9,7 +10,12 @@ from app.constants import Commands as commands_constants
 from app.constants import GuildConstants as guild_constants
 from app.data import cogs as cogs_data
 from app.data import moderations as moderations_data
-from app.services.cogs import insert_cog_event, update_cog_by_guild
+from app.data.aio import cogs as cogs_aio_data
+from app.data.aio import moderations as moderations_aio_data
+from app.services import guild_features
+from app.services.cache import remove_all_cache_by_guild
+from app.services.cogs import parse_cog_event, update_cog_by_guild
+from app.services.streamer_targets import remove_streamer_targets_by_guild
 from app.services.utils import (
     get_form_settings_with_database_values,
     ml,
@@ -20,69 +26,83 @@ from app.services.utils import (
 )
 
 
-def update_moderations_by_guild(guild_id: str, key: str, value: str):
+async def update_moderations_by_guild(guild_id: str, key: str, value: str):
     if not guild_id:
         return
 
-    moderations = moderations_data.find_moderations_by_guild(guild_id)
-    if not moderations:
-        data = parse_default_moderations(guild_id)
-        data[key] = value
+    defaults = parse_default_moderations(guild_id)
+    previous = await moderations_aio_data.upsert_moderations_by_guild(guild_id, {key: value}, defaults=defaults)
+    if previous is None:
+        guild_features.set_guild_features(guild_id, {**defaults, key: value})
+    else:
+        guild_features.set_guild_feature(guild_id, key, value)
+    return previous
 
-        return moderations_data.insert_moderations_by_guild(data)
 
-    return moderations_data.update_moderations_by_guild(
-        guild_id=guild_id, data=key, value=value
-    )
+async def join_moderations_by_guild(guild_id: str, owner_id: str) -> Optional[Dict[str, Any]]:
+    """Marks the bot online in the guild, creating its default moderations; returns the previous document."""
+    data = {guild_constants.IS_BOT_ONLINE: True, "owner_id": str(owner_id)}
+    defaults = parse_default_moderations(guild_id, owner_id=owner_id)
+    previous = await moderations_aio_data.upsert_moderations_by_guild(guild_id, data, defaults=defaults)
+    guild_features.set_guild_features(guild_id, {**(previous or defaults), **data})
+    return previous
 
 
-def pause_all_moderations_by_guild(guild_id: str, bot_user_id: str):
-    moderations = moderations_data.find_moderations_by_guild(guild_id)
+async def pause_all_moderations_by_guild(
+    guild_id: str, bot_user_id: str, moderations: Optional[Dict[str, Any]] = None
+) -> Optional[Dict[str, Any]]:
+    """Pauses every enabled feature of the guild and evicts its cache; returns the moderations before the pause.
+
+    The moderations $set, the feature collections and the events collections are written
+    concurrently, then the guild cache is evicted in one pipeline.
+    """
+    moderations = moderations or await moderations_aio_data.find_moderations_by_guild(guild_id)
     if not moderations:
         return None
 
-    for key, value in moderations.items():
-
-        if not isinstance(value, bool) or not value:
-            continue
-
-        update_moderations_by_guild(guild_id, key, False)
-        update_cog_by_guild(
-            guild_id=guild_id, cog_key=key, data={commands_constants.ENABLED_KEY: False}
-        )
-
-        if key == guild_constants.IS_BOT_ONLINE:
-            continue
-
-        insert_cog_event(
-            str(guild_id),
-            key,
-            commands_constants.PAUSED_KEY,
-            date=datetime.fromisoformat(datetime.now().isoformat()),
-            user_id=bot_user_id,
+    enabled = [key for key, value in moderations.items() if isinstance(value, bool) and value]
+    features = [key for key in enabled if key != guild_constants.IS_BOT_ONLINE]
+    date = datetime.fromisoformat(datetime.now().isoformat())
+
+    if enabled:
+        await asyncio.gather(
+            moderations_aio_data.set_moderations_by_guild(guild_id, {key: False for key in enabled}),
+            cogs_aio_data.update_cogs_by_guild(guild_id, features, {commands_constants.ENABLED_KEY: False}),
+            cogs_aio_data.insert_cog_events([
+                parse_cog_event(str(guild_id), key, commands_constants.PAUSED_KEY, date, bot_user_id)
+                for key in features
+            ]),
+            *(
+                [remove_streamer_targets_by_guild(guild_id)]
+                if commands_constants.NOTIFICATIONS_TWITCH_KEY in features else []
+            ),
         )
+    await remove_all_cache_by_guild(guild_id)
+    guild_features.set_guild_features(guild_id, {**moderations, **{key: False for key in enabled}})
 
     return moderations
 
 
-def pause_moderations_by_guild(guild_id: str, key: str):
-    update_moderations_by_guild(guild_id, key, False)
-    return update_cog_by_guild(
+async def pause_moderations_by_guild(guild_id: str, key: str):
+    await update_moderations_by_guild(guild_id, key, False)
+    return await update_cog_by_guild(
         guild_id=guild_id, cog_key=key, data={commands_constants.ENABLED_KEY: False}
     )
 
 
-def unpause_moderations_by_guild(guild_id: str, key: str):
-    update_moderations_by_guild(guild_id, key, True)
-    return update_cog_by_guild(
+async def unpause_moderations_by_guild(guild_id: str, key: str):
+    await update_moderations_by_guild(guild_id, key, True)
+    return await update_cog_by_guild(
         guild_id=guild_id, cog_key=key, data={commands_constants.ENABLED_KEY: True}
     )
 
 
 def insert_moderations_by_guild(guild_id: str, data: Dict[str, Any] = None, owner_id: str = None) -> str:
-    default_data = parse_default_moderations(guild_id, owner_id=owner_id)
+    data = data or parse_default_moderations(guild_id, owner_id=owner_id)
 
-    return moderations_data.insert_moderations_by_guild(data or default_data)
+    result = moderations_data.insert_moderations_by_guild(data)
+    guild_features.set_guild_features(guild_id, data)
+    return result
 
 
 def parse_default_moderations(guild_id: str, owner_id: str = None) -> Dict[str, Any]:
@@ -127,7 +147,7 @@ async def send_command_manager_message(
     cog_data: Dict[str, str],
     additional_info: str = "",
     additional_buttons: Optional[List[discord.ui.Button]] = None,
-    settings_provider: Optional[Callable[[discord.Interaction, Dict[str, Any], str], List[Dict[str, Any]]]] = None,
+    settings_provider: Optional[Callable[[discord.Interaction, Dict[str, Any], str], Awaitable[List[Dict[str, Any]]]]] = None,
     enable_composition_controls: bool = True,
     lifecycle_callbacks: Optional[Dict[str, Callable]] = None,
 ):
@@ -141,7 +161,7 @@ async def send_command_manager_message(
     form_steps = list(parse_form_yaml_to_dict(key))
     embed = parse_form_dict_to_embed(form_steps[0], locale, True)
     if settings_provider:
-        description = settings_provider(interaction, cog_data, locale)
+        description = await settings_provider(interaction, cog_data, locale)
     else:
         description = parse_settings_with_database_values(cog_data, form_steps, locale)
 
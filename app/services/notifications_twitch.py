@@ -1,7 +1,9 @@
+import asyncio
 import datetime
 import random
 import time
-from typing import Any, Dict, List, Union
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 
 import discord
 from dateutil import parser
@@ -10,24 +12,37 @@ from app import bot, logger
 from app.constants import Commands as constants
 from app.constants import LogTypes as logconstants
 from app.exceptions import ErrorContext
-from app.data.notifications_twitch import (
-    count_streamers_guilds,
-    find_guilds_by_streamer_name,
+from app.metrics import TWITCH_NOTIFICATION_DELAY
+from app.data.aio.notifications_twitch import (
     find_last_stream_date,
     find_stream_notification,
     save_stream_notification,
     update_last_stream_date,
 )
 from app.services import cache
+from app.services.fanout import FanoutTarget, fan_out
 from app.services.moderations import (
     send_command_form_message,
     send_command_manager_message,
 )
+from app.services.streamer_targets import count_streamer_guilds, find_streamer_targets
 from app.services.utils import format_datetime_output
 
+# Helix can take a while to index a stream after stream.online; stream info is polled
+# with jittered exponential backoff: up to 5s, 10s, 20s, 40s and 60s between attempts.
+STREAM_INFO_ATTEMPTS = 6
+STREAM_INFO_BASE_DELAY = 5
+STREAM_INFO_MAX_DELAY = 60
+
+# Online notification task of each streamer, while it waits for the stream info.
+_stream_info_tasks: Dict[str, asyncio.Task] = {}
+
+# Profile of the streamer used by the announcement, so it is posted without waiting on Helix.
+TWITCH_PROFILE_CACHE_EXPIRATION = 60 * 60 * 24
+
 
 async def manager(interaction: discord.Interaction, guild_id: str):
-    cogs = cache.get_cog_data_or_populate(guild_id, constants.NOTIFICATIONS_TWITCH_KEY, manager=True)
+    cogs = await cache.get_cog_config(guild_id, constants.NOTIFICATIONS_TWITCH_KEY, manager=True)
 
     if cogs == None:
         return await send_command_form_message(interaction, constants.NOTIFICATIONS_TWITCH_KEY)
@@ -46,19 +61,21 @@ async def handle_send_streamer_notification(streamer_name: str) -> None:
     )
 
     try:
-        user_info = bot.twitch.get_user_info(streamer_name)
-        stream_info = wait_for_stream_info(streamer_name)
+        user_info = await bot.twitch.get_user_info(streamer_name)
+        stream_info = await wait_for_stream_info(streamer_name)
+        # Past this point a stream.offline no longer cancels the notification.
+        _release_stream_info_task(streamer_name, asyncio.current_task())
 
         if not stream_info:
             logger.info(f"Stream info not found for streamer **{streamer_name}**", log_type=logconstants.COMMAND_INFO_TYPE)
             return
 
         stream_started_at = stream_info.get("started_at")
-        last_stream_date = find_last_stream_date(streamer_name)
+        last_stream_date = await find_last_stream_date(streamer_name)
 
         if not last_stream_date or is_more_than_one_hour(stream_started_at, last_stream_date):
             await send_streamer_notifications(stream_info, user_info)
-            update_last_stream_date(streamer_name, stream_started_at)
+            await update_last_stream_date(streamer_name, stream_started_at)
         else:
             await edit_streamer_notifications(user_info, status=constants.NOTIFICATIONS_TWITCH_STREAM_STATUS_ONLINE)
     except Exception as e:
@@ -70,20 +87,130 @@ async def handle_send_streamer_notification(streamer_name: str) -> None:
         )
         raise
 
+async def announce_streamer_notification(streamer_name: str, event: Dict[str, Any], received_at: float) -> None:
+    """Posts the go-live notifications from the stream.online payload and the cached profile, without
+    waiting for Helix to index the stream; title, game and thumbnail are added later by the enrichment.
+    """
+    context = ErrorContext(
+        flow="twitch_notification",
+        extra={
+            "streamer_name": streamer_name,
+            "event_type": "stream_online",
+        }
+    )
+
+    try:
+        user_info = await get_streamer_profile(streamer_name)
+        stream_started_at = event.get("started_at")
+        last_stream_date = await find_last_stream_date(streamer_name)
+
+        if last_stream_date and not is_more_than_one_hour(stream_started_at, last_stream_date):
+            await edit_streamer_notifications({"login": streamer_name}, status=constants.NOTIFICATIONS_TWITCH_STREAM_STATUS_ONLINE)
+            return
+
+        targets = await find_streamer_targets(streamer_name)
+        embed = create_stream_announcement_embed(streamer_name, event, user_info)
+        messages = await process_notifications(targets, streamer_name, embed)
+        await update_last_stream_date(streamer_name, stream_started_at)
+
+        delay = time.monotonic() - received_at
+        TWITCH_NOTIFICATION_DELAY.labels("announce").observe(delay)
+        logger.info(
+            f"Notifications sent for **{streamer_name}** in {len(messages)} guilds after {delay:.2f}s",
+            log_type=logconstants.COMMAND_INFO_TYPE,
+        )
+    except Exception as e:
+        logger.error(
+            f"Failed to handle twitch notification: {type(e).__name__}: {e}",
+            log_type=logconstants.COMMAND_ERROR_TYPE,
+            context=context,
+            exc_info=True,
+        )
+        raise
+
+    if messages:
+        # Same task name as the announcement, so a redelivered stream.online is still ignored while enriching.
+        enrichment = asyncio.get_running_loop().create_task(
+            enrich_streamer_notifications(streamer_name, messages, received_at),
+            name=asyncio.current_task().get_name(),
+        )
+        _track_stream_info_task(streamer_name, enrichment)
+
+async def enrich_streamer_notifications(streamer_name: str, messages: List[discord.Message], received_at: float) -> None:
+    """Edits the announcements with the stream title, game and thumbnail once Helix has indexed the stream."""
+    context = ErrorContext(
+        flow="twitch_notification",
+        extra={
+            "streamer_name": streamer_name,
+            "event_type": "stream_online_enrich",
+        }
+    )
+
+    try:
+        user_info, stream_info = await asyncio.gather(
+            bot.twitch.get_user_info(streamer_name), wait_for_stream_info(streamer_name)
+        )
+        if not stream_info or not user_info:
+            logger.info(f"Stream info not found for streamer **{streamer_name}**", log_type=logconstants.COMMAND_INFO_TYPE)
+            return
+
+        await cache.set_data_in_redis_with_expiration(
+            get_streamer_profile_key(streamer_name), user_info, TWITCH_PROFILE_CACHE_EXPIRATION
+        )
+        # Past this point a stream.offline no longer cancels the edits.
+        _release_stream_info_task(streamer_name, asyncio.current_task())
+
+        embed = create_stream_notification_embed(streamer_name, stream_info, user_info)
+        result = await fan_out("twitch-enrich", streamer_name, [
+            FanoutTarget(str(message.id), str(message.channel.id), partial(message.edit, embed=embed))
+            for message in messages
+        ])
+
+        delay = time.monotonic() - received_at
+        TWITCH_NOTIFICATION_DELAY.labels("enrich").observe(delay)
+        logger.info(
+            f"Notifications enriched for **{streamer_name}** after {delay:.2f}s: {result.summary()}",
+            log_type=logconstants.COMMAND_INFO_TYPE,
+        )
+    except Exception as e:
+        logger.error(
+            f"Failed to enrich twitch notification: {type(e).__name__}: {e}",
+            log_type=logconstants.COMMAND_ERROR_TYPE,
+            context=context,
+            exc_info=True,
+        )
+        raise
+
+def get_streamer_profile_key(streamer_name: str) -> str:
+    return f"twitch:profile:{streamer_name}"
+
+async def get_streamer_profile(streamer_name: str) -> Optional[Dict[str, Any]]:
+    profile = await cache.get_data_from_redis(get_streamer_profile_key(streamer_name))
+    if profile:
+        return profile
+
+    profile = await bot.twitch.get_user_info(streamer_name)
+    if profile:
+        await cache.set_data_in_redis_with_expiration(
+            get_streamer_profile_key(streamer_name), profile, TWITCH_PROFILE_CACHE_EXPIRATION
+        )
+    return profile
+
 async def send_streamer_notifications(stream_info: Dict[str, Any], user_info: Dict[str, Any]) -> None:
     streamer_name = user_info.get("login")
-    guilds_data = find_guilds_by_streamer_name(streamer_name)
+    targets = await find_streamer_targets(streamer_name)
     logger.info(f"Sending notifications for **{streamer_name}**", log_type=logconstants.COMMAND_INFO_TYPE)
 
-    count = await process_notifications(guilds_data, streamer_name, stream_info, user_info)
-    logger.info(f"Notifications sent for **{streamer_name}** in {count} guilds", log_type=logconstants.COMMAND_INFO_TYPE)
+    embed = create_stream_notification_embed(streamer_name, stream_info, user_info)
+    messages = await process_notifications(targets, streamer_name, embed)
+    logger.info(f"Notifications sent for **{streamer_name}** in {len(messages)} guilds", log_type=logconstants.COMMAND_INFO_TYPE)
 
 async def edit_streamer_notifications(user_info: Dict[str, Any], status: str) -> None:
     streamer_name = user_info.get("login")
-    guilds_data = find_guilds_by_streamer_name(streamer_name)
+    targets = await find_streamer_targets(streamer_name)
     logger.info(f"Editing notifications to {status} for **{streamer_name}**", log_type=logconstants.COMMAND_INFO_TYPE)
 
-    count = await update_notification_status(guilds_data, streamer_name, status)
+    count = await update_notification_status(targets, streamer_name, status)
     logger.info(f"Notifications edited to {status} for **{streamer_name}** in {count} guilds", log_type=logconstants.COMMAND_INFO_TYPE)
 
 async def handle_send_streamer_offline_notification(streamer_name: str) -> None:
@@ -96,8 +223,8 @@ async def handle_send_streamer_offline_notification(streamer_name: str) -> None:
     )
 
     try:
-        guilds_data = find_guilds_by_streamer_name(streamer_name)
-        last_stream_date = find_last_stream_date(streamer_name)
+        targets = await find_streamer_targets(streamer_name)
+        last_stream_date = await find_last_stream_date(streamer_name)
         stream_duration = None
 
         if last_stream_date:
@@ -105,7 +232,7 @@ async def handle_send_streamer_offline_notification(streamer_name: str) -> None:
             stream_duration = format_datetime_output(datetime.datetime.now(datetime.timezone.utc) - last_stream_date)
 
         logger.info(f"Editing notifications to offline for **{streamer_name}**", log_type=logconstants.COMMAND_INFO_TYPE)
-        count = await update_notification_status(guilds_data, streamer_name, constants.NOTIFICATIONS_TWITCH_STREAM_STATUS_OFFLINE, stream_duration)
+        count = await update_notification_status(targets, streamer_name, constants.NOTIFICATIONS_TWITCH_STREAM_STATUS_OFFLINE, stream_duration)
         logger.info(f"Notifications edited to offline for **{streamer_name}** in {count} guilds", log_type=logconstants.COMMAND_INFO_TYPE)
     except Exception as e:
         logger.error(
@@ -116,49 +243,59 @@ async def handle_send_streamer_offline_notification(streamer_name: str) -> None:
         )
         raise
 
-async def process_notifications(guilds_data, streamer_name, stream_info, user_info):
-    count = 0
-    for guild_data in guilds_data:
-        guild = bot.get_guild(int(guild_data["guild_id"]))
-
-        for notification in guild_data["notifications"]["values"]:
-            if notification["streamer"]["value"].lower() != streamer_name:
-                continue
-
-            channel = guild.get_channel(int(notification["channel"]["value"]))
-            message = await channel.send(
-                content=compose_notification_message(notification, streamer_name),
-                embed=create_stream_notification_embed(streamer_name, stream_info, user_info)
-            )
-            save_stream_notification(guild.id, channel.id, streamer_name, message.id)
-            count += 1
-    return count
-
-async def update_notification_status(guilds_data: List[Dict[str, Any]], streamer_name: str, status: str, duration: str = None) -> int:
-    count = 0
-    for guild_data in guilds_data:
-        guild = bot.get_guild(int(guild_data["guild_id"]))
-
-        for notification in guild_data["notifications"]["values"]:
-            if notification["streamer"]["value"].lower() != streamer_name:
-                continue
-
-            channel = guild.get_channel(int(notification["channel"]["value"]))
-            message = await fetch_notification_message(guild.id, channel.id, streamer_name)
-            status = parse_stream_status(status)
-            status = f"{status} | ⌛️ Duration: {duration}" if duration else status
-
-            if message:
-                message.embeds[0].set_footer(text=status)
-                await message.edit(embed=message.embeds[0])
-                count += 1
-    return count
+async def process_notifications(
+    targets: List[Dict[str, Any]], streamer_name: str, embed: discord.Embed
+) -> List[discord.Message]:
+    async def send(guild: discord.Guild, channel: discord.TextChannel, target: Dict[str, Any]) -> discord.Message:
+        message = await channel.send(
+            content=compose_notification_message(target, streamer_name),
+            embed=embed
+        )
+        await save_stream_notification(guild.id, channel.id, streamer_name, message.id)
+        return message
+
+    result = await fan_out("twitch", streamer_name, get_notification_targets(targets, send))
+    logger.info(f"Twitch announcement of **{streamer_name}**: {result.summary()}", log_type=logconstants.COMMAND_INFO_TYPE)
+    return result.values
+
+async def update_notification_status(targets: List[Dict[str, Any]], streamer_name: str, status: str, duration: str = None) -> int:
+    status = parse_stream_status(status)
+    status = f"{status} | ⌛️ Duration: {duration}" if duration else status
+
+    async def edit(guild: discord.Guild, channel: discord.TextChannel, target: Dict[str, Any]) -> bool:
+        message = await fetch_notification_message(guild.id, channel.id, streamer_name)
+        if not message:
+            return False
+        message.embeds[0].set_footer(text=status)
+        await message.edit(embed=message.embeds[0])
+        return True
+
+    result = await fan_out("twitch-status", streamer_name, get_notification_targets(targets, edit))
+    return sum(1 for edited in result.values if edited)
+
+def get_notification_targets(
+    targets: List[Dict[str, Any]],
+    deliver: Callable[[discord.Guild, discord.TextChannel, Dict[str, Any]], Awaitable[Any]],
+) -> List[FanoutTarget]:
+    """One fan-out target per index entry of the streamer; guilds the bot left and deleted channels are skipped."""
+    fanout_targets = []
+    for target in targets:
+        guild = bot.get_guild(int(target["guild_id"]))
+        channel_id = int(target["channel_id"])
+        key = f"{target['guild_id']}/{channel_id}"
+        channel = guild.get_channel(channel_id) if guild else None
+        if channel is None:
+            fanout_targets.append(FanoutTarget.skipped(key, "guild not found" if guild is None else "channel not found"))
+            continue
+
+        fanout_targets.append(FanoutTarget(key, str(channel_id), partial(deliver, guild, channel, target)))
+    return fanout_targets
 
 def parse_stream_status(status: str) -> str:
     return f"🟢 {status.capitalize()}" if status == constants.NOTIFICATIONS_TWITCH_STREAM_STATUS_ONLINE else f"🔴 {status.capitalize()}"
 
 async def fetch_notification_message(guild_id: str, channel_id: str, streamer_name: str) -> discord.Message:
-    stream_notification = find_stream_notification(guild_id, channel_id, streamer_name)
+    stream_notification = await find_stream_notification(guild_id, channel_id, streamer_name)
     if stream_notification:
         channel = bot.get_guild(guild_id).get_channel(channel_id)
         try:
@@ -171,22 +308,81 @@ def is_more_than_one_hour(start_time: str, last_time: str) -> bool:
     return (parser.parse(start_time) - parser.parse(last_time)).total_seconds() > 3600
 
 
-def wait_for_stream_info(streamer: str) -> Dict[str, Any]:
-    stream_info = bot.twitch.get_stream_info(streamer)
-    if stream_info:
-        return stream_info
+def get_stream_info_delay(attempt: int) -> float:
+    """Full jitter: a random delay up to the exponential backoff of the attempt."""
+    return random.uniform(0, min(STREAM_INFO_MAX_DELAY, STREAM_INFO_BASE_DELAY * 2 ** attempt))
 
-    attempts = 0
-    while attempts <= 3:
-        attempts += 1
 
-        logger.info(f"Checking stream info for {streamer}, attempt {attempts}", log_type=logconstants.COMMAND_INFO_TYPE)
-        stream_info = bot.twitch.get_stream_info(streamer)
+async def wait_for_stream_info(streamer: str) -> Optional[Dict[str, Any]]:
+    for attempt in range(STREAM_INFO_ATTEMPTS):
+        if attempt:
+            logger.info(f"Checking stream info for {streamer}, attempt {attempt + 1}", log_type=logconstants.COMMAND_INFO_TYPE)
+
+        stream_info = await bot.twitch.get_stream_info(streamer)
         if stream_info:
             return stream_info
 
-        if attempts < 3:
-            time.sleep(15)
+        if attempt < STREAM_INFO_ATTEMPTS - 1:
+            await asyncio.sleep(get_stream_info_delay(attempt))
+    return None
+
+
+def schedule_streamer_notification(
+    streamer_name: str, event: Optional[Dict[str, Any]] = None, received_at: Optional[float] = None
+) -> asyncio.Task:
+    """Runs the online notification of a streamer in the background; a newer event replaces a pending one.
+
+    With the stream.online payload the notification is announced first and enriched later,
+    otherwise it is posted once the stream info is available. A redelivery of the stream.online
+    of a stream still being announced returns the pending task instead of posting again.
+    """
+    loop = asyncio.get_running_loop()
+    if event is not None:
+        task_name = get_stream_task_name(streamer_name, event)
+        pending = _stream_info_tasks.get(streamer_name)
+        if pending and not pending.done() and pending.get_name() == task_name:
+            logger.info(f"Duplicate stream.online ignored for {streamer_name}", log_type=logconstants.COMMAND_INFO_TYPE)
+            return pending
+
+        cancel_streamer_notification(streamer_name)
+        return _track_stream_info_task(streamer_name, loop.create_task(
+            announce_streamer_notification(streamer_name, event, received_at or time.monotonic()), name=task_name
+        ))
+
+    cancel_streamer_notification(streamer_name)
+    return _track_stream_info_task(streamer_name, loop.create_task(handle_send_streamer_notification(streamer_name)))
+
+
+def get_stream_task_name(streamer_name: str, event: Dict[str, Any]) -> str:
+    return f"twitch-online:{streamer_name}:{event.get('id') or event.get('started_at')}"
+
+
+def schedule_streamer_offline_notification(streamer_name: str) -> asyncio.Task:
+    """Cancels the online notification still waiting for stream info, then edits the notifications to offline."""
+    cancel_streamer_notification(streamer_name)
+    return asyncio.get_running_loop().create_task(handle_send_streamer_offline_notification(streamer_name))
+
+
+def cancel_streamer_notification(streamer_name: str) -> bool:
+    task = _stream_info_tasks.pop(streamer_name, None)
+    if not task or task.done():
+        return False
+
+    task.cancel()
+    logger.info(f"Stream info retry cancelled for {streamer_name}", log_type=logconstants.COMMAND_INFO_TYPE)
+    return True
+
+
+def _track_stream_info_task(streamer_name: str, task: asyncio.Task) -> asyncio.Task:
+    _stream_info_tasks[streamer_name] = task
+    task.add_done_callback(lambda done: _release_stream_info_task(streamer_name, done))
+    return task
+
+
+def _release_stream_info_task(streamer_name: str, task: asyncio.Task):
+    if _stream_info_tasks.get(streamer_name) is task:
+        del _stream_info_tasks[streamer_name]
+
 
 def create_stream_notification_embed(streamer: str, stream_info: Dict[str, Any], user_info: Dict[str, Any]) -> discord.Embed:
     stream_link = f"https://www.twitch.tv/{streamer}"
@@ -213,18 +409,38 @@ def create_stream_notification_embed(streamer: str, stream_info: Dict[str, Any],
 
     return embed
 
-def handle_subscribe_streamer(interaction: discord.Interaction, cogs: Union[List[Dict[str, Any]], Dict[str, Any]]):
+def create_stream_announcement_embed(streamer: str, event: Dict[str, Any], user_info: Optional[Dict[str, Any]]) -> discord.Embed:
+    user_info = user_info or {}
+    display_name = event.get("broadcaster_user_name") or user_info.get("display_name") or streamer
+
+    embed = discord.Embed(
+        title=f"{display_name} is live!",
+        description=user_info.get("description"),
+        url=f"https://www.twitch.tv/{streamer}",
+        color=discord.Color.purple(),
+    )
+
+    if user_info.get("profile_image_url"):
+        embed.set_thumbnail(url=user_info.get("profile_image_url"))
+    embed.add_field(name="Streamer", value=streamer, inline=True)
+    embed.set_footer(text=parse_stream_status(constants.NOTIFICATIONS_TWITCH_STREAM_STATUS_ONLINE))
+
+    return embed
+
+async def handle_subscribe_streamer(interaction: discord.Interaction, cogs: Union[List[Dict[str, Any]], Dict[str, Any]]):
     if isinstance(cogs, list):
         for form_responses in cogs[0].get("value"):
-            subscribe_streamer(interaction, form_responses)
+            await subscribe_streamer(interaction, form_responses)
     else:
-        subscribe_streamer(interaction, cogs)
+        await subscribe_streamer(interaction, cogs)
 
-def subscribe_streamer(interaction: discord.Interaction, response: Dict[str, Any]) -> None:
+async def subscribe_streamer(interaction: discord.Interaction, response: Dict[str, Any]) -> None:
     streamer = response.get("streamer").get("value")
-    streamer_id = bot.twitch.get_user_id_from_login(streamer)
+    # Also warms the profile cache used by the go-live announcement.
+    profile = await get_streamer_profile(streamer.lower())
+    streamer_id = profile.get("id") if profile else None
 
-    response = bot.twitch.subscribe_to_stream_online_event(streamer_id)
+    response = await bot.twitch.subscribe_to_stream_online_event(streamer_id)
     if response.status_code == 409:
         logger.warn(
             f"Streamer {streamer} already subscribed",
@@ -241,7 +457,7 @@ def subscribe_streamer(interaction: discord.Interaction, response: Dict[str, Any
         )
         return
 
-    response = bot.twitch.subscribe_to_stream_offline_event(streamer_id)
+    response = await bot.twitch.subscribe_to_stream_offline_event(streamer_id)
     if response.status_code != 202:
         logger.error(
             f"Error subscribing offline event to streamer {streamer}: {response.json()}",
@@ -256,18 +472,18 @@ def subscribe_streamer(interaction: discord.Interaction, response: Dict[str, Any
         log_type=logconstants.COMMAND_INFO_TYPE,
     )
 
-def handle_unsubscribe_streamer(interaction: discord.Interaction, cogs: Union[List[Dict[str, Any]], Dict[str, Any]]):
+async def handle_unsubscribe_streamer(interaction: discord.Interaction, cogs: Union[List[Dict[str, Any]], Dict[str, Any]]):
     if cogs.get("notifications"):
         for notification in cogs.get("notifications").get("values"):
-            unsubscribe_streamer(interaction, notification)
+            await unsubscribe_streamer(interaction, notification)
     else:
-        unsubscribe_streamer(interaction, cogs)
+        await unsubscribe_streamer(interaction, cogs)
 
-def unsubscribe_streamer(interaction: discord.Interaction, notification: Dict[str, Any]) -> None:
+async def unsubscribe_streamer(interaction: discord.Interaction, notification: Dict[str, Any]) -> None:
     streamer = notification.get("streamer").get("value")
-    streamer_id = bot.twitch.get_user_id_from_login(streamer)
+    streamer_id = await bot.twitch.get_user_id_from_login(streamer)
 
-    guilds_by_streamer = count_streamers_guilds(streamer)
+    guilds_by_streamer = await count_streamer_guilds(streamer.lower())
     if guilds_by_streamer > 1:
         logger.warn(
             f"Streamer {streamer} has more than one subscription and will not be unsubscribed",
@@ -276,12 +492,12 @@ def unsubscribe_streamer(interaction: discord.Interaction, notification: Dict[st
         )
         return
 
-    subscriptions = bot.twitch.get_subscription_by_user_id(streamer_id)
+    subscriptions = await bot.twitch.get_subscription_by_user_id(streamer_id)
     if not subscriptions.get("data"):
         return
 
     for subscription in subscriptions.get("data"):
-        response = bot.twitch.unsubscribe_from_stream_event(subscription.get("id"))
+        response = await bot.twitch.unsubscribe_from_stream_event(subscription.get("id"))
         if response.status_code != 204:
             logger.error(
                 f"Error unsubscribing from streamer {streamer}: {response.json()}",
@@ -296,8 +512,8 @@ def unsubscribe_streamer(interaction: discord.Interaction, notification: Dict[st
         log_type=logconstants.COMMAND_INFO_TYPE,
     )
 
-def compose_notification_message(notification: Dict[str, Any], streamer: str) -> str:
-    messages = notification.get("notification_messages").get("value")
+def compose_notification_message(target: Dict[str, Any], streamer: str) -> str:
+    messages = target.get("notification_messages")
     stream_link = f"https://www.twitch.tv/{streamer}"
     random_message = random.choice(messages.split(";")).lstrip()
 
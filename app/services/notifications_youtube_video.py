@@ -1,5 +1,7 @@
+import asyncio
 import random
 from datetime import datetime, timedelta
+from functools import partial
 from typing import Any, Dict, List, Union
 
 import discord
@@ -18,6 +20,7 @@ from app.data.reminder import (
     insert_reminder,
 )
 from app.services import cache
+from app.services.fanout import FanoutTarget, fan_out
 from app.services.moderations import (
     send_command_form_message,
     send_command_manager_message,
@@ -25,7 +28,7 @@ from app.services.moderations import (
 
 
 async def manager(interaction: discord.Interaction, guild_id: str):
-    cogs = cache.get_cog_data_or_populate(guild_id, constants.NOTIFICATIONS_YOUTUBE_VIDEO_KEY, manager=True)
+    cogs = await cache.get_cog_config(guild_id, constants.NOTIFICATIONS_YOUTUBE_VIDEO_KEY, manager=True)
 
     if cogs == None:
         return await send_command_form_message(interaction, constants.NOTIFICATIONS_YOUTUBE_VIDEO_KEY)
@@ -57,7 +60,8 @@ def send_youtube_video_notification(video_id: str, channel_id: str) -> None:
             log_type=logconstants.COMMAND_INFO_TYPE,
         )
 
-        count = 0
+        embed = create_video_notification_embed(video_info, youtuber_info)
+        targets = []
         for guild_data in guilds_data:
             guild = bot.get_guild(int(guild_data.get("guild_id")))
 
@@ -67,18 +71,18 @@ def send_youtube_video_notification(video_id: str, channel_id: str) -> None:
                 if youtuber != youtuber_user:
                     continue
 
-                message = compose_notification_message(notification, youtuber, video_id)
-                channel = guild.get_channel(int(notification.get("channel").get("value")))
-
-                embed = create_video_notification_embed(video_info, youtuber_info)
+                target_channel_id = int(notification.get("channel").get("value"))
+                key = f"{guild_data.get('guild_id')}/{target_channel_id}"
+                channel = guild.get_channel(target_channel_id) if guild else None
+                if channel is None:
+                    targets.append(FanoutTarget.skipped(key, "guild not found" if guild is None else "channel not found"))
+                    continue
 
-                bot.loop.create_task(channel.send(content=message, embed=embed))
-                count += 1
+                message = compose_notification_message(notification, youtuber, video_id)
+                targets.append(FanoutTarget(key, str(target_channel_id), partial(channel.send, content=message, embed=embed)))
 
-        logger.info(
-            f"Notifications sent for youtuber **{youtuber_user}** new video in {count} guilds",
-            log_type=logconstants.COMMAND_INFO_TYPE,
-        )
+        # Runs on the webhook thread: the sends are handed to the bot loop without waiting for them.
+        asyncio.run_coroutine_threadsafe(deliver_youtube_video_notifications(youtuber_user, targets), bot.loop)
     except Exception as e:
         logger.error(
             f"Failed to send youtube notification: {type(e).__name__}: {e}",
@@ -88,6 +92,13 @@ def send_youtube_video_notification(video_id: str, channel_id: str) -> None:
         )
         raise
 
+async def deliver_youtube_video_notifications(youtuber_user: str, targets: List[FanoutTarget]) -> None:
+    result = await fan_out("youtube", youtuber_user, targets)
+    logger.info(
+        f"Notifications sent for youtuber **{youtuber_user}** new video: {result.summary()}",
+        log_type=logconstants.COMMAND_INFO_TYPE,
+    )
+
 def create_video_notification_embed(video_info: Dict[str, Any], youtuber_info: Dict[str, Any]) -> discord.Embed:
     video_link = f"https://www.youtube.com/watch?v={video_info.get('id')}"
     video_thumbnail = video_info.get("thumbnails").get("maxres") or video_info.get("thumbnails").get("high")
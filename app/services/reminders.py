@@ -1,5 +1,6 @@
+import asyncio
 from datetime import datetime, time
-from typing import Callable, Optional
+from typing import Awaitable, Callable, Optional
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from app import bot, logger
@@ -104,10 +105,10 @@ def delete_reminder(reminder_id: Optional[str]) -> None:
         )
 
 
-def cleanup_reminder_if_unused(
+async def cleanup_reminder_if_unused(
     reminder_id: Optional[str],
-    count_remaining: Callable[[], int],
+    count_remaining: Callable[[], Awaitable[int]],
 ) -> None:
-    if not reminder_id or count_remaining() > 0:
+    if not reminder_id or await count_remaining() > 0:
         return
-    delete_reminder(reminder_id)
+    await asyncio.to_thread(delete_reminder, reminder_id)
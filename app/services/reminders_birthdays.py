@@ -1,3 +1,4 @@
+import asyncio
 from collections import Counter
 from datetime import date, datetime, timezone
 from typing import Any, Dict, List, Optional
@@ -8,7 +9,7 @@ from app.components.buttons import AdditionalButton
 from app.constants import Commands as commands_constants
 from app.constants import KeikoIcons
 from app.constants import Style
-from app.data import birthdays as birthdays_data
+from app.data.aio import birthdays as birthdays_data
 from app.data.birthdays import to_summary_composition
 from app.services.dates import (
     format_mm_dd_count,
@@ -24,14 +25,21 @@ from app.services.utils import (
     parse_locale,
 )
 
+# Fields each birthday read needs, so message and image payloads are not transferred for them.
+UPCOMING_PROJECTION = {"user_id": True, "date": True, "_id": False}
+STATS_PROJECTION = {"month": True, "date": True, "_id": False}
+REMINDER_PROJECTION = {"reminder_id": True, "date": True, "_id": False}
+
 
 async def manager(interaction: discord.Interaction, guild_id: str) -> None:
     from app.services.moderations import send_command_form_message
     from app.services.moderations import send_command_manager_message
 
     locale = parse_locale(interaction.locale)
-    config = birthdays_data.find_birthday_config(guild_id)
-    enabled = birthdays_data.is_birthday_enabled(guild_id)
+    config, enabled = await asyncio.gather(
+        birthdays_data.find_birthday_config(guild_id),
+        birthdays_data.is_birthday_enabled(guild_id),
+    )
     if not enabled or not config:
         return await send_command_form_message(
             interaction,
@@ -51,7 +59,7 @@ async def manager(interaction: discord.Interaction, guild_id: str) -> None:
     await send_command_manager_message(
         interaction,
         commands_constants.REMINDERS_BIRTHDAY_KEY,
-        birthday_manager_cog_data(guild_id),
+        await birthday_manager_cog_data(guild_id),
         additional_buttons=[stats_button],
         settings_provider=birthday_manager_settings,
         lifecycle_callbacks={
@@ -80,7 +88,7 @@ def can_self_edit_birthday(item: Optional[Dict[str, Any]]) -> bool:
     return get_self_edit_count(item) < commands_constants.SELF_BIRTHDAY_EDIT_LIMIT
 
 
-def upsert_birthday(
+async def upsert_birthday(
     guild_id: str,
     user_id: str,
     mm_dd: str,
@@ -88,22 +96,23 @@ def upsert_birthday(
     message: Optional[Dict[str, Any]] = None,
     image: Optional[Dict[str, Any]] = None,
 ) -> Optional[Dict[str, Any]]:
-    existing = birthdays_data.find_birthday_item(guild_id, user_id)
+    existing = await birthdays_data.find_birthday_item(guild_id, user_id)
     old_date = existing.get("date") if existing else None
     old_reminder_id = existing.get("reminder_id") if existing else None
     self_edit_count = get_self_edit_count(existing) + (1 if existing and increment_self_edit else 0)
 
-    reminder_id = birthdays_data.find_reminder_id_by_guild_and_date(guild_id, mm_dd)
+    reminder_id = await birthdays_data.find_reminder_id_by_guild_and_date(guild_id, mm_dd)
     if not reminder_id:
-        config = birthdays_data.find_birthday_config(guild_id) or {}
-        reminder_id = reminders_service.create_reminder(
+        config = await birthdays_data.find_birthday_config(guild_id) or {}
+        reminder_id = await asyncio.to_thread(
+            reminders_service.create_reminder,
             commands_constants.REMINDER_API_TITLE_BIRTHDAY,
             mm_dd,
             notes=mm_dd,
             timezone_name=config.get("timezone"),
             notification_time=config.get("notification_time"),
         )
-    item = birthdays_data.upsert_birthday_item(
+    item = await birthdays_data.upsert_birthday_item(
         guild_id,
         user_id,
         mm_dd,
@@ -114,7 +123,7 @@ def upsert_birthday(
     )
 
     if old_date and old_date != mm_dd:
-        reminders_service.cleanup_reminder_if_unused(
+        await reminders_service.cleanup_reminder_if_unused(
             old_reminder_id,
             lambda: birthdays_data.count_birthday_items_by_guild_and_date(guild_id, old_date),
         )
@@ -122,26 +131,26 @@ def upsert_birthday(
     return item
 
 
-def remove_birthday(guild_id: str, user_id: str) -> Optional[Dict[str, Any]]:
-    item = birthdays_data.remove_birthday_item(guild_id, user_id)
+async def remove_birthday(guild_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+    item = await birthdays_data.remove_birthday_item(guild_id, user_id)
     if item:
         removed_date = item.get("date")
-        reminders_service.cleanup_reminder_if_unused(
+        await reminders_service.cleanup_reminder_if_unused(
             item.get("reminder_id"),
             lambda: birthdays_data.count_birthday_items_by_guild_and_date(guild_id, removed_date),
         )
     return item
 
 
-def get_upcoming_birthdays(guild_id: str, limit: int = 3, today: Optional[date] = None) -> List[Dict[str, Any]]:
+async def get_upcoming_birthdays(guild_id: str, limit: int = 3, today: Optional[date] = None) -> List[Dict[str, Any]]:
     today = today or datetime.now(timezone.utc).date()
-    items = birthdays_data.find_birthday_items_by_guild(guild_id)
+    items = await birthdays_data.find_birthday_items_by_guild(guild_id, UPCOMING_PROJECTION)
     return sorted(items, key=lambda item: next_mm_dd_occurrence(item["date"], today))[:limit]
 
 
-def get_birthday_stats(guild_id: str, today: Optional[date] = None) -> Dict[str, Any]:
+async def get_birthday_stats(guild_id: str, today: Optional[date] = None) -> Dict[str, Any]:
     today = today or datetime.now(timezone.utc).date()
-    items = birthdays_data.find_birthday_items_by_guild(guild_id)
+    items = await birthdays_data.find_birthday_items_by_guild(guild_id, STATS_PROJECTION)
     month_counts = Counter(item.get("month") for item in items)
     date_counts = Counter(item.get("date") for item in items)
     return {
@@ -153,12 +162,16 @@ def get_birthday_stats(guild_id: str, today: Optional[date] = None) -> Dict[str,
     }
 
 
-def birthday_manager_cog_data(guild_id: str) -> Dict[str, Any]:
-    config = birthdays_data.find_birthday_config(guild_id) or {}
-    items = birthdays_data.find_birthday_items_by_guild(guild_id)
+async def birthday_manager_cog_data(guild_id: str) -> Dict[str, Any]:
+    config, items, enabled = await asyncio.gather(
+        birthdays_data.find_birthday_config(guild_id),
+        birthdays_data.find_birthday_items_by_guild(guild_id),
+        birthdays_data.is_birthday_enabled(guild_id),
+    )
+    config = config or {}
     return {
         "guild_id": str(guild_id),
-        commands_constants.ENABLED_KEY: birthdays_data.is_birthday_enabled(guild_id),
+        commands_constants.ENABLED_KEY: enabled,
         commands_constants.BIRTHDAY_CONFIG_CHANNEL: {
             "style": "channel",
             "values": str(config.get("channel_id")) if config.get("channel_id") else None,
@@ -189,7 +202,7 @@ async def edit_birthday_save(interaction: discord.Interaction, manager_view: dis
         items = composition_data.get("values") or []
         index = int(composition_index)
         if 0 <= index < len(items):
-            save_form_birthday_item(guild_id, items[index])
+            await save_form_birthday_item(guild_id, items[index])
         return
 
     config_keys = {
@@ -202,7 +215,7 @@ async def edit_birthday_save(interaction: discord.Interaction, manager_view: dis
         commands_constants.BIRTHDAY_CONFIG_DEFAULT_MESSAGE_CONTENT,
     }
     if config_keys.intersection(data):
-        config = birthdays_data.find_birthday_config(guild_id) or {}
+        config = await birthdays_data.find_birthday_config(guild_id) or {}
         channel_entry = data.get(commands_constants.BIRTHDAY_CONFIG_CHANNEL)
         mention_entry = data.get(commands_constants.BIRTHDAY_CONFIG_MENTION_EVERYONE)
         timezone_entry = data.get(commands_constants.BIRTHDAY_CONFIG_TIMEZONE)
@@ -216,7 +229,7 @@ async def edit_birthday_save(interaction: discord.Interaction, manager_view: dis
         timezone_value = _extract_first(timezone_entry) or config.get("timezone")
         notification_time = _extract_first(notification_time_entry) or config.get("notification_time")
         default_message = _default_message_from_data(data, config)
-        setup_birthdays(
+        await setup_birthdays(
             guild_id,
             str(channel_id),
             mention_everyone,
@@ -278,17 +291,18 @@ def _default_message_from_data(data: Dict[str, Any], config: Dict[str, Any]) ->
     )
 
 
-def reschedule_birthdays(guild_id: str, timezone_value: str, notification_time: str) -> None:
+async def reschedule_birthdays(guild_id: str, timezone_value: str, notification_time: str) -> None:
     if not timezone_value or not notification_time:
         return
     reminders_by_id: Dict[str, str] = {}
-    for item in birthdays_data.find_birthday_items_by_guild(guild_id):
+    for item in await birthdays_data.find_birthday_items_by_guild(guild_id, REMINDER_PROJECTION):
         reminder_id = item.get("reminder_id")
         date_value = item.get("date")
         if reminder_id and date_value:
             reminders_by_id[str(reminder_id)] = str(date_value)
     for reminder_id, date_value in reminders_by_id.items():
-        reminders_service.update_reminder(
+        await asyncio.to_thread(
+            reminders_service.update_reminder,
             reminder_id,
             date_value,
             timezone_name=timezone_value,
@@ -296,15 +310,18 @@ def reschedule_birthdays(guild_id: str, timezone_value: str, notification_time:
         )
 
 
-def birthday_manager_settings(
+async def birthday_manager_settings(
     interaction: discord.Interaction,
     cog_data: Dict[str, Any],
     locale: str,
 ) -> List[Dict[str, Any]]:
     guild_id = str(interaction.guild_id)
-    config = birthdays_data.find_birthday_config(guild_id) or {}
-    stats = get_birthday_stats(guild_id)
-    upcoming = get_upcoming_birthdays(guild_id, limit=3)
+    config, stats, upcoming = await asyncio.gather(
+        birthdays_data.find_birthday_config(guild_id),
+        get_birthday_stats(guild_id),
+        get_upcoming_birthdays(guild_id, limit=3),
+    )
+    config = config or {}
     upcoming_text = "\n".join(
         f"{index}. <@{item['user_id']}> — {format_mm_dd_label(item['date'], locale)}"
         for index, item in enumerate(upcoming, start=1)
@@ -346,7 +363,7 @@ def birthday_manager_settings(
 
 async def send_stats_message(interaction: discord.Interaction) -> None:
     locale = parse_locale(interaction.locale)
-    stats = get_birthday_stats(str(interaction.guild_id))
+    stats = await get_birthday_stats(str(interaction.guild_id))
     lines = [
         f"🎂 **{_mb('stats.fields.total', locale)}:** {stats['total']}",
         f"📅 **{_mb('stats.fields.this-month', locale)}:** {stats['current_month']}",
@@ -366,11 +383,11 @@ async def send_stats_message(interaction: discord.Interaction) -> None:
     await interaction.followup.send(embed=embed, ephemeral=True)
 
 
-def disable_birthdays_manager(interaction: discord.Interaction, cogs: Any = None) -> None:
-    handle_unsubscribe_birthdays(interaction)
+async def disable_birthdays_manager(interaction: discord.Interaction, cogs: Any = None) -> None:
+    await handle_unsubscribe_birthdays(interaction)
 
 
-def setup_birthdays(
+async def setup_birthdays(
     guild_id: str,
     channel_id: str,
     mention_everyone: bool,
@@ -379,9 +396,9 @@ def setup_birthdays(
     notification_time: str = None,
     default_message: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    previous_config = birthdays_data.find_birthday_config(guild_id) or {}
-    update_moderations_by_guild(guild_id, commands_constants.REMINDERS_BIRTHDAY_KEY, True)
-    config = birthdays_data.upsert_birthday_config(
+    previous_config = await birthdays_data.find_birthday_config(guild_id) or {}
+    await update_moderations_by_guild(guild_id, commands_constants.REMINDERS_BIRTHDAY_KEY, True)
+    config = await birthdays_data.upsert_birthday_config(
         guild_id,
         channel_id,
         mention_everyone,
@@ -391,15 +408,15 @@ def setup_birthdays(
         default_message=default_message,
     )
     if _schedule_changed(previous_config, config):
-        reschedule_birthdays(guild_id, config.get("timezone"), config.get("notification_time"))
+        await reschedule_birthdays(guild_id, config.get("timezone"), config.get("notification_time"))
     return config
 
 
-def persist_setup_form(interaction: discord.Interaction, responses: List[Dict[str, Any]], cog_param: Dict[str, Any]) -> List[Dict[str, Any]]:
-    return save_setup_form(str(interaction.guild_id), responses, parse_locale(interaction.locale))
+async def persist_setup_form(interaction: discord.Interaction, responses: List[Dict[str, Any]], cog_param: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return await save_setup_form(str(interaction.guild_id), responses, parse_locale(interaction.locale))
 
 
-def save_setup_form(guild_id: str, responses: List[Dict[str, Any]], locale: str = None) -> List[Dict[str, Any]]:
+async def save_setup_form(guild_id: str, responses: List[Dict[str, Any]], locale: str = None) -> List[Dict[str, Any]]:
     channel_id = _response_value(responses, commands_constants.BIRTHDAY_CONFIG_CHANNEL)
     mention_everyone = _parse_bool(_response_value(responses, commands_constants.BIRTHDAY_CONFIG_MENTION_EVERYONE))
     timezone_value = _response_value(responses, commands_constants.BIRTHDAY_CONFIG_TIMEZONE)
@@ -409,7 +426,7 @@ def save_setup_form(guild_id: str, responses: List[Dict[str, Any]], locale: str
     if isinstance(items, dict):
         items = [items]
 
-    setup_birthdays(
+    await setup_birthdays(
         guild_id,
         str(channel_id),
         mention_everyone,
@@ -421,18 +438,18 @@ def save_setup_form(guild_id: str, responses: List[Dict[str, Any]], locale: str
 
     saved_items = []
     for item in items:
-        saved_item = save_form_birthday_item(guild_id, item)
+        saved_item = await save_form_birthday_item(guild_id, item)
         if saved_item:
             saved_items.append(saved_item)
     return saved_items
 
 
-def save_form_birthday_item(guild_id: str, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+async def save_form_birthday_item(guild_id: str, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     birthday = _parse_form_birthday_item(item)
     if not birthday:
         return None
 
-    return upsert_birthday(
+    return await upsert_birthday(
         guild_id,
         birthday["user_id"],
         birthday["date"],
@@ -492,26 +509,26 @@ def _parse_form_birthday_item(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     }
 
 
-def handle_unsubscribe_birthdays(interaction: discord.Interaction, cogs: Any = None) -> None:
+async def handle_unsubscribe_birthdays(interaction: discord.Interaction, cogs: Any = None) -> None:
     guild_id = str(interaction.guild_id)
-    items = birthdays_data.find_birthday_items_by_guild(guild_id)
+    items = await birthdays_data.find_birthday_items_by_guild(guild_id, REMINDER_PROJECTION)
     reminder_ids = {item.get("reminder_id") for item in items if item.get("reminder_id")}
 
-    birthdays_data.delete_birthday_items_by_guild(guild_id)
-    birthdays_data.delete_birthday_config(guild_id)
+    await birthdays_data.delete_birthday_items_by_guild(guild_id)
+    await birthdays_data.delete_birthday_config(guild_id)
 
     for reminder_id in reminder_ids:
-        reminders_service.delete_reminder(reminder_id)
+        await asyncio.to_thread(reminders_service.delete_reminder, reminder_id)
 
-    update_moderations_by_guild(guild_id, commands_constants.REMINDERS_BIRTHDAY_KEY, False)
+    await update_moderations_by_guild(guild_id, commands_constants.REMINDERS_BIRTHDAY_KEY, False)
 
 
 async def add_birthdays_manager_item(interaction: discord.Interaction, manager_view: discord.ui.View, response: Dict[str, Any]) -> Optional[bool]:
     birthday = _parse_form_birthday_item(response)
-    if birthday and birthdays_data.find_birthday_item(str(interaction.guild_id), birthday["user_id"]):
+    if birthday and await birthdays_data.find_birthday_item(str(interaction.guild_id), birthday["user_id"]):
         return False
 
-    saved_item = save_form_birthday_item(str(interaction.guild_id), response)
+    saved_item = await save_form_birthday_item(str(interaction.guild_id), response)
     if not saved_item:
         return
 
@@ -534,4 +551,4 @@ async def remove_birthdays_manager_item(
     user = item_removed.get("user") if isinstance(item_removed, dict) else None
     user_id = user.get("value") if isinstance(user, dict) else user
     if user_id:
-        remove_birthday(str(interaction.guild_id), str(user_id))
+        await remove_birthday(str(interaction.guild_id), str(user_id))
@@ -20,7 +20,7 @@ from app.views.pagination_without_interaction import PaginationWithoutInteractio
 
 
 async def manager(interaction: discord.Interaction, guild_id: str):
-    cogs = cache.get_cog_data_or_populate(guild_id, constants.INTEGRATIONS_STREAM_ELEMENTS_COMMANDS_KEY, manager=True)
+    cogs = await cache.get_cog_config(guild_id, constants.INTEGRATIONS_STREAM_ELEMENTS_COMMANDS_KEY, manager=True)
 
     if cogs == None:
         return await send_command_form_message(interaction, constants.INTEGRATIONS_STREAM_ELEMENTS_COMMANDS_KEY)
@@ -30,7 +30,7 @@ async def manager(interaction: discord.Interaction, guild_id: str):
     )
 
 async def check_message(guild_id: str, message: discord.Message, prefix: str) -> None:
-    cogs = cache.get_cog_data_or_populate(guild_id, constants.INTEGRATIONS_STREAM_ELEMENTS_COMMANDS_KEY)
+    cogs = await cache.get_cog_config(guild_id, constants.INTEGRATIONS_STREAM_ELEMENTS_COMMANDS_KEY)
 
     if not cogs:
         return
@@ -51,10 +51,10 @@ async def check_message(guild_id: str, message: discord.Message, prefix: str) ->
 
     try:
         if command == "commands":
-            view = parse_command_list_view(channel_id, message, streamer)
+            view = await parse_command_list_view(channel_id, message, streamer)
             return await view.send(message)
 
-        reply = get_reply_in_cache_or_populate(channel_id, command, message.author)
+        reply = await get_reply_in_cache_or_populate(channel_id, command, message.author)
         if not reply:
             return
 
@@ -68,15 +68,15 @@ async def check_message(guild_id: str, message: discord.Message, prefix: str) ->
         )
         raise
 
-def parse_command_list_view(channel_id: str, message: discord.Message, streamer: str) -> discord.ui.View:
+async def parse_command_list_view(channel_id: str, message: discord.Message, streamer: str) -> discord.ui.View:
     from app import bot
-    commands_list = get_commands_in_cache_or_populate(channel_id, message.author)
+    commands_list = await get_commands_in_cache_or_populate(channel_id, message.author)
     if not commands_list:
         return []
 
     title = "StreamElements Commands"
     description = f"Here is a list of all the StreamElements commands available in {streamer}'s channel"
-    icon = bot.twitch.get_user_info(streamer).get("profile_image_url")
+    icon = (await bot.twitch.get_user_info(streamer)).get("profile_image_url")
     view = PaginationWithoutInteractionView(title, description, commands_list, message, thumbnail=icon, sep=4)
     return view
 
@@ -139,10 +139,10 @@ def parse_placeholders(reply: str, user: discord.User) -> str:
     return reply
 
 
-def get_commands_in_cache_or_populate(channel_id: str, user: discord.User) -> List[Dict[str, Any]]:
+async def get_commands_in_cache_or_populate(channel_id: str, user: discord.User) -> List[Dict[str, Any]]:
     cache_key = f"streamelements:commands:{channel_id}"
 
-    data = cache.get_data_from_redis(cache_key)
+    data = await cache.get_data_from_redis(cache_key)
     if data:
         return data
 
@@ -158,14 +158,14 @@ def get_commands_in_cache_or_populate(channel_id: str, user: discord.User) -> Li
         cache_batch[f"!{channel_command.get('command')}"] = parse_placeholders(channel_command.get("reply"), user)
 
     day_in_seconds = 60 * 60 * 24
-    cache.set_data_in_redis_with_expiration(cache_key, cache_batch, day_in_seconds)
+    await cache.set_data_in_redis_with_expiration(cache_key, cache_batch, day_in_seconds)
 
     return cache_batch
 
-def get_reply_in_cache_or_populate(channel_id: str, command: str, user: discord.User) -> str:
+async def get_reply_in_cache_or_populate(channel_id: str, command: str, user: discord.User) -> str:
     cache_key = f"streamelements:commands:{channel_id}"
 
-    data = cache.get_data_from_redis(cache_key)
+    data = await cache.get_data_from_redis(cache_key)
     if data.get(command):
         return data.get(command)
 
@@ -188,6 +188,6 @@ def get_reply_in_cache_or_populate(channel_id: str, command: str, user: discord.
         cache_batch[f"!{channel_command.get('command')}"] = reply
 
     day_in_seconds = 60 * 60 * 24
-    cache.set_data_in_redis_with_expiration(cache_key, cache_batch, day_in_seconds)
+    await cache.set_data_in_redis_with_expiration(cache_key, cache_batch, day_in_seconds)
 
     return message
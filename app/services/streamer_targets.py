@@ -0,0 +1,132 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+from app import redis_async_client
+from app.constants import Commands as constants
+from app.data.aio import notifications_twitch as twitch_aio_data
+from app.services import cache_codec
+from app.services.cache import CACHE_KEY_PREFIX, encode_value
+
+# Each stream.online / stream.offline reads the targets of one streamer: the index
+# (twitch_streamer_targets) is mirrored in Redis so the lookup is a single GET.
+# A reader fills the mirror and expires it, so an entry it loaded just before a write
+# and stored after that write's eviction does not outlive the expiration.
+STREAMER_TARGETS_CACHE_EXPIRATION = 60 * 60
+
+
+def get_streamer_targets_key(streamer_name: str) -> str:
+    return f"{CACHE_KEY_PREFIX}twitch:targets:{streamer_name}"
+
+
+def parse_streamer_targets(document: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Index entries of a notifications_twitch document; none while the feature is paused or removed."""
+    if not document or not document.get(constants.ENABLED_KEY):
+        return []
+
+    guild_id = str(document["guild_id"])
+    return [
+        {
+            "streamer": notification["streamer"]["value"].lower(),
+            "guild_id": guild_id,
+            "channel_id": str(notification["channel"]["value"]),
+            "notification_messages": (notification.get("notification_messages") or {}).get("value"),
+        }
+        for notification in (document.get("notifications") or {}).get("values") or []
+    ]
+
+
+async def update_streamer_targets_by_guild(guild_id: str, document: Optional[Dict[str, Any]]):
+    """Re-indexes the guild from the document just written to Mongo (None once it is deleted)."""
+    targets = parse_streamer_targets(document)
+    streamers = set(await twitch_aio_data.find_streamers_by_guild(guild_id)) | {target["streamer"] for target in targets}
+    await twitch_aio_data.replace_streamer_targets_by_guild(guild_id, targets)
+    await _evict_streamers(streamers)
+
+
+async def remove_streamer_targets_by_guild(guild_id: str):
+    streamers = await twitch_aio_data.find_streamers_by_guild(guild_id)
+    await twitch_aio_data.delete_streamer_targets_by_guild(guild_id)
+    await _evict_streamers(streamers)
+
+
+async def find_streamer_targets(streamer_name: str) -> List[Dict[str, Any]]:
+    """Guild, channel and message templates of each notification of the streamer."""
+    raw = await redis_async_client.get(get_streamer_targets_key(streamer_name))
+    if raw is not None:
+        return cache_codec.decode(raw)
+
+    targets = await twitch_aio_data.find_streamer_targets(streamer_name)
+    # NX: a rebuild that reached Redis while this read was in flight is not replaced.
+    await redis_async_client.set(
+        get_streamer_targets_key(streamer_name),
+        encode_value(targets),
+        ex=STREAMER_TARGETS_CACHE_EXPIRATION,
+        nx=True,
+    )
+    return targets
+
+
+async def count_streamer_guilds(streamer_name: str) -> int:
+    return len({target["guild_id"] for target in await find_streamer_targets(streamer_name)})
+
+
+async def rebuild_streamer_targets() -> Dict[str, int]:
+    """Rebuilds the index and its Redis mirror from the notifications_twitch documents.
+
+    Returns the number of entries written, and how many were missing from or stale in the previous index.
+    """
+    documents = await twitch_aio_data.find_enabled_notifications(
+        {"guild_id": True, constants.ENABLED_KEY: True, "notifications": True, "_id": False}
+    )
+    targets = [target for document in documents for target in parse_streamer_targets(document)]
+    previous = await twitch_aio_data.find_all_streamer_targets()
+    await twitch_aio_data.replace_all_streamer_targets(targets)
+
+    streamers = {target["streamer"] for target in targets} | {target["streamer"] for target in previous}
+    await _mirror_streamers(streamers, targets)
+
+    current = {_target_identity(target) for target in targets}
+    indexed = {_target_identity(target) for target in previous}
+    return {
+        "guilds": len(documents),
+        "targets": len(targets),
+        "missing": len(current - indexed),
+        "stale": len(indexed - current),
+    }
+
+
+async def ensure_streamer_targets() -> Optional[Dict[str, int]]:
+    """Builds the index when it is empty, as on the first start after it was introduced."""
+    if await twitch_aio_data.has_streamer_targets():
+        return None
+    return await rebuild_streamer_targets()
+
+
+def _target_identity(target: Dict[str, Any]) -> tuple:
+    return target["streamer"], target["guild_id"], target["channel_id"], target["notification_messages"]
+
+
+async def _evict_streamers(streamers: Iterable[str]):
+    """Drops the Redis entry of each streamer; the next lookup loads it from the index.
+
+    Other guilds write the same entries concurrently, so rewriting them from a read-back
+    could store a list older than the one another write just committed.
+    """
+    keys = [get_streamer_targets_key(streamer) for streamer in streamers]
+    if keys:
+        await redis_async_client.delete(*keys)
+
+
+async def _mirror_streamers(streamers: Iterable[str], targets: List[Dict[str, Any]]):
+    """Writes the Redis entry of each streamer from the targets of a full rebuild."""
+    by_streamer: Dict[str, List[Dict[str, Any]]] = {}
+    for target in targets:
+        by_streamer.setdefault(target["streamer"], []).append(target)
+
+    async with redis_async_client.pipeline(transaction=False) as pipeline:
+        for streamer in streamers:
+            pipeline.set(
+                get_streamer_targets_key(streamer),
+                encode_value(by_streamer.get(streamer, [])),
+                ex=STREAMER_TARGETS_CACHE_EXPIRATION,
+            )
+        await pipeline.execute()
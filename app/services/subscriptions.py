@@ -1,3 +1,5 @@
+import asyncio
+
 import discord
 
 from app import bot
@@ -6,10 +8,10 @@ from app.components.buttons import (
     SyncronizeRemindersButton,
     SyncronizeSubscriptionsButton,
 )
-from app.data.notifications_twitch import count_streamers_guilds
 from app.data.notifications_youtube_video import (
     count_youtube_video_subscription_by_guilds,
 )
+from app.services.streamer_targets import count_streamer_guilds
 
 
 def get_reminder_subscriptions() -> discord.ui.View:
@@ -48,14 +50,16 @@ def generate_reminders_by_streamer_view(reminders: dict, streamers_by_reminder:
     view.custom_embed = embed
     return view
 
-def get_twitch_subscriptions() -> discord.ui.View:
-    subscriptions = bot.twitch.get_subscriptions()["data"]
+async def get_twitch_subscriptions() -> discord.ui.View:
+    subscriptions = (await bot.twitch.get_subscriptions())["data"]
     guils_by_streamer = {}
 
-    for subscription in subscriptions:
-        user_id = subscription["condition"]["broadcaster_user_id"]
-        streamer = bot.twitch.get_user_info_by_id(user_id)
-        count = count_streamers_guilds(streamer["login"])
+    streamers = await asyncio.gather(*(
+        bot.twitch.get_user_info_by_id(subscription["condition"]["broadcaster_user_id"])
+        for subscription in subscriptions
+    ))
+    counts = await asyncio.gather(*(count_streamer_guilds(streamer["login"]) for streamer in streamers))
+    for streamer, count in zip(streamers, counts):
         guils_by_streamer[streamer["login"]] = count
 
     return generate_guilds_by_twitch_subscription_view(guils_by_streamer)
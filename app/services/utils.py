@@ -5,7 +5,6 @@ import hmac
 import os
 import random
 from pathlib import Path
-from re import findall
 from typing import Any, Dict, List, Tuple
 
 import discord
@@ -57,11 +56,6 @@ def format_relative_time(dt: datetime.datetime) -> str:
     return f"{years} year{'s' if years != 1 else ''} ago"
 
 
-def get_message_links(message: str) -> List[str]:
-    links = findall(r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*(),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+", message.lower())
-
-    return links
-
 def verify_twitch_signature(request, twitch_secret_key: str):
     message = request.headers['Twitch-Eventsub-Message-Id'] + request.headers['Twitch-Eventsub-Message-Timestamp'] + request.get_data(as_text=True)
     secret = twitch_secret_key.encode('utf-8')
@@ -7,7 +7,6 @@ Estes testes NAO fazem I/O - apenas testam logica pura.
 import pytest
 from unittest.mock import MagicMock, patch
 from app.services.utils import (
-    get_message_links,
     check_two_lists_intersection,
     list_roles_id,
     parse_welcome_messages,
@@ -21,128 +20,6 @@ from app.services.reminders_birthdays import can_self_edit_birthday, get_self_ed
 from datetime import date, timedelta
 
 
-class TestGetMessageLinks:
-    """Testes para extracao de links de mensagens."""
-
-    def test_detects_https_link(self):
-        """
-        Verifica que links HTTPS sao detectados corretamente.
-
-        Input: Mensagem contendo um link HTTPS
-        Output: Lista contendo o link detectado
-        """
-        # Arrange
-        content = "Check https://example.com"
-
-        # Act
-        links = get_message_links(content)
-
-        # Assert
-        assert len(links) == 1
-        assert "example.com" in links[0]
-
-    def test_detects_http_link(self):
-        """
-        Verifica que links HTTP (sem SSL) sao detectados.
-
-        Input: Mensagem contendo um link HTTP
-        Output: Lista contendo o link detectado
-        """
-        # Arrange
-        content = "Old site http://old.com"
-
-        # Act
-        links = get_message_links(content)
-
-        # Assert
-        assert len(links) == 1
-        assert "old.com" in links[0]
-
-    def test_detects_link_with_path_and_query(self):
-        """
-        Verifica que links com path e query string sao detectados integralmente.
-
-        Input: Mensagem com link contendo path e parametros
-        Output: Link completo com path e query
-        """
-        # Arrange
-        content = "https://site.com/path/to/page?query=1&other=2"
-
-        # Act
-        links = get_message_links(content)
-
-        # Assert
-        assert len(links) == 1
-        assert "site.com" in links[0]
-        assert "path" in links[0]
-
-    def test_detects_multiple_links(self):
-        """
-        Verifica que multiplos links na mesma mensagem sao todos detectados.
-
-        Input: Mensagem com dois links diferentes
-        Output: Lista com ambos os links
-        """
-        # Arrange
-        content = "Links: https://a.com and https://b.com"
-
-        # Act
-        links = get_message_links(content)
-
-        # Assert
-        assert len(links) == 2
-
-    def test_returns_empty_when_no_links(self):
-        """
-        Verifica que mensagem sem links retorna lista vazia.
-
-        Input: Mensagem de texto sem nenhum link
-        Output: Lista vazia
-        """
-        # Arrange
-        content = "No links here, just text."
-
-        # Act
-        links = get_message_links(content)
-
-        # Assert
-        assert len(links) == 0
-
-    def test_handles_links_in_sentence(self):
-        """
-        Verifica que links em meio a frases sao detectados.
-
-        Input: Mensagem com link no meio do texto
-        Output: Link extraido corretamente
-        """
-        # Arrange
-        content = "Veja esse video https://youtube.com/watch?v=123 que legal"
-
-        # Act
-        links = get_message_links(content)
-
-        # Assert
-        assert len(links) == 1
-        assert "youtube.com" in links[0]
-
-    def test_converts_to_lowercase(self):
-        """
-        Verifica que links sao convertidos para lowercase.
-
-        Input: Link com letras maiusculas
-        Output: Link em lowercase
-        """
-        # Arrange
-        content = "Check HTTPS://EXAMPLE.COM/PATH"
-
-        # Act
-        links = get_message_links(content)
-
-        # Assert
-        assert len(links) == 1
-        assert links[0] == links[0].lower()
-
-
 class TestCheckTwoListsIntersection:
     """Testes para verificacao de intersecao de listas."""
 
@@ -319,7 +196,7 @@ class TestBirthdayItemDefaults:
         assert can_self_edit_birthday({"self_edit_count": 1}) is False
         assert get_self_edit_count({"self_edit_count": "invalid"}) == 0
 
-    def test_birthday_stats_from_items(self):
+    async def test_birthday_stats_from_items(self):
         from app.services.reminders_birthdays import get_birthday_stats
 
         items = [
@@ -329,7 +206,7 @@ class TestBirthdayItemDefaults:
         ]
 
         with patch("app.services.reminders_birthdays.birthdays_data.find_birthday_items_by_guild", return_value=items):
-            stats = get_birthday_stats("1", today=date(2026, 5, 2))
+            stats = await get_birthday_stats("1", today=date(2026, 5, 2))
 
         assert stats["total"] == 3
         assert stats["current_month"] == 2
@@ -337,7 +214,7 @@ class TestBirthdayItemDefaults:
         assert stats["min_month"] == (6, 1)
         assert stats["max_date"] == ("05-15", 2)
 
-    def test_reuses_existing_reminder_for_date(self):
+    async def test_reuses_existing_reminder_for_date(self):
         with patch("app.services.reminders_birthdays.birthdays_data.find_reminder_id_by_guild_and_date", return_value="rem-1"):
             with patch("app.services.reminders_birthdays.birthdays_data.find_birthday_item", return_value=None):
                 with patch(
@@ -345,7 +222,7 @@ class TestBirthdayItemDefaults:
                     return_value={"reminder_id": "rem-1"},
                 ):
                     with patch("app.services.reminders_birthdays.reminders_service.create_reminder") as create:
-                        assert reminders_birthdays.upsert_birthday("guild-1", "user-1", "05-15")["reminder_id"] == "rem-1"
+                        assert (await reminders_birthdays.upsert_birthday("guild-1", "user-1", "05-15"))["reminder_id"] == "rem-1"
 
         create.assert_not_called()
 
@@ -355,7 +232,7 @@ class TestBirthdayItemDefaults:
         assert format_values_by_style(True, "boolean", "pt-br") == "Sim"
         assert format_values_by_style(False, "boolean", "pt-br") == "Não"
 
-    def test_save_setup_form_writes_config_and_items(self):
+    async def test_save_setup_form_writes_config_and_items(self):
         from app.services.reminders_birthdays import save_setup_form
 
         responses = [
@@ -378,7 +255,7 @@ class TestBirthdayItemDefaults:
 
         with patch("app.services.reminders_birthdays.setup_birthdays") as setup:
             with patch("app.services.reminders_birthdays.upsert_birthday", return_value={"user_id": "222"}) as upsert:
-                saved = save_setup_form("guild-1", responses, "pt-br")
+                saved = await save_setup_form("guild-1", responses, "pt-br")
 
         setup.assert_called_once_with(
             "guild-1",
@@ -402,7 +279,7 @@ class TestBirthdayItemDefaults:
         )
         assert saved == [{"user_id": "222"}]
 
-    def test_save_setup_form_writes_schedule_and_default_message(self):
+    async def test_save_setup_form_writes_schedule_and_default_message(self):
         from app.services.reminders_birthdays import save_setup_form
 
         responses = [
@@ -416,7 +293,7 @@ class TestBirthdayItemDefaults:
         ]
 
         with patch("app.services.reminders_birthdays.setup_birthdays") as setup:
-            saved = save_setup_form("guild-1", responses, "pt-br")
+            saved = await save_setup_form("guild-1", responses, "pt-br")
 
         setup.assert_called_once_with(
             "guild-1",
@@ -433,7 +310,7 @@ class TestBirthdayItemDefaults:
         )
         assert saved == []
 
-    def test_upsert_birthday_creates_reminder_with_guild_schedule(self):
+    async def test_upsert_birthday_creates_reminder_with_guild_schedule(self):
         with patch("app.services.reminders_birthdays.birthdays_data.find_reminder_id_by_guild_and_date", return_value=None):
             with patch("app.services.reminders_birthdays.birthdays_data.find_birthday_item", return_value=None):
                 with patch(
@@ -448,7 +325,7 @@ class TestBirthdayItemDefaults:
                             "app.services.reminders_birthdays.reminders_service.create_reminder",
                             return_value="rem-1",
                         ) as create:
-                            assert reminders_birthdays.upsert_birthday("guild-1", "user-1", "05-15")["reminder_id"] == "rem-1"
+                            assert (await reminders_birthdays.upsert_birthday("guild-1", "user-1", "05-15"))["reminder_id"] == "rem-1"
 
         create.assert_called_once_with(
             "birthday_reminder",
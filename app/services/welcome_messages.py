@@ -22,7 +22,7 @@ from app.services.utils import parse_welcome_messages
 
 
 async def manager(interaction: discord.Interaction, guild_id: str):
-    cogs = cache.get_cog_data_or_populate(guild_id, constants.WELCOME_MESSAGES_KEY, manager=True)
+    cogs = await cache.get_cog_config(guild_id, constants.WELCOME_MESSAGES_KEY, manager=True)
 
     if cogs == None:
         return await send_command_form_message(interaction, constants.WELCOME_MESSAGES_KEY)
@@ -34,7 +34,7 @@ async def manager(interaction: discord.Interaction, guild_id: str):
     )
 
 async def send_welcome_message(member: discord.Member):
-    cogs = cache.get_cog_data_or_populate(member.guild.id, constants.WELCOME_MESSAGES_KEY)
+    cogs = await cache.get_cog_config(member.guild.id, constants.WELCOME_MESSAGES_KEY)
 
     if cogs == None:
         return
@@ -148,7 +148,7 @@ async def send_welcome_message_preview(interaction: discord.Interaction, respons
     }
 
     if not welcome_data:
-        cogs = cache.get_cog_data_or_populate(interaction.guild.id, constants.WELCOME_MESSAGES_KEY)
+        cogs = await cache.get_cog_config(interaction.guild.id, constants.WELCOME_MESSAGES_KEY)
         if not cogs:
             return
         welcome_data = {
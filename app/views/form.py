@@ -857,10 +857,10 @@ class Form(discord.ui.View):
             if inspect.isawaitable(result):
                 await result
         else:
-            update_moderations_by_guild(
+            await update_moderations_by_guild(
                 guild_id=interaction.guild_id, key=self.command_key, value=True
             )
-            insert_cog_by_guild(
+            await insert_cog_by_guild(
                 guild_id=interaction.guild_id, cog=self.command_key, data=cog_param
             )
 
@@ -933,7 +933,7 @@ class Form(discord.ui.View):
 
         if self.command_key in subscriptions:
             sub = subscriptions[self.command_key]
-            sub["handler"](interaction, sub["subscribe"], sub["unsubscribe"], sub["key"])
+            await sub["handler"](interaction, sub["subscribe"], sub["unsubscribe"], sub["key"])
 
         if self.command_key == commandconstants.INTEGRATIONS_STREAM_ELEMENTS_COMMANDS_KEY:
             streamer = self.responses[0]["value"]
@@ -941,7 +941,7 @@ class Form(discord.ui.View):
             self.responses.append({"key": "channel_id", "title": "Channel ID", "value": channel_info["_id"]})
 
 
-    def _handle_subscription(
+    async def _handle_subscription(
         self, interaction: discord.Interaction, subscribe_func, unsubscribe_func, key: str):
         index = getattr(self, "composition_index", 0)
 
@@ -954,11 +954,15 @@ class Form(discord.ui.View):
         if old_entry and old_entry[key]["value"] == new_entry[key]["value"]:
             return
 
+        # The Twitch handlers are coroutines, the YouTube ones are not.
         if old_entry:
-            unsubscribe_func(interaction, old_entry)
-            subscribe_func(interaction, new_entry)
+            calls = [(unsubscribe_func, old_entry), (subscribe_func, new_entry)]
         else:
-            subscribe_func(interaction, self.responses)
+            calls = [(subscribe_func, self.responses)]
+        for func, entry in calls:
+            result = func(interaction, entry)
+            if inspect.isawaitable(result):
+                await result
 
     def _parse_cogs_to_select(self) -> None:
         if isinstance(self.cogs, list):
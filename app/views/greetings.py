@@ -7,7 +7,7 @@ from app.constants import Commands as commands_constants
 from app.constants import LogTypes as logconstants
 from app.constants import supported_locales
 from app.integrations.google_translate import GoogleTranslate
-from app.services.cache import increment_redis_key
+from app.services.command_counters import increment_command_counter
 from app.services.utils import get_command_by_key, ml, parse_locale
 
 SETUP_FEATURES = [
@@ -65,7 +65,7 @@ class SetupButton(discord.ui.Button):
             interaction_source="button (greetings)",
         )
 
-        increment_redis_key(f"{logconstants.COMMAND_CALL_TYPE}:{self.command_key}:button")
+        increment_command_counter(logconstants.COMMAND_CALL_TYPE, f"{self.command_key}:button")
 
         guild_id = str(interaction.guild.id)
         service = importlib.import_module(ExecuteCommandButton.COMMAND_SERVICES[self.command_key])
@@ -88,13 +88,14 @@ class DashboardButton(discord.ui.Button):
             embed = response_embed("buttons.setup.admin-only", self.locale)
             return await interaction.response.send_message(embed=embed, ephemeral=True)
 
-        from app.data.moderations import find_moderations_by_guild
-        from app.views.setup import SetupView
+        from app.data.aio.moderations import find_moderations_by_guild
+        from app.views.setup import SetupView, find_paused_features
 
         locale = parse_locale(interaction.locale)
         guild_id = str(interaction.guild.id)
-        moderations = find_moderations_by_guild(interaction.guild.id) or {}
-        view = SetupView(moderations, locale, guild_id=guild_id)
+        moderations = await find_moderations_by_guild(interaction.guild.id) or {}
+        paused = await find_paused_features(guild_id, moderations)
+        view = SetupView(moderations, locale, guild_id=guild_id, paused=paused)
         embed = view.get_embed()
 
         await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
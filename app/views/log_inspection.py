@@ -4,11 +4,11 @@ from app import bot, logger
 from app.components.buttons import GenericButton, HistoryButton
 from app.constants import Commands as constants
 from app.constants import LogTypes as logconstants
-from app.data import moderations as moderations_data
-from app.services.cogs import find_cog_events_by_guild
-from app.services.manager import parse_history_data
+from app.data.aio import cogs as cogs_data
+from app.data.aio import moderations as moderations_data
+from app.services.manager import CogEventsHistory, parse_history_data
 from app.services.utils import format_relative_time, ml
-from app.views.pagination import PaginationView
+from app.views.pagination import HistoryPaginationView
 
 COMMAND_STATUS_ICONS = {
     True: "\u2705",
@@ -59,10 +59,10 @@ class LogInspectionView(discord.ui.View):
         embed.add_field(name="guild_id", value=self.guild.id, inline=False)
         embed.add_field(name="guild_created_at", value=self.parse_if_time(self.guild.created_at), inline=False)
 
-        moderations = moderations_data.find_moderations_by_guild(self.guild.id)
+        moderations = await moderations_data.find_moderations_by_guild(self.guild.id)
         if moderations:
             self._add_moderations_fields(embed, moderations)
-            self._add_commands_status(embed, moderations)
+            await self._add_commands_status(embed, moderations)
 
         try:
             integrations = await self.guild.integrations()
@@ -89,10 +89,10 @@ class LogInspectionView(discord.ui.View):
             color=discord.Color.dark_gray(),
         )
 
-        moderations = moderations_data.find_moderations_by_guild(self.guild_id)
+        moderations = await moderations_data.find_moderations_by_guild(self.guild_id)
         if moderations:
             self._add_moderations_fields(embed, moderations)
-            self._add_commands_status(embed, moderations)
+            await self._add_commands_status(embed, moderations)
 
         return embed
 
@@ -109,7 +109,7 @@ class LogInspectionView(discord.ui.View):
 
             embed.add_field(name=key, value=self.parse_if_time(value), inline=False)
 
-    def _add_commands_status(self, embed: discord.Embed, moderations: dict):
+    async def _add_commands_status(self, embed: discord.Embed, moderations: dict):
         guild_id = self.guild.id if self.guild else self.guild_id
         status_lines = []
         for command_key in constants.COMMANDS_LIST:
@@ -118,10 +118,9 @@ class LogInspectionView(discord.ui.View):
             line = f"{icon} {command_key}"
 
             if is_active:
-                events = find_cog_events_by_guild(guild_id, command_key)
-                last_enabled = self._find_last_enabled_event(events)
+                last_enabled = await cogs_data.find_last_cog_event(guild_id, command_key, ["enabled", "unpaused"])
                 if last_enabled:
-                    line += f" ({format_relative_time(last_enabled)})"
+                    line += f" ({format_relative_time(last_enabled['datetime'])})"
 
             status_lines.append(line)
 
@@ -134,25 +133,18 @@ class LogInspectionView(discord.ui.View):
             inline=False,
         )
 
-    @staticmethod
-    def _find_last_enabled_event(events):
-        last = None
-        for event in events:
-            if event.get("event") in ("enabled", "unpaused"):
-                last = event.get("datetime")
-        return last
-
     async def history_callback(self, interaction: discord.Interaction):
         guild_id = self.guild.id if self.guild else self.guild_id
-        raw_data = []
-
-        for cog_key in constants.COMMANDS_LIST:
-            raw_data += find_cog_events_by_guild(guild_id, cog_key)
-
-        data = parse_history_data(raw_data, interaction, guild=self.guild, with_cog=True)
+        history = CogEventsHistory(guild_id, constants.COMMANDS_LIST)
 
         title = ml("buttons.changes-history.label", locale=interaction.locale)
-        pagination_view = PaginationView(interaction, title, "", data, sep=4)
+        pagination_view = HistoryPaginationView(
+            interaction,
+            title,
+            "",
+            history,
+            lambda events: parse_history_data(events, interaction, guild=self.guild, with_cog=True),
+        )
 
         await pagination_view.send(ephemeral=True)
 
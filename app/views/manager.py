@@ -20,11 +20,10 @@ from app.constants import Commands as constants
 from app.constants import KeikoIcons as icons
 from app.services.cogs import (
     delete_cog_by_guild,
-    find_cog_events_by_guild,
     insert_cog_event,
     update_cog_by_guild,
 )
-from app.services.manager import parse_history_data, parse_history_desc
+from app.services.manager import CogEventsHistory, parse_history_data, parse_history_desc
 from app.services.moderations import (
     pause_moderations_by_guild,
     unpause_moderations_by_guild,
@@ -40,7 +39,7 @@ from app.services.utils import (
     parse_form_yaml_to_dict,
     parse_locale,
 )
-from app.views.pagination import PaginationView
+from app.views.pagination import HistoryPaginationView
 
 
 class Manager(discord.ui.View):
@@ -106,7 +105,7 @@ class Manager(discord.ui.View):
         if custom_save:
             await custom_save(interaction, self, data)
         else:
-            update_cog_by_guild(interaction.guild_id, self.command_key, data)
+            await update_cog_by_guild(interaction.guild_id, self.command_key, data)
 
         if hasattr(self, "_original_embed"):
             embed = self._original_embed
@@ -172,7 +171,7 @@ class Manager(discord.ui.View):
         guild_id = str(interaction.guild.id)
         embed = interaction.message.embeds[0]
 
-        unpause_moderations_by_guild(guild_id=guild_id, key=self.command_key)
+        await unpause_moderations_by_guild(guild_id=guild_id, key=self.command_key)
 
         embed.title = ml("commands.command-events.unpaused.title", locale=self.locale)
         embed.description = parse_command_event_description(
@@ -206,7 +205,7 @@ class Manager(discord.ui.View):
         guild_id = str(interaction.guild.id)
         embed = interaction.message.embeds[0]
 
-        pause_moderations_by_guild(guild_id=guild_id, key=self.command_key)
+        await pause_moderations_by_guild(guild_id=guild_id, key=self.command_key)
 
         embed.title = ml("commands.command-events.paused.title", locale=self.locale)
         embed.description = parse_command_event_description(
@@ -248,7 +247,7 @@ class Manager(discord.ui.View):
 
         # TODO: handle this type of logic in a service
         if self.command_key == constants.NOTIFICATIONS_TWITCH_KEY:
-            handle_unsubscribe_streamer(interaction, self.cogs)
+            await handle_unsubscribe_streamer(interaction, self.cogs)
         if self.command_key == constants.NOTIFICATIONS_YOUTUBE_VIDEO_KEY:
             handle_unsubscribe_youtube_new_video(interaction, self.cogs)
         custom_disable = self.lifecycle_callbacks.get(constants.LIFECYCLE_DISABLE)
@@ -257,9 +256,9 @@ class Manager(discord.ui.View):
             if hasattr(result, "__await__"):
                 await result
 
-        unpause_moderations_by_guild(guild_id=guild_id, key=self.command_key)
+        await unpause_moderations_by_guild(guild_id=guild_id, key=self.command_key)
 
-        delete_cog_by_guild(guild_id, self.command_key)
+        await delete_cog_by_guild(guild_id, self.command_key)
 
         embed.title = ml("commands.command-events.disabled.title", locale=self.locale)
         embed.description = parse_command_event_description(
@@ -293,12 +292,13 @@ class Manager(discord.ui.View):
                 pass
 
     async def history_callback(self, interaction: discord.Interaction):
-        raw_data = find_cog_events_by_guild(self.interaction.guild_id, self.command_key)
-        data = parse_history_data(raw_data, interaction)
+        history = CogEventsHistory(self.interaction.guild_id, [self.command_key])
 
         title = ml("buttons.changes-history.label", locale=self.locale)
         desc = parse_history_desc(interaction, self.command_key)
-        pagination_view = PaginationView(interaction, title, desc, data, sep=4)
+        pagination_view = HistoryPaginationView(
+            interaction, title, desc, history, lambda events: parse_history_data(events, interaction)
+        )
 
         await pagination_view.send(ephemeral=True)
 
@@ -335,7 +335,7 @@ class Manager(discord.ui.View):
                 return
         else:
             values.append(response)
-            update_cog_by_guild(interaction.guild_id, self.command_key, self.cogs)
+            await update_cog_by_guild(interaction.guild_id, self.command_key, self.cogs)
 
         embed = self._response_embed(interaction)
         embed.clear_fields()
@@ -444,14 +444,14 @@ class Manager(discord.ui.View):
             await interaction.response.defer(ephemeral=True)
 
         if self.command_key == constants.NOTIFICATIONS_TWITCH_KEY:
-            handle_unsubscribe_streamer(interaction, item_removed)
+            await handle_unsubscribe_streamer(interaction, item_removed)
         if self.command_key == constants.NOTIFICATIONS_YOUTUBE_VIDEO_KEY:
             handle_unsubscribe_youtube_new_video(interaction, item_removed)
         custom_remove_item = self.lifecycle_callbacks.get(constants.LIFECYCLE_REMOVE_ITEM)
         if custom_remove_item:
             await custom_remove_item(interaction, self, item_removed, new_cogs)
         else:
-            update_cog_by_guild(interaction.guild_id, self.command_key, new_cogs)
+            await update_cog_by_guild(interaction.guild_id, self.command_key, new_cogs)
 
         embed = self._response_embed(interaction)
         embed.clear_fields()
@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Any, Callable, Dict, List
 
 import discord
 
@@ -6,6 +6,7 @@ from app import logger
 from app.constants import KeikoIcons as icons_constants
 from app.constants import LogTypes as logconstants
 from app.constants import Style as constants
+from app.services.manager import CogEventsHistory
 from app.services.utils import ml
 
 
@@ -52,7 +53,7 @@ class PaginationView(discord.ui.View):
         footer = ml("commands.pagination-view.footer", locale=self.interaction.locale)
         self.embed.set_thumbnail(url=icons_constants.IMAGE_02)
         self.embed.set_footer(
-            text=f"• {footer} {self.current_page} / {len(self.separated_data)}"
+            text=f"• {footer} {self.current_page} / {self.get_total_pages_label()}"
         )
         return self.embed
 
@@ -85,6 +86,13 @@ class PaginationView(discord.ui.View):
             embed=self.create_embed(data), view=self
         )
 
+    def get_total_pages_label(self) -> str:
+        return str(len(self.separated_data))
+
+    async def show_page(self, page: int):
+        self.current_page = page
+        await self.update_message(self.get_current_page_data())
+
     def update_buttons(self):
         total_pages = len(self.separated_data)
         self.first_page_button.disabled = self.current_page == 1
@@ -103,32 +111,28 @@ class PaginationView(discord.ui.View):
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
         await interaction.response.defer()
-        self.current_page = 1
-        await self.update_message(self.get_current_page_data())
+        await self.show_page(1)
 
     @discord.ui.button(label="<", style=discord.ButtonStyle.primary)
     async def prev_button(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
         await interaction.response.defer()
-        self.current_page -= 1
-        await self.update_message(self.get_current_page_data())
+        await self.show_page(self.current_page - 1)
 
     @discord.ui.button(label=">", style=discord.ButtonStyle.primary)
     async def next_button(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
         await interaction.response.defer()
-        self.current_page += 1
-        await self.update_message(self.get_current_page_data())
+        await self.show_page(self.current_page + 1)
 
     @discord.ui.button(label=">|", style=discord.ButtonStyle.green)
     async def last_page_button(
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
         await interaction.response.defer()
-        self.current_page = len(self.separated_data)
-        await self.update_message(self.get_current_page_data())
+        await self.show_page(len(self.separated_data))
 
     async def on_error(self, interaction: discord.Interaction, error: Exception, item: discord.ui.Item) -> None:
         logger.error(
@@ -137,3 +141,54 @@ class PaginationView(discord.ui.View):
             log_type=logconstants.COMMAND_ERROR_TYPE,
             exc_info=True,
         )
+
+
+class HistoryPaginationView(PaginationView):
+    """Pagination over a command history fetched one page at a time, as the user moves forward."""
+
+    def __init__(
+        self,
+        interaction: discord.Interaction,
+        title: str,
+        description: str,
+        history: CogEventsHistory,
+        parse_page: Callable[[List[Dict[str, Any]]], Dict[str, str]],
+    ):
+        self.history = history
+        self.parse_page = parse_page
+        self.pages: List[Dict[str, str]] = []
+        super().__init__(interaction, title, description, {}, sep=history.page_size)
+
+    async def send(self, ephemeral: bool = False):
+        await self.load_page(1)
+        await super().send(ephemeral)
+
+    async def load_page(self, page: int):
+        while len(self.pages) < page and not self.history.exhausted:
+            events = await self.history.next_page()
+            if events:
+                self.pages.append(self.parse_page(events))
+
+    async def show_page(self, page: int):
+        await self.load_page(page)
+        await super().show_page(max(1, min(page, len(self.pages))))
+
+    def get_current_page_data(self):
+        if self.current_page - 1 < len(self.pages):
+            return self.pages[self.current_page - 1]
+        return {}
+
+    def create_embed(self, data):
+        self.data = data
+        return super().create_embed(data)
+
+    def get_total_pages_label(self) -> str:
+        return str(max(len(self.pages), 1)) if self.history.exhausted else f"{len(self.pages)}+"
+
+    def update_buttons(self):
+        is_last_loaded = self.current_page >= len(self.pages)
+        self.first_page_button.disabled = self.current_page == 1
+        self.prev_button.disabled = self.current_page == 1
+        self.next_button.disabled = is_last_loaded and self.history.exhausted
+        # Jumping to the end would read the whole history, so it is only offered once it is loaded.
+        self.last_page_button.disabled = is_last_loaded or not self.history.exhausted
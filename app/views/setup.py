@@ -1,11 +1,14 @@
+import asyncio
+from typing import Set
+
 import discord
 
 from app import logger
 from app.constants import Commands as commands_constants
 from app.constants import LogTypes as logconstants
 from app.constants import Style as style
-from app.data.cogs import find_cog_by_guild_id
-from app.services.cache import increment_redis_key
+from app.data.aio.cogs import find_cog_by_guild_id
+from app.services.command_counters import increment_command_counter
 from app.services.utils import get_command_by_key, ml
 
 def _get_translated_command(command_key: str, locale: str) -> str:
@@ -47,29 +50,45 @@ class SetupFeatureButton(discord.ui.Button):
             interaction_source="button (setup)",
         )
 
-        increment_redis_key(f"{logconstants.COMMAND_CALL_TYPE}:{self.command_key}:button")
+        increment_command_counter(logconstants.COMMAND_CALL_TYPE, f"{self.command_key}:button")
 
         guild_id = str(interaction.guild.id)
         service = importlib.import_module(ExecuteCommandButton.COMMAND_SERVICES[self.command_key])
         await service.manager(interaction=interaction, guild_id=guild_id)
 
 
+async def find_paused_features(guild_id: str, moderations: dict) -> Set[str]:
+    command_keys = [
+        feature["command_key"]
+        for feature in commands_constants.SETUP_FEATURES
+        if moderations.get(feature["command_key"], False)
+    ]
+    projection = {commands_constants.ENABLED_KEY: 1}
+    cogs = await asyncio.gather(
+        *(find_cog_by_guild_id(guild_id, command_key, projection) for command_key in command_keys)
+    )
+    return {
+        command_key
+        for command_key, cog_data in zip(command_keys, cogs)
+        if cog_data and not cog_data.get(commands_constants.ENABLED_KEY, True)
+    }
+
+
 class SetupView(discord.ui.View):
-    def __init__(self, moderations: dict, locale: str, guild_id: str = None):
+    def __init__(self, moderations: dict, locale: str, guild_id: str = None, paused: Set[str] = None):
         super().__init__(timeout=300)
         self.locale = locale
         self.moderations = moderations
         self.guild_id = guild_id
+        self.paused = paused or set()
         self._build(moderations, locale)
 
     def _get_feature_status(self, command_key: str, is_configured: bool):
         if not is_configured:
             return "not-configured", "🔴"
 
-        if self.guild_id:
-            cog_data = find_cog_by_guild_id(self.guild_id, command_key)
-            if cog_data and not cog_data.get(commands_constants.ENABLED_KEY, True):
-                return "paused", "⏸"
+        if command_key in self.paused:
+            return "paused", "⏸"
 
         return "enabled", "🟢"
 
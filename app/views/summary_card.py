@@ -337,7 +337,7 @@ class SummaryCardPickerView(discord.ui.LayoutView):
 
                 from app.components.modals import ModalValidations
 
-                result = ModalValidations(cogs={}).validate(
+                result = await ModalValidations(cogs={}).validate(
                     validation,
                     responses=candidate_state,
                 )
@@ -2,7 +2,7 @@ import discord
 
 from app import bot, logger
 from app.constants import LogTypes as logconstants
-from app.data import moderations as moderations_data
+from app.data.aio import moderations as moderations_data
 from app.services.utils import format_relative_time
 
 
@@ -10,6 +10,13 @@ BOT_STATUS_ICONS = {
     True: "\u2705",
     False: "\u274c",
 }
+GUILDS_FIELD_PROJECTION = {
+    "guild_id": True,
+    "is_bot_online": True,
+    "created_at": True,
+    "updated_at": True,
+    "_id": False,
+}
 
 
 class UserInspectionView(discord.ui.View):
@@ -17,7 +24,7 @@ class UserInspectionView(discord.ui.View):
         self.user = user
         super().__init__(timeout=None)
 
-    def _get_embed(self) -> discord.Embed:
+    async def _get_embed(self) -> discord.Embed:
         embed = discord.Embed(
             title=self.user.name,
             color=discord.Color.green(),
@@ -31,10 +38,10 @@ class UserInspectionView(discord.ui.View):
         )
         embed.add_field(name="Display Name", value=self.user.display_name, inline=False)
 
-        total_guilds = moderations_data.count_moderations_by_owner(str(self.user.id))
+        total_guilds = await moderations_data.count_moderations_by_owner(str(self.user.id))
         embed.add_field(name="Total Guilds Invited", value=total_guilds, inline=False)
 
-        guilds_value = self._get_guilds_field()
+        guilds_value = await self._get_guilds_field()
         embed.add_field(name="Guilds", value=guilds_value, inline=False)
 
         if self.user.avatar:
@@ -42,8 +49,8 @@ class UserInspectionView(discord.ui.View):
 
         return embed
 
-    def _get_guilds_field(self) -> str:
-        moderations = moderations_data.find_moderations_by_owner(str(self.user.id))
+    async def _get_guilds_field(self) -> str:
+        moderations = await moderations_data.find_moderations_by_owner(str(self.user.id), GUILDS_FIELD_PROJECTION)
 
         if not moderations:
             return "No guilds found"
@@ -80,7 +87,7 @@ class UserInspectionView(discord.ui.View):
             return value
 
     async def send(self, interaction: discord.Interaction):
-        embed = self._get_embed()
+        embed = await self._get_embed()
         await interaction.response.send_message(embed=embed, view=self, ephemeral=True)
 
     async def on_error(self, interaction: discord.Interaction, error: Exception, item: discord.ui.Item) -> None:
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from functools import partial
 from typing import Any, Dict, List, Tuple
 
 import discord
@@ -7,9 +8,10 @@ from app import bot, logger
 from app.components.embed import default_welcome_embed
 from app.constants import KeikoIcons
 from app.constants import LogTypes as logconstants
-from app.data import birthdays as birthdays_data
+from app.data.aio import birthdays as birthdays_data
 from app.exceptions import ErrorContext
 from app.services.dates import format_mm_dd_label, is_valid_mm_dd
+from app.services.fanout import FanoutTarget, fan_out
 from app.services.utils import ml, parse_locale
 
 
@@ -72,7 +74,7 @@ async def process_birthday_webhook(reminder_id: str, notes: str) -> None:
             logger.warn(f"Invalid birthday reminder notes: {notes}", log_type=logconstants.COMMAND_WARN_TYPE)
             return
 
-        items = birthdays_data.find_birthday_items_by_date(mm_dd)
+        items = await birthdays_data.find_birthday_items_by_date(mm_dd)
         grouped: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         for item in items:
             grouped[str(item.get("guild_id"))].append(item)
@@ -82,36 +84,42 @@ async def process_birthday_webhook(reminder_id: str, notes: str) -> None:
             log_type=logconstants.COMMAND_INFO_TYPE,
         )
 
+        targets: List[FanoutTarget] = []
         for guild_id, guild_items in grouped.items():
-            if not birthdays_data.is_birthday_enabled(guild_id):
+            if not await birthdays_data.is_birthday_enabled(guild_id):
                 continue
 
-            config = birthdays_data.find_birthday_config(guild_id)
+            config = await birthdays_data.find_birthday_config(guild_id)
             if not config or not config.get("channel_id"):
                 continue
 
             guild = bot.get_guild(int(guild_id))
-            if not guild:
-                logger.warn(f"Guild not found: {guild_id}", log_type=logconstants.COMMAND_WARN_TYPE)
-                continue
-
-            channel = guild.get_channel(int(config["channel_id"]))
+            channel = guild.get_channel(int(config["channel_id"])) if guild else None
             if not channel:
-                logger.warn(f"Channel not found: {config['channel_id']}", log_type=logconstants.COMMAND_WARN_TYPE)
+                reason = f"guild not found: {guild_id}" if not guild else f"channel not found: {config['channel_id']}"
+                targets.extend(FanoutTarget.skipped(f"{guild_id}/{item['user_id']}", reason) for item in guild_items)
                 continue
 
             locale = parse_locale(config.get("locale") or getattr(guild, "preferred_locale", "en-US"))
             mention_everyone = bool(config.get("mention_everyone"))
+            content = "@everyone" if mention_everyone else None
+            allowed_mentions = discord.AllowedMentions(everyone=mention_everyone, users=False, roles=False)
             for item in guild_items:
+                key = f"{guild_id}/{item['user_id']}"
                 member = guild.get_member(int(item["user_id"]))
                 if not member:
-                    logger.warn(f"Member not found: {item['user_id']}", log_type=logconstants.COMMAND_WARN_TYPE)
+                    targets.append(FanoutTarget.skipped(key, f"member not found: {item['user_id']}"))
                     continue
 
                 embed = build_celebration_embed(item, member, guild, config, locale)
-                content = "@everyone" if mention_everyone else None
-                allowed_mentions = discord.AllowedMentions(everyone=mention_everyone, users=False, roles=False)
-                await channel.send(content=content, embed=embed, allowed_mentions=allowed_mentions)
+                targets.append(FanoutTarget(
+                    key,
+                    str(channel.id),
+                    partial(channel.send, content=content, embed=embed, allowed_mentions=allowed_mentions),
+                ))
+
+        result = await fan_out("birthday", mm_dd, targets)
+        logger.info(f"Birthday reminder date={mm_dd} {result.summary()}", log_type=logconstants.COMMAND_INFO_TYPE)
 
     except Exception as e:
         logger.error(
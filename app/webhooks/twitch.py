@@ -1,3 +1,5 @@
+import time
+
 from flask import request
 
 from app import logger
@@ -18,19 +20,20 @@ def twitch_webhook():
     if bot.twitch.check_request_is_a_challenge(request):
         return data['challenge']
 
+    # Scheduled on the bot loop from the Flask thread.
     if data.get('subscription', {}).get('type') == 'stream.online':
-        from app.services.notifications_twitch import handle_send_streamer_notification
+        from app.services.notifications_twitch import schedule_streamer_notification
 
         streamer_name = data['event']['broadcaster_user_name'].lower()
-        bot.loop.create_task(handle_send_streamer_notification(streamer_name))
+        bot.loop.call_soon_threadsafe(schedule_streamer_notification, streamer_name, data['event'], time.monotonic())
 
     if data.get('subscription', {}).get('type') == 'stream.offline':
         from app.services.notifications_twitch import (
-            handle_send_streamer_offline_notification,
+            schedule_streamer_offline_notification,
         )
 
         streamer_name = data['event']['broadcaster_user_name'].lower()
         logger.info(f"Stream offline event received for {streamer_name}", log_type=logconstants.COMMAND_INFO_TYPE)
-        bot.loop.create_task(handle_send_streamer_offline_notification(streamer_name))
+        bot.loop.call_soon_threadsafe(schedule_streamer_offline_notification, streamer_name)
 
     return "Webhook processed", 200
@@ -0,0 +1,121 @@
+"""
+Micro-benchmark of the block_links message scan.
+
+Compares the legacy regex findall + list removal with the link_matcher
+engine (pre-filter, host extraction, suffix trie) over a corpus of
+chat-like messages.
+
+Usage:
+    python -m benchmarks.block_links_matcher [--messages 20000] [--rounds 5]
+"""
+
+import argparse
+import random
+import re
+import time
+from typing import Callable, List
+
+from app.constants import default_allowed_domains
+from app.services.link_matcher import DomainTrie, find_blocked_links
+
+LEGACY_ALLOWED_LINKS = {
+    "twitter": "https://twitter.com",
+    "youtube": "https://youtube.com",
+    "twitch": "https://twitch.tv",
+}
+ALLOWED = list(LEGACY_ALLOWED_LINKS)
+
+PLAIN_MESSAGES = [
+    "bom dia galera",
+    "alguém vai jogar hoje à noite?",
+    "kkkkkkkkkkk",
+    "gg wp",
+    "vou dormir, até amanhã :sleeping:",
+    "alguem sabe que horas começa a live?",
+    "that was insane lol",
+    "ok. vou ver isso depois. valeu!",
+    "<@123456789012345678> bora?",
+    "lembrete: reunião às 20h.",
+    "o patch 1.2.3 saiu ontem",
+]
+LINK_MESSAGES = [
+    "olha isso https://twitter.com",
+    "clipe novo https://www.twitch.tv/gaules/clip/AbCdEf",
+    "https://youtube.com/watch?v=dQw4w9WgXcQ",
+    "free nitro https://discord-gift.example.ru/claim?code=123",
+    "vejam https://spam-site.com/promo e https://twitter.com/user/status/1",
+    "<https://m.youtube.com/watch?v=abc>",
+    "docs: https://docs.python.org/3/library/re.html.",
+    "http://old-site.net/index.php?id=1",
+]
+
+
+def build_corpus(size: int, link_ratio: float = 0.15, seed: int = 42) -> List[str]:
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        pool = LINK_MESSAGES if rng.random() < link_ratio else PLAIN_MESSAGES
+        corpus.append(rng.choice(pool))
+    return corpus
+
+
+def legacy_scan(message: str) -> List[str]:
+    links = re.findall(
+        r"http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*(),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+",
+        message.lower(),
+    )
+
+    allowed_link_list = []
+    for allowed_link in ALLOWED:
+        allowed_link_list.append(LEGACY_ALLOWED_LINKS[allowed_link.lower()])
+
+    for link in links:
+        link = link.replace("www.", "")
+        if link.endswith("/"):
+            link = link[:-1]
+        if link in allowed_link_list:
+            try:
+                links.remove(link)
+            except ValueError:
+                pass
+
+    return links
+
+
+ALLOWED_DOMAINS = DomainTrie(
+    domain for name in ALLOWED for domain in default_allowed_domains[name]
+)
+
+
+def matcher_scan(message: str) -> List[str]:
+    return find_blocked_links(message, ALLOWED_DOMAINS)
+
+
+def measure(scan: Callable[[str], List[str]], corpus: List[str], rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for message in corpus:
+            scan(message)
+        best = min(best, time.perf_counter() - start)
+    return len(corpus) / best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.messages)
+    before = measure(legacy_scan, corpus, args.rounds)
+    after = measure(matcher_scan, corpus, args.rounds)
+
+    print(f"corpus: {len(corpus)} messages, best of {args.rounds} rounds")
+    print(f"legacy regex + list removal: {before:>12,.0f} msg/s")
+    print(f"link_matcher (trie):         {after:>12,.0f} msg/s")
+    print(f"speedup:                     {after / before:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
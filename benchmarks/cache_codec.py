@@ -0,0 +1,159 @@
+"""
+Benchmark of the Redis cache value codecs.
+
+Compares bson.json_util (the legacy format) with the cache_codec msgpack
+and JSON codecs, with and without zlib, on cog documents shaped like the
+ones stored in guild.* (small flag documents, welcome messages, twitch
+notification compositions and birthday lists).
+
+Usage:
+    python -m benchmarks.cache_codec [--rounds 2000]
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Tuple
+
+from bson import ObjectId, json_util
+
+from app.services import cache_codec
+
+COMPRESSION_THRESHOLD = 1024
+
+
+def _base_document(guild_id: int) -> Dict[str, Any]:
+    created_at = datetime(2024, 3, 1, 12, 0, 0)
+    return {
+        "_id": ObjectId(),
+        "guild_id": str(guild_id),
+        "enabled": True,
+        "created_at": created_at,
+        "updated_at": created_at + timedelta(days=30),
+    }
+
+
+def _field(title: str, value: Any) -> Dict[str, Any]:
+    return {"title": title, "value": value}
+
+
+def block_links_document() -> Dict[str, Any]:
+    return {
+        **_base_document(1),
+        "allowed_links": {"title": "Links permitidos", "values": ["youtube", "twitch", "twitter"]},
+        "allowed_roles": {"title": "Cargos permitidos", "values": ["1180000000000000001"]},
+        "allowed_chats": {"title": "Canais permitidos", "values": ["1180000000000000002"]},
+        "answer": "Links não são permitidos aqui!",
+    }
+
+
+def welcome_messages_document() -> Dict[str, Any]:
+    return {
+        **_base_document(2),
+        "welcome_messages_channel": {"title": "Canal", "values": "1180000000000000003"},
+        "welcome_messages": {
+            "title": "Mensagens",
+            "values": [f"Bem-vindo(a) {{user}} ao servidor! Mensagem {index}" for index in range(10)],
+        },
+        "welcome_messages_title": "Olá!",
+        "welcome_messages_footer": "Leia as regras em #regras",
+        "welcome_design": "server_blur",
+    }
+
+
+def notifications_twitch_document(streamers: int = 40) -> Dict[str, Any]:
+    return {
+        **_base_document(3),
+        "notifications": {
+            "title": "Notificações",
+            "values": [
+                {
+                    "streamer": _field("Streamer", f"streamer_{index}"),
+                    "channel": _field("Canal", str(1180000000000000100 + index)),
+                    "message": _field("Mensagem", f"{{streamer}} está ao vivo! Vem assistir: {{link}} #{index}"),
+                    "role": _field("Cargo", str(1180000000000000200 + index)),
+                }
+                for index in range(streamers)
+            ],
+        },
+    }
+
+
+def birthdays_document(members: int = 150) -> Dict[str, Any]:
+    return {
+        **_base_document(4),
+        "birthdays": {
+            "title": "Aniversários",
+            "values": [
+                {
+                    "user": _field("Membro", str(1180000000000001000 + index)),
+                    "date": _field("Data", f"{index % 28 + 1:02d}/{index % 12 + 1:02d}"),
+                    "created_at": datetime(2024, 1, 1) + timedelta(hours=index),
+                }
+                for index in range(members)
+            ],
+        },
+    }
+
+
+DOCUMENTS = {
+    "block_links": block_links_document(),
+    "welcome_messages": welcome_messages_document(),
+    "notifications_twitch (40)": notifications_twitch_document(),
+    "birthdays (150)": birthdays_document(),
+}
+
+# name -> (encode, decode)
+FORMATS: Dict[str, Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    "json_util (legacy)": (lambda doc: json_util.dumps(doc).encode(), cache_codec.decode_legacy),
+    "json": (lambda doc: cache_codec.encode(doc, "json"), cache_codec.decode),
+    "json + zlib": (
+        lambda doc: cache_codec.encode(doc, "json", COMPRESSION_THRESHOLD),
+        cache_codec.decode,
+    ),
+    "msgpack": (lambda doc: cache_codec.encode(doc, "msgpack"), cache_codec.decode),
+    "msgpack + zlib": (
+        lambda doc: cache_codec.encode(doc, "msgpack", COMPRESSION_THRESHOLD),
+        cache_codec.decode,
+    ),
+}
+
+
+def measure(function: Callable[[], Any], rounds: int) -> float:
+    """Returns the mean time per call in microseconds (best of 3 runs)."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            function()
+        best = min(best, time.perf_counter() - start)
+    return best / rounds * 1_000_000
+
+
+def run(rounds: int) -> List[Tuple[str, str, int, float, float]]:
+    results = []
+    for document_name, document in DOCUMENTS.items():
+        for format_name, (encode, decode) in FORMATS.items():
+            raw = encode(document)
+            results.append((
+                document_name,
+                format_name,
+                len(raw),
+                measure(lambda: encode(document), rounds),
+                measure(lambda: decode(raw), rounds),
+            ))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'document':<28}{'format':<22}{'bytes':>8}{'encode µs':>12}{'decode µs':>12}")
+    for document_name, format_name, size, encode_time, decode_time in run(args.rounds):
+        print(f"{document_name:<28}{format_name:<22}{size:>8}{encode_time:>12.1f}{decode_time:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
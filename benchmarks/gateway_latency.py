@@ -0,0 +1,89 @@
+"""
+Benchmark of gateway event latency with a blocking and an async data layer.
+
+Simulates the bot event loop receiving gateway events at a fixed rate, each
+handler doing one MongoDB round trip: with pymongo the round trip blocks the
+loop (every event queued behind it waits), with Motor it is awaited. Reports
+the latency from event arrival to handler completion.
+
+Usage:
+    python -m benchmarks.gateway_latency [--events 500] [--rate 200] [--query-ms 5]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, List, Tuple
+
+
+def blocking_query(seconds: float) -> Callable[[], Awaitable[None]]:
+    async def query():
+        time.sleep(seconds)
+
+    return query
+
+
+def async_query(seconds: float) -> Callable[[], Awaitable[None]]:
+    async def query():
+        await asyncio.sleep(seconds)
+
+    return query
+
+
+async def dispatch(events: int, rate: float, query: Callable[[], Awaitable[None]]) -> List[float]:
+    """Dispatches `events` handlers at `rate` per second; returns their latencies in seconds."""
+    latencies: List[float] = []
+
+    async def handler(arrived_at: float):
+        await query()
+        latencies.append(time.perf_counter() - arrived_at)
+
+    tasks = []
+    started_at = time.perf_counter()
+    for index in range(events):
+        arrival = started_at + index / rate
+        delay = arrival - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        # Latency counts from the scheduled arrival: a blocked loop delays the dispatch itself.
+        tasks.append(asyncio.create_task(handler(arrival)))
+
+    await asyncio.gather(*tasks)
+    return latencies
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run(events: int, rate: float, query_ms: float) -> List[Tuple[str, float, float, float]]:
+    results = []
+    for name, query in (
+        ("pymongo (blocking)", blocking_query(query_ms / 1000)),
+        ("motor (async)", async_query(query_ms / 1000)),
+    ):
+        latencies = asyncio.run(dispatch(events, rate, query))
+        results.append((
+            name,
+            percentile(latencies, 0.50) * 1000,
+            percentile(latencies, 0.99) * 1000,
+            max(latencies) * 1000,
+        ))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--rate", type=float, default=200, help="events per second")
+    parser.add_argument("--query-ms", type=float, default=5, help="MongoDB round trip per event")
+    args = parser.parse_args()
+
+    print(f"{'data layer':<22}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, p50, p99, worst in run(args.events, args.rate, args.query_ms):
+        print(f"{name:<22}{p50:>10.1f}{p99:>10.1f}{worst:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Benchmark of projected versus full document reads.
+
+Encodes the documents each hot read returns as BSON, the way the server sends
+them, with and without the projection the caller now asks for, and measures
+the bytes transferred and the driver decode time per call: birthday enablement
+(one moderations document), birthday stats (every item of a guild) and user
+inspection (every moderations document of an owner).
+
+Usage:
+    python -m benchmarks.projection_reads [--rounds 2000] [--items 300] [--guilds 25]
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import bson
+from bson import ObjectId
+
+FEATURES = [
+    "block_links",
+    "default_roles",
+    "notifications_twitch",
+    "notifications_youtube_video",
+    "reminders_birthday",
+    "welcome_messages",
+]
+
+
+def moderations_document(guild_id: int) -> Dict[str, Any]:
+    created_at = datetime(2024, 3, 1, 12, 0, 0)
+    document = {
+        "_id": ObjectId(),
+        "guild_id": str(guild_id),
+        "owner_id": "123456789012345678",
+        "is_bot_online": True,
+        "language": "pt-br",
+        "created_at": created_at,
+        "updated_at": created_at + timedelta(days=30),
+    }
+    document.update({feature: index % 2 == 0 for index, feature in enumerate(FEATURES)})
+    return document
+
+
+def birthday_item(index: int) -> Dict[str, Any]:
+    month, day = index % 12 + 1, index % 28 + 1
+    created_at = datetime(2025, 1, 1) + timedelta(hours=index)
+    return {
+        "_id": ObjectId(),
+        "guild_id": "987654321098765432",
+        "user_id": str(100000000000000000 + index),
+        "date": f"{month:02d}-{day:02d}",
+        "month": month,
+        "day": day,
+        "reminder_id": f"rem_{index:06d}",
+        "self_edit_count": index % 2,
+        "message": {
+            "mode": "custom" if index % 3 == 0 else "default",
+            "title": "Feliz aniversario!" if index % 3 == 0 else None,
+            "content": "Parabens {user}! Que seu dia seja incrivel " * (4 if index % 3 == 0 else 0) or None,
+        },
+        "image": {
+            "mode": "custom" if index % 4 == 0 else "default",
+            "url": f"https://cdn.discordapp.com/attachments/{index}/birthday.png" if index % 4 == 0 else None,
+        },
+        "created_at": created_at,
+        "updated_at": created_at,
+    }
+
+
+def project(document: Dict[str, Any], projection: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if not projection:
+        return document
+    included = {field for field, value in projection.items() if value and field != "_id"}
+    return {
+        key: value for key, value in document.items()
+        if key in included or (key == "_id" and projection.get("_id", True))
+    }
+
+
+CASES: List[Tuple[str, str, Dict[str, Any]]] = [
+    ("birthday enabled", "moderations", {"reminders_birthday": True, "_id": False}),
+    ("birthday stats", "birthdays", {"month": True, "date": True, "_id": False}),
+    (
+        "user inspection",
+        "owner moderations",
+        {"guild_id": True, "is_bot_online": True, "created_at": True, "updated_at": True, "_id": False},
+    ),
+]
+
+
+def measure(documents: List[Dict[str, Any]], projection: Optional[Dict[str, Any]], rounds: int) -> Tuple[int, float]:
+    """Bytes per call and decode µs per call for the documents of one read."""
+    payloads = [bson.encode(project(document, projection)) for document in documents]
+
+    started_at = time.perf_counter()
+    for _ in range(rounds):
+        for payload in payloads:
+            bson.decode(payload)
+    decode_time = (time.perf_counter() - started_at) / rounds * 1_000_000
+
+    return sum(len(payload) for payload in payloads), decode_time
+
+
+def run(rounds: int, items: int, guilds: int) -> List[Tuple[str, str, int, float]]:
+    documents = {
+        "moderations": [moderations_document(1)],
+        "birthdays": [birthday_item(index) for index in range(items)],
+        "owner moderations": [moderations_document(guild_id) for guild_id in range(guilds)],
+    }
+
+    results = []
+    for name, source, projection in CASES:
+        for variant, variant_projection in (("full", None), ("projected", projection)):
+            size, decode_time = measure(documents[source], variant_projection, rounds)
+            results.append((name, variant, size, decode_time))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=2000)
+    parser.add_argument("--items", type=int, default=300, help="birthday items in the guild")
+    parser.add_argument("--guilds", type=int, default=25, help="guilds of the inspected owner")
+    args = parser.parse_args()
+
+    print(f"{'read':<20}{'variant':<12}{'bytes':>10}{'decode µs':>12}")
+    for name, variant, size, decode_time in run(args.rounds, args.items, args.guilds):
+        print(f"{name:<20}{variant:<12}{size:>10}{decode_time:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -88,7 +88,7 @@ async def test_manager_form_renders_birthday_via_real_settings_provider(
     )
     upsert_birthday_item(GUILD_ID, "555", "05-12")
 
-    cog_data = birthday_manager_cog_data(GUILD_ID)
+    cog_data = await birthday_manager_cog_data(GUILD_ID)
     scenario = await scenario_factory(locale="pt-br").start_manager(
         "reminders_birthday", cog_data
     )
@@ -141,7 +141,7 @@ async def test_add_item_runs_real_subform_and_appends(scenario_factory, deps):
 async def test_remove_item_unsubscribes_and_updates_document(scenario_factory, deps):
     deps.twitch.add_user("gaules", user_id="111")
     deps.twitch.add_user("cellbit", user_id="222")
-    deps.twitch.subscribe_to_stream_online_event("111")
+    await deps.twitch.subscribe_to_stream_online_event("111")
     cog = _twitch_cog("gaules", "cellbit")
     deps.mongo_client.guild["notifications_twitch"].insert_one(dict(cog))
     scenario = await scenario_factory(locale="pt-br").start_manager(
@@ -74,7 +74,7 @@ async def test_unknown_streamer_is_rejected_by_real_validator(
 async def test_disable_unsubscribes_streamers(scenario_factory, deps,
                                               production_like_bot):
     deps.twitch.add_user("gaules", user_id="111")
-    deps.twitch.subscribe_to_stream_online_event("111")
+    await deps.twitch.subscribe_to_stream_online_event("111")
     cog = {
         "guild_id": GUILD_ID, "enabled": True,
         "notifications": {
@@ -20,7 +20,7 @@ import pytest
 import pytest_asyncio
 import asyncio
 from types import SimpleNamespace
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 
 import i18n
 
@@ -33,7 +33,7 @@ if os.path.isdir(_LANGUAGES_ROOT):
     i18n.set("fallback", "en")
 
 # Early patching happens as side-effect of this import
-from tests.mocks.database import MockRedisClient, MockMongoClient
+from tests.mocks.database import MockAsyncMongoClient, MockAsyncRedisClient, MockRedisClient, MockMongoClient
 
 from tests.mocks import (
     create_guild,
@@ -132,6 +132,8 @@ def deps(mongodb, redis_client):
     # Banco de dados
     ns.mongo_client = mongodb
     ns.redis_client = redis_client
+    ns.mongo_async_client = MockAsyncMongoClient(mongodb)
+    ns.redis_async_client = MockAsyncRedisClient(redis_client)
 
     # APIs mockadas
     ns.twitch = MockTwitchAPI()
@@ -186,8 +188,18 @@ def auto_inject_dependencies(deps):
         patch('app.data.moderations.mongo_client', deps.mongo_client),
         patch('app.data.birthdays.mongo_client', deps.mongo_client),
         patch('app.data.reminder.mongo_client', deps.mongo_client),
+        patch('app.data.indexes.mongo_client', deps.mongo_client),
+        *(
+            patch(f'app.data.aio.{module}.mongo_async_client', deps.mongo_async_client)
+            for module in (
+                'admin', 'birthdays', 'cogs', 'config', 'moderations',
+                'notifications_twitch', 'notifications_youtube_video', 'reminder',
+            )
+        ),
         patch('app.services.cache.redis_client', deps.redis_client),
-        patch('app.services.cache.cogs_data.mongo_client', deps.mongo_client),
+        patch('app.services.cache.redis_async_client', deps.redis_async_client),
+        patch('app.services.command_counters.redis_async_client', deps.redis_async_client),
+        patch('app.services.streamer_targets.redis_async_client', deps.redis_async_client),
     ]
 
     started_patches = []
@@ -198,6 +210,13 @@ def auto_inject_dependencies(deps):
         except Exception:
             pass
 
+    from app.services import block_links_policy, cache, cog_events, command_counters, guild_features
+    cache.clear_local_caches()
+    cog_events.clear_pending_cog_events()
+    command_counters.clear_pending_counters()
+    block_links_policy.clear_policies()
+    guild_features.reset_guild_features()
+
     yield
 
     for p in started_patches:
@@ -290,8 +309,8 @@ def admin_interaction(admin_member, guild, channel) -> MockInteraction:
 
 @pytest.fixture
 def mock_cache():
-    """Mock do cache.get_cog_data_or_populate."""
-    with patch('app.services.cache.get_cog_data_or_populate') as mock:
+    """Mock do cache.get_cog_config."""
+    with patch('app.services.cache.get_cog_config', new_callable=AsyncMock) as mock:
         yield mock
 
 
@@ -322,12 +341,12 @@ def twitch_data():
     """Mocks da camada de dados e helpers de notificacoes Twitch."""
     mocks = SimpleNamespace()
     targets = {
-        'find_guilds': 'app.services.notifications_twitch.find_guilds_by_streamer_name',
+        'find_targets': 'app.services.notifications_twitch.find_streamer_targets',
         'find_last_stream_date': 'app.services.notifications_twitch.find_last_stream_date',
         'save_notification': 'app.services.notifications_twitch.save_stream_notification',
         'update_last_stream_date': 'app.services.notifications_twitch.update_last_stream_date',
         'find_notification': 'app.services.notifications_twitch.find_stream_notification',
-        'count_guilds': 'app.services.notifications_twitch.count_streamers_guilds',
+        'count_guilds': 'app.services.notifications_twitch.count_streamer_guilds',
         'wait_for_stream_info': 'app.services.notifications_twitch.wait_for_stream_info',
         'is_more_than_one_hour': 'app.services.notifications_twitch.is_more_than_one_hour',
     }
@@ -35,7 +35,9 @@ from tests.mocks.stream_elements import (
 
 from tests.mocks.database import (
     MockRedisClient,
+    MockAsyncRedisClient,
     MockMongoClient,
+    MockAsyncMongoClient,
     MockMongoDatabase,
     MockMongoCollection,
     MockCursor,
@@ -64,7 +66,9 @@ __all__ = [
     "MockStreamElementsAPI",
     # Database
     "MockRedisClient",
+    "MockAsyncRedisClient",
     "MockMongoClient",
+    "MockAsyncMongoClient",
     "MockMongoDatabase",
     "MockMongoCollection",
     "MockCursor",
@@ -4,14 +4,21 @@ Mocks de banco de dados para testes.
 Este modulo contem:
 - Early patching: mocks instalados antes que modulos do app sejam importados
 - MockRedisClient, MockMongoClient: mocks completos para testes unitarios
+- MockAsyncRedisClient: fachada awaitable sobre o MockRedisClient
+- MockAsyncMongoClient: fachada awaitable (Motor) sobre o MockMongoClient
 
 IMPORTANTE: Importar este modulo executa o early patching como side-effect.
 Isso e intencional - o conftest.py importa este modulo antes de qualquer
 modulo da app.
 """
 
+import asyncio
 from unittest.mock import MagicMock
 
+from bson import ObjectId
+from pymongo import DeleteMany, InsertOne, ReplaceOne
+from pymongo.errors import BulkWriteError
+
 
 # ============================================================================
 # EARLY PATCHING - Before any app modules are imported
@@ -76,6 +83,8 @@ class _EarlyMockRedisClient:
 import app
 app.mongo_client = _EarlyMockMongoClient()
 app.redis_client = _EarlyMockRedisClient()
+app.redis_async_client = _EarlyMockRedisClient()
+app.mongo_async_client = _EarlyMockMongoClient()
 app.bot = MagicMock()
 
 
@@ -88,30 +97,68 @@ class MockRedisClient:
 
     def __init__(self):
         self._data = {}
+        self._expirations = {}
+        self.published = []
+        self.incoming = []
 
     def get(self, key):
         return self._data.get(key)
 
-    def set(self, key, value):
+    def set(self, key, value, nx=False, ex=None, px=None):
+        if nx and key in self._data:
+            return None
         self._data[key] = value
+        self._expirations.pop(key, None)
+        if ex or px:
+            self._expirations[key] = ex or px / 1000
+        return True
 
     def setex(self, key, expiration, value):
         self._data[key] = value
+        self._expirations[key] = expiration
+
+    def ttl(self, key):
+        if key not in self._data:
+            return -2
+        return int(self._expirations.get(key, -1))
 
     def delete(self, *keys):
         for key in keys:
             self._data.pop(key, None)
+            self._expirations.pop(key, None)
+
+    def unlink(self, *keys):
+        self.delete(*keys)
+
+    def expire(self, key, seconds):
+        if key in self._data:
+            self._expirations[key] = seconds
+
+    def sadd(self, key, *members):
+        self._data.setdefault(key, set()).update(members)
+
+    def srem(self, key, *members):
+        self._data.get(key, set()).difference_update(members)
+
+    def smembers(self, key):
+        return set(self._data.get(key, set()))
+
+    def hincrby(self, key, field, amount=1):
+        values = self._data.setdefault(key, {})
+        values[field] = str(int(values.get(field, 0)) + amount)
+        return int(values[field])
+
+    def hgetall(self, key):
+        return dict(self._data.get(key, {}))
 
     def keys(self, pattern):
         import fnmatch
-        pattern = pattern.replace('*', '.*')
-        return [k for k in self._data.keys() if fnmatch.fnmatch(k, pattern)]
+        return [k for k in self._data.keys() if fnmatch.fnmatchcase(k, pattern)]
 
-    def scan_iter(self, pattern):
+    def scan_iter(self, match="*", count=None):
         import fnmatch
-        pattern = pattern.replace('*', '.*')
-        for key in self._data.keys():
-            if fnmatch.fnmatch(key, pattern):
+        for key in list(self._data.keys()):
+            if fnmatch.fnmatchcase(key, match):
                 yield key
 
     def flushdb(self):
@@ -125,6 +172,129 @@ class MockRedisClient:
         self._data[key] = str(current + amount)
         return current + amount
 
+    def incr(self, key, amount=1):
+        return self.incrby(key, amount)
+
+    def mget(self, *keys):
+        return [self._data.get(key) for key in keys]
+
+    def publish(self, channel, message):
+        self.published.append((channel, message))
+        return 0
+
+    def pubsub(self, **kwargs):
+        return MockPubSub(self)
+
+    def pipeline(self, transaction=True):
+        return MockRedisPipeline(self)
+
+
+class MockRedisPipeline:
+    """Mock do pipeline do Redis: enfileira os comandos e executa em ordem."""
+
+    def __init__(self, client):
+        self._client = client
+        self._commands = []
+
+    def __getattr__(self, name):
+        method = getattr(self._client, name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((method, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        commands, self._commands = self._commands, []
+        return [method(*args, **kwargs) for method, args, kwargs in commands]
+
+
+class MockPubSub:
+    """Mock do PubSub do Redis: entrega as mensagens de `incoming` do cliente."""
+
+    def __init__(self, client):
+        self._client = client
+        self.channels = []
+        self.closed = False
+
+    def subscribe(self, *channels):
+        self.channels.extend(channels)
+
+    def get_message(self, timeout=0.0):
+        if self._client.incoming:
+            return {"type": "message", "data": self._client.incoming.pop(0)}
+        return None
+
+    def close(self):
+        self.closed = True
+
+
+class MockAsyncRedisClient:
+    """Mock do cliente redis.asyncio: mesmos dados do MockRedisClient, com metodos awaitable.
+
+    `round_trips` registra cada comando enviado (um pipeline conta como um).
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self.round_trips = []
+
+    def __getattr__(self, name):
+        method = getattr(self._client, name)
+
+        async def command(*args, **kwargs):
+            self.round_trips.append(name)
+            return method(*args, **kwargs)
+
+        return command
+
+    def pubsub(self, **kwargs):
+        return MockAsyncPubSub(self._client)
+
+    async def scan_iter(self, match="*", count=None):
+        for key in self._client.scan_iter(match, count):
+            yield key
+
+    def pipeline(self, transaction=True):
+        return MockAsyncRedisPipeline(self._client, self.round_trips)
+
+
+class MockAsyncRedisPipeline(MockRedisPipeline):
+    """Mock do pipeline do redis.asyncio: execute e awaitable e suporta `async with`."""
+
+    def __init__(self, client, round_trips):
+        super().__init__(client)
+        self._round_trips = round_trips
+
+    async def execute(self):
+        self._round_trips.append("pipeline")
+        return MockRedisPipeline.execute(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self._commands = []
+
+
+class MockAsyncPubSub(MockPubSub):
+    """Mock do PubSub do redis.asyncio: `listen` entrega as mensagens de `incoming` do cliente."""
+
+    async def subscribe(self, *channels):
+        self.channels.extend(channels)
+
+    async def listen(self):
+        while True:
+            message = self.get_message()
+            if message:
+                yield message
+            else:
+                await asyncio.sleep(0.01)
+
+    async def aclose(self):
+        self.closed = True
+
 
 class MockCursor:
     """Mock de um cursor MongoDB."""
@@ -133,6 +303,14 @@ class MockCursor:
         self._data = data
 
     def sort(self, field, direction=-1):
+        keys = field if isinstance(field, list) else [(field, direction)]
+        for key, key_direction in reversed(keys):
+            self._data.sort(key=lambda doc: doc.get(key), reverse=key_direction == -1)
+        return self
+
+    def limit(self, count):
+        if count:
+            self._data = self._data[:count]
         return self
 
     def __iter__(self):
@@ -142,13 +320,99 @@ class MockCursor:
         return len(self._data)
 
 
+_OPERATORS = {
+    "$lt": lambda value, bound: value is not None and value < bound,
+    "$lte": lambda value, bound: value is not None and value <= bound,
+    "$gt": lambda value, bound: value is not None and value > bound,
+    "$gte": lambda value, bound: value is not None and value >= bound,
+    "$in": lambda value, bound: value in bound,
+    "$nin": lambda value, bound: value not in bound,
+    "$ne": lambda value, bound: value != bound,
+}
+
+
+def _matches(value, condition):
+    """Compara um valor com uma condicao de filtro: igualdade ou operadores de comparacao."""
+    if isinstance(condition, dict) and condition and all(key in _OPERATORS for key in condition):
+        return all(_OPERATORS[operator](value, bound) for operator, bound in condition.items())
+    return value == condition
+
+
+def _get_path(doc, key):
+    """Valor de um campo, com suporte a queries aninhadas como "notifications.values.streamer.value"."""
+    if '.' not in key:
+        return doc.get(key)
+    current = doc
+    for part in key.split('.'):
+        if isinstance(current, dict):
+            current = current.get(part)
+        elif isinstance(current, list):
+            current = next((item.get(part) for item in current if isinstance(item, dict) and part in item), None)
+            if current is None:
+                return None
+        else:
+            return None
+    return current
+
+
+def _matches_filter(doc, filter_dict):
+    """Aplica um filtro de find: campos, operadores de comparacao, $or e $nor."""
+    for key, condition in filter_dict.items():
+        if key == "$or":
+            if not any(_matches_filter(doc, branch) for branch in condition):
+                return False
+        elif key == "$nor":
+            if any(_matches_filter(doc, branch) for branch in condition):
+                return False
+        elif not _matches(_get_path(doc, key), condition):
+            return False
+    return True
+
+
+def _project(doc, projection):
+    """Aplica uma projecao de inclusao de campos de primeiro nivel, como o MongoDB."""
+    if doc is None or not projection:
+        return doc
+    included = {field for field, value in projection.items() if value and field != "_id"}
+    keep_id = projection.get("_id", True)
+    if not included:
+        return {k: v for k, v in doc.items() if k != "_id" or keep_id}
+    return {k: v for k, v in doc.items() if k in included or (k == "_id" and keep_id)}
+
+
 class MockMongoCollection:
     """Mock de uma collection MongoDB."""
 
     def __init__(self):
         self._data = []
-
-    def find_one(self, filter_dict):
+        self._indexes = {"_id_": {"key": [("_id", 1)]}}
+        self.index_ops = {}
+
+    def index_information(self):
+        return {name: dict(info) for name, info in self._indexes.items()}
+
+    def create_indexes(self, models):
+        names = []
+        for model in models:
+            document = model.document
+            options = {key: value for key, value in document.items() if key not in ("key", "name")}
+            self._indexes[document["name"]] = {"key": list(document["key"].items()), **options}
+            names.append(document["name"])
+        return names
+
+    def aggregate(self, pipeline):
+        if pipeline != [{"$indexStats": {}}]:
+            raise NotImplementedError(pipeline)
+        return iter([
+            {"name": name, "key": dict(info["key"]), "accesses": {"ops": self.index_ops.get(name, 0), "since": None}}
+            for name, info in self._indexes.items()
+        ])
+
+    def find_one(self, filter_dict, projection=None):
+        return _project(self._find_first(filter_dict), projection)
+
+    def _find_first(self, filter_dict):
+        # Used by the compound operations, so tests can patch find_one to catch extra reads.
         for doc in self._data:
             if all(doc.get(k) == v for k, v in filter_dict.items()):
                 return doc.copy()
@@ -156,46 +420,34 @@ class MockMongoCollection:
 
     def find(self, filter_dict=None, projection=None):
         filter_dict = filter_dict or {}
-        results = []
-        for doc in self._data:
-            match = True
-            for k, v in filter_dict.items():
-                # Suporte a queries aninhadas como "notifications.values.streamer.value"
-                if '.' in k:
-                    parts = k.split('.')
-                    current = doc
-                    for part in parts:
-                        if isinstance(current, dict):
-                            current = current.get(part)
-                        elif isinstance(current, list):
-                            found = False
-                            for item in current:
-                                if isinstance(item, dict) and part in item:
-                                    current = item.get(part)
-                                    found = True
-                                    break
-                            if not found:
-                                current = None
-                                break
-                        else:
-                            current = None
-                            break
-                    if current != v:
-                        match = False
-                        break
-                elif doc.get(k) != v:
-                    match = False
-                    break
-            if match:
-                results.append(doc.copy())
-        return MockCursor(results)
+        return MockCursor([
+            _project(doc.copy(), projection) for doc in self._data if _matches_filter(doc, filter_dict)
+        ])
 
     def count_documents(self, filter_dict=None):
         return len(list(self.find(filter_dict or {})))
 
     def insert_one(self, doc):
-        self._data.append(doc.copy())
-        return MagicMock(inserted_id="mock_id")
+        doc = {"_id": ObjectId(), **doc}
+        self._data.append(doc)
+        return MagicMock(inserted_id=doc["_id"])
+
+    def insert_many(self, docs, ordered=True):
+        """Como o pymongo, grava o _id em cada documento recebido; _id repetido e erro 11000."""
+        write_errors = []
+        inserted = 0
+        for index, doc in enumerate(docs):
+            doc.setdefault("_id", ObjectId())
+            if any(stored.get("_id") == doc["_id"] for stored in self._data):
+                write_errors.append({"index": index, "code": 11000, "errmsg": "E11000 duplicate key error"})
+                if ordered:
+                    break
+                continue
+            self._data.append(doc.copy())
+            inserted += 1
+        if write_errors:
+            raise BulkWriteError({"writeErrors": write_errors, "nInserted": inserted})
+        return MagicMock(inserted_ids=[doc["_id"] for doc in docs])
 
     def update_one(self, filter_dict, update, upsert=False):
         for doc in self._data:
@@ -205,12 +457,28 @@ class MockMongoCollection:
                 return MagicMock(modified_count=1)
         if upsert:
             new_doc = filter_dict.copy()
+            new_doc.update(update.get("$setOnInsert", {}))
             if "$set" in update:
                 new_doc.update(update["$set"])
             self._data.append(new_doc)
             return MagicMock(modified_count=0, upserted_id="mock_id")
         return MagicMock(modified_count=0)
 
+    def find_one_and_update(self, filter_dict, update, upsert=False, return_document=False):
+        before = self._find_first(filter_dict)
+        self.update_one(filter_dict, update, upsert=upsert)
+        return self._find_first(filter_dict) if return_document else before
+
+    def find_one_and_replace(self, filter_dict, replacement, upsert=False, return_document=False):
+        for i, doc in enumerate(self._data):
+            if all(doc.get(k) == v for k, v in filter_dict.items()):
+                self._data[i] = replacement.copy()
+                return replacement.copy() if return_document else doc
+        if upsert:
+            self._data.append(replacement.copy())
+            return replacement.copy() if return_document else None
+        return None
+
     def delete_one(self, filter_dict):
         for i, doc in enumerate(self._data):
             if all(doc.get(k) == v for k, v in filter_dict.items()):
@@ -235,6 +503,35 @@ class MockMongoCollection:
         return MagicMock(deleted_count=len(to_delete))
 
 
+    def distinct(self, key, filter_dict=None):
+        values = []
+        for doc in self.find(filter_dict or {}):
+            if doc.get(key) is not None and doc.get(key) not in values:
+                values.append(doc.get(key))
+        return values
+
+    def bulk_write(self, requests, ordered=True):
+        """Aplica InsertOne, ReplaceOne e DeleteMany em ordem, como um bulk write ordenado."""
+        for request in requests:
+            if isinstance(request, InsertOne):
+                self.insert_one(request._doc)
+            elif isinstance(request, ReplaceOne):
+                self._replace_one(request._filter, request._doc, request._upsert)
+            elif isinstance(request, DeleteMany):
+                self._data[:] = [doc for doc in self._data if not _matches_filter(doc, request._filter)]
+            else:
+                raise NotImplementedError(request)
+        return MagicMock(acknowledged=True)
+
+    def _replace_one(self, filter_dict, replacement, upsert=False):
+        for index, doc in enumerate(self._data):
+            if _matches_filter(doc, filter_dict):
+                self._data[index] = {"_id": doc.get("_id"), **replacement}
+                return
+        if upsert:
+            self.insert_one(replacement)
+
+
 class MockMongoDatabase:
     """Mock de um database MongoDB."""
 
@@ -266,3 +563,87 @@ class MockMongoClient:
 
     def __getattr__(self, name):
         return self[name]
+
+
+class MockAsyncCursor:
+    """Mock do cursor do Motor: `to_list` e awaitable e suporta `async for`."""
+
+    def __init__(self, cursor, round_trip=None):
+        self._cursor = cursor
+        self._round_trip = round_trip or (lambda: None)
+
+    def sort(self, *args, **kwargs):
+        self._cursor = self._cursor.sort(*args, **kwargs)
+        return self
+
+    def limit(self, count):
+        self._cursor = self._cursor.limit(count)
+        return self
+
+    async def to_list(self, length=None):
+        self._round_trip()
+        return list(self._cursor)[:length]
+
+    async def __aiter__(self):
+        self._round_trip()
+        for doc in self._cursor:
+            yield doc
+
+
+class MockAsyncMongoCollection:
+    """Mock de uma collection do Motor: mesmos dados da MockMongoCollection, com metodos awaitable."""
+
+    def __init__(self, collection, namespace, round_trips):
+        self._collection = collection
+        self._namespace = namespace
+        self._round_trips = round_trips
+
+    def __getattr__(self, name):
+        method = getattr(self._collection, name)
+
+        async def command(*args, **kwargs):
+            self._round_trips.append((self._namespace, name))
+            return method(*args, **kwargs)
+
+        return command
+
+    def find(self, *args, **kwargs):
+        return MockAsyncCursor(self._collection.find(*args, **kwargs), self._round_trip("find"))
+
+    def aggregate(self, *args, **kwargs):
+        return MockAsyncCursor(self._collection.aggregate(*args, **kwargs), self._round_trip("aggregate"))
+
+    def _round_trip(self, name):
+        return lambda: self._round_trips.append((self._namespace, name))
+
+
+class MockAsyncMongoDatabase:
+    """Mock de um database do Motor."""
+
+    def __init__(self, database, name, round_trips):
+        self._database = database
+        self._name = name
+        self._round_trips = round_trips
+
+    def __getitem__(self, name):
+        return MockAsyncMongoCollection(self._database[name], f"{self._name}.{name}", self._round_trips)
+
+    def __getattr__(self, name):
+        return self[name]
+
+
+class MockAsyncMongoClient:
+    """Mock do AsyncIOMotorClient: le e grava nos mesmos dados do MockMongoClient.
+
+    `round_trips` registra (namespace, operacao) de cada operacao enviada.
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self.round_trips = []
+
+    def __getitem__(self, name):
+        return MockAsyncMongoDatabase(self._client[name], name, self.round_trips)
+
+    def __getattr__(self, name):
+        return self[name]
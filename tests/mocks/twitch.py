@@ -135,33 +135,33 @@ class MockTwitchAPI:
         self._streams[login.lower()] = None
         return self
 
-    # Metodos que serao chamados pelo codigo de producao
-    def get_user_id_from_login(self, login: str) -> Optional[str]:
+    # Metodos que serao chamados pelo codigo de producao (coroutines, como na TwitchClient)
+    async def get_user_id_from_login(self, login: str) -> Optional[str]:
         """Retorna ID do usuario ou None se nao existe."""
         self.get_user_info_calls.append(login)
         user = self._users.get(login.lower())
         return user.id if user else None
 
-    def get_user_info(self, login: str) -> Optional[Dict[str, Any]]:
+    async def get_user_info(self, login: str) -> Optional[Dict[str, Any]]:
         """Retorna informacoes do usuario."""
         self.get_user_info_calls.append(login)
         user = self._users.get(login.lower())
         return user.to_dict() if user else None
 
-    def get_user_info_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
+    async def get_user_info_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Retorna informacoes do usuario por ID."""
         for user in self._users.values():
             if user.id == user_id:
                 return user.to_dict()
         return None
 
-    def get_stream_info(self, login: str) -> Optional[Dict[str, Any]]:
+    async def get_stream_info(self, login: str) -> Optional[Dict[str, Any]]:
         """Retorna informacoes da stream ou None se offline."""
         self.get_stream_info_calls.append(login)
         stream = self._streams.get(login.lower())
         return stream.to_dict() if stream else None
 
-    def subscribe_to_stream_online_event(self, user_id: str) -> MagicMock:
+    async def subscribe_to_stream_online_event(self, user_id: str) -> MagicMock:
         """Simula criacao de subscription online."""
         self._subscription_counter += 1
         sub = {
@@ -183,7 +183,7 @@ class MockTwitchAPI:
         response.json.return_value = sub
         return response
 
-    def subscribe_to_stream_offline_event(self, user_id: str) -> MagicMock:
+    async def subscribe_to_stream_offline_event(self, user_id: str) -> MagicMock:
         """Simula criacao de subscription offline."""
         self._subscription_counter += 1
         sub = {
@@ -199,7 +199,7 @@ class MockTwitchAPI:
         response.json.return_value = sub
         return response
 
-    def unsubscribe_from_stream_event(self, subscription_id: str) -> MagicMock:
+    async def unsubscribe_from_stream_event(self, subscription_id: str) -> MagicMock:
         """Simula remocao de subscription."""
         self.unsubscribe_calls.append(subscription_id)
         self._subscriptions = [s for s in self._subscriptions if s["id"] != subscription_id]
@@ -208,11 +208,11 @@ class MockTwitchAPI:
         response.status_code = 204
         return response
 
-    def get_subscriptions(self) -> Dict[str, Any]:
+    async def get_subscriptions(self) -> Dict[str, Any]:
         """Retorna todas as subscriptions."""
         return {"data": self._subscriptions.copy()}
 
-    def get_subscription_by_user_id(self, user_id: str) -> Dict[str, Any]:
+    async def get_subscription_by_user_id(self, user_id: str) -> Dict[str, Any]:
         """Retorna subscriptions para um user_id especifico."""
         subs = [s for s in self._subscriptions if s.get("user_id") == user_id or
                 s.get("condition", {}).get("broadcaster_user_id") == user_id]
@@ -107,7 +107,7 @@ class TestBirthdaysManagerComposition:
         interaction.message.embeds = [MagicMock()]
 
         async def add_item_callback(interaction, manager_view, response):
-            saved = save_item(str(interaction.guild_id), response)
+            saved = await save_item(str(interaction.guild_id), response)
             if saved:
                 manager_view.cogs[constants.REMINDERS_BIRTHDAY_KEY]["values"].append(summary_item)
 
@@ -150,7 +150,7 @@ class TestBirthdaysManagerComposition:
 
         async def remove_item_callback(interaction, manager_view, item_removed, new_cogs):
             user = item_removed.get("user")
-            remove_item(str(interaction.guild_id), user.get("value"))
+            await remove_item(str(interaction.guild_id), user.get("value"))
 
         manager.lifecycle_callbacks = {"remove_item": remove_item_callback}
 
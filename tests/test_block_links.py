@@ -283,3 +283,112 @@ class TestBlockLinksEdgeCases:
 
         # Assert
         msg.assert_deleted()
+
+
+class TestBlockLinksPolicyCache:
+    """Testes da politica compilada de block_links em memoria."""
+
+    @pytest.mark.asyncio
+    async def test_compiles_policy_once_per_guild(
+        self, mock_cache, guild, channel, member
+    ):
+        """
+        Verifica que a configuracao e lida uma unica vez por guild.
+
+        Input: Duas mensagens seguidas no mesmo guild
+        Output: Apenas uma leitura do cache, ambas as mensagens bloqueadas
+        """
+        # Arrange
+        mock_cache.return_value = {
+            "allowed_roles": {"values": []},
+            "allowed_chats": {"values": []},
+            "allowed_links": [],
+            "answer": "Bloqueado!"
+        }
+        first = create_message(channel, member, "https://spam.com")
+        second = create_message(channel, member, "https://spam.com/again")
+
+        # Act
+        await check_message(str(guild.id), first)
+        await check_message(str(guild.id), second)
+
+        # Assert
+        assert mock_cache.call_count == 1
+        first.assert_deleted()
+        second.assert_deleted()
+
+    @pytest.mark.asyncio
+    async def test_caches_unconfigured_guild(self, mock_cache, guild, channel, member):
+        """
+        Verifica que guilds sem block_links tambem ficam em memoria.
+
+        Input: Guild sem configuracao, duas mensagens
+        Output: Apenas uma leitura do cache
+        """
+        # Arrange
+        mock_cache.return_value = None
+
+        # Act
+        await check_message(str(guild.id), create_message(channel, member, "https://a.com"))
+        await check_message(str(guild.id), create_message(channel, member, "https://b.com"))
+
+        # Assert
+        assert mock_cache.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_update_cog_invalidates_policy(self, mock_cache, guild, channel, member):
+        """
+        Verifica que editar a feature invalida a politica compilada.
+
+        Input: Politica em memoria, update_cog_by_guild liberando o canal
+        Output: Nova leitura do cache e mensagem permitida
+        """
+        from app.services.cogs import update_cog_by_guild
+
+        # Arrange
+        mock_cache.return_value = {
+            "allowed_roles": {"values": []},
+            "allowed_chats": {"values": []},
+            "allowed_links": [],
+            "answer": "Bloqueado!"
+        }
+        await check_message(str(guild.id), create_message(channel, member, "https://a.com"))
+
+        mock_cache.return_value = {
+            "allowed_roles": {"values": []},
+            "allowed_chats": {"values": [str(channel.id)]},
+            "allowed_links": [],
+            "answer": "Bloqueado!"
+        }
+
+        # Act
+        await update_cog_by_guild(str(guild.id), "block_links", {"allowed_chats": {"values": [str(channel.id)]}})
+        msg = create_message(channel, member, "https://a.com")
+        await check_message(str(guild.id), msg)
+
+        # Assert
+        assert mock_cache.call_count == 2
+        msg.assert_not_deleted()
+
+    @pytest.mark.asyncio
+    async def test_allows_configured_domain_with_www(self, mock_cache, guild, channel, member):
+        """
+        Verifica que o dominio permitido e comparado pelo host normalizado.
+
+        Input: Link https://www.twitter.com/, Twitter permitido
+        Output: Mensagem NAO deletada
+        """
+        # Arrange
+        mock_cache.return_value = {
+            "allowed_roles": {"values": []},
+            "allowed_chats": {"values": []},
+            "allowed_links": ["Twitter"],
+            "answer": "Bloqueado!"
+        }
+        msg = create_message(channel, member, "olha https://www.twitter.com/")
+
+        # Act
+        await check_message(str(guild.id), msg)
+
+        # Assert
+        msg.assert_not_deleted()
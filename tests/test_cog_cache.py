@@ -0,0 +1,681 @@
+"""
+Testes para o cache de configuracoes de cogs (app/services/cache.py).
+
+Estes testes usam os mocks de Redis e MongoDB do conftest.
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from prometheus_client import REGISTRY
+
+from app.services import cache
+from app.services.cogs import delete_cog_by_guild, insert_cog_by_guild, update_cog_by_guild
+
+
+BLOCK_LINKS_KEY = "v2:guild:1:cog.block_links"
+
+
+def _cached(data, version: int = 0) -> bytes:
+    return cache._stamp(cache.encode_value(data), version)
+
+
+def _read_cached(redis_client, key: str):
+    return cache.cache_codec.decode(cache._unstamp(redis_client.get(key))[1])
+
+
+def _lookups(cog: str, result: str) -> float:
+    return REGISTRY.get_sample_value(
+        "keiko_cog_cache_lookups_total", {"cog": cog, "result": result}
+    ) or 0
+
+
+class TestNegativeCache:
+    """Testes de cache negativo para guilds sem a feature configurada."""
+
+    async def test_caches_missing_config_as_sentinel(self, redis_client, mongodb):
+        """
+        Verifica que uma guild sem configuracao consulta o Mongo uma unica vez.
+
+        Input: Duas leituras de block_links para guild sem documento
+        Output: None nas duas, sentinela no Redis, uma unica miss
+        """
+        # Arrange
+        misses = _lookups("block_links", "miss")
+        negative_hits = _lookups("block_links", "negative_hit")
+
+        # Act
+        first = await cache.get_cog_data_or_populate("1", "block_links")
+        second = await cache.get_cog_data_or_populate("1", "block_links")
+
+        # Assert
+        assert first is None
+        assert second is None
+        assert redis_client.get(BLOCK_LINKS_KEY) == _cached(None)
+        assert _lookups("block_links", "miss") == misses + 1
+        assert _lookups("block_links", "negative_hit") == negative_hits + 1
+
+    async def test_manager_still_sees_missing_config_as_none(self, redis_client, mongodb):
+        """
+        Verifica que o manager continua recebendo None (abre o formulario).
+
+        Input: Sentinela no Redis, leitura com manager=True
+        Output: None
+        """
+        # Arrange
+        await cache.get_cog_data_or_populate("1", "welcome_messages")
+
+        # Act
+        result = await cache.get_cog_data_or_populate("1", "welcome_messages", manager=True)
+
+        # Assert
+        assert result is None
+
+    async def test_insert_cog_drops_sentinel(self, redis_client, mongodb):
+        """
+        Verifica que configurar a feature invalida o cache negativo.
+
+        Input: Sentinela no Redis, insert_cog_by_guild habilitando block_links
+        Output: Proxima leitura retorna o documento salvo
+        """
+        # Arrange
+        await cache.get_cog_data_or_populate("1", "block_links")
+
+        # Act
+        await insert_cog_by_guild("1", "block_links", {"enabled": True, "answer": "Bloqueado!"})
+        result = await cache.get_cog_data_or_populate("1", "block_links")
+
+        # Assert
+        assert result["answer"] == "Bloqueado!"
+
+    async def test_counts_hits_for_cached_config(self, redis_client, mongodb):
+        """
+        Verifica que leituras servidas pelo Redis contam como hit.
+
+        Input: Documento no Mongo, duas leituras
+        Output: Uma miss e um hit
+        """
+        # Arrange
+        mongodb.guild.default_roles.insert_one({"guild_id": "1", "enabled": True})
+        hits = _lookups("default_roles", "hit")
+
+        # Act
+        await cache.get_cog_data_or_populate("1", "default_roles")
+        await cache.get_cog_data_or_populate("1", "default_roles")
+
+        # Assert
+        assert _lookups("default_roles", "hit") == hits + 1
+
+
+class TestTwoTierCache:
+    """Testes do cache em memoria na frente do Redis."""
+
+    async def test_serves_repeated_reads_from_memory(self, redis_client, mongodb):
+        """
+        Verifica que leituras repetidas nao voltam ao Redis.
+
+        Input: Documento no Mongo, duas leituras via get_cog_config
+        Output: Uma unica miss e nenhum hit no Redis
+        """
+        # Arrange
+        mongodb.guild.default_roles.insert_one({"guild_id": "1", "enabled": True})
+        misses = _lookups("default_roles", "miss")
+        hits = _lookups("default_roles", "hit")
+
+        # Act
+        first = await cache.get_cog_config("1", "default_roles")
+        second = await cache.get_cog_config("1", "default_roles")
+
+        # Assert
+        assert first == second
+        assert _lookups("default_roles", "miss") == misses + 1
+        assert _lookups("default_roles", "hit") == hits
+        assert cache.get_cache_stats()["cog"]["hits"] == 1
+
+    async def test_update_invalidates_memory_tier(self, redis_client, mongodb):
+        """
+        Verifica que escrever a configuracao invalida o cache em memoria.
+
+        Input: Leitura em cache, update_cog_by_guild com nova resposta
+        Output: Proxima leitura retorna o valor novo
+        """
+        # Arrange
+        await insert_cog_by_guild("1", "block_links", {"enabled": True, "answer": "Antigo"})
+        await cache.get_cog_config("1", "block_links")
+
+        # Act
+        await update_cog_by_guild("1", "block_links", {"enabled": True, "answer": "Novo"})
+        result = await cache.get_cog_config("1", "block_links")
+
+        # Assert
+        assert result["answer"] == "Novo"
+
+    async def test_manager_gets_private_copy(self, redis_client, mongodb):
+        """
+        Verifica que o manager recebe uma copia que pode ser alterada.
+
+        Input: Leitura com manager=True e alteracao do documento retornado
+        Output: Cache em memoria nao e afetado
+        """
+        # Arrange
+        mongodb.guild.welcome_messages.insert_one(
+            {"guild_id": "1", "enabled": True, "welcome_messages": {"values": ["a", "b"]}}
+        )
+        cogs = await cache.get_cog_config("1", "welcome_messages", manager=True)
+
+        # Act
+        del cogs["welcome_messages"]["values"][0]
+        result = await cache.get_cog_config("1", "welcome_messages")
+
+        # Assert
+        assert result["welcome_messages"]["values"] == ["a", "b"]
+
+    async def test_remove_all_cache_runs_invalidation_hooks(self, redis_client, mongodb):
+        """
+        Verifica que remover o cache da guild chama os hooks de invalidacao.
+
+        Input: Hook registrado, remove_all_cache_by_guild
+        Output: Hook chamado com (guild_id, None) e memoria vazia para a guild
+        """
+        # Arrange
+        calls = []
+        await cache.get_cog_config("1", "block_links")
+        cache.on_invalidate(cache.COG_CACHE_FAMILY, lambda guild_id, key: calls.append((guild_id, key)))
+
+        try:
+            # Act
+            await cache.remove_all_cache_by_guild("1")
+        finally:
+            cache._invalidation_hooks["cog"].pop()
+
+        # Assert
+        assert calls == [("1", None)]
+        assert cache.get_cache_stats()["cog"]["entries"] == 0
+
+
+def _remote_invalidation(guild_id: str, key, version: int) -> str:
+    return json.dumps({
+        "origin": "other-process",
+        "family": "cog",
+        "guild_id": guild_id,
+        "key": key,
+        "version": version,
+    })
+
+
+class TestCacheInvalidationBus:
+    """Testes da invalidacao entre processos via pub/sub do Redis."""
+
+    async def test_remove_cog_cache_publishes_versioned_event(self, redis_client, mongodb):
+        """
+        Verifica que invalidar um cog publica (guild_id, cog_key) com versao.
+
+        Input: Duas chamadas de remove_cog_cache_by_guild
+        Output: Dois eventos no canal com versoes crescentes
+        """
+        # Act
+        await cache.remove_cog_cache_by_guild("1", "block_links")
+        await cache.remove_all_cache_by_guild("1")
+
+        # Assert
+        events = [json.loads(message) for channel, message in redis_client.published]
+        assert all(channel == cache.CACHE_INVALIDATION_CHANNEL for channel, _ in redis_client.published)
+        assert [(e["guild_id"], e["key"], e["version"]) for e in events] == [
+            ("1", "block_links", 1),
+            ("1", None, 2),
+        ]
+
+    async def test_remote_event_evicts_local_entry(self, redis_client, mongodb):
+        """
+        Verifica que um evento de outro processo remove a entrada local e a policy.
+
+        Input: block_links em cache, evento remoto para a guild
+        Output: Memoria vazia e nova leitura com o valor atualizado
+        """
+        # Arrange
+        from app.services import block_links_policy
+        mongodb.guild.block_links.insert_one({"guild_id": "1", "enabled": True, "answer": "Antigo"})
+        await block_links_policy.get_policy("1")
+
+        # Act: another process updates Mongo and invalidates Redis
+        mongodb.guild.block_links.update_one({"guild_id": "1"}, {"$set": {"answer": "Novo"}})
+        redis_client.delete(BLOCK_LINKS_KEY)
+        redis_client.set("cache:version:1", "1")
+        cache.handle_invalidation_message(_remote_invalidation("1", "block_links", 1))
+
+        # Assert
+        assert (await block_links_policy.get_policy("1")).answer == "Novo"
+
+    async def test_invalidation_during_policy_load_is_not_overwritten(self, redis_client, mongodb):
+        """
+        Verifica que uma invalidacao durante a leitura da policy nao e sobrescrita.
+
+        Input: Invalidacao da guild enquanto get_cog_config esta em andamento
+        Output: Policy antiga devolvida mas nao guardada, proxima leitura com o valor novo
+        """
+        # Arrange
+        from app.services import block_links_policy
+        mongodb.guild.block_links.insert_one({"guild_id": "1", "enabled": True, "answer": "Antigo"})
+        get_cog_config = cache.get_cog_config
+
+        async def racing_load(guild_id, cog_key):
+            cog_data = await get_cog_config(guild_id, cog_key)
+            mongodb.guild.block_links.update_one({"guild_id": "1"}, {"$set": {"answer": "Novo"}})
+            await cache.remove_cog_cache_by_guild("1", "block_links")
+            return cog_data
+
+        # Act
+        with patch.object(cache, "get_cog_config", side_effect=racing_load):
+            stale = await block_links_policy.get_policy("1")
+
+        # Assert
+        assert stale.answer == "Antigo"
+        assert (await block_links_policy.get_policy("1")).answer == "Novo"
+
+    async def test_ignores_own_events(self, redis_client, mongodb):
+        """
+        Verifica que o processo ignora os eventos que ele mesmo publicou.
+
+        Input: Entrada em cache, evento com a origem deste processo
+        Output: Entrada mantida
+        """
+        # Arrange
+        await cache.get_cog_config("1", "welcome_messages")
+        message = json.loads(_remote_invalidation("1", "welcome_messages", 1))
+        message["origin"] = cache.CACHE_INSTANCE_ID
+
+        # Act
+        cache.handle_invalidation_message(json.dumps(message))
+
+        # Assert
+        assert cache.get_cache_stats()["cog"]["entries"] == 1
+
+    async def test_stale_read_is_not_kept_in_memory(self, redis_client, mongodb):
+        """
+        Verifica que dados lidos antes de uma invalidacao ja recebida nao voltam ao cache.
+
+        Input: Evento remoto com versao 5, Redis ainda na versao 0
+        Output: Leitura nao armazenada em memoria
+        """
+        # Arrange
+        cache.handle_invalidation_message(_remote_invalidation("1", "default_roles", 5))
+
+        # Act
+        await cache.get_cog_config("1", "default_roles")
+
+        # Assert
+        assert cache.get_cache_stats()["cog"]["entries"] == 0
+
+    async def test_outdated_redis_stamp_is_reloaded(self, redis_client, mongodb):
+        """
+        Verifica que um valor gravado no Redis com versao antiga e ignorado.
+
+        Input: Redis com valor da versao 1 e cog invalidado na versao 2
+        Output: Documento recarregado do Mongo
+        """
+        # Arrange
+        mongodb.guild.block_links.insert_one({"guild_id": "1", "enabled": True, "answer": "Novo"})
+        redis_client.set(BLOCK_LINKS_KEY, _cached({"enabled": True, "answer": "Antigo"}, 1))
+        redis_client.set("cache:version:1", "2")
+        redis_client.set("cache:invalidated:1:block_links", "2")
+
+        # Act
+        result = await cache.get_cog_config("1", "block_links")
+
+        # Assert
+        assert result["answer"] == "Novo"
+        assert redis_client.get(BLOCK_LINKS_KEY).startswith(b"@2:")
+
+    @pytest.mark.asyncio
+    async def test_subscriber_applies_remote_events(self, redis_client, mongodb):
+        """
+        Verifica que a task de inscricao consome o canal e remove entradas.
+
+        Input: Entradas de duas guilds e evento remoto para a guild 1
+        Output: Apenas a entrada da guild 2 permanece
+        """
+        # Arrange
+        task = asyncio.create_task(cache.run_invalidation_subscriber())
+        await asyncio.sleep(0.05)
+        await cache.get_cog_config("1", "block_links")
+        await cache.get_cog_config("2", "block_links")
+
+        # Act
+        redis_client.incoming.append(_remote_invalidation("1", None, 1))
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if not redis_client.incoming:
+                break
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # Assert
+        assert cache.get_cache_stats()["cog"]["entries"] == 1
+
+
+class TestStampedeProtection:
+    """Testes de protecao contra avalanche de misses no cache."""
+
+    async def test_concurrent_misses_cost_one_mongo_query(self, redis_client, mongodb):
+        """
+        Verifica que varias leituras simultaneas da mesma chave fazem uma unica consulta.
+
+        Input: 8 leituras concorrentes de block_links com consulta lenta ao Mongo
+        Output: Uma unica consulta e o mesmo documento para todas
+        """
+        # Arrange
+        mongodb.guild.block_links.insert_one({"guild_id": "1", "enabled": True, "answer": "Bloqueado!"})
+        find_cog = cache.cogs_data.find_cog_by_guild_id
+        calls = []
+
+        async def slow_find(guild_id, key):
+            calls.append(key)
+            await asyncio.sleep(0.05)
+            return await find_cog(guild_id, key)
+
+        # Act
+        with patch.object(cache.cogs_data, "find_cog_by_guild_id", side_effect=slow_find):
+            results = await asyncio.gather(
+                *(cache.get_cog_config("1", "block_links") for _ in range(8))
+            )
+
+        # Assert
+        assert calls == ["block_links"]
+        assert [result["answer"] for result in results] == ["Bloqueado!"] * 8
+
+    async def test_waits_for_other_process_holding_the_lock(self, redis_client, mongodb):
+        """
+        Verifica que o processo sem o lock espera o valor gravado por outro processo.
+
+        Input: Lock de outro processo e valor gravado durante a espera
+        Output: Valor lido do Redis, sem consulta ao Mongo
+        """
+        # Arrange
+        redis_client.set(BLOCK_LINKS_KEY + ":lock", "other-process", nx=True, px=5000)
+
+        async def other_process_populates(seconds):
+            redis_client.setex(BLOCK_LINKS_KEY, 60, _cached({"enabled": True, "answer": "Outro"}))
+
+        # Act
+        with patch.object(cache.asyncio, "sleep", side_effect=other_process_populates), \
+                patch.object(cache.cogs_data, "find_cog_by_guild_id") as find_cog:
+            result = await cache.get_cog_config("1", "block_links")
+
+        # Assert
+        assert result["answer"] == "Outro"
+        find_cog.assert_not_called()
+
+    async def test_loads_anyway_when_lock_holder_is_slow(self, redis_client, mongodb):
+        """
+        Verifica que o processo consulta o Mongo se o dono do lock demorar.
+
+        Input: Lock de outro processo e nenhum valor gravado
+        Output: Documento lido do Mongo e lock alheio mantido
+        """
+        # Arrange
+        mongodb.guild.block_links.insert_one({"guild_id": "1", "enabled": True, "answer": "Mongo"})
+        redis_client.set(BLOCK_LINKS_KEY + ":lock", "other-process", nx=True, px=5000)
+
+        # Act
+        with patch.object(cache.asyncio, "sleep", new_callable=AsyncMock):
+            result = await cache.get_cog_config("1", "block_links")
+
+        # Assert
+        assert result["answer"] == "Mongo"
+        assert redis_client.get(BLOCK_LINKS_KEY + ":lock") == "other-process"
+
+    async def test_refreshes_early_before_redis_expiration(self, redis_client, mongodb):
+        """
+        Verifica a recarga antecipada quando o valor do Redis esta perto de expirar.
+
+        Input: Valor antigo no Redis com TTL de 1s e sorteio de recarga
+        Output: Documento novo do Mongo gravado no Redis e lock liberado
+        """
+        # Arrange
+        mongodb.guild.block_links.insert_one({"guild_id": "1", "enabled": True, "answer": "Novo"})
+        redis_client.setex(BLOCK_LINKS_KEY, 1, _cached({"enabled": True, "answer": "Antigo"}))
+        refreshes = _lookups("block_links", "early_refresh")
+
+        # Act
+        with patch.object(cache, "should_refresh_early", return_value=True):
+            result = await cache.get_cog_data_or_populate("1", "block_links")
+
+        # Assert
+        assert result["answer"] == "Novo"
+        assert _read_cached(redis_client, BLOCK_LINKS_KEY)["answer"] == "Novo"
+        assert redis_client.get(BLOCK_LINKS_KEY + ":lock") is None
+        assert _lookups("block_links", "early_refresh") == refreshes + 1
+
+
+class TestWriteThrough:
+    """Testes da escrita do documento atualizado direto no cache."""
+
+    async def test_update_caches_new_document_without_reload(self, redis_client, mongodb):
+        """
+        Verifica que o documento retornado pelo update e gravado no cache.
+
+        Input: Documento no Mongo, update_cog_by_guild e nova leitura
+        Output: Valor novo servido sem consultar o Mongo
+        """
+        # Arrange
+        await insert_cog_by_guild("1", "block_links", {"enabled": True, "answer": "Antigo"})
+
+        # Act
+        document = await update_cog_by_guild("1", "block_links", {"answer": "Novo"})
+        cache.clear_local_caches()
+        with patch.object(cache.cogs_data, "find_cog_by_guild_id") as find_cog:
+            result = await cache.get_cog_config("1", "block_links")
+
+        # Assert
+        assert document["answer"] == "Novo"
+        assert result["answer"] == "Novo"
+        assert result["enabled"] is True
+        find_cog.assert_not_called()
+
+    async def test_update_keeps_other_cogs_cached(self, redis_client, mongodb):
+        """
+        Verifica que atualizar um cog nao invalida os outros cogs da guild no Redis.
+
+        Input: default_roles em cache, update de block_links
+        Output: default_roles servido sem consultar o Mongo
+        """
+        # Arrange
+        mongodb.guild.default_roles.insert_one({"guild_id": "1", "enabled": True})
+        await insert_cog_by_guild("1", "block_links", {"enabled": True, "answer": "Antigo"})
+        await cache.get_cog_config("1", "default_roles")
+
+        # Act
+        await update_cog_by_guild("1", "block_links", {"answer": "Novo"})
+        cache.clear_local_caches()
+        with patch.object(cache.cogs_data, "find_cog_by_guild_id") as find_cog:
+            result = await cache.get_cog_config("1", "default_roles")
+
+        # Assert
+        assert result["enabled"] is True
+        find_cog.assert_not_called()
+
+    async def test_late_stale_write_is_ignored(self, redis_client, mongodb):
+        """
+        Verifica que um leitor atrasado nao sobrescreve o valor novo com o antigo.
+
+        Input: update_cog_by_guild seguido de gravacao do documento antigo sem versao
+        Output: Proxima leitura recarrega o documento novo
+        """
+        # Arrange
+        await insert_cog_by_guild("1", "block_links", {"enabled": True, "answer": "Antigo"})
+        await update_cog_by_guild("1", "block_links", {"answer": "Novo"})
+
+        # Act: a reader that loaded the old document before the update writes it now
+        redis_client.setex(BLOCK_LINKS_KEY, 60, _cached({"enabled": True, "answer": "Antigo"}))
+        cache.clear_local_caches()
+        result = await cache.get_cog_config("1", "block_links")
+
+        # Assert
+        assert result["answer"] == "Novo"
+
+    async def test_delete_caches_missing_config(self, redis_client, mongodb):
+        """
+        Verifica que remover o cog grava o sentinela de configuracao ausente.
+
+        Input: Cog configurado e delete_cog_by_guild
+        Output: Leitura retorna None sem consultar o Mongo
+        """
+        # Arrange
+        await insert_cog_by_guild("1", "welcome_messages", {"enabled": True})
+
+        # Act
+        await delete_cog_by_guild("1", "welcome_messages")
+        cache.clear_local_caches()
+        with patch.object(cache.cogs_data, "find_cog_by_guild_id") as find_cog:
+            result = await cache.get_cog_config("1", "welcome_messages", manager=True)
+
+        # Assert
+        assert result is None
+        find_cog.assert_not_called()
+
+
+class TestCacheCodec:
+    """Testes do formato versionado dos valores no Redis."""
+
+    async def test_reads_and_migrates_legacy_key(self, redis_client, mongodb):
+        """
+        Verifica que valores gravados com json_util na chave antiga continuam sendo lidos.
+
+        Input: Documento em json_util na chave sem prefixo
+        Output: Documento lido sem Mongo, regravado na chave v2 e chave antiga removida
+        """
+        # Arrange
+        redis_client.setex("guild:1:cog.block_links", 60, '{"enabled": true, "answer": "Legado"}')
+
+        # Act
+        with patch.object(cache.cogs_data, "find_cog_by_guild_id") as find_cog:
+            result = await cache.get_cog_config("1", "block_links")
+
+        # Assert
+        assert result["answer"] == "Legado"
+        find_cog.assert_not_called()
+        assert _read_cached(redis_client, BLOCK_LINKS_KEY)["answer"] == "Legado"
+        assert redis_client.get("guild:1:cog.block_links") is None
+
+    async def test_reads_legacy_generic_value(self, redis_client, mongodb):
+        """
+        Verifica que get_data_from_redis le valores antigos e novos.
+
+        Input: Valor antigo em json_util e valor novo gravado pelo codec
+        Output: Ambos decodificados
+        """
+        # Arrange
+        redis_client.set("locale:oi", '"pt-br"')
+        await cache.set_data_in_redis_with_expiration("locale:hello", "en-us", 60)
+
+        # Act / Assert
+        assert await cache.get_data_from_redis("locale:oi") == "pt-br"
+        assert await cache.get_data_from_redis("locale:hello") == "en-us"
+        assert await cache.get_data_from_redis("locale:missing") == {}
+
+    async def test_remove_all_cache_deletes_both_formats(self, redis_client, mongodb):
+        """
+        Verifica que remover o cache da guild apaga chaves novas e antigas ja registradas.
+
+        Input: Chave v2 e chave antiga da guild, backfill do registro
+        Output: Nenhuma chave da guild no Redis
+        """
+        # Arrange
+        redis_client.set(BLOCK_LINKS_KEY, _cached({"enabled": True}))
+        redis_client.set("guild:1:cog.welcome_messages", '{"enabled": true}')
+        await cache.backfill_guild_key_registry()
+
+        # Act
+        await cache.remove_all_cache_by_guild("1")
+
+        # Assert
+        assert redis_client.get(BLOCK_LINKS_KEY) is None
+        assert redis_client.get("guild:1:cog.welcome_messages") is None
+
+
+class TestGuildKeyRegistry:
+    """Testes do registro de chaves por guild usado na remocao do cache."""
+
+    async def test_reads_and_writes_register_keys(self, redis_client, mongodb):
+        """
+        Verifica que carregar e gravar cogs registra as chaves da guild.
+
+        Input: Leitura de default_roles e insert de block_links
+        Output: As duas chaves no registro da guild 1
+        """
+        # Act
+        await cache.get_cog_config("1", "default_roles")
+        await insert_cog_by_guild("1", "block_links", {"enabled": True})
+
+        # Assert
+        assert redis_client.smembers("cache:keys:1") == {
+            "v2:guild:1:cog.default_roles",
+            BLOCK_LINKS_KEY,
+        }
+
+    async def test_remove_all_cache_does_not_scan_keyspace(self, redis_client, mongodb):
+        """
+        Verifica que remover o cache da guild usa o registro em vez de KEYS.
+
+        Input: Cogs em cache nas guilds 1 e 2, KEYS indisponivel
+        Output: Chaves e registro da guild 1 removidos, guild 2 mantida
+        """
+        # Arrange
+        await cache.get_cog_config("1", "block_links")
+        await cache.get_cog_config("2", "block_links")
+
+        # Act
+        with patch.object(redis_client, "keys", side_effect=AssertionError("KEYS")):
+            await cache.remove_all_cache_by_guild("1")
+
+        # Assert
+        assert redis_client.get(BLOCK_LINKS_KEY) is None
+        assert redis_client.get("cache:keys:1") is None
+        assert redis_client.get("v2:guild:2:cog.block_links") is not None
+
+    async def test_backfill_registers_existing_keys(self, redis_client, mongodb):
+        """
+        Verifica que a migracao registra as chaves gravadas antes do registro.
+
+        Input: Chave v2, chave antiga, chave de comandos, lock e contador global
+        Output: Apenas as chaves de guild registradas, cada uma na sua guild
+        """
+        # Arrange
+        redis_client.set(BLOCK_LINKS_KEY, _cached({"enabled": True}))
+        redis_client.set("guild:2:cog.welcome_messages", '{"enabled": true}')
+        redis_client.set("1@commands:streamer", "[]")
+        redis_client.set(BLOCK_LINKS_KEY + ":lock", "other-process")
+        redis_client.set("command_call:help", "3")
+
+        # Act
+        registered = await cache.backfill_guild_key_registry(batch_size=2)
+
+        # Assert
+        assert registered == 3
+        assert redis_client.smembers("cache:keys:1") == {BLOCK_LINKS_KEY, "1@commands:streamer"}
+        assert redis_client.smembers("cache:keys:2") == {"guild:2:cog.welcome_messages"}
+
+    def test_clear_cache_commands_by_guild(self, redis_client, mongodb):
+        """
+        Verifica que os comandos em cache da guild sao removidos pelo registro.
+
+        Input: Duas chaves do comando e uma de outro comando registradas
+        Output: 2 removidas, a outra mantida no Redis e no registro
+        """
+        # Arrange
+        for key in ("1@commands:a", "1@commands:b", "1@replies:a"):
+            redis_client.set(key, "[]")
+            redis_client.sadd("cache:keys:1", key)
+
+        # Act
+        removed = cache.clear_cache_commands_by_guild("1", "commands")
+
+        # Assert
+        assert removed == 2
+        assert redis_client.get("1@commands:a") is None
+        assert redis_client.smembers("cache:keys:1") == {"1@replies:a"}
@@ -0,0 +1,258 @@
+"""
+Testes para o buffer de eventos de auditoria dos cogs (app/services/cog_events.py).
+
+Estes testes usam o mock de MongoDB do conftest.
+"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from bson import ObjectId, json_util
+
+from app.constants import Commands as constants
+from app.services import cog_events
+from app.services.cogs import insert_cog_event
+
+
+DATE = datetime(2026, 10, 18, 12, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def no_spill_file():
+    cog_events.configure_cog_events_spill(None)
+    yield
+    cog_events.configure_cog_events_spill(None)
+
+
+def _record(key, event=constants.ENABLED_KEY):
+    insert_cog_event("1", key, event, date=DATE, user_id="2")
+
+
+class TestCogEvents:
+    """Testes do envio em lote dos eventos de auditoria."""
+
+    async def test_insert_only_buffers(self, deps, mongodb):
+        """
+        Verifica que registrar um evento nao acessa o Mongo.
+
+        Input: Dois eventos de block_links
+        Output: Eventos pendentes e nenhuma operacao no Mongo
+        """
+        # Act
+        _record(constants.BLOCK_LINKS_KEY)
+        _record(constants.BLOCK_LINKS_KEY, constants.PAUSED_KEY)
+
+        # Assert
+        assert [event["event"] for event in cog_events.get_pending_cog_events()] == ["enabled", "paused"]
+        assert deps.mongo_async_client.round_trips == []
+
+    async def test_flush_writes_one_batch_per_collection(self, deps, mongodb):
+        """
+        Verifica que o flush grava um insert_many por collection de eventos.
+
+        Input: Dois eventos de block_links e um de welcome_messages
+        Output: Dois insert_many, eventos gravados e buffer vazio
+        """
+        # Arrange
+        _record(constants.BLOCK_LINKS_KEY)
+        _record(constants.BLOCK_LINKS_KEY, constants.EDITED_KEY)
+        _record(constants.WELCOME_MESSAGES_KEY)
+
+        # Act
+        flushed = await cog_events.flush_cog_events()
+
+        # Assert
+        assert flushed == 3
+        assert sorted(deps.mongo_async_client.round_trips) == [
+            ("events.block_links", "insert_many"),
+            ("events.welcome_messages", "insert_many"),
+        ]
+        assert mongodb.events.block_links.count_documents({"guild_id": "1"}) == 2
+        assert cog_events.get_pending_cog_events() == []
+
+    async def test_failed_flush_keeps_events(self, mongodb):
+        """
+        Verifica que, sem arquivo de spill, um flush com erro devolve os eventos ao buffer.
+
+        Input: Evento pendente e Mongo indisponivel
+        Output: Nenhum evento gravado e evento ainda pendente
+        """
+        # Arrange
+        _record(constants.BLOCK_LINKS_KEY)
+
+        # Act
+        with patch.object(cog_events.cogs_data, "insert_cog_events", side_effect=ConnectionError("down")):
+            flushed = await cog_events.flush_cog_events()
+
+        # Assert
+        assert flushed == 0
+        assert len(cog_events.get_pending_cog_events()) == 1
+
+    async def test_spills_and_replays_when_mongo_is_down(self, mongodb, tmp_path):
+        """
+        Verifica que o modo duravel grava os eventos em arquivo e os reenvia depois.
+
+        Input: Arquivo de spill, flush com Mongo indisponivel e replay com Mongo de volta
+        Output: Eventos no arquivo, depois gravados no Mongo com a data original e arquivo removido
+        """
+        # Arrange
+        spill = tmp_path / "cog_events.jsonl"
+        cog_events.configure_cog_events_spill(str(spill))
+        _record(constants.BLOCK_LINKS_KEY)
+
+        # Act
+        with patch.object(cog_events.cogs_data, "insert_cog_events", side_effect=ConnectionError("down")):
+            await cog_events.flush_cog_events()
+        spilled = spill.read_text().splitlines()
+        replayed = await cog_events.replay_spilled_cog_events()
+
+        # Assert
+        assert len(spilled) == 1
+        assert replayed == 1
+        assert cog_events.get_pending_cog_events() == []
+        assert mongodb.events.block_links.find_one({"guild_id": "1"})["datetime"] == DATE
+        assert not spill.exists()
+
+
+class TestCogEventsRetries:
+    """Testes do reenvio de lotes gravados em parte."""
+
+    async def test_retry_after_partial_write_skips_stored_events(self, mongodb):
+        """
+        Verifica que reenviar um lote gravado em parte nao trava em erro de chave duplicada.
+
+        Input: Dois eventos, o primeiro gravado antes de o Mongo cair
+        Output: Lote devolvido ao buffer e, no reenvio, apenas o segundo gravado
+        """
+        # Arrange
+        _record(constants.BLOCK_LINKS_KEY)
+        _record(constants.BLOCK_LINKS_KEY, constants.PAUSED_KEY)
+        collection = mongodb.events.block_links
+        original_insert_many = collection.insert_many
+
+        def insert_first_then_fail(documents, ordered=True):
+            original_insert_many(documents[:1], ordered=ordered)
+            for document in documents:
+                document.setdefault("_id", ObjectId())
+            raise ConnectionError("down")
+
+        # Act
+        with patch.object(collection, "insert_many", side_effect=insert_first_then_fail):
+            first = await cog_events.flush_cog_events()
+        second = await cog_events.flush_cog_events()
+
+        # Assert
+        assert (first, second) == (0, 2)
+        assert [event["event"] for event in collection.find({})] == ["enabled", "paused"]
+        assert cog_events.get_pending_cog_events() == []
+
+    async def test_replay_of_stored_events_removes_spill_file(self, mongodb, tmp_path):
+        """
+        Verifica que o replay de eventos ja gravados remove o arquivo em vez de falhar a cada boot.
+
+        Input: Arquivo de spill com um evento ja gravado no Mongo e outro ainda nao
+        Output: Os dois eventos contados como gravados, sem duplicata, e arquivo removido
+        """
+        # Arrange
+        spill = tmp_path / "cog_events.jsonl"
+        cog_events.configure_cog_events_spill(str(spill))
+        _record(constants.BLOCK_LINKS_KEY)
+        await cog_events.flush_cog_events()
+        stored = mongodb.events.block_links.find_one({})
+        _record(constants.BLOCK_LINKS_KEY, constants.PAUSED_KEY)
+        pending = cog_events.get_pending_cog_events()
+        cog_events.clear_pending_cog_events()
+        spill.write_text(json_util.dumps(stored) + "\n" + json_util.dumps(pending[0]) + "\n")
+
+        # Act
+        replayed = await cog_events.replay_spilled_cog_events()
+
+        # Assert
+        assert replayed == 2
+        assert mongodb.events.block_links.count_documents({}) == 2
+        assert not spill.exists()
+
+    async def test_flusher_survives_spill_failure(self, mongodb, tmp_path):
+        """
+        Verifica que um erro ao gravar o spill devolve os eventos ao buffer sem parar o flusher.
+
+        Input: Mongo indisponivel e arquivo de spill em um diretorio inexistente
+        Output: Evento de volta ao buffer e gravado no flush seguinte
+        """
+        # Arrange
+        cog_events.configure_cog_events_spill(str(tmp_path / "missing" / "cog_events.jsonl"))
+        _record(constants.BLOCK_LINKS_KEY)
+
+        # Act
+        with patch.object(cog_events.cogs_data, "insert_cog_events", side_effect=ConnectionError("down")):
+            await cog_events.flush_cog_events()
+        pending = len(cog_events.get_pending_cog_events())
+        with patch.object(cog_events, "COG_EVENTS_FLUSH_INTERVAL", 0.01):
+            flusher = asyncio.create_task(cog_events.run_cog_events_flusher())
+            await asyncio.sleep(0.05)
+            running = not flusher.done()
+            flusher.cancel()
+
+        # Assert
+        assert pending == 1
+        assert running
+        assert mongodb.events.block_links.count_documents({}) == 1
+
+
+    async def test_flusher_keeps_running_after_flush_error(self):
+        """
+        Verifica que um erro inesperado no flush e registrado sem encerrar o flusher.
+
+        Input: Flush que falha com OSError na primeira execucao
+        Output: Flusher ainda rodando e novo flush executado
+        """
+        # Arrange
+        async def fail_once():
+            if flush.await_count == 1:
+                raise OSError("disk full")
+            return 0
+
+        flush = AsyncMock(side_effect=fail_once)
+
+        # Act
+        with patch.object(cog_events, "COG_EVENTS_FLUSH_INTERVAL", 0.01), \
+                patch.object(cog_events, "flush_cog_events", flush):
+            flusher = asyncio.create_task(cog_events.run_cog_events_flusher())
+            await asyncio.sleep(0.05)
+            running = not flusher.done()
+            flusher.cancel()
+
+        # Assert
+        assert running
+        assert flush.await_count > 1
+
+
+class TestShutdown:
+    """Testes do flush dos buffers ao desligar o bot."""
+
+    async def test_close_flushes_events_when_counters_fail(self, mongodb):
+        """
+        Verifica que uma falha no flush dos contadores nao impede o resto do desligamento.
+
+        Input: Evento pendente e Redis indisponivel no flush dos contadores
+        Output: Evento gravado, sessao da Twitch fechada e gateway fechado
+        """
+        # Arrange
+        from app.bot import DiscordBot
+        from app.services import command_counters
+
+        bot = DiscordBot.__new__(DiscordBot)
+        bot.twitch = AsyncMock()
+        _record(constants.BLOCK_LINKS_KEY)
+
+        # Act
+        with patch.object(command_counters, "flush_command_counters", side_effect=ConnectionError("down")), \
+                patch("discord.ext.commands.Bot.close", new_callable=AsyncMock) as gateway_close:
+            await bot.close()
+
+        # Assert
+        assert mongodb.events.block_links.count_documents({"guild_id": "1"}) == 1
+        bot.twitch.close.assert_awaited_once()
+        gateway_close.assert_awaited_once()
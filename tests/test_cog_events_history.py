@@ -0,0 +1,149 @@
+"""
+Testes para o historico de comandos paginado sob demanda
+(app/services/manager.CogEventsHistory).
+
+Estes testes usam o mock de MongoDB do conftest.
+"""
+
+from collections import Counter
+from datetime import datetime, timedelta
+
+from app.constants import Commands as constants
+from app.data import indexes
+from app.services import cog_events
+from app.services.cogs import parse_cog_event
+from app.services.manager import CogEventsHistory
+
+START = datetime(2025, 1, 1, 12, 0, 0)
+
+
+def _insert_events(mongodb, cog_key, minutes, guild_id="1"):
+    mongodb.events[cog_key].insert_many([
+        {"guild_id": guild_id, "cog_key": cog_key, "event": "edited", "user_id": "9",
+         "datetime": START + timedelta(minutes=minute)}
+        for minute in minutes
+    ])
+
+
+class TestCogEventsHistory:
+    """Testes da leitura do historico uma pagina por vez."""
+
+    async def test_pages_merge_collections_newest_first(self, mongodb):
+        """
+        Verifica que as paginas juntam as collections de eventos em ordem decrescente.
+
+        Input: Eventos intercalados de duas funcionalidades e de outra guild
+        Output: Paginas de tres eventos da guild, sem repeticao, e historico esgotado no final
+        """
+        # Arrange
+        _insert_events(mongodb, constants.BLOCK_LINKS_KEY, [0, 2, 4, 6])
+        _insert_events(mongodb, constants.DEFAULT_ROLES_KEY, [1, 3, 5])
+        _insert_events(mongodb, constants.DEFAULT_ROLES_KEY, [7], guild_id="2")
+        history = CogEventsHistory("1", [constants.BLOCK_LINKS_KEY, constants.DEFAULT_ROLES_KEY], page_size=3)
+
+        # Act
+        pages = []
+        while not history.exhausted:
+            pages.append([int((event["datetime"] - START).total_seconds() // 60) for event in await history.next_page()])
+
+        # Assert
+        assert pages == [[6, 5, 4], [3, 2, 1], [0]]
+
+    async def test_each_page_reads_at_most_one_limited_query_per_collection(self, deps, mongodb):
+        """
+        Verifica que uma pagina nao le o historico inteiro.
+
+        Input: Cinquenta eventos em uma funcionalidade
+        Output: Primeira pagina com uma unica consulta limitada ao tamanho da pagina
+        """
+        # Arrange
+        _insert_events(mongodb, constants.BLOCK_LINKS_KEY, range(50))
+        history = CogEventsHistory("1", [constants.BLOCK_LINKS_KEY], page_size=4)
+
+        # Act
+        page = await history.next_page()
+
+        # Assert
+        assert [event["datetime"] for event in page] == [START + timedelta(minutes=m) for m in (49, 48, 47, 46)]
+        assert Counter(deps.mongo_async_client.round_trips) == Counter({
+            (f"events.{constants.BLOCK_LINKS_KEY}", "find"): 1,
+        })
+        assert not history.exhausted
+
+    async def test_events_sharing_a_datetime_are_not_skipped(self, mongodb):
+        """
+        Verifica que eventos com o mesmo datetime na borda da pagina nao sao pulados.
+
+        Input: Cinco eventos no mesmo minuto e paginas de dois eventos
+        Output: Os cinco eventos lidos uma unica vez
+        """
+        # Arrange
+        _insert_events(mongodb, constants.BLOCK_LINKS_KEY, [0, 0, 0, 0, 0])
+        history = CogEventsHistory("1", [constants.BLOCK_LINKS_KEY], page_size=2)
+
+        # Act
+        events = []
+        while not history.exhausted:
+            events.extend(await history.next_page())
+
+        # Assert
+        assert len(events) == 5
+        assert len({event["_id"] for event in events}) == 5
+
+    async def test_buffered_events_are_flushed_before_first_page(self, mongodb):
+        """
+        Verifica que eventos ainda no buffer aparecem na primeira pagina.
+
+        Input: Um evento gravado e outro ainda no buffer de app.services.cog_events
+        Output: Primeira pagina com os dois eventos, o mais novo primeiro
+        """
+        # Arrange
+        _insert_events(mongodb, constants.BLOCK_LINKS_KEY, [0])
+        cog_events.enqueue_cog_event(
+            parse_cog_event("1", constants.BLOCK_LINKS_KEY, "paused", START + timedelta(minutes=1), "9")
+        )
+        history = CogEventsHistory("1", [constants.BLOCK_LINKS_KEY], page_size=4)
+
+        # Act
+        page = await history.next_page()
+
+        # Assert
+        assert [event["event"] for event in page] == ["paused", "edited"]
+        assert cog_events.get_pending_cog_events() == []
+
+    async def test_empty_history_is_exhausted_after_first_page(self):
+        """
+        Verifica o historico de uma guild sem eventos.
+
+        Input: Nenhum evento gravado
+        Output: Pagina vazia e historico esgotado
+        """
+        # Arrange
+        history = CogEventsHistory("1", constants.COMMANDS_LIST)
+
+        # Act
+        page = await history.next_page()
+
+        # Assert
+        assert page == []
+        assert history.exhausted
+
+
+class TestCogEventsRetention:
+    """Testes da politica de retencao dos eventos."""
+
+    def test_event_collections_have_ttl_index(self, mongodb):
+        """
+        Verifica que cada collection de eventos recebe o indice TTL de retencao.
+
+        Input: Execucao de ensure_indexes
+        Output: Indice datetime_1 com expireAfterSeconds igual a retencao
+        """
+        # Act
+        indexes.ensure_indexes()
+
+        # Assert
+        for collection in indexes.EVENT_COLLECTIONS:
+            information = mongodb.events[collection].index_information()
+            assert information["datetime_1"]["expireAfterSeconds"] == indexes.COG_EVENTS_RETENTION
+            assert "guild_id_1_datetime_-1__id_-1" in information
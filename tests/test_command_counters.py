@@ -0,0 +1,130 @@
+"""
+Testes para os contadores de comandos (app/services/command_counters.py).
+
+Estes testes usam o mock de Redis do conftest.
+"""
+
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from app.constants import LogTypes as logconstants
+from app.services import command_counters
+
+
+CALL = logconstants.COMMAND_CALL_TYPE
+ERROR = logconstants.COMMAND_ERROR_TYPE
+TODAY = date(2026, 10, 18)
+
+
+@pytest.fixture(autouse=True)
+def fixed_today():
+    with patch.object(command_counters, "_today", return_value=TODAY):
+        yield
+
+
+class TestCommandCounters:
+    """Testes dos contadores em hash com buckets diarios."""
+
+    async def test_increment_does_no_redis_io(self, redis_client):
+        """
+        Verifica que contar um comando apenas acumula em memoria.
+
+        Input: Tres incrementos de dois comandos
+        Output: Contagens pendentes e Redis vazio
+        """
+        # Act
+        command_counters.increment_command_counter(CALL, "birthdays")
+        command_counters.increment_command_counter(CALL, "birthdays")
+        command_counters.increment_command_counter(ERROR, "birthdays")
+
+        # Assert
+        assert command_counters.get_pending_counters() == {(CALL, "birthdays"): 2, (ERROR, "birthdays"): 1}
+        assert redis_client._data == {}
+
+    async def test_flush_writes_total_and_daily_buckets(self, redis_client):
+        """
+        Verifica que o flush grava o total e o bucket do dia com TTL.
+
+        Input: Dois incrementos de block_links e flush
+        Output: Hashes com 2 no total e no dia, bucket com expiracao e buffer vazio
+        """
+        # Arrange
+        command_counters.increment_command_counter(CALL, "block_links", 2)
+
+        # Act
+        flushed = await command_counters.flush_command_counters()
+
+        # Assert
+        assert flushed == 1
+        assert redis_client.hgetall(f"counters:{CALL}") == {"block_links": "2"}
+        assert redis_client.hgetall(f"counters:{CALL}:2026-10-18") == {"block_links": "2"}
+        assert redis_client.ttl(f"counters:{CALL}:2026-10-18") == command_counters.COMMAND_COUNTERS_BUCKET_EXPIRATION
+        assert command_counters.get_pending_counters() == {}
+
+    async def test_failed_flush_keeps_counts(self, redis_client):
+        """
+        Verifica que um flush com erro devolve as contagens ao buffer.
+
+        Input: Incremento e Redis indisponivel no flush
+        Output: ConnectionError e contagem ainda pendente
+        """
+        # Arrange
+        command_counters.increment_command_counter(CALL, "welcome_messages")
+
+        # Act
+        with patch.object(redis_client, "hincrby", side_effect=ConnectionError("down")):
+            with pytest.raises(ConnectionError):
+                await command_counters.flush_command_counters()
+
+        # Assert
+        assert command_counters.get_pending_counters() == {(CALL, "welcome_messages"): 1}
+
+    async def test_overview_reads_in_one_round_trip(self, redis_client):
+        """
+        Verifica que a leitura do overview usa um unico pipeline de HGETALL.
+
+        Input: Contagens de hoje, de ontem e um erro, sem GET por chave
+        Output: Totais por comando e chamadas por dia
+        """
+        # Arrange
+        redis_client.hincrby(f"counters:{CALL}", "birthdays", 5)
+        redis_client.hincrby(f"counters:{CALL}:{TODAY - timedelta(days=1)}", "birthdays", 4)
+        command_counters.increment_command_counter(CALL, "birthdays")
+        command_counters.increment_command_counter(ERROR, "birthdays")
+
+        # Act
+        with patch.object(redis_client, "get", side_effect=AssertionError("GET")):
+            counters = await command_counters.get_command_counters(days=3)
+
+        # Assert
+        assert counters["calls"] == {"birthdays": 6}
+        assert counters["errors"] == {"birthdays": 1}
+        assert counters["daily_calls"] == [
+            (TODAY, 1),
+            (TODAY - timedelta(days=1), 4),
+            (TODAY - timedelta(days=2), 0),
+        ]
+
+    async def test_migrates_legacy_string_counters(self, redis_client):
+        """
+        Verifica que a migracao soma os contadores antigos nos hashes.
+
+        Input: Contadores antigos de chamada e erro e um total ja em hash
+        Output: Totais somados e chaves antigas removidas
+        """
+        # Arrange
+        redis_client.set(f"{CALL}:birthdays", "3")
+        redis_client.set(f"{CALL}:birthdays:button", "2")
+        redis_client.set(f"{ERROR}:birthdays", "1")
+        redis_client.hincrby(f"counters:{CALL}", "birthdays", 4)
+
+        # Act
+        migrated = await command_counters.migrate_legacy_command_counters()
+
+        # Assert
+        assert migrated == 3
+        assert redis_client.hgetall(f"counters:{CALL}") == {"birthdays": "7", "birthdays:button": "2"}
+        assert redis_client.hgetall(f"counters:{ERROR}") == {"birthdays": "1"}
+        assert redis_client.get(f"{CALL}:birthdays") is None
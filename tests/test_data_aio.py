@@ -0,0 +1,78 @@
+"""
+Testes para a camada de dados async (app/data/aio).
+
+Estes testes usam o mock de MongoDB do conftest, compartilhado com a camada sync.
+"""
+
+from app.constants import Commands as constants
+from app.data import birthdays as birthdays_sync
+from app.data.aio import birthdays, cogs, moderations, notifications_twitch
+
+
+class TestAsyncDataLayer:
+    """Testes das funcoes async espelhando as funcoes sync."""
+
+    async def test_reads_documents_written_by_sync_layer(self, mongodb):
+        """
+        Verifica que a camada async le os mesmos documentos da camada sync.
+
+        Input: Aniversario gravado pela funcao sync
+        Output: Mesmo item lido pela funcao async
+        """
+        # Arrange
+        birthdays_sync.upsert_birthday_item("1", "2", "10-18")
+
+        # Act
+        item = await birthdays.find_birthday_item("1", "2")
+        items = await birthdays.find_birthday_items_by_date("10-18")
+
+        # Assert
+        assert item["date"] == "10-18"
+        assert [found["user_id"] for found in items] == ["2"]
+
+    async def test_birthday_enabled_reads_moderations(self, mongodb):
+        """
+        Verifica que is_birthday_enabled usa o documento de moderations.
+
+        Input: Moderations com reminders_birthday ativo em uma guild
+        Output: True para a guild e False para outra
+        """
+        # Arrange
+        await moderations.insert_moderations_by_guild({"guild_id": "1", constants.REMINDERS_BIRTHDAY_KEY: True})
+
+        # Act / Assert
+        assert await birthdays.is_birthday_enabled("1") is True
+        assert await birthdays.is_birthday_enabled("2") is False
+        assert await moderations.count_moderations_by_owner("9") == 0
+
+    async def test_cog_insert_and_update(self, mongodb):
+        """
+        Verifica que insert e update de cog retornam o documento gravado.
+
+        Input: Insert de block_links e update do campo enabled
+        Output: Documento com created_at e o novo valor de enabled
+        """
+        # Act
+        inserted = await cogs.insert_cog_by_guild_id("block_links", {"guild_id": "1", "enabled": True})
+        updated = await cogs.update_cog_by_guild("1", "block_links", {"enabled": False})
+
+        # Assert
+        assert "created_at" in inserted
+        assert updated["enabled"] is False
+        assert (await cogs.find_cog_by_guild_id("1", "block_links"))["enabled"] is False
+
+    async def test_stream_notification_upsert(self, mongodb):
+        """
+        Verifica que a notificacao de stream e gravada e lida pela camada async.
+
+        Input: save_stream_notification duas vezes para o mesmo canal
+        Output: Um documento com o ultimo message_id
+        """
+        # Act
+        await notifications_twitch.save_stream_notification("1", "2", "gaules", "10")
+        await notifications_twitch.save_stream_notification("1", "2", "gaules", "11")
+
+        # Assert
+        notification = await notifications_twitch.find_stream_notification("1", "2", "gaules")
+        assert notification["message_id"] == "11"
+        assert mongodb.notifications[constants.NOTIFICATIONS_TWITCH_KEY].count_documents({}) == 1
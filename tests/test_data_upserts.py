@@ -0,0 +1,139 @@
+"""
+Testes para os upserts atomicos da camada de dados ($set/$setOnInsert).
+
+Estes testes usam o mock de MongoDB do conftest.
+"""
+
+import datetime
+from unittest.mock import patch
+
+from app.constants import Commands as constants
+from app.data import birthdays, cogs
+from app.data.util import parse_upsert_timestamp
+from app.services import guild_features
+from app.services.moderations import join_moderations_by_guild, update_moderations_by_guild
+
+
+def _no_reads(collection):
+    return patch.object(collection, "find_one", side_effect=AssertionError("find_one"))
+
+
+class TestAtomicUpserts:
+    """Testes dos upserts de uma unica operacao."""
+
+    def test_cog_upsert_keeps_created_at(self, mongodb):
+        """
+        Verifica que o upsert de cog nao le antes de gravar e preserva created_at.
+
+        Input: Dois inserts de block_links para a mesma guild
+        Output: Um documento com o created_at do primeiro e os campos do segundo
+        """
+        # Arrange
+        first = cogs.insert_cog_by_guild_id("block_links", {"guild_id": "1", "enabled": True, "answer": "a"})
+
+        # Act
+        with patch.object(cogs, "find_cog_by_guild_id", side_effect=AssertionError("read")):
+            second = cogs.insert_cog_by_guild_id("block_links", {"guild_id": "1", "answer": "b"})
+
+        # Assert
+        assert second["created_at"] == first["created_at"]
+        assert second["enabled"] is True
+        assert second["answer"] == "b"
+        assert mongodb.guild.block_links.count_documents({}) == 1
+
+    def test_upsert_never_sets_created_at(self):
+        """
+        Verifica que created_at vindo nos dados vai apenas para o $setOnInsert.
+
+        Input: Dados de um documento lido do banco, com created_at
+        Output: created_at original apenas no $setOnInsert, sem conflito de caminho com o $set
+        """
+        # Arrange
+        created_at = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+
+        # Act
+        update = parse_upsert_timestamp({"guild_id": "1", "created_at": created_at}, {"enabled": True})
+
+        # Assert
+        assert "created_at" not in update["$set"]
+        assert update["$setOnInsert"] == {"created_at": created_at, "enabled": True}
+
+    async def test_moderation_update_creates_defaults_once(self, mongodb):
+        """
+        Verifica que atualizar uma moderation cria o documento padrao sem leitura previa.
+
+        Input: Duas atualizacoes de chaves diferentes em guild sem documento
+        Output: Documento com os padroes, as duas chaves e o bitmap atualizado
+        """
+        # Act
+        with _no_reads(mongodb.guild.moderations):
+            await update_moderations_by_guild("1", constants.DEFAULT_ROLES_KEY, True)
+            await update_moderations_by_guild("1", constants.BLOCK_LINKS_KEY, True)
+
+        # Assert
+        document = mongodb.guild.moderations.find_one({"guild_id": "1"})
+        assert document[constants.DEFAULT_ROLES_KEY] is True
+        assert document[constants.BLOCK_LINKS_KEY] is True
+        assert document["is_bot_online"] is True
+        assert "created_at" in document
+        assert guild_features.is_feature_enabled("1", constants.DEFAULT_ROLES_KEY)
+        assert mongodb.guild.moderations.count_documents({}) == 1
+
+    async def test_join_reports_new_and_returning_guilds(self, mongodb):
+        """
+        Verifica que entrar em uma guild cria ou reativa as moderations em uma operacao.
+
+        Input: Entrada em guild nova, saida e nova entrada com outro dono
+        Output: None na primeira entrada, documento anterior na segunda e dono atualizado
+        """
+        # Act
+        first = await join_moderations_by_guild("1", "9")
+        await update_moderations_by_guild("1", "is_bot_online", False)
+        second = await join_moderations_by_guild("1", "8")
+
+        # Assert
+        document = mongodb.guild.moderations.find_one({"guild_id": "1"})
+        assert first is None
+        assert second["is_bot_online"] is False
+        assert document["is_bot_online"] is True
+        assert document["owner_id"] == "8"
+
+    def test_birthday_item_keeps_fields_not_given(self, mongodb):
+        """
+        Verifica que o upsert de aniversario preserva os campos nao informados.
+
+        Input: Item com mensagem customizada e depois so a troca de data
+        Output: Nova data, mensagem e reminder_id mantidos e created_at original
+        """
+        # Arrange
+        message = {"mode": "custom", "title": "Oi", "content": "Parabens"}
+        first = birthdays.upsert_birthday_item("1", "2", "10-18", "r1", message=message)
+
+        # Act
+        with _no_reads(mongodb.reminders.birthdays):
+            second = birthdays.upsert_birthday_item("1", "2", "11-20")
+
+        # Assert
+        assert second["date"] == "11-20"
+        assert second["month"] == 11
+        assert second["message"] == message
+        assert second["reminder_id"] == "r1"
+        assert second["self_edit_count"] == 0
+        assert second["created_at"] == first["created_at"]
+
+    def test_birthday_config_keeps_optional_fields(self, mongodb):
+        """
+        Verifica que o upsert da configuracao so sobrescreve os campos informados.
+
+        Input: Config com timezone e depois so a troca de canal
+        Output: Novo canal e timezone mantido
+        """
+        # Arrange
+        birthdays.upsert_birthday_config("1", "10", timezone="America/Sao_Paulo")
+
+        # Act
+        config = birthdays.upsert_birthday_config("1", "11")
+
+        # Assert
+        assert config["channel_id"] == "11"
+        assert config["timezone"] == "America/Sao_Paulo"
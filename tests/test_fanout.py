@@ -0,0 +1,289 @@
+"""
+Testes para o envio em leque de anuncios (app/services/fanout.py).
+
+Os envios sao corrotinas falsas que registram a concorrencia e falham sob demanda.
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import discord
+import pytest
+
+from app.services import fanout
+from app.services.fanout import FanoutResult, FanoutTarget, fan_out
+
+
+def _http_exception(cls, status):
+    return cls(MagicMock(status=status, reason="error"), "error")
+
+
+class Sender:
+    """Envios falsos que contam quantos estao em andamento ao mesmo tempo."""
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.in_flight_by_route = {}
+        self.max_in_flight_by_route = {}
+        self.failures = {}
+        self.calls = {}
+
+    def target(self, key, route=None):
+        return FanoutTarget(key, route, lambda: self.send(key, route or key))
+
+    async def send(self, key, route):
+        self.calls[key] = self.calls.get(key, 0) + 1
+        self.in_flight += 1
+        self.in_flight_by_route[route] = self.in_flight_by_route.get(route, 0) + 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.max_in_flight_by_route[route] = max(
+            self.max_in_flight_by_route.get(route, 0), self.in_flight_by_route[route]
+        )
+        try:
+            await asyncio.sleep(self.delay)
+            failures = self.failures.get(key)
+            if failures:
+                raise failures.pop(0)
+            return key
+        finally:
+            self.in_flight -= 1
+            self.in_flight_by_route[route] -= 1
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay():
+    with patch.object(fanout, "FANOUT_RETRY_DELAY", 0):
+        fanout.clear_dead_letters()
+        yield
+
+
+class TestFanoutConcurrency:
+    """Testes do limite de envios simultaneos."""
+
+    async def test_sends_are_bounded_by_concurrency(self):
+        """
+        Verifica que nunca ha mais envios em andamento que o limite.
+
+        Input: Cinquenta alvos em canais diferentes com limite de cinco
+        Output: Todos enviados, no maximo cinco ao mesmo tempo
+        """
+        # Arrange
+        sender = Sender()
+        targets = [sender.target(f"guild{i}") for i in range(50)]
+
+        # Act
+        result = await fan_out("test", "run", targets, concurrency=5)
+
+        # Assert
+        assert result.sent == 50
+        assert sender.max_in_flight == 5
+
+    async def test_same_route_is_sent_in_sequence(self):
+        """
+        Verifica que alvos do mesmo canal sao enviados um por vez.
+
+        Input: Seis alvos em um unico canal e seis em canais diferentes
+        Output: Um envio por vez no canal compartilhado, os outros em paralelo
+        """
+        # Arrange
+        sender = Sender()
+        targets = [sender.target(f"shared{i}", "channel") for i in range(6)]
+        targets += [sender.target(f"guild{i}") for i in range(6)]
+
+        # Act
+        result = await fan_out("test", "run", targets)
+
+        # Assert
+        assert result.sent == 12
+        assert sender.max_in_flight_by_route["channel"] == 1
+        assert sender.max_in_flight > 1
+
+    async def test_values_follow_target_order(self):
+        """
+        Verifica que os retornos dos envios seguem a ordem dos alvos.
+
+        Input: Alvos com atrasos decrescentes
+        Output: Valores na ordem dos alvos, nao na de conclusao
+        """
+        # Arrange
+        async def send(key, delay):
+            await asyncio.sleep(delay)
+            return key
+
+        targets = [FanoutTarget(f"guild{i}", None, lambda i=i: send(f"guild{i}", 0.05 - i * 0.01)) for i in range(5)]
+
+        # Act
+        result = await fan_out("test", "run", targets)
+
+        # Assert
+        assert result.values == [f"guild{i}" for i in range(5)]
+
+
+class TestFanoutErrors:
+    """Testes de isolamento de falhas, novas tentativas e dead letters."""
+
+    async def test_transient_errors_are_retried(self):
+        """
+        Verifica que erros transitorios sao repetidos ate o envio dar certo.
+
+        Input: Alvo que falha com 503 e depois com timeout
+        Output: Enviado na terceira tentativa, sem dead letter
+        """
+        # Arrange
+        sender = Sender()
+        sender.failures["guild1"] = [_http_exception(discord.HTTPException, 503), asyncio.TimeoutError()]
+
+        # Act
+        result = await fan_out("test", "run", [sender.target("guild1")])
+
+        # Assert
+        assert result.sent == 1
+        assert sender.calls["guild1"] == 3
+        assert result.dead_letters == []
+
+    async def test_rate_limit_waits_retry_after(self):
+        """
+        Verifica que uma resposta 429 espera o retry_after antes de repetir.
+
+        Input: Alvo que falha com 429 e retry_after de 0.1s
+        Output: Enviado na segunda tentativa depois do retry_after
+        """
+        # Arrange
+        sender = Sender(delay=0)
+        error = _http_exception(discord.HTTPException, 429)
+        error.retry_after = 0.1
+        sender.failures["guild1"] = [error]
+        started_at = asyncio.get_running_loop().time()
+
+        # Act
+        result = await fan_out("test", "run", [sender.target("guild1")])
+
+        # Assert
+        assert result.sent == 1
+        assert asyncio.get_running_loop().time() - started_at >= 0.1
+
+    async def test_permanent_error_is_dead_lettered_without_stopping_others(self):
+        """
+        Verifica que um erro permanente vai para as dead letters sem afetar os outros alvos.
+
+        Input: Tres alvos, um sem permissao no canal
+        Output: Dois enviados, um dead letter com uma unica tentativa
+        """
+        # Arrange
+        sender = Sender()
+        sender.failures["guild1"] = [_http_exception(discord.Forbidden, 403)]
+        targets = [sender.target(f"guild{i}") for i in range(3)]
+
+        # Act
+        result = await fan_out("test", "run", targets)
+
+        # Assert
+        assert result.sent == 2
+        assert result.failed == 1
+        assert result.values == ["guild0", "guild2"]
+        assert result.dead_letters[0]["key"] == "guild1"
+        assert result.dead_letters[0]["attempts"] == 1
+        assert fanout.get_dead_letters() == result.dead_letters
+
+    async def test_exhausted_retries_are_dead_lettered(self):
+        """
+        Verifica que um erro transitorio persistente vira dead letter apos as tentativas.
+
+        Input: Alvo que sempre falha com 500
+        Output: Dead letter depois de FANOUT_RETRIES + 1 tentativas
+        """
+        # Arrange
+        sender = Sender()
+        sender.failures["guild1"] = [
+            _http_exception(discord.HTTPException, 500) for _ in range(fanout.FANOUT_RETRIES + 1)
+        ]
+
+        # Act
+        result = await fan_out("test", "run", [sender.target("guild1")])
+
+        # Assert
+        assert result.failed == 1
+        assert result.dead_letters[0]["attempts"] == fanout.FANOUT_RETRIES + 1
+
+    async def test_skipped_targets_are_counted(self):
+        """
+        Verifica que alvos sem canal sao contados como ignorados sem envio.
+
+        Input: Um alvo valido e um alvo ignorado por canal inexistente
+        Output: Um enviado e um ignorado
+        """
+        # Arrange
+        sender = Sender()
+        targets = [sender.target("guild0"), FanoutTarget.skipped("guild1", "channel not found")]
+
+        # Act
+        result = await fan_out("test", "run", targets)
+
+        # Assert
+        assert (result.sent, result.failed, result.skipped) == (1, 0, 1)
+        assert "guild1" not in sender.calls
+
+
+class TestFanoutResult:
+    """Testes do resumo do envio."""
+
+    def test_percentiles_and_summary(self):
+        """
+        Verifica os percentis de latencia e o resumo.
+
+        Input: Cem latencias de 1ms a 100ms
+        Output: p50 de 51ms, p99 de 100ms e o resumo com as contagens
+        """
+        # Arrange
+        result = FanoutResult("test", sent=100, latencies=[i / 1000 for i in range(1, 101)])
+
+        # Act
+        summary = result.summary()
+
+        # Assert
+        assert result.percentile(0.5) == 0.051
+        assert result.percentile(0.99) == 0.1
+        assert summary == "sent=100 failed=0 skipped=0 p50=51ms p95=96ms p99=100ms"
+
+    def test_summary_without_sends(self):
+        """
+        Verifica o resumo de um envio sem alvos.
+
+        Input: Resultado vazio
+        Output: Apenas as contagens, sem percentis
+        """
+        # Act / Assert
+        assert FanoutResult("test").percentile(0.5) is None
+        assert FanoutResult("test").summary() == "sent=0 failed=0 skipped=0"
+
+
+class TestFanoutMetrics:
+    """Testes do contador de entregas."""
+
+    async def test_metric_is_labelled_by_kind(self):
+        """
+        Verifica que o contador usa o tipo do envio, nao o nome de cada execucao.
+
+        Input: Dois envios do tipo "twitch" para streamers diferentes
+        Output: Uma unica serie "twitch" somando os dois; o nome completo fica nas dead letters
+        """
+        # Arrange
+        sender = Sender()
+        sender.failures["guild1"] = [_http_exception(discord.Forbidden, 403)]
+        sent = fanout.FANOUT_DELIVERIES.labels("twitch", "sent")
+        before = sent._value.get()
+
+        # Act
+        await fan_out("twitch", "gaules", [sender.target("guild0")])
+        result = await fan_out("twitch", "alanzoka", [sender.target("guild1")])
+
+        # Assert
+        assert sent._value.get() - before == 1
+        assert result.dead_letters[0]["fanout"] == "twitch:alanzoka"
+        assert not any(
+            sample.labels["kind"].startswith("twitch:")
+            for metric in fanout.FANOUT_DELIVERIES.collect()
+            for sample in metric.samples
+        )
@@ -0,0 +1,199 @@
+"""
+Testes para o bitmap de features por guild (app/services/guild_features.py).
+
+Estes testes usam os mocks de MongoDB do conftest.
+"""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services import cache, guild_features
+from app.services.moderations import (
+    insert_moderations_by_guild,
+    pause_moderations_by_guild,
+    update_moderations_by_guild,
+)
+from tests.mocks import create_message
+
+
+class TestGuildFeaturesBitmap:
+    """Testes de carga e atualizacao do bitmap."""
+
+    def test_handlers_run_until_bitmap_is_loaded(self):
+        """
+        Verifica que, antes da carga, nenhuma feature e bloqueada.
+
+        Input: Bitmap nao carregado
+        Output: is_feature_enabled retorna True
+        """
+        assert guild_features.is_feature_enabled("1", "block_links") is True
+
+    def test_loads_online_guilds_from_moderations(self, mongodb):
+        """
+        Verifica que a carga le os booleanos do guild.moderations.
+
+        Input: Guild online com block_links ligado e welcome desligado
+        Output: Apenas block_links habilitado
+        """
+        # Arrange
+        mongodb.guild.moderations.insert_one({
+            "guild_id": "1", "is_bot_online": True,
+            "block_links": True, "welcome_messages": False,
+        })
+
+        # Act
+        total = guild_features.load_guild_features()
+
+        # Assert
+        assert total == 1
+        assert guild_features.is_feature_enabled("1", "block_links")
+        assert not guild_features.is_feature_enabled("1", "welcome_messages")
+        assert not guild_features.is_feature_enabled("2", "block_links")
+
+    async def test_tracks_enable_pause_and_join(self, mongodb):
+        """
+        Verifica que ativar, pausar e entrar em guild atualizam o bitmap.
+
+        Input: Guild nova, ativacao de default_roles e depois pausa
+        Output: Bitmap segue o estado salvo no Mongo
+        """
+        # Arrange
+        guild_features.load_guild_features()
+
+        # Act / Assert
+        insert_moderations_by_guild("1", owner_id="9")
+        assert not guild_features.is_feature_enabled("1", "default_roles")
+
+        await update_moderations_by_guild("1", "default_roles", True)
+        assert guild_features.is_feature_enabled("1", "default_roles")
+
+        await pause_moderations_by_guild("1", "default_roles")
+        assert not guild_features.is_feature_enabled("1", "default_roles")
+
+    def test_untracked_keys_are_never_gated(self, mongodb):
+        """
+        Verifica que chaves fora do bitmap nao bloqueiam handlers.
+
+        Input: Bitmap carregado, chave desconhecida
+        Output: True
+        """
+        guild_features.load_guild_features()
+
+        assert guild_features.is_feature_enabled("1", "unknown_feature") is True
+
+
+class TestEventsGating:
+    """Testes dos listeners de eventos com o bitmap carregado."""
+
+    @pytest.mark.asyncio
+    async def test_on_message_skips_disabled_block_links(self, mongodb, guild, channel, member):
+        """
+        Verifica que on_message nao consulta block_links quando a feature esta desligada.
+
+        Input: Guild sem block_links no bitmap
+        Output: check_message nao e chamado
+        """
+        from app.cogs.events import Events
+
+        # Arrange
+        guild_features.load_guild_features()
+        events = Events(MagicMock())
+        msg = create_message(channel, member, "https://spam.com")
+
+        # Act
+        with patch("app.cogs.events.block_links_service.check_message", new=AsyncMock()) as check:
+            await events.on_message(msg)
+
+        # Assert
+        check.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_on_message_checks_enabled_block_links(self, mongodb, guild, channel, member):
+        """
+        Verifica que on_message chama block_links quando a feature esta ligada.
+
+        Input: Guild com block_links no bitmap
+        Output: check_message chamado
+        """
+        from app.cogs.events import Events
+
+        # Arrange
+        guild_features.load_guild_features()
+        guild_features.set_guild_feature(guild.id, "block_links", True)
+        events = Events(MagicMock())
+        msg = create_message(channel, member, "https://spam.com")
+
+        # Act
+        with patch("app.cogs.events.block_links_service.check_message", new=AsyncMock()) as check:
+            await events.on_message(msg)
+
+        # Assert
+        check.assert_awaited_once()
+
+
+class TestGuildFeaturesInvalidation:
+    """Testes da atualizacao do bitmap pelo barramento de invalidacao do cache."""
+
+    @staticmethod
+    async def _remote_invalidation(guild_id, key):
+        cache.handle_invalidation_message(json.dumps({
+            "origin": "outro-processo", "family": cache.COG_CACHE_FAMILY.name,
+            "guild_id": guild_id, "key": key, "version": 1,
+        }))
+        await asyncio.gather(*guild_features._refreshes.values())
+
+    async def test_remote_write_refreshes_guild_from_moderations(self, mongodb):
+        """
+        Verifica que uma escrita de outro processo atualiza o bitmap local.
+
+        Input: Bitmap carregado, block_links ligado no Mongo por outro processo e evento de invalidacao
+        Output: block_links habilitado sem recarregar todas as guilds
+        """
+        # Arrange
+        mongodb.guild.moderations.insert_one({"guild_id": "1", "is_bot_online": True, "block_links": False})
+        guild_features.load_guild_features()
+        mongodb.guild.moderations.update_one({"guild_id": "1"}, {"$set": {"block_links": True}})
+
+        # Act
+        await self._remote_invalidation("1", "block_links")
+
+        # Assert
+        assert guild_features.is_feature_enabled("1", "block_links")
+
+    async def test_guild_invalidation_drops_offline_guild(self, mongodb):
+        """
+        Verifica que a invalidacao da guild inteira remove uma guild que ficou offline.
+
+        Input: Guild com block_links ligado, marcada offline por outro processo
+        Output: Nenhuma feature habilitada para a guild
+        """
+        # Arrange
+        mongodb.guild.moderations.insert_one({"guild_id": "1", "is_bot_online": True, "block_links": True})
+        guild_features.load_guild_features()
+        mongodb.guild.moderations.update_one({"guild_id": "1"}, {"$set": {"is_bot_online": False}})
+
+        # Act
+        await self._remote_invalidation("1", None)
+
+        # Assert
+        assert not guild_features.is_feature_enabled("1", "block_links")
+
+    async def test_untracked_keys_do_not_reload(self, deps, mongodb):
+        """
+        Verifica que invalidacoes de chaves fora do bitmap nao leem o MongoDB.
+
+        Input: Bitmap carregado e invalidacao de uma chave que nao e feature
+        Output: Nenhuma consulta as moderations
+        """
+        # Arrange
+        guild_features.load_guild_features()
+        deps.mongo_async_client.round_trips.clear()
+
+        # Act
+        await self._remote_invalidation("1", "not_a_feature")
+
+        # Assert
+        assert deps.mongo_async_client.round_trips == []
@@ -0,0 +1,176 @@
+"""
+Testes para o registro de indices do MongoDB (app/data/indexes.py).
+
+Os testes unitarios usam o mock de MongoDB do conftest. Os testes de
+integracao rodam explain() contra um mongod local e sao ignorados quando
+ele nao esta disponivel.
+"""
+
+from dataclasses import replace
+from unittest.mock import patch
+
+import pytest
+
+from app.constants import Commands as constants
+from app.data import indexes
+from app.data.notifications_twitch import STREAMER_TARGETS_COLLECTION
+
+
+class TestEnsureIndexes:
+    """Testes da criacao idempotente dos indices declarados."""
+
+    def test_creates_declared_indexes_once(self, mongodb):
+        """
+        Verifica que os indices sao criados na primeira execucao e nao na segunda.
+
+        Input: Duas execucoes de ensure_indexes
+        Output: Todos os indices criados na primeira, nenhum na segunda
+        """
+        # Act
+        first = indexes.ensure_indexes()
+        second = indexes.ensure_indexes()
+
+        # Assert
+        assert len(first) == len(indexes.INDEXES)
+        assert second == []
+        assert "guild_id_1" in mongodb.guild.block_links.index_information()
+        assert "guild_id_1_user_id_1" in mongodb.reminders.birthdays.index_information()
+
+    def test_index_names_match_mongodb_defaults(self):
+        """
+        Verifica que o nome do indice e o mesmo gerado pelo MongoDB.
+
+        Input: Indice composto de streamer e enabled
+        Output: Nome no formato campo_direcao
+        """
+        spec = indexes.IndexSpec(
+            "guild", constants.NOTIFICATIONS_TWITCH_KEY,
+            (("notifications.values.streamer.value", 1), ("enabled", 1)),
+        )
+
+        assert spec.name == "notifications.values.streamer.value_1_enabled_1"
+
+
+class TestIndexReport:
+    """Testes do relatorio de indices ausentes e sem uso."""
+
+    def test_reports_missing_and_unused_indexes(self, mongodb):
+        """
+        Verifica que o relatorio lista indices ausentes e indices sem uso.
+
+        Input: Indices de moderations criados, um usado, e um indice nao declarado
+        Output: Indices de reminders ausentes, nao declarado e sem uso listados
+        """
+        # Arrange
+        specs = [spec for spec in indexes.INDEXES if spec.namespace in ("guild.moderations", "reminders.birthdays")]
+        moderation_specs = [spec for spec in specs if spec.collection == "moderations"]
+        indexes.ensure_indexes(moderation_specs)
+        mongodb.guild.moderations.create_indexes([
+            indexes.IndexSpec("guild", "moderations", (("is_bot_online", 1),)).to_model()
+        ])
+        mongodb.guild.moderations.index_ops["guild_id_1"] = 10
+
+        # Act
+        report = indexes.get_index_report(specs)
+
+        # Assert
+        assert {(index["namespace"], index["name"]) for index in report["missing"]} == {
+            ("reminders.birthdays", "date_1"),
+            ("reminders.birthdays", "guild_id_1_user_id_1"),
+        }
+        assert [(index["name"], index["declared"]) for index in report["unused"]] == [
+            ("is_bot_online_1", False),
+            ("owner_id_1", True),
+        ]
+
+
+@pytest.fixture(scope="module")
+def local_mongo():
+    """Cliente pymongo de um mongod local, com os databases de teste removidos no final."""
+    from pymongo import MongoClient
+    from pymongo.errors import PyMongoError
+
+    client = MongoClient("mongodb://localhost:27017", serverSelectionTimeoutMS=500)
+    try:
+        client.admin.command("ping")
+    except PyMongoError:
+        pytest.skip("mongod local indisponivel")
+
+    yield client
+    for database in {spec.database for spec in indexes.INDEXES}:
+        client.drop_database(f"keiko_test_{database}")
+    client.close()
+
+
+def _winning_stages(explain):
+    stages = []
+    plan = explain["queryPlanner"]["winningPlan"]
+    plan = plan.get("queryPlan", plan)
+    while plan:
+        stages.append(plan["stage"])
+        plan = plan.get("inputStage")
+    return stages
+
+
+class TestIndexesAgainstMongod:
+    """Testes de integracao: as consultas quentes usam os indices declarados.
+
+    Sem o marker integration: o Redis continua mockado e so o mongod local e usado.
+    """
+
+    @pytest.fixture(autouse=True)
+    def test_databases(self, local_mongo):
+        self.client = local_mongo
+        self.specs = [replace(spec, database=f"keiko_test_{spec.database}") for spec in indexes.INDEXES]
+        with patch.object(indexes, "mongo_client", local_mongo):
+            indexes.ensure_indexes(self.specs)
+            yield
+
+    def _explain(self, database, collection, query, sort=None):
+        cursor = self.client[f"keiko_test_{database}"][collection].find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        return cursor.explain()
+
+    @pytest.mark.parametrize("query, expected_index", [
+        (("guild", constants.BLOCK_LINKS_KEY, {"guild_id": "1"}), "guild_id_1"),
+        (("guild", constants.MODERATIONS_KEY, {"owner_id": "1"}), "owner_id_1"),
+        (("notifications", STREAMER_TARGETS_COLLECTION, {"streamer": "gaules"}), "streamer_1"),
+        (("notifications", STREAMER_TARGETS_COLLECTION, {"guild_id": "1"}), "guild_id_1"),
+        (
+            ("guild", constants.NOTIFICATIONS_YOUTUBE_VIDEO_KEY, {"notifications.values.youtuber.value": "x", "enabled": True}),
+            "notifications.values.youtuber.value_1_enabled_1",
+        ),
+        (("reminders", "birthdays", {"date": "18/10"}), "date_1"),
+        (("reminders", "birthdays", {"guild_id": "1", "user_id": "2"}), "guild_id_1_user_id_1"),
+        (("reminders", "birthdays", {"guild_id": "1"}), "guild_id_1_user_id_1"),
+    ])
+    def test_hot_queries_use_index(self, query, expected_index):
+        """
+        Verifica que cada consulta quente e resolvida por IXSCAN no indice declarado.
+
+        Input: Filtro usado pela camada de dados
+        Output: Plano vencedor com IXSCAN no indice esperado, sem COLLSCAN
+        """
+        # Act
+        explain = self._explain(*query)
+
+        # Assert
+        stages = _winning_stages(explain)
+        assert "COLLSCAN" not in stages
+        assert expected_index in str(explain["queryPlanner"]["winningPlan"])
+
+    def test_event_history_is_sorted_by_index(self):
+        """
+        Verifica que o historico de eventos nao precisa ordenar em memoria.
+
+        Input: Eventos de uma guild ordenados por datetime decrescente
+        Output: Plano sem COLLSCAN nem SORT
+        """
+        # Act
+        explain = self._explain("events", constants.BLOCK_LINKS_KEY, {"guild_id": "1"}, [("datetime", -1)])
+
+        # Assert
+        stages = _winning_stages(explain)
+        assert "COLLSCAN" not in stages
+        assert "SORT" not in stages
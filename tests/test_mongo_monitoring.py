@@ -0,0 +1,132 @@
+"""
+Testes para o monitoramento de comandos do MongoDB (app/data/monitoring.py).
+
+Os eventos sao criados diretamente, como o pymongo os entrega ao listener.
+"""
+
+from datetime import timedelta
+
+from prometheus_client import REGISTRY
+from pymongo import monitoring
+
+from app.data.monitoring import CommandMonitor, redact_filter
+
+CONNECTION = ("localhost", 27017)
+
+
+def _run_command(monitor, command, duration_ms, database="guild", request_id=1, failed=False):
+    command_name = next(iter(command))
+    monitor.started(monitoring.CommandStartedEvent(command, database, request_id, CONNECTION, request_id))
+    if failed:
+        monitor.failed(monitoring.CommandFailedEvent(
+            timedelta(milliseconds=duration_ms), {"ok": 0}, command_name, request_id, CONNECTION, request_id,
+        ))
+    else:
+        monitor.succeeded(monitoring.CommandSucceededEvent(
+            timedelta(milliseconds=duration_ms), {"ok": 1}, command_name, request_id, CONNECTION, request_id,
+        ))
+
+
+def _duration_count(database, collection, command):
+    return REGISTRY.get_sample_value(
+        "keiko_mongo_command_duration_seconds_count",
+        {"database": database, "collection": collection, "command": command},
+    ) or 0
+
+
+class TestRedactFilter:
+    """Testes da forma do filtro sem os valores."""
+
+    def test_keeps_fields_and_operators_only(self):
+        """
+        Verifica que nomes de campos e operadores sao mantidos e valores substituidos.
+
+        Input: Filtro com igualdade, $in de varios ids e $or
+        Output: Mesma estrutura com valores trocados por ?, $in reduzido a uma forma
+        """
+        # Act
+        shape = redact_filter({
+            "guild_id": "123",
+            "user_id": {"$in": ["1", "2", "3"]},
+            "$or": [{"enabled": True}, {"paused": False}],
+        })
+
+        # Assert
+        assert shape == {
+            "guild_id": "?",
+            "user_id": {"$in": ["?"]},
+            "$or": [{"enabled": "?"}, {"paused": "?"}],
+        }
+
+
+class TestCommandMonitor:
+    """Testes do listener registrado nos clientes do MongoDB."""
+
+    def test_records_latency_per_collection_and_command(self):
+        """
+        Verifica que cada comando e observado no histograma da sua collection.
+
+        Input: Dois finds rapidos e um update em collections diferentes
+        Output: Contagens do histograma por database, collection e comando, sem consultas lentas
+        """
+        # Arrange
+        monitor = CommandMonitor(threshold_ms=100)
+        before_find = _duration_count("guild", "monitoring_find", "find")
+        before_update = _duration_count("guild", "monitoring_update", "update")
+
+        # Act
+        _run_command(monitor, {"find": "monitoring_find", "filter": {"guild_id": "1"}}, 2, request_id=1)
+        _run_command(monitor, {"find": "monitoring_find", "filter": {"guild_id": "2"}}, 3, request_id=2)
+        _run_command(monitor, {"update": "monitoring_update", "updates": [{"q": {"guild_id": "1"}}]}, 4, request_id=3)
+
+        # Assert
+        assert _duration_count("guild", "monitoring_find", "find") - before_find == 2
+        assert _duration_count("guild", "monitoring_update", "update") - before_update == 1
+        assert monitor.get_slow_queries() == []
+
+    def test_slow_queries_are_kept_redacted_and_bounded(self):
+        """
+        Verifica o buffer de consultas lentas.
+
+        Input: Quatro consultas acima do limite em um buffer de tres e uma abaixo
+        Output: As tres mais recentes, ordenadas pela duracao, com filtros sem valores
+        """
+        # Arrange
+        monitor = CommandMonitor(threshold_ms=100, size=3)
+
+        # Act
+        _run_command(monitor, {"find": "a", "filter": {"owner_id": "secret"}}, 900, request_id=1)
+        _run_command(monitor, {"count": "b", "query": {"guild_id": "1"}}, 150, request_id=2)
+        _run_command(monitor, {"aggregate": "c", "pipeline": [{"$match": {"date": "05-15"}}]}, 400, request_id=3)
+        _run_command(monitor, {"delete": "d", "deletes": [{"q": {"user_id": "2"}}]}, 200, request_id=4)
+        _run_command(monitor, {"find": "e", "filter": {"guild_id": "1"}}, 5, request_id=5)
+
+        # Assert
+        slow = monitor.get_slow_queries()
+        assert [(query["collection"], query["command"], query["filter"]) for query in slow] == [
+            ("c", "aggregate", {"date": "?"}),
+            ("d", "delete", {"user_id": "?"}),
+            ("b", "count", {"guild_id": "?"}),
+        ]
+        assert "secret" not in str(slow)
+
+    def test_failures_are_counted_and_handshakes_ignored(self):
+        """
+        Verifica comandos com erro e comandos internos do driver.
+
+        Input: Um find que falha e um ping
+        Output: Falha contada para o find e nenhuma observacao para o ping
+        """
+        # Arrange
+        monitor = CommandMonitor()
+        labels = {"database": "guild", "collection": "monitoring_failed", "command": "find"}
+        before = REGISTRY.get_sample_value("keiko_mongo_command_failures_total", labels) or 0
+
+        # Act
+        _run_command(monitor, {"find": "monitoring_failed", "filter": {}}, 1, request_id=1, failed=True)
+        _run_command(monitor, {"ping": 1}, 1, database="admin", request_id=2)
+
+        # Assert
+        assert REGISTRY.get_sample_value("keiko_mongo_command_failures_total", labels) - before == 1
+        assert _duration_count("admin", "", "ping") == 0
+        assert monitor._started == {}
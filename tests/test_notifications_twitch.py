@@ -5,9 +5,14 @@ Estes testes verificam o fluxo completo de notificacoes,
 desde o recebimento do webhook ate o envio da mensagem.
 """
 
+import asyncio
+import time
 import pytest
 import discord
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from prometheus_client import REGISTRY
+from app.services import cache, notifications_twitch
 from app.services.notifications_twitch import (
     handle_send_streamer_notification,
     is_more_than_one_hour,
@@ -52,18 +57,14 @@ class TestTwitchStreamOnline:
         bot.get_guild.return_value = guild
         guild.get_channel = lambda id: channel if str(id) == str(channel.id) else None
 
-        twitch_data.find_guilds.return_value = [{
+        twitch_data.find_targets.return_value = [{
+            "streamer": "gaules",
             "guild_id": str(guild.id),
-            "notifications": {
-                "values": [{
-                    "channel": {"value": str(channel.id)},
-                    "streamer": {"value": "gaules"},
-                    "notification_messages": {"value": "{streamer} esta ao vivo!"}
-                }]
-            }
+            "channel_id": str(channel.id),
+            "notification_messages": "{streamer} esta ao vivo!",
         }]
         twitch_data.find_last_stream_date.return_value = None  # Primeira vez
-        twitch_data.wait_for_stream_info.return_value = twitch.get_stream_info("gaules")
+        twitch_data.wait_for_stream_info.return_value = await twitch.get_stream_info("gaules")
 
         # Act
         await handle_send_streamer_notification("gaules")
@@ -78,10 +79,10 @@ class TestTwitchStreamOnline:
         # Verify mocks were called with correct arguments
         twitch_data.wait_for_stream_info.assert_called_once_with("gaules")
         twitch_data.find_last_stream_date.assert_called_once_with("gaules")
-        twitch_data.find_guilds.assert_called_once_with("gaules")
+        twitch_data.find_targets.assert_called_once_with("gaules")
         twitch_data.save_notification.assert_called_once()
         twitch_data.update_last_stream_date.assert_called_once_with(
-            "gaules", twitch.get_stream_info("gaules").get("started_at")
+            "gaules", (await twitch.get_stream_info("gaules")).get("started_at")
         )
 
     @pytest.mark.asyncio
@@ -118,11 +119,47 @@ class TestTwitchStreamOnline:
 
         # When stream_info is None, should not proceed to find guilds or save
         twitch_data.wait_for_stream_info.assert_called_once_with("gaules")
-        twitch_data.find_guilds.assert_not_called()
+        twitch_data.find_targets.assert_not_called()
         twitch_data.find_last_stream_date.assert_not_called()
         twitch_data.save_notification.assert_not_called()
 
 
+    async def test_skips_deleted_channel_and_notifies_others(self, twitch_data, guild, twitch, bot):
+        """
+        Verifica que um canal apagado nao impede as notificacoes dos outros canais.
+
+        Input: Duas notificacoes do streamer, uma em um canal que nao existe mais
+        Output: Notificacao enviada apenas no canal existente, sem erro
+        """
+        # Arrange
+        channel = guild.text_channels[0]
+        twitch.add_user("gaules", user_id="123")
+        twitch.set_stream_online("gaules", game="CS2", title="LOUD vs FURIA!")
+        bot.get_guild.return_value = guild
+        guild.get_channel = lambda id: channel if str(id) == str(channel.id) else None
+
+        twitch_data.find_targets.return_value = [{
+            "streamer": "gaules",
+            "guild_id": str(guild.id),
+            "channel_id": "999",
+            "notification_messages": "{streamer} esta ao vivo!",
+        }, {
+            "streamer": "gaules",
+            "guild_id": str(guild.id),
+            "channel_id": str(channel.id),
+            "notification_messages": "{streamer} esta ao vivo!",
+        }]
+        twitch_data.find_last_stream_date.return_value = None
+        twitch_data.wait_for_stream_info.return_value = await twitch.get_stream_info("gaules")
+
+        # Act
+        await handle_send_streamer_notification("gaules")
+
+        # Assert
+        assert len(channel.get_all_messages()) == 1
+        assert_embed_contains(channel.get_last_embed(), "CS2")
+
+
 class TestTwitchDuplicatePrevention:
     """Testes de prevencao de notificacoes duplicadas."""
 
@@ -153,14 +190,13 @@ class TestTwitchDuplicatePrevention:
         bot.get_guild.return_value = guild
         guild.get_channel = lambda id: channel
 
-        twitch_data.find_guilds.return_value = [{
+        twitch_data.find_targets.return_value = [{
+            "streamer": "gaules",
             "guild_id": str(guild.id),
-            "notifications": {"values": [{
-                "streamer": {"value": "gaules"},
-                "channel": {"value": str(channel.id)},
-                "notification_messages": {"value": "{streamer} esta ao vivo!"}
-            }]}
+            "channel_id": str(channel.id),
+            "notification_messages": "{streamer} esta ao vivo!",
         }]
+        twitch_data.wait_for_stream_info.return_value = await twitch.get_stream_info("gaules")
         twitch_data.find_last_stream_date.return_value = recent_time
         twitch_data.is_more_than_one_hour.return_value = False  # Menos de 1 hora
 
@@ -233,15 +269,11 @@ class TestTwitchMessageComposition:
         Output: Mensagem com valores reais
         """
         # Arrange
-        notification = {
-            "notification_messages": {
-                "value": "{streamer} esta ao vivo! {stream_link}"
-            }
-        }
+        target = {"notification_messages": "{streamer} esta ao vivo! {stream_link}"}
         streamer = "gaules"
 
         # Act
-        result = compose_notification_message(notification, streamer)
+        result = compose_notification_message(target, streamer)
 
         # Assert
         assert "gaules" in result
@@ -269,7 +301,7 @@ class TestTwitchMessageComposition:
 class TestTwitchStreamEmbed:
     """Testes da criacao de embeds de notificacao."""
 
-    def test_create_stream_notification_embed_has_required_fields(self, twitch):
+    async def test_create_stream_notification_embed_has_required_fields(self, twitch):
         """
         Verifica que o embed tem todos os campos necessarios.
 
@@ -280,8 +312,8 @@ class TestTwitchStreamEmbed:
         twitch.add_user("gaules", user_id="123")
         twitch.set_stream_online("gaules", game="CS2", title="Live Test!")
 
-        stream_info = twitch.get_stream_info("gaules")
-        user_info = twitch.get_user_info("gaules")
+        stream_info = await twitch.get_stream_info("gaules")
+        user_info = await twitch.get_user_info("gaules")
 
         # Act
         embed = create_stream_notification_embed("gaules", stream_info, user_info)
@@ -292,7 +324,7 @@ class TestTwitchStreamEmbed:
         assert_embed_field(embed, "Game", "CS2")
         assert_embed_field(embed, "Streamer", "gaules")
 
-    def test_embed_has_correct_color(self, twitch):
+    async def test_embed_has_correct_color(self, twitch):
         """
         Verifica que o embed tem cor roxa (Twitch).
 
@@ -303,8 +335,8 @@ class TestTwitchStreamEmbed:
         twitch.add_user("streamer", user_id="123")
         twitch.set_stream_online("streamer")
 
-        stream_info = twitch.get_stream_info("streamer")
-        user_info = twitch.get_user_info("streamer")
+        stream_info = await twitch.get_stream_info("streamer")
+        user_info = await twitch.get_user_info("streamer")
 
         # Act
         embed = create_stream_notification_embed("streamer", stream_info, user_info)
@@ -316,7 +348,7 @@ class TestTwitchStreamEmbed:
 class TestTwitchSubscriptionManagement:
     """Testes de gerenciamento de subscriptions."""
 
-    def test_subscribe_returns_202_for_new_subscription(self, twitch):
+    async def test_subscribe_returns_202_for_new_subscription(self, twitch):
         """
         Verifica que subscription nova retorna 202.
 
@@ -327,13 +359,13 @@ class TestTwitchSubscriptionManagement:
         twitch.add_user("gaules", user_id="123")
 
         # Act
-        response = twitch.subscribe_to_stream_online_event("123")
+        response = await twitch.subscribe_to_stream_online_event("123")
 
         # Assert
         assert response.status_code == 202
         twitch.assert_subscribed("123", "stream.online")
 
-    def test_subscribe_returns_409_for_duplicate(self, twitch):
+    async def test_subscribe_returns_409_for_duplicate(self, twitch):
         """
         Verifica que subscription duplicada retorna 409.
 
@@ -342,15 +374,15 @@ class TestTwitchSubscriptionManagement:
         """
         # Arrange
         twitch.add_user("gaules", user_id="123")
-        twitch.subscribe_to_stream_online_event("123")
+        await twitch.subscribe_to_stream_online_event("123")
 
         # Act
-        response = twitch.subscribe_to_stream_online_event("123")
+        response = await twitch.subscribe_to_stream_online_event("123")
 
         # Assert
         assert response.status_code == 409
 
-    def test_unsubscribe_removes_subscription(self, twitch):
+    async def test_unsubscribe_removes_subscription(self, twitch):
         """
         Verifica que unsubscribe remove a subscription.
 
@@ -359,11 +391,230 @@ class TestTwitchSubscriptionManagement:
         """
         # Arrange
         twitch.add_user("gaules", user_id="123")
-        twitch.subscribe_to_stream_online_event("123")
+        await twitch.subscribe_to_stream_online_event("123")
 
         # Act
-        response = twitch.unsubscribe_from_stream_event("sub-online-123-1")
+        response = await twitch.unsubscribe_from_stream_event("sub-online-123-1")
 
         # Assert
         assert response.status_code == 204
         twitch.assert_unsubscribed()
+
+
+class TestStreamInfoRetry:
+    """Testes da espera pelas informacoes da stream em segundo plano."""
+
+    def test_backoff_delay_is_exponential_and_capped(self):
+        """
+        Verifica que o limite do atraso dobra a cada tentativa ate o maximo.
+
+        Input: Tentativas 0 a 5 com o jitter no maior valor possivel
+        Output: 5, 10, 20, 40, 60 e 60 segundos
+        """
+        # Act
+        with patch.object(notifications_twitch.random, "uniform", side_effect=lambda low, high: high):
+            delays = [notifications_twitch.get_stream_info_delay(attempt) for attempt in range(6)]
+
+        # Assert
+        assert delays == [5, 10, 20, 40, 60, 60]
+
+    async def test_waiting_does_not_block_event_loop(self, twitch):
+        """
+        Verifica que a espera pela stream libera o event loop entre as tentativas.
+
+        Input: Stream indexada pela Helix so depois de algumas tentativas
+        Output: Stream info retornada e outra coroutine executada durante a espera
+        """
+        # Arrange
+        twitch.add_user("gaules", user_id="123")
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(1)
+                await asyncio.sleep(0.005)
+
+        ticker_task = asyncio.create_task(ticker())
+        asyncio.get_running_loop().call_later(0.05, lambda: twitch.set_stream_online("gaules"))
+
+        # Act
+        with patch.object(notifications_twitch, "STREAM_INFO_BASE_DELAY", 0.02):
+            stream_info = await notifications_twitch.wait_for_stream_info("gaules")
+        ticker_task.cancel()
+
+        # Assert
+        assert stream_info["user_login"] == "gaules"
+        assert len(twitch.get_stream_info_calls) > 1
+        assert len(ticks) > 1
+
+    async def test_offline_cancels_only_its_streamer(self, twitch):
+        """
+        Verifica que um stream.offline cancela apenas a espera do mesmo streamer.
+
+        Input: Duas lives aguardando stream info e um offline de gaules
+        Output: Espera de gaules cancelada, notificacao de cellbit enviada
+        """
+        # Arrange
+        twitch.add_user("gaules", user_id="1")
+        twitch.add_user("cellbit", user_id="2")
+        asyncio.get_running_loop().call_later(0.05, lambda: twitch.set_stream_online("cellbit"))
+
+        with patch.object(notifications_twitch, "STREAM_INFO_BASE_DELAY", 0.02), \
+                patch.object(notifications_twitch, "find_last_stream_date", return_value=None), \
+                patch.object(notifications_twitch, "update_last_stream_date"), \
+                patch.object(notifications_twitch, "send_streamer_notifications") as send, \
+                patch.object(notifications_twitch, "handle_send_streamer_offline_notification") as offline:
+            gaules = notifications_twitch.schedule_streamer_notification("gaules")
+            cellbit = notifications_twitch.schedule_streamer_notification("cellbit")
+            await asyncio.sleep(0.01)
+
+            # Act
+            await notifications_twitch.schedule_streamer_offline_notification("gaules")
+            await cellbit
+
+        # Assert
+        with pytest.raises(asyncio.CancelledError):
+            await gaules
+        offline.assert_awaited_once_with("gaules")
+        send.assert_awaited_once()
+        assert send.call_args.args[1]["login"] == "cellbit"
+        assert notifications_twitch._stream_info_tasks == {}
+
+
+def _announce_delay_count(phase):
+    return REGISTRY.get_sample_value("keiko_twitch_notification_delay_seconds_count", {"phase": phase}) or 0
+
+
+class TestTwitchNotifyFirst:
+    """Testes do anuncio imediato com enriquecimento posterior."""
+
+    async def _arrange(self, twitch_data, guild, twitch, bot):
+        channel = guild.text_channels[0]
+        twitch.add_user("gaules", user_id="123", display_name="Gaules")
+        bot.get_guild.return_value = guild
+        guild.get_channel = lambda id: channel
+
+        twitch_data.find_targets.return_value = [{
+            "streamer": "gaules",
+            "guild_id": str(guild.id),
+            "channel_id": str(channel.id),
+            "notification_messages": "{streamer} esta ao vivo!",
+        }]
+        twitch_data.find_last_stream_date.return_value = None
+        await cache.set_data_in_redis_with_expiration(
+            notifications_twitch.get_streamer_profile_key("gaules"), await twitch.get_user_info("gaules"), 60
+        )
+        twitch.get_user_info_calls.clear()
+
+        indexed = asyncio.Event()
+
+        async def wait_for_stream_info(streamer):
+            await indexed.wait()
+            twitch.set_stream_online(streamer, game="CS2", title="LOUD vs FURIA!")
+            return await twitch.get_stream_info(streamer)
+
+        twitch_data.wait_for_stream_info.side_effect = wait_for_stream_info
+        event = {
+            "broadcaster_user_login": "gaules",
+            "broadcaster_user_name": "Gaules",
+            "started_at": datetime.now(timezone.utc).isoformat(),
+        }
+        return channel, indexed, event
+
+    async def test_announces_from_payload_then_enriches(self, twitch_data, guild, twitch, bot):
+        """
+        Verifica que o anuncio sai antes da Helix indexar a stream e e editado depois.
+
+        Input: Evento stream.online com perfil em cache e stream ainda nao indexada
+        Output: Anuncio sem chamadas a Helix, depois editado com jogo e titulo
+        """
+        # Arrange
+        channel, indexed, event = await self._arrange(twitch_data, guild, twitch, bot)
+        announced_before = _announce_delay_count("announce")
+        enriched_before = _announce_delay_count("enrich")
+
+        # Act
+        await notifications_twitch.schedule_streamer_notification("gaules", event, time.monotonic())
+
+        # Assert
+        message = channel.get_last_message()
+        assert message.embeds[0].title == "Gaules is live!"
+        assert [field.name for field in message.embeds[0].fields] == ["Streamer"]
+        assert twitch.get_user_info_calls == []
+        assert _announce_delay_count("announce") - announced_before == 1
+        twitch_data.update_last_stream_date.assert_awaited_once_with("gaules", event["started_at"])
+
+        # Act
+        indexed.set()
+        await notifications_twitch._stream_info_tasks["gaules"]
+
+        # Assert
+        assert len(channel.get_all_messages()) == 1
+        message.assert_edited()
+        assert message.embeds[0].title == "LOUD vs FURIA!"
+        assert_embed_field(message.embeds[0], "Game", "CS2")
+        assert _announce_delay_count("enrich") - enriched_before == 1
+
+    async def test_offline_cancels_enrichment(self, twitch_data, guild, twitch, bot):
+        """
+        Verifica que um stream.offline cancela o enriquecimento pendente.
+
+        Input: Anuncio enviado e stream.offline antes da stream ser indexada
+        Output: Enriquecimento cancelado e anuncio sem edicao
+        """
+        # Arrange
+        channel, indexed, event = await self._arrange(twitch_data, guild, twitch, bot)
+        await notifications_twitch.schedule_streamer_notification("gaules", event, time.monotonic())
+        enrichment = notifications_twitch._stream_info_tasks["gaules"]
+
+        # Act
+        with patch.object(notifications_twitch, "handle_send_streamer_offline_notification"):
+            await notifications_twitch.schedule_streamer_offline_notification("gaules")
+
+        # Assert
+        with pytest.raises(asyncio.CancelledError):
+            await enrichment
+        assert channel.get_last_message().embeds[0].title == "Gaules is live!"
+        assert notifications_twitch._stream_info_tasks == {}
+
+    async def test_redelivered_online_is_announced_once(self, twitch_data, guild, twitch, bot):
+        """
+        Verifica que um stream.online reenviado durante o anuncio nao posta de novo.
+
+        Input: O mesmo evento stream.online entregue duas vezes seguidas
+        Output: A mesma tarefa para as duas entregas e um unico anuncio
+        """
+        # Arrange
+        channel, indexed, event = await self._arrange(twitch_data, guild, twitch, bot)
+        event["id"] = "stream-1"
+
+        # Act
+        first = notifications_twitch.schedule_streamer_notification("gaules", event, time.monotonic())
+        second = notifications_twitch.schedule_streamer_notification("gaules", dict(event), time.monotonic())
+        await first
+
+        # Assert
+        assert second is first
+        assert len(channel.get_all_messages()) == 1
+        notifications_twitch.cancel_streamer_notification("gaules")
+
+    async def test_offline_cancels_pending_announcement(self, twitch_data, guild, twitch, bot):
+        """
+        Verifica que um stream.offline cancela o anuncio que ainda nao foi postado.
+
+        Input: stream.online seguido de stream.offline antes do anuncio rodar
+        Output: Anuncio cancelado, nenhuma mensagem e nenhuma tarefa pendente
+        """
+        # Arrange
+        channel, indexed, event = await self._arrange(twitch_data, guild, twitch, bot)
+        announcement = notifications_twitch.schedule_streamer_notification("gaules", event, time.monotonic())
+
+        # Act
+        with patch.object(notifications_twitch, "handle_send_streamer_offline_notification"):
+            await notifications_twitch.schedule_streamer_offline_notification("gaules")
+
+        # Assert
+        with pytest.raises(asyncio.CancelledError):
+            await announcement
+        assert channel.get_all_messages() == []
+        assert notifications_twitch._stream_info_tasks == {}
@@ -0,0 +1,102 @@
+"""
+Testes para a pausa de todas as funcionalidades ao sair de uma guild
+(app/services/moderations.pause_all_moderations_by_guild).
+
+Estes testes usam os mocks de MongoDB e Redis do conftest.
+"""
+
+from collections import Counter
+
+from app.constants import Commands as constants
+from app.services import cache, guild_features
+from app.services.moderations import pause_all_moderations_by_guild
+
+
+FEATURES = [
+    constants.BLOCK_LINKS_KEY,
+    constants.DEFAULT_ROLES_KEY,
+    constants.NOTIFICATIONS_TWITCH_KEY,
+    constants.REMINDERS_BIRTHDAY_KEY,
+    constants.WELCOME_MESSAGES_KEY,
+]
+
+
+def _enabled_guild(mongodb, redis_client):
+    moderations = {"guild_id": "1", "is_bot_online": True, constants.NOTIFICATIONS_YOUTUBE_VIDEO_KEY: False}
+    for key in FEATURES:
+        moderations[key] = True
+        mongodb.guild[key].insert_one({"guild_id": "1", "enabled": True})
+        redis_client.sadd(cache.get_guild_keys_key("1"), cache.get_cog_cache_key("1", key))
+        redis_client.set(cache.get_cog_cache_key("1", key), b"cached")
+    mongodb.guild.moderations.insert_one(moderations)
+    return mongodb.guild.moderations.find_one({"guild_id": "1"})
+
+
+class TestPauseAllModerations:
+    """Testes do caminho em lote da pausa ao sair de uma guild."""
+
+    async def test_round_trips_are_bounded(self, deps, mongodb, redis_client):
+        """
+        Verifica o numero de round trips da pausa de uma guild com cinco funcionalidades.
+
+        Input: Guild com cinco funcionalidades ativas e documentos em cache
+        Output: Um $set em moderations, uma escrita por collection de funcionalidade,
+                um insert_many por collection de eventos, a remocao da guild no indice
+                de streamers e dois pipelines no Redis
+        """
+        # Arrange
+        moderations = _enabled_guild(mongodb, redis_client)
+
+        # Act
+        await pause_all_moderations_by_guild("1", "bot", moderations)
+
+        # Assert
+        assert Counter(deps.mongo_async_client.round_trips) == Counter({
+            ("guild.moderations", "update_one"): 1,
+            **{(f"guild.{key}", "update_one"): 1 for key in FEATURES},
+            **{(f"events.{key}", "insert_many"): 1 for key in FEATURES},
+            ("notifications.twitch_streamer_targets", "distinct"): 1,
+            ("notifications.twitch_streamer_targets", "delete_many"): 1,
+        })
+        assert deps.redis_async_client.round_trips == ["pipeline", "pipeline"]
+        assert len(redis_client.published) == 1
+
+    async def test_pauses_features_and_records_events(self, mongodb, redis_client):
+        """
+        Verifica o estado gravado pela pausa em lote.
+
+        Input: Guild com cinco funcionalidades ativas, sem documento de moderations informado
+        Output: Flags falsas, cogs desativados, um evento de pausa por funcionalidade e cache vazio
+        """
+        # Arrange
+        _enabled_guild(mongodb, redis_client)
+        guild_features.load_guild_features()
+
+        # Act
+        previous = await pause_all_moderations_by_guild("1", "bot")
+
+        # Assert
+        document = mongodb.guild.moderations.find_one({"guild_id": "1"})
+        assert previous[constants.BLOCK_LINKS_KEY] is True
+        assert not any(document[key] for key in [*FEATURES, "is_bot_online"])
+        for key in FEATURES:
+            assert mongodb.guild[key].find_one({"guild_id": "1"})["enabled"] is False
+            events = list(mongodb.events[key].find({"guild_id": "1"}))
+            assert [(event["event"], event["user_id"]) for event in events] == [(constants.PAUSED_KEY, "bot")]
+            assert redis_client.get(cache.get_cog_cache_key("1", key)) is None
+        assert list(mongodb.events[constants.NOTIFICATIONS_YOUTUBE_VIDEO_KEY].find({})) == []
+        assert not guild_features.is_feature_enabled("1", constants.BLOCK_LINKS_KEY)
+
+    async def test_unknown_guild_is_ignored(self, deps):
+        """
+        Verifica que uma guild sem moderations nao gera escritas.
+
+        Input: Guild sem documento
+        Output: None e apenas a leitura de moderations
+        """
+        # Act
+        result = await pause_all_moderations_by_guild("404", "bot")
+
+        # Assert
+        assert result is None
+        assert deps.mongo_async_client.round_trips == [("guild.moderations", "find_one")]
@@ -0,0 +1,62 @@
+"""
+Testes para as leituras com projecao da camada de dados.
+
+Estes testes usam o mock de MongoDB do conftest, que aplica projecoes de inclusao.
+"""
+
+from unittest.mock import patch
+
+from app.constants import Commands as constants
+from app.data import birthdays
+from app.data.aio import birthdays as birthdays_aio
+from app.services import reminders_birthdays
+
+
+class TestProjectedReads:
+    """Testes dos campos pedidos pelas leituras quentes."""
+
+    async def test_birthday_enabled_reads_only_its_flag(self, mongodb):
+        """
+        Verifica que is_birthday_enabled pede apenas a flag de aniversarios.
+
+        Input: Moderations com aniversarios ativos
+        Output: True e find_one com projecao da flag, sem _id
+        """
+        # Arrange
+        mongodb.guild.moderations.insert_one({"guild_id": "1", constants.REMINDERS_BIRTHDAY_KEY: True, "owner_id": "9"})
+        find_one = mongodb.guild.moderations.find_one
+
+        # Act
+        with patch.object(mongodb.guild.moderations, "find_one", wraps=find_one) as spy:
+            enabled = await birthdays_aio.is_birthday_enabled("1")
+
+        # Assert
+        assert enabled is True
+        spy.assert_called_once_with({"guild_id": "1"}, {constants.REMINDERS_BIRTHDAY_KEY: True, "_id": False})
+
+    async def test_stats_read_only_month_and_date(self, mongodb):
+        """
+        Verifica que as estatisticas leem apenas mes e data dos itens.
+
+        Input: Dois aniversarios com mensagem customizada
+        Output: Estatisticas corretas e itens sem mensagem, imagem ou _id
+        """
+        # Arrange
+        message = {"mode": "custom", "title": "Oi", "content": "Parabens"}
+        birthdays.upsert_birthday_item("1", "2", "05-15", message=message)
+        birthdays.upsert_birthday_item("1", "3", "06-01", message=message)
+        find = birthdays_aio.find_birthday_items_by_guild
+        returned = []
+
+        async def spy(guild_id, projection=None):
+            items = await find(guild_id, projection)
+            returned.extend(items)
+            return items
+
+        # Act
+        with patch.object(reminders_birthdays.birthdays_data, "find_birthday_items_by_guild", side_effect=spy):
+            stats = await reminders_birthdays.get_birthday_stats("1")
+
+        # Assert
+        assert stats["total"] == 2
+        assert {frozenset(item) for item in returned} == {frozenset({"month", "date"})}
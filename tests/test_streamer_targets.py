@@ -0,0 +1,297 @@
+"""
+Testes para o indice invertido streamer -> destinos das notificacoes Twitch
+(app/services/streamer_targets.py).
+
+O indice e gravado pelos caminhos de escrita do cog (app/services/cogs.py), que
+removem o espelho no Redis para que a proxima leitura o recarregue; os testes usam os
+mocks de MongoDB e Redis do conftest.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+from app.constants import Commands as constants
+from app.data.notifications_twitch import STREAMER_TARGETS_COLLECTION
+from app.services import cache, cache_codec, streamer_targets
+from app.services.cogs import delete_cog_by_guild, insert_cog_by_guild, update_cog_by_guild
+from app.services.moderations import pause_all_moderations_by_guild
+from app.services.streamer_targets import (
+    count_streamer_guilds,
+    find_streamer_targets,
+    get_streamer_targets_key,
+    rebuild_streamer_targets,
+)
+
+TWITCH = constants.NOTIFICATIONS_TWITCH_KEY
+
+
+def _notification(streamer, channel_id, messages="{streamer} esta ao vivo!"):
+    return {
+        "streamer": {"value": streamer},
+        "channel": {"value": channel_id},
+        "notification_messages": {"value": messages},
+    }
+
+
+def _document(*notifications, enabled=True):
+    return {"enabled": enabled, "notifications": {"values": list(notifications)}}
+
+
+def _mirrored(redis_client, streamer):
+    raw = redis_client.get(get_streamer_targets_key(streamer))
+    return cache_codec.decode(raw) if raw is not None else None
+
+
+class TestStreamerTargetsWrites:
+    """Testes da atualizacao do indice pelos caminhos de escrita do cog."""
+
+    async def test_save_indexes_and_mirrors_streamers(self, mongodb, redis_client):
+        """
+        Verifica que salvar o formulario indexa cada notificacao e a leitura a espelha no Redis.
+
+        Input: Guild com notificacoes de "Gaules" e "alanzoka"
+        Output: Uma entrada por notificacao, com o login em minusculas, e a lista no Redis apos a leitura
+        """
+        # Act
+        await insert_cog_by_guild("1", TWITCH, _document(_notification("Gaules", "10"), _notification("alanzoka", "11")))
+
+        # Assert
+        assert sorted(doc["streamer"] for doc in mongodb.notifications[STREAMER_TARGETS_COLLECTION].find({})) == [
+            "alanzoka", "gaules",
+        ]
+        await find_streamer_targets("gaules")
+        assert _mirrored(redis_client, "gaules") == [{
+            "streamer": "gaules",
+            "guild_id": "1",
+            "channel_id": "10",
+            "notification_messages": "{streamer} esta ao vivo!",
+        }]
+
+    async def test_edit_removes_streamer_from_guild(self, mongodb, redis_client):
+        """
+        Verifica que remover um streamer do formulario o tira do indice e do espelho.
+
+        Input: Guild com "gaules" e "alanzoka", editada para manter apenas "alanzoka"
+        Output: Espelho de "gaules" removido, sem destinos, e "alanzoka" mantido
+        """
+        # Arrange
+        await insert_cog_by_guild("1", TWITCH, _document(_notification("gaules", "10"), _notification("alanzoka", "11")))
+        await find_streamer_targets("gaules")
+
+        # Act
+        await update_cog_by_guild("1", TWITCH, {"notifications": {"values": [_notification("alanzoka", "11")]}})
+
+        # Assert
+        assert _mirrored(redis_client, "gaules") is None
+        assert await find_streamer_targets("gaules") == []
+        assert [target["guild_id"] for target in await find_streamer_targets("alanzoka")] == ["1"]
+
+    async def test_edit_keeps_other_guilds(self, redis_client):
+        """
+        Verifica que a escrita de uma guild nao afeta as entradas de outra.
+
+        Input: Duas guilds com "gaules", a primeira desativa o comando
+        Output: Apenas a segunda guild nos destinos de "gaules"
+        """
+        # Arrange
+        await insert_cog_by_guild("1", TWITCH, _document(_notification("gaules", "10")))
+        await insert_cog_by_guild("2", TWITCH, _document(_notification("gaules", "20")))
+
+        # Act
+        await delete_cog_by_guild("1", TWITCH)
+
+        # Assert
+        assert [target["guild_id"] for target in await find_streamer_targets("gaules")] == ["2"]
+
+    async def test_edit_updates_kept_entries_in_place(self, mongodb):
+        """
+        Verifica que editar a guild atualiza as entradas mantidas sem apaga-las antes.
+
+        Input: Guild com "gaules" e "alanzoka", editada para mudar a mensagem de "gaules" e tirar "alanzoka"
+        Output: Entrada de "gaules" com o mesmo _id e a mensagem nova, "alanzoka" removido
+        """
+        # Arrange
+        collection = mongodb.notifications[STREAMER_TARGETS_COLLECTION]
+        await insert_cog_by_guild("1", TWITCH, _document(_notification("gaules", "10"), _notification("alanzoka", "11")))
+        entry_id = collection.find_one({"streamer": "gaules"})["_id"]
+
+        # Act
+        await update_cog_by_guild("1", TWITCH, {"notifications": {"values": [_notification("gaules", "10", "Nova")]}})
+
+        # Assert
+        assert [(doc["_id"], doc["notification_messages"]) for doc in collection.find({})] == [(entry_id, "Nova")]
+
+    async def test_pause_removes_and_unpause_restores(self, redis_client):
+        """
+        Verifica que pausar o comando tira a guild do indice e despausar a devolve.
+
+        Input: Guild com "gaules" pausada e depois despausada
+        Output: Sem destinos durante a pausa e o destino de volta depois
+        """
+        # Arrange
+        await insert_cog_by_guild("1", TWITCH, _document(_notification("gaules", "10")))
+
+        # Act / Assert
+        await update_cog_by_guild("1", TWITCH, {constants.ENABLED_KEY: False})
+        assert await find_streamer_targets("gaules") == []
+
+        await update_cog_by_guild("1", TWITCH, {constants.ENABLED_KEY: True})
+        assert [target["channel_id"] for target in await find_streamer_targets("gaules")] == ["10"]
+
+    async def test_concurrent_guild_writes_keep_both_guilds(self, redis_client):
+        """
+        Verifica que escritas simultaneas de guilds diferentes nao apagam uma a outra no espelho.
+
+        Input: Duas guilds salvando "gaules" ao mesmo tempo com o espelho ja carregado
+        Output: Espelho removido e os destinos das duas guilds na proxima leitura
+        """
+        # Arrange
+        await insert_cog_by_guild("1", TWITCH, _document())
+        await find_streamer_targets("gaules")
+
+        # Act
+        await asyncio.gather(
+            update_cog_by_guild("1", TWITCH, {"notifications": {"values": [_notification("gaules", "10")]}}),
+            insert_cog_by_guild("2", TWITCH, _document(_notification("gaules", "20"))),
+        )
+
+        # Assert
+        assert _mirrored(redis_client, "gaules") is None
+        assert sorted(target["guild_id"] for target in await find_streamer_targets("gaules")) == ["1", "2"]
+        assert redis_client.ttl(get_streamer_targets_key("gaules")) > 0
+
+    async def test_other_cogs_are_not_indexed(self, mongodb):
+        """
+        Verifica que apenas o cog de notificacoes Twitch alimenta o indice.
+
+        Input: Documento salvo no cog de notificacoes do YouTube
+        Output: Indice vazio
+        """
+        # Act
+        await insert_cog_by_guild("1", constants.NOTIFICATIONS_YOUTUBE_VIDEO_KEY, _document())
+
+        # Assert
+        assert list(mongodb.notifications[STREAMER_TARGETS_COLLECTION].find({})) == []
+
+    async def test_pause_all_removes_guild(self, mongodb, redis_client):
+        """
+        Verifica que a pausa em lote ao sair da guild a remove do indice.
+
+        Input: Guild com "gaules" ativo e pausa de todas as funcionalidades
+        Output: Indice e espelho sem a guild
+        """
+        # Arrange
+        await insert_cog_by_guild("1", TWITCH, _document(_notification("gaules", "10")))
+        await find_streamer_targets("gaules")
+        mongodb.guild.moderations.insert_one({"guild_id": "1", TWITCH: True})
+
+        # Act
+        await pause_all_moderations_by_guild("1", "bot")
+
+        # Assert
+        assert list(mongodb.notifications[STREAMER_TARGETS_COLLECTION].find({})) == []
+        assert _mirrored(redis_client, "gaules") is None
+
+
+class TestStreamerTargetsReads:
+    """Testes da leitura pelo espelho no Redis."""
+
+    async def test_lookup_is_served_from_redis(self, deps):
+        """
+        Verifica que a leitura dos destinos nao vai ao MongoDB quando o espelho existe.
+
+        Input: Duas guilds com "gaules" ja indexadas
+        Output: Dois destinos, nenhuma operacao no MongoDB e a contagem de guilds
+        """
+        # Arrange
+        await insert_cog_by_guild("1", TWITCH, _document(_notification("gaules", "10")))
+        await insert_cog_by_guild("2", TWITCH, _document(_notification("gaules", "20"), _notification("gaules", "21")))
+        await find_streamer_targets("gaules")
+        deps.mongo_async_client.round_trips.clear()
+
+        # Act
+        targets = await find_streamer_targets("gaules")
+
+        # Assert
+        assert sorted(target["channel_id"] for target in targets) == ["10", "20", "21"]
+        assert await count_streamer_guilds("gaules") == 2
+        assert deps.mongo_async_client.round_trips == []
+
+    async def test_miss_loads_from_mongo_without_replacing_newer_write(self, mongodb, redis_client):
+        """
+        Verifica que uma leitura sem espelho carrega do MongoDB sem sobrescrever uma escrita mais nova.
+
+        Input: Entrada no indice sem espelho, e um espelho gravado antes do SET NX
+        Output: Primeira leitura vinda do MongoDB; o espelho mais novo e mantido
+        """
+        # Arrange
+        target = {"streamer": "gaules", "guild_id": "1", "channel_id": "10", "notification_messages": "x"}
+        mongodb.notifications[STREAMER_TARGETS_COLLECTION].insert_one(target)
+
+        # Act
+        first = await find_streamer_targets("gaules")
+        redis_client.delete(get_streamer_targets_key("gaules"))
+        original_find = streamer_targets.twitch_aio_data.find_streamer_targets
+
+        async def find_then_write(streamer):
+            targets = await original_find(streamer)
+            redis_client.set(get_streamer_targets_key(streamer), cache.encode_value([]))
+            return targets
+
+        with patch.object(streamer_targets.twitch_aio_data, "find_streamer_targets", find_then_write):
+            second = await find_streamer_targets("gaules")
+
+        # Assert
+        assert first == [target]
+        assert second == [target]
+        assert _mirrored(redis_client, "gaules") == []
+
+
+class TestStreamerTargetsRebuild:
+    """Testes da reconstrucao do indice pelo comando de reparo."""
+
+    async def test_rebuild_repairs_missing_and_stale_entries(self, mongodb, redis_client):
+        """
+        Verifica que a reconstrucao refaz o indice a partir dos documentos de notificacao.
+
+        Input: Documento ativo fora do indice, documento pausado e uma entrada orfa no indice
+        Output: Apenas o documento ativo indexado, contagens de ausentes e obsoletas e espelho atualizado
+        """
+        # Arrange
+        mongodb.guild[TWITCH].insert_one({"guild_id": "1", **_document(_notification("gaules", "10"))})
+        mongodb.guild[TWITCH].insert_one({"guild_id": "2", **_document(_notification("gaules", "20"), enabled=False)})
+        mongodb.notifications[STREAMER_TARGETS_COLLECTION].insert_one(
+            {"streamer": "alanzoka", "guild_id": "3", "channel_id": "30", "notification_messages": "x"}
+        )
+
+        # Act
+        result = await rebuild_streamer_targets()
+
+        # Assert
+        assert result == {"guilds": 1, "targets": 1, "missing": 1, "stale": 1}
+        assert [doc["guild_id"] for doc in mongodb.notifications[STREAMER_TARGETS_COLLECTION].find({})] == ["1"]
+        assert [target["channel_id"] for target in _mirrored(redis_client, "gaules")] == ["10"]
+        assert _mirrored(redis_client, "alanzoka") == []
+
+    async def test_rebuild_keeps_current_entries_in_place(self, mongodb):
+        """
+        Verifica que a reconstrucao nao esvazia o indice: entradas atuais sao mantidas e as obsoletas removidas.
+
+        Input: Indice com uma entrada atual e uma obsoleta da mesma guild
+        Output: Entrada atual com o mesmo _id e a obsoleta removida
+        """
+        # Arrange
+        collection = mongodb.notifications[STREAMER_TARGETS_COLLECTION]
+        mongodb.guild[TWITCH].insert_one({"guild_id": "1", **_document(_notification("gaules", "10"))})
+        collection.insert_one(
+            {"streamer": "gaules", "guild_id": "1", "channel_id": "10", "notification_messages": "{streamer} esta ao vivo!"}
+        )
+        collection.insert_one({"streamer": "gaules", "guild_id": "1", "channel_id": "99", "notification_messages": "x"})
+        entry_id = collection.find_one({"channel_id": "10"})["_id"]
+
+        # Act
+        result = await rebuild_streamer_targets()
+
+        # Assert
+        assert result["stale"] == 1
+        assert [(doc["_id"], doc["channel_id"]) for doc in collection.find({})] == [(entry_id, "10")]
@@ -0,0 +1,234 @@
+"""
+Testes para o cliente Helix da Twitch (app/integrations/twitch.py).
+
+Estes testes usam um servidor Helix falso local (aiohttp), com emissao de
+token, 401 para tokens revogados e cabecalhos de rate limit.
+"""
+
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.integrations import twitch as twitch_module
+from app.integrations.twitch import TWITCH_TOKEN_REFRESH_MARGIN, TwitchClient
+
+
+class FakeHelix:
+    """Servidor Helix falso: emite tokens, valida o Bearer e aplica um bucket de rate limit."""
+
+    def __init__(self):
+        self.token_requests = 0
+        self.valid_tokens = set()
+        self.unauthorized = 0
+        self.rate_limited = 0
+        self.peers = set()
+        self.bucket_size = None
+        self.remaining = None
+        self.reset_at = None
+        self.reject_next = 0
+        self.delay = 0
+
+        self.app = web.Application()
+        self.app.router.add_post("/oauth2/token", self.token)
+        self.app.router.add_get("/helix/users", self.users)
+        self.app.router.add_get("/helix/streams", self.streams)
+
+    def set_bucket(self, size: int, window: float):
+        self.bucket_size = size
+        self.remaining = size
+        self.reset_at = time.time() + window
+        self.window = window
+
+    async def token(self, request: web.Request):
+        self.token_requests += 1
+        # Alarga a janela em que chamadas concorrentes poderiam renovar o token juntas.
+        await asyncio.sleep(0.05)
+        token = f"token-{self.token_requests}"
+        self.valid_tokens.add(token)
+        return web.json_response({"access_token": token, "expires_in": 3600 * 24})
+
+    def _check(self, request: web.Request):
+        self.peers.add(request.transport.get_extra_info("peername"))
+        if request.headers.get("Authorization", "").removeprefix("Bearer ") not in self.valid_tokens:
+            self.unauthorized += 1
+            raise web.HTTPUnauthorized()
+
+        headers = {}
+        if self.bucket_size is not None:
+            if time.time() >= self.reset_at:
+                self.remaining = self.bucket_size
+                self.reset_at = time.time() + self.window
+            headers = {"Ratelimit-Remaining": str(max(self.remaining - 1, 0)), "Ratelimit-Reset": str(self.reset_at)}
+            if self.remaining <= 0:
+                self.rate_limited += 1
+                raise web.HTTPTooManyRequests(headers=headers)
+            self.remaining -= 1
+        if self.reject_next:
+            self.reject_next -= 1
+            self.rate_limited += 1
+            raise web.HTTPTooManyRequests()
+        return headers
+
+    async def users(self, request: web.Request):
+        headers = self._check(request)
+        login = request.query["login"]
+        return web.json_response({"data": [{"id": "1", "login": login}]}, headers=headers)
+
+    async def streams(self, request: web.Request):
+        headers = self._check(request)
+        await asyncio.sleep(self.delay)
+        return web.json_response({"data": []}, headers=headers)
+
+
+@pytest_asyncio.fixture
+async def helix():
+    fake = FakeHelix()
+    server = TestServer(fake.app)
+    await server.start_server()
+
+    bot = MagicMock()
+    bot.config.TWITCH_CLIENT_ID = "client"
+    bot.config.TWITCH_SECRET = "secret"
+    client = TwitchClient(bot, api_url=str(server.make_url("/helix")), auth_url=str(server.make_url("/oauth2/token")))
+
+    yield fake, client
+
+    await client.close()
+    await server.close()
+
+
+class TestTwitchClientToken:
+    """Testes da renovacao do token de app."""
+
+    async def test_concurrent_callers_share_one_token_request(self, helix):
+        """
+        Verifica que chamadas concorrentes sem token disparam uma unica autenticacao.
+
+        Input: Vinte get_user_info em paralelo antes do primeiro token
+        Output: Todas respondidas e um unico pedido de token
+        """
+        fake, client = helix
+
+        # Act
+        users = await asyncio.gather(*(client.get_user_info(f"streamer{i}") for i in range(20)))
+
+        # Assert
+        assert [user["login"] for user in users] == [f"streamer{i}" for i in range(20)]
+        assert fake.token_requests == 1
+
+    async def test_token_is_refreshed_before_it_expires(self, helix):
+        """
+        Verifica a renovacao proativa do token.
+
+        Input: Token valido a menos da margem de renovacao do vencimento
+        Output: Novo token pedido antes da chamada, sem nenhuma resposta 401
+        """
+        fake, client = helix
+        await client.get_user_info("gaules")
+        client.token_expiration_time = time.time() + TWITCH_TOKEN_REFRESH_MARGIN - 1
+
+        # Act
+        user = await client.get_user_info("gaules")
+
+        # Assert
+        assert user["login"] == "gaules"
+        assert fake.token_requests == 2
+        assert fake.unauthorized == 0
+
+    async def test_revoked_token_is_refreshed_and_retried(self, helix):
+        """
+        Verifica a renovacao do token quando a Helix responde 401.
+
+        Input: Token revogado no servidor durante sua validade
+        Output: Uma resposta 401, um novo token e a chamada respondida
+        """
+        fake, client = helix
+        await client.get_user_info("gaules")
+        fake.valid_tokens.clear()
+
+        # Act
+        user = await client.get_user_info("gaules")
+
+        # Assert
+        assert user["login"] == "gaules"
+        assert fake.unauthorized == 1
+        assert fake.token_requests == 2
+
+
+class TestTwitchClientRequests:
+    """Testes do pool de conexoes, dos timeouts e do rate limit."""
+
+    async def test_requests_reuse_keep_alive_connection(self, helix):
+        """
+        Verifica que chamadas em sequencia reutilizam a mesma conexao.
+
+        Input: Cinco get_user_info em sequencia
+        Output: Uma unica conexao vista pelo servidor
+        """
+        fake, client = helix
+
+        # Act
+        for _ in range(5):
+            await client.get_user_info("gaules")
+
+        # Assert
+        assert len(fake.peers) == 1
+
+    async def test_requests_wait_for_ratelimit_reset(self, helix):
+        """
+        Verifica que as chamadas esperam o reset do rate limit em vez de falhar.
+
+        Input: Bucket de tres chamadas, uma ja feita, e tres chamadas em paralelo
+        Output: Todas respondidas, nenhuma 429, a ultima depois do reset
+        """
+        fake, client = helix
+        fake.set_bucket(3, window=0.3)
+        await client.get_user_info("warmup")
+        reset_at = fake.reset_at
+
+        # Act
+        users = await asyncio.gather(*(client.get_user_info(f"streamer{i}") for i in range(3)))
+
+        # Assert
+        assert all(users)
+        assert fake.rate_limited == 0
+        assert time.time() >= reset_at
+
+    async def test_too_many_requests_is_retried(self, helix):
+        """
+        Verifica que uma resposta 429 inesperada e repetida.
+
+        Input: Servidor responde 429 uma vez sem cabecalhos de rate limit
+        Output: Chamada respondida na segunda tentativa
+        """
+        fake, client = helix
+        await client.get_user_info("warmup")
+        fake.reject_next = 1
+
+        # Act
+        user = await client.get_user_info("gaules")
+
+        # Assert
+        assert user["login"] == "gaules"
+        assert fake.rate_limited == 1
+
+    async def test_slow_response_times_out(self, helix):
+        """
+        Verifica que uma resposta lenta nao prende o chamador.
+
+        Input: Servidor que demora mais que o timeout total
+        Output: asyncio.TimeoutError
+        """
+        fake, client = helix
+        fake.delay = 1
+
+        # Act / Assert
+        with patch.object(twitch_module, "TWITCH_REQUEST_TIMEOUT", aiohttp.ClientTimeout(total=0.2)):
+            with pytest.raises(asyncio.TimeoutError):
+                await client.get_stream_info("gaules")